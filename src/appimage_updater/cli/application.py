@@ -13,6 +13,8 @@ from rich.console import Console
 import typer
 
 from .._version import __version__
+from ..core.version_service import version_service
+from ..repositories.domain_service import get_domain_index
 from ..utils.logging_config import configure_logging
 from .handlers.add_handler import AddCommandHandler
 from .handlers.base import CommandHandler
@@ -91,6 +93,12 @@ def _ensure_config_directory_exists() -> None:
         logger.debug(f"Created default configuration file: {config_file}")
 
 
+def _save_command_state() -> None:
+    """Write the indexes a command updated, once, when it finishes."""
+    version_service.installed_state.flush()
+    get_domain_index().flush()
+
+
 class GlobalState:
     """Global state for CLI options that need to be accessible across commands."""
 
@@ -184,6 +192,7 @@ class AppImageUpdaterCLI:
             # but before any actual command is executed
             if ctx.invoked_subcommand is not None:
                 _ensure_config_directory_exists()
+                ctx.call_on_close(_save_command_state)
 
             # If no command was provided, show help message
             if ctx.invoked_subcommand is None:
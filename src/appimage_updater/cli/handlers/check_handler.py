@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
+import re
 from typing import Any
 
 from rich.console import Console
@@ -20,6 +21,23 @@ from ..options import CLIOptions
 from .base import CommandHandler
 
 
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$", re.IGNORECASE)
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as 90, 60s, 5m or 1h into seconds.
+
+    Raises:
+        ValueError: If the value is not a positive duration
+    """
+    match = _DURATION_PATTERN.match(value)
+    if match is None or float(match.group(1)) <= 0:
+        msg = f"Invalid duration '{value}', expected a positive number of seconds or a value like 60s, 5m or 1h"
+        raise ValueError(msg)
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2).lower()]
+
+
 class CheckCommandHandler(CommandHandler):
     """Handler for the check command."""
 
@@ -46,6 +64,10 @@ class CheckCommandHandler(CommandHandler):
             debug: bool = CLIOptions.debug_option(),
             output_format: OutputFormat = CLIOptions.FORMAT_OPTION,
             info: bool = CLIOptions.CHECK_INFO_OPTION,
+            pipeline: bool = CLIOptions.CHECK_PIPELINE_OPTION,
+            deadline: str | None = CLIOptions.CHECK_DEADLINE_OPTION,
+            max_age: str | None = CLIOptions.CHECK_MAX_AGE_OPTION,
+            cached_first: bool = CLIOptions.CHECK_CACHED_FIRST_OPTION,
             instrument_http: bool = CLIOptions.INSTRUMENT_HTTP_OPTION,
             http_stack_depth: int = CLIOptions.HTTP_STACK_DEPTH_OPTION,
             http_track_headers: bool = CLIOptions.HTTP_TRACK_HEADERS_OPTION,
@@ -59,6 +81,9 @@ class CheckCommandHandler(CommandHandler):
 
             Use --yes to automatically download available updates.
             Use --no to perform real checks but automatically decline downloads.
+            Use --yes --pipeline to start each download as soon as its application has been checked.
+            Use --deadline to bound the time spent checking, e.g. for scheduled runs.
+            Use --max-age to reuse recent results, or --cached-first to show them while refreshing.
             Use --dry-run to preview what would be checked without making network requests.
             Use --verbose to see detailed parameter resolution and processing information.
             """
@@ -73,6 +98,10 @@ class CheckCommandHandler(CommandHandler):
                 debug=debug,
                 output_format=output_format,
                 info=info,
+                pipeline=pipeline,
+                deadline=deadline,
+                max_age=max_age,
+                cached_first=cached_first,
                 instrument_http=instrument_http,
                 http_stack_depth=http_stack_depth,
                 http_track_headers=http_track_headers,
@@ -83,11 +112,26 @@ class CheckCommandHandler(CommandHandler):
         """Validate check command options."""
         yes = kwargs.get("yes", False)
         no = kwargs.get("no", False)
+        pipeline = kwargs.get("pipeline", False)
 
         if yes and no:
             self.console.print("[red]Error: --yes and --no options are mutually exclusive")
             raise typer.Exit(1)
 
+        if pipeline and not yes:
+            self.console.print("[red]Error: --pipeline requires --yes, as downloads start before all checks complete")
+            raise typer.Exit(1)
+
+        for option in ("deadline", "max_age"):
+            value = kwargs.get(option)
+            if value is None:
+                continue
+            try:
+                parse_duration(value)
+            except ValueError as e:
+                self.console.print(f"[red]Error: --{option.replace('_', '-')}: {e}")
+                raise typer.Exit(1) from e
+
     def _version_callback(self, value: bool) -> None:
         """Callback for --version option."""
         if value:
@@ -110,10 +154,14 @@ class CheckCommandHandler(CommandHandler):
         http_stack_depth: int,
         http_track_headers: bool,
         trace: bool,
+        pipeline: bool = False,
+        deadline: str | None = None,
+        max_age: str | None = None,
+        cached_first: bool = False,
     ) -> None:
         """Execute the check command logic."""
         # Validate mutually exclusive options
-        self.validate_options(yes=yes, no=no)
+        self.validate_options(yes=yes, no=no, pipeline=pipeline, deadline=deadline, max_age=max_age)
 
         # Create instrumentation params to reduce parameter list complexity
         instrumentation = InstrumentationParams(
@@ -132,6 +180,10 @@ class CheckCommandHandler(CommandHandler):
             yes=yes,
             no=no,
             no_interactive=no_interactive,
+            pipeline=pipeline,
+            deadline=None if deadline is None else parse_duration(deadline),
+            max_age=None if max_age is None else parse_duration(max_age),
+            cached_first=cached_first,
             verbose=verbose,
             debug=debug,
             instrumentation=instrumentation,
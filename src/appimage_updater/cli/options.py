@@ -147,6 +147,30 @@ class CLIOptions:
         help="Update or create .info files with current version scheme for selected applications",
     )
 
+    CHECK_DEADLINE_OPTION = typer.Option(
+        None,
+        "--deadline",
+        help="Time allowed for all checks, e.g. 90, 60s, 5m or 1h; checks still running then are reported as timed out",
+    )
+
+    CHECK_MAX_AGE_OPTION = typer.Option(
+        None,
+        "--max-age",
+        help="Reuse check results younger than this, e.g. 30m, without contacting repositories",
+    )
+
+    CHECK_CACHED_FIRST_OPTION = typer.Option(
+        False,
+        "--cached-first",
+        help="Show cached check results at once, then check again and show only what changed",
+    )
+
+    CHECK_PIPELINE_OPTION = typer.Option(
+        False,
+        "--pipeline",
+        help="Download each update as soon as its check completes instead of after all checks (requires --yes)",
+    )
+
     # ============================================================================
     # ADD COMMAND OPTIONS
     # ============================================================================
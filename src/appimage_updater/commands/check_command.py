@@ -5,6 +5,7 @@ from typing import Any
 from loguru import logger
 from rich.console import Console
 
+from ..core.http_service import GlobalHTTPClient
 from ..core.update_operations import _check_updates
 from ..utils.logging_config import configure_logging
 from .base import (
@@ -81,6 +82,7 @@ class CheckCommand(Command):
         output_formatter.start_section("HTTP Tracking Summary")
         self._display_request_count(http_tracker, output_formatter)
         self._display_request_details(http_tracker, output_formatter)
+        self._display_connection_stats(output_formatter)
         output_formatter.end_section()
 
     # noinspection PyMethodMayBeStatic
@@ -106,6 +108,18 @@ class CheckCommand(Command):
             remaining = len(http_tracker.requests) - 5
             output_formatter.print_message(f"  ... and {remaining} more requests")
 
+    # noinspection PyMethodMayBeStatic
+    def _display_connection_stats(self, output_formatter: Any) -> None:
+        """Display connection reuse counters of the shared HTTP client."""
+        stats = GlobalHTTPClient().get_stats()
+        if "connections_opened" not in stats:
+            return
+
+        output_formatter.print_message(
+            f"Connections opened: {stats['connections_opened']}, reused: {stats['connections_reused']}, "
+            f"TLS handshakes: {stats['tls_handshakes']}, HTTP/2 requests: {stats['http2_requests']}"
+        )
+
     # noinspection PyMethodMayBeStatic
     def _create_result(self, success: bool) -> CommandResult:
         """Create the appropriate CommandResult based on success status."""
@@ -133,6 +147,10 @@ class CheckCommand(Command):
             no_interactive=self.params.no_interactive,
             verbose=self.params.verbose,
             info=self.params.info,
+            pipeline=self.params.pipeline,
+            deadline=self.params.deadline,
+            max_age=self.params.max_age,
+            cached_first=self.params.cached_first,
             output_formatter=output_formatter,
         )
         return success
@@ -104,6 +104,10 @@ class CommandFactory:
         yes: bool = False,
         no: bool = False,
         no_interactive: bool = False,
+        pipeline: bool = False,
+        deadline: float | None = None,
+        max_age: float | None = None,
+        cached_first: bool = False,
         verbose: bool = False,
         debug: bool = False,
         instrumentation: InstrumentationParams | None = None,
@@ -123,6 +127,10 @@ class CommandFactory:
             yes: Automatically answer yes to prompts
             no: Automatically answer no to prompts
             no_interactive: Disable interactive prompts
+            pipeline: Download each update as soon as its check completes
+            deadline: Seconds allowed for all checks
+            max_age: Reuse check results younger than this many seconds
+            cached_first: Show cached results before checking again in the foreground
             verbose: Enable verbose output
             debug: Enable debug output
             instrumentation: Instrumentation parameters object
@@ -140,6 +148,10 @@ class CommandFactory:
             yes=yes,
             no=no,
             no_interactive=no_interactive,
+            pipeline=pipeline,
+            deadline=deadline,
+            max_age=max_age,
+            cached_first=cached_first,
             verbose=verbose,
             debug=debug,
             info=instr.info,
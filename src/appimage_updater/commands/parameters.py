@@ -70,6 +70,10 @@ class CheckParams(BaseParams):
     yes: bool = False
     no: bool = False
     no_interactive: bool = False
+    pipeline: bool = False
+    deadline: float | None = None  # Seconds allowed for all checks
+    max_age: float | None = None  # Seconds for which cached check results are reused
+    cached_first: bool = False
     # HTTP instrumentation options
     info: bool = False
     instrument_http: bool = False
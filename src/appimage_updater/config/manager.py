@@ -13,6 +13,7 @@ from typing import (
 
 from loguru import logger
 
+from ..core.http_service import GlobalHTTPClient
 from .loader import ConfigLoadError
 from .models import (
     ApplicationConfig,
@@ -25,6 +26,11 @@ from .models import (
 class Manager:
     """Base configuration manager class with common functionality."""
 
+    # noinspection PyMethodMayBeStatic
+    def _apply_http_settings(self, config: Config) -> None:
+        """Apply the loaded HTTP settings to the shared HTTP client, whichever command loaded them."""
+        GlobalHTTPClient().configure(config.global_config.http)
+
     def _parse_global_config_data(self, config_data: dict[str, Any]) -> GlobalConfig:
         """Parse global config data supporting both legacy and new formats.
 
@@ -462,6 +468,7 @@ class GlobalConfigManager(Manager):
         """
         self._config_path = config_path
         self._config = self._load_config()
+        self._apply_http_settings(self._config)
 
     def _load_config(self) -> Config:
         """Load global configuration from config.json file."""
@@ -671,6 +678,7 @@ class AppConfigs(Manager):
         """
         self._config_path = config_path
         self._config = self._load_config()
+        self._apply_http_settings(self._config)
         self._app_names = set(app_names) if app_names else set()
         self._filtered_apps = self._get_filtered_apps()
 
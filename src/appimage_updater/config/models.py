@@ -200,11 +200,103 @@ class DomainKnowledge(BaseModel):
     dynamic_domains: list[str] = Field(default_factory=list, description="Known dynamic download domains")
 
 
+class HTTPConfig(BaseModel):
+    """HTTP client settings shared by all network operations."""
+
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache API responses on disk and revalidate them with ETag/Last-Modified",
+    )
+    cache_max_entries: int = Field(default=2000, ge=1, description="Maximum number of cached responses")
+    cache_max_size_mb: int = Field(default=100, ge=1, description="Maximum total size of cached responses in MB")
+    cache_max_age_days: int = Field(
+        default=30,
+        ge=1,
+        description="Evict cached responses not revalidated within this many days",
+    )
+    rate_limit_enabled: bool = Field(
+        default=True,
+        description="Pace requests per host using X-RateLimit/RateLimit/Retry-After response headers",
+    )
+    rate_limit_max_wait_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="Longest delay accepted while waiting for a host's rate limit to reset",
+    )
+    host_concurrency: dict[str, int] = Field(
+        default_factory=lambda: {"api.github.com": 8, "sourceforge.net": 2},
+        description="Maximum concurrent requests per host (subdomains inherit their parent's limit)",
+    )
+    default_host_concurrency: int = Field(
+        default=6,
+        ge=1,
+        description="Maximum concurrent requests for hosts not listed in host_concurrency",
+    )
+    retry_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts for idempotent requests failing with network errors or 429/5xx responses",
+    )
+    retry_timeouts: bool = Field(
+        default=False,
+        description="Also retry API and page requests that time out (each attempt may take a full timeout)",
+    )
+    retry_backoff_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="Base delay of the jittered exponential backoff between retries",
+    )
+    retry_max_delay_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="Longest delay between retries; longer Retry-After values are not waited for",
+    )
+    hedge_requests: bool = Field(
+        default=False,
+        description="Send a second GET/HEAD when a response is slower than the observed p95 latency",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Multiplex requests over HTTP/2 connections (requires the 'h2' package)",
+    )
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum open connections in the shared connection pool",
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum idle connections kept open for reuse",
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds an idle connection is kept open for reuse",
+    )
+    host_max_connections: dict[str, int] = Field(
+        default_factory=dict,
+        description="Maximum open connections per host, each host getting its own pool (subdomains included)",
+    )
+    max_redirects: int = Field(
+        default=10,
+        ge=0,
+        description="Maximum redirects followed by a single request",
+    )
+
+
 class GlobalConfig(BaseModel):
     """Global configuration settings."""
 
     concurrent_downloads: int = Field(default=3, ge=1, le=10)
+    concurrent_checks: int = Field(default=16, ge=1, le=100, description="Applications checked at once")
+    concurrent_checks_per_host: int = Field(
+        default=4, ge=1, le=100, description="Applications with the same repository host checked at once"
+    )
     timeout_seconds: int = Field(default=30, ge=5, le=300)
+    check_timeout_seconds: int | None = Field(
+        default=None, ge=5, le=3600, description="Time allowed for checking one application before giving up"
+    )
     user_agent: str = Field(
         default_factory=lambda: _get_default_user_agent(),
         description="User agent for HTTP requests",
@@ -216,6 +308,7 @@ class GlobalConfig(BaseModel):
     domain_knowledge: DomainKnowledge = Field(
         default_factory=DomainKnowledge, description="Learned domain knowledge for repository detection"
     )
+    http: HTTPConfig = Field(default_factory=HTTPConfig, description="HTTP client and response cache settings")
 
 
 class Config(BaseModel):
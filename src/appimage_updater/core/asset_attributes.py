@@ -0,0 +1,144 @@
+"""Asset attributes parsed from filenames.
+
+Architecture, platform, format and target distribution are all encoded in an
+asset's filename. The compatibility filter, the distribution selector and the
+display code each look at them several times per asset, so a name is parsed
+once into an AssetAttributes descriptor that is cached by filename; names such
+as ``App-x86_64.AppImage`` repeat across releases and hit the cache.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+
+# Architecture tokens, most specific first
+_ARCHITECTURES = (
+    "x86_64",
+    "amd64",
+    "x64",
+    "aarch64",
+    "arm64",
+    "armv7l",
+    "armv7",
+    "armhf",
+    "i386",
+    "i686",
+    "x86",
+)
+_ARCHITECTURE_PATTERN = re.compile(rf"\b(?:{'|'.join(_ARCHITECTURES)})\b")
+_ARCHITECTURE_PRIORITY = {architecture: index for index, architecture in enumerate(_ARCHITECTURES)}
+
+# noinspection SpellCheckingInspection
+_PLATFORM_PATTERN = re.compile(r"\b(?:(?P<linux>linux)|(?P<darwin>darwin|macos)|(?P<win32>windows?|win32|win64))\b")
+_PLATFORM_PRIORITY = {"linux": 0, "darwin": 1, "win32": 2}
+
+# Architecture substrings looked for by the distribution selector, in its order
+_ARCHITECTURE_HINTS = ("x86_64", "amd64", "x64", "i386", "i686", "arm64", "aarch64", "armv7l", "armhf")
+
+# Longer extensions first
+_FILE_EXTENSIONS = (
+    ".pkg.tar.zst",
+    ".pkg.tar.xz",
+    ".tar.gz",
+    ".tar.xz",
+    ".tar.bz2",
+    ".appimage",
+    ".deb",
+    ".rpm",
+    ".dmg",
+    ".pkg",
+    ".exe",
+    ".msi",
+    ".zip",
+)
+
+# Formats the distribution selector ranks
+_SELECTOR_FORMATS = ((".appimage", "appimage"), (".zip", "zip"), (".tar.gz", "tar.gz"))
+
+# Distribution patterns and names; arch is rolling and carries no version
+_DISTRIBUTIONS = tuple(
+    (re.compile(pattern), name)
+    for pattern, name in (
+        (r"ubuntu[-_](\d+\.?\d*)", "ubuntu"),
+        (r"fedora[-_]?v?([\d.]+)", "fedora"),  # Match fedora with optional version like fedora-v02.02.01.60
+        (r"centos[-_](\d+)", "centos"),
+        (r"rhel[-_](\d+)", "rhel"),
+        (r"debian[-_](\d+)", "debian"),
+        (r"arch[-_](\w+)", "arch"),
+        (r"opensuse[-_](\d+\.?\d*)", "opensuse"),
+        (r"suse[-_](\d+\.?\d*)", "suse"),
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AssetAttributes:
+    """Attributes of an asset, parsed from its filename."""
+
+    architecture: str | None = None  # Whole-word architecture token, e.g. "x86_64"
+    platform: str | None = None  # linux, darwin or win32
+    file_extension: str | None = None  # e.g. ".appimage", ".tar.gz"
+    architecture_hint: str | None = None  # Architecture substring, also found inside words
+    distribution: str | None = None  # ubuntu, fedora, etc.
+    distribution_version: str | None = None  # 24.04, 38, etc.
+    format: str | None = None  # appimage, zip or tar.gz
+
+
+def get_asset_attributes(filename: str) -> AssetAttributes:
+    """Get the attributes encoded in an asset filename (cached per filename)."""
+    return _parse_attributes(filename.lower())
+
+
+@lru_cache(maxsize=4096)
+def _parse_attributes(filename: str) -> AssetAttributes:
+    """Parse a lowercase filename."""
+    distribution, distribution_version = _parse_distribution(filename)
+    return AssetAttributes(
+        architecture=_parse_architecture(filename),
+        platform=_parse_platform(filename),
+        file_extension=_parse_file_extension(filename),
+        architecture_hint=next((hint for hint in _ARCHITECTURE_HINTS if hint in filename), None),
+        distribution=distribution,
+        distribution_version=distribution_version,
+        format=next((name for extension, name in _SELECTOR_FORMATS if filename.endswith(extension)), None),
+    )
+
+
+def _parse_architecture(filename: str) -> str | None:
+    """Get the most specific architecture token in a filename."""
+    found = _ARCHITECTURE_PATTERN.findall(filename)
+    return min(found, key=_ARCHITECTURE_PRIORITY.__getitem__) if found else None
+
+
+def _parse_platform(filename: str) -> str | None:
+    """Get the platform named in a filename, preferring linux, then darwin."""
+    best: str | None = None
+    for match in _PLATFORM_PATTERN.finditer(filename):
+        platform = match.lastgroup
+        if platform and (best is None or _PLATFORM_PRIORITY[platform] < _PLATFORM_PRIORITY[best]):
+            best = platform
+    return best
+
+
+def _parse_file_extension(filename: str) -> str | None:
+    """Get a filename's extension, recognizing compound extensions."""
+    for extension in _FILE_EXTENSIONS:
+        if filename.endswith(extension):
+            return extension
+
+    # Fallback to simple extension
+    if "." in filename:
+        return "." + filename.rsplit(".", 1)[-1]
+    return None
+
+
+def _parse_distribution(filename: str) -> tuple[str | None, str | None]:
+    """Get the target distribution and its version from a filename."""
+    for pattern, distribution in _DISTRIBUTIONS:
+        match = pattern.search(filename)
+        if match:
+            return distribution, None if distribution == "arch" else match.group(1)
+    return None, None
@@ -0,0 +1,199 @@
+"""Persistent cache of update check results per application.
+
+Each successful check result, with the latest release and the asset selected
+for download, is stored keyed by what determines it: the source type, URL,
+asset and version patterns, prerelease flag, checksum settings and download
+directory. Results are kept in one file, updated once at the end of a check
+run, when results of applications no longer configured are dropped. A later
+``check --max-age`` serves results younger than the given age without any
+network I/O, and ``check --cached-first`` shows cached results at once before
+checking again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from loguru import logger
+from pydantic import ValidationError
+
+from ..config.models import ApplicationConfig
+from .http_cache import get_default_cache_dir
+from .models import CheckResult
+
+
+# Bumped when the stored format changes, so older entries are ignored
+CHECK_CACHE_FORMAT = 3
+
+
+def get_default_check_cache_path() -> Path:
+    """Get default path of the check result cache, next to the HTTP response cache."""
+    return get_default_cache_dir().parent / "checks.json"
+
+
+@dataclass
+class CachedCheck:
+    """A check result loaded from the cache."""
+
+    result: CheckResult
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        """Get the seconds since the result was stored."""
+        return max(time.time() - self.stored_at, 0.0)
+
+
+class CheckResultCache:
+    """On-disk cache of the latest successful check result of each application.
+
+    The cache file is loaded on first use. Stored results are kept in memory
+    and written in one atomic update by flush().
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize check result cache.
+
+        Args:
+            path: Cache file (defaults to one in the user cache dir)
+        """
+        self.path = path or get_default_check_cache_path()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        # Entries stored or discarded since the last flush (None when discarded)
+        self._pending: dict[str, dict[str, Any] | None] = {}
+
+    # noinspection PyMethodMayBeStatic
+    def make_key(self, app_config: ApplicationConfig) -> str:
+        """Build a cache key from the settings that determine an application's check result."""
+        key_parts = [
+            app_config.source_type,
+            app_config.url,
+            app_config.pattern,
+            f"version_pattern={app_config.version_pattern}",
+            f"prerelease={app_config.prerelease}",
+            f"checksum={app_config.checksum.model_dump_json()}",
+            str(app_config.download_dir),
+        ]
+        return hashlib.sha256("\n".join(key_parts).encode()).hexdigest()
+
+    def lookup(self, app_config: ApplicationConfig) -> CachedCheck | None:
+        """Get the cached result of an application, discarding it when unreadable."""
+        key = self.make_key(app_config)
+        entry = self._get_entries().get(key)
+        if entry is None:
+            return None
+
+        try:
+            result = CheckResult.model_validate(entry["result"])
+            stored_at = float(entry["stored_at"])
+        except (ValueError, KeyError, TypeError, ValidationError) as e:
+            logger.debug(f"Discarding unreadable cached check result of {app_config.name}: {e}")
+            self._discard(key)
+            return None
+
+        # The configuration is not stored; candidates use the current one
+        if result.candidate is not None:
+            result.candidate.app_config = app_config
+        return CachedCheck(result=result, stored_at=stored_at)
+
+    def store(self, app_config: ApplicationConfig, result: CheckResult) -> bool:
+        """Keep a successful check result for the next flush.
+
+        Returns:
+            True if the result was stored
+        """
+        if not result.success:
+            return False
+
+        try:
+            entry = {"stored_at": time.time(), "result": self._result_to_dict(result)}
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Failed to cache check result of {app_config.name}: {e}")
+            return False
+
+        key = self.make_key(app_config)
+        self._get_entries()[key] = entry
+        self._pending[key] = entry
+        return True
+
+    def flush(self, app_configs: Iterable[ApplicationConfig] | None = None) -> None:
+        """Write the stored results to disk in one atomic update.
+
+        The file is re-read first, so results stored by other runs are kept.
+
+        Args:
+            app_configs: All configured applications; results of any others are dropped
+        """
+        entries = self._read_entries()
+        for key, entry in self._pending.items():
+            if entry is None:
+                entries.pop(key, None)
+            else:
+                entries[key] = entry
+
+        changed = bool(self._pending)
+        if app_configs is not None:
+            keep = {self.make_key(app_config) for app_config in app_configs}
+            stale = [key for key in entries if key not in keep]
+            for key in stale:
+                del entries[key]
+            changed = changed or bool(stale)
+
+        if not changed:
+            return
+        try:
+            self._write_entries(entries)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write check result cache {self.path}: {e}")
+            return
+        self._entries = entries
+        self._pending.clear()
+
+    # noinspection PyMethodMayBeStatic
+    def _result_to_dict(self, result: CheckResult) -> dict[str, Any]:
+        """Serialize a result for storage, leaving out the application configuration."""
+        data: dict[str, Any] = result.model_dump(mode="json", exclude={"candidate": {"app_config"}})
+        return data
+
+    def _discard(self, key: str) -> None:
+        """Drop an entry, also from disk on the next flush."""
+        self._get_entries().pop(key, None)
+        self._pending[key] = None
+
+    def _get_entries(self) -> dict[str, dict[str, Any]]:
+        """Get the cached entries, loading them from disk on first use."""
+        if self._entries is None:
+            self._entries = self._read_entries()
+        return self._entries
+
+    def _read_entries(self) -> dict[str, dict[str, Any]]:
+        """Read the cache file, starting over when it is missing, unreadable or of another format."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("format") != CHECK_CACHE_FORMAT:
+                return {}
+            entries = data["entries"]
+            if not isinstance(entries, dict):
+                return {}
+            return entries
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Discarding unreadable check result cache {self.path}: {e}")
+            return {}
+
+    def _write_entries(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Atomically write the cache file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"format": CHECK_CACHE_FORMAT, "entries": entries}
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.path)
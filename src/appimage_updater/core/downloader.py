@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import (
+    AsyncIterable,
+    Callable,
+)
+from contextlib import nullcontext
 import hashlib
 from pathlib import Path
 import time
@@ -24,12 +29,17 @@ from rich.progress import (
 from .._version import __version__
 from ..events.event_bus import get_event_bus
 from ..events.progress_events import DownloadProgressEvent
-from .http_service import get_http_client
+from ..repositories.checksums import is_checksum_manifest
+from .http_service import (
+    GlobalHTTPClient,
+    get_http_client,
+)
 from .models import (
     ChecksumResult,
     DownloadResult,
     UpdateCandidate,
 )
+from .version_service import version_service
 
 
 class Downloader:
@@ -58,17 +68,7 @@ class Downloader:
         semaphore = asyncio.Semaphore(self.max_concurrent)
 
         if show_progress:
-            with Progress(
-                TextColumn("[bold blue]{task.description}", justify="right"),
-                BarColumn(bar_width=None),
-                "[progress.percentage]{task.percentage:>3.1f}%",
-                "•",
-                DownloadColumn(),
-                "•",
-                TransferSpeedColumn(),
-                "•",
-                TimeRemainingColumn(),
-            ) as progress:
+            with self._create_progress() as progress:
                 tasks = []
                 for candidate in candidates:
                     task = asyncio.create_task(self._download_with_semaphore(semaphore, candidate, progress))
@@ -83,6 +83,65 @@ class Downloader:
 
             return await asyncio.gather(*tasks)
 
+    async def download_as_available(
+        self,
+        candidates: AsyncIterable[UpdateCandidate],
+        show_progress: bool = True,
+        progress_callback: Callable[[int, int, str], None] | None = None,
+    ) -> list[DownloadResult]:
+        """Download updates as the candidates arrive, e.g. while other applications are still being checked.
+
+        Each download starts as soon as its candidate is received and a slot is
+        free, with at most max_concurrent downloads at once.
+
+        Args:
+            candidates: Update candidates, downloaded in the order they arrive
+            show_progress: Whether to display the download progress bars
+            progress_callback: Optional callback for progress updates (completed, received, app name),
+                called as each download finishes
+
+        Returns:
+            Download results, in the order the candidates arrived
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        tasks: list[asyncio.Task[DownloadResult]] = []
+        completed = 0
+
+        def report_progress(task: asyncio.Task[DownloadResult]) -> None:
+            nonlocal completed
+            if progress_callback is None or task.cancelled() or task.exception() is not None:
+                return
+            completed += 1
+            progress_callback(completed, len(tasks), task.result().app_name)
+
+        with self._create_progress() if show_progress else nullcontext() as progress:
+            try:
+                async for candidate in candidates:
+                    task = asyncio.create_task(self._download_with_semaphore(semaphore, candidate, progress))
+                    task.add_done_callback(report_progress)
+                    tasks.append(task)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            return list(await asyncio.gather(*tasks))
+
+    # noinspection PyMethodMayBeStatic
+    def _create_progress(self) -> Progress:
+        """Create the progress display shared by concurrent downloads."""
+        return Progress(
+            TextColumn("[bold blue]{task.description}", justify="right"),
+            BarColumn(bar_width=None),
+            "[progress.percentage]{task.percentage:>3.1f}%",
+            "•",
+            DownloadColumn(),
+            "•",
+            TransferSpeedColumn(),
+            "•",
+            TimeRemainingColumn(),
+        )
+
     async def _download_with_semaphore(
         self,
         semaphore: asyncio.Semaphore,
@@ -122,6 +181,9 @@ class Downloader:
         final_path = await self._handle_rotation(candidate)
         logger.debug(f"Rotation completed for {candidate.app_name}, final path: {final_path}")
 
+        # Record the new installed state once the download directory is settled
+        await self._record_installed_state(candidate, final_path, checksum_result)
+
         # Return successful result
         duration = time.time() - start_time
         file_size = final_path.stat().st_size if final_path.exists() else 0
@@ -136,23 +198,30 @@ class Downloader:
             checksum_result=checksum_result,
         )
 
-    # noinspection PyMethodMayBeStatic
-    async def _handle_download_failure(
-        self, candidate: UpdateCandidate, attempt: int, max_retries: int, error: Exception
+    async def _record_installed_state(
+        self, candidate: UpdateCandidate, final_path: Path, checksum_result: ChecksumResult | None
     ) -> None:
-        """Handle download failure cleanup and retry logic."""
-        logger.debug(f"Download attempt {attempt + 1} failed for {candidate.app_name}: {error}")
+        """Record the installed file and its hash in the installed-state index."""
+        if candidate.app_config is None or not final_path.exists():
+            return
 
-        # Clean up partial download on failed attempt
+        if checksum_result and checksum_result.verified and checksum_result.algorithm == "sha256":
+            sha256 = checksum_result.actual
+        else:
+            try:
+                sha256 = await asyncio.to_thread(self._calculate_file_hash, final_path, "sha256")
+            except OSError as e:
+                logger.debug(f"Failed to hash {final_path.name}: {e}")
+                sha256 = None
+
+        version_service.record_installed_file(candidate.app_config, final_path, sha256)
+
+    # noinspection PyMethodMayBeStatic
+    def _cleanup_partial_download(self, candidate: UpdateCandidate) -> None:
+        """Remove a partially downloaded file."""
         if candidate.download_path.exists():
             candidate.download_path.unlink()
 
-        # If not the last attempt, wait before retrying
-        if attempt < max_retries - 1:
-            wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-            logger.debug(f"Waiting {wait_time}s before retry...")
-            await asyncio.sleep(wait_time)
-
     # noinspection PyMethodMayBeStatic
     def _create_failure_result(
         self, candidate: UpdateCandidate, last_error: Exception | None, start_time: float
@@ -170,25 +239,29 @@ class Downloader:
         self,
         candidate: UpdateCandidate,
         progress: Progress | None = None,
-        max_retries: int = 3,
     ) -> DownloadResult:
-        """Download a single update with retry logic."""
+        """Download a single update, retrying transient failures through the shared retry engine."""
         start_time = time.time()
-        last_error = None
-
-        for attempt in range(max_retries):
-            if attempt > 0:
-                logger.debug(f"Retry attempt {attempt + 1}/{max_retries} for {candidate.app_name}")
-
-            try:
-                return await self._execute_download_attempt(candidate, progress, start_time)
 
-            except (httpx.HTTPError, httpx.TimeoutException, OSError) as e:
-                last_error = e
-                await self._handle_download_failure(candidate, attempt, max_retries, e)
+        def on_retry(error: BaseException) -> None:
+            logger.debug(f"Download attempt failed for {candidate.app_name}: {error}")
+            self._cleanup_partial_download(candidate)
 
-        # All retries failed
-        return self._create_failure_result(candidate, last_error, start_time)
+        try:
+            # A transfer that stalls mid-way is worth another attempt, unlike an API request
+            return (
+                await GlobalHTTPClient()
+                .get_retry_engine()
+                .call(
+                    lambda: self._execute_download_attempt(candidate, progress, start_time),
+                    retry_timeouts=True,
+                    on_retry=on_retry,
+                )
+            )
+        except (httpx.HTTPError, OSError) as e:
+            # Permanent failures such as 404 are not retried
+            self._cleanup_partial_download(candidate)
+            return self._create_failure_result(candidate, e, start_time)
 
     # noinspection PyMethodMayBeStatic
     def _setup_download(
@@ -319,22 +392,36 @@ class Downloader:
             return None
 
         checksum_result = await self._verify_download_checksum(candidate)
+        self._check_required_checksum(candidate, checksum_result)
+        return checksum_result
+
+    def _handle_digest_verification(self, candidate: UpdateCandidate) -> ChecksumResult | None:
+        """Verify the download against the digest provided by the repository, if any."""
+        checksum_result = self._verify_digest(candidate)
+        if checksum_result is not None:
+            self._check_required_checksum(candidate, checksum_result)
+        return checksum_result
 
-        # If checksum is required and verification failed, treat as error
+    # noinspection PyMethodMayBeStatic
+    def _check_required_checksum(self, candidate: UpdateCandidate, checksum_result: ChecksumResult | None) -> None:
+        """Raise if checksum is required and verification failed."""
         if candidate.checksum_required and checksum_result and not checksum_result.verified:
             raise Exception(f"Checksum verification failed: {checksum_result.error_message}")
 
-        return checksum_result
-
     async def _post_process_download(self, candidate: UpdateCandidate) -> ChecksumResult | None:
         """Post-process downloaded file (extract if a zip file, then make executable, and verify checksum)."""
+        # Repository digests describe the file as downloaded, so check them before extraction
+        digest_result = self._handle_digest_verification(candidate)
+
         # Handle zip extraction first
         await self._extract_if_zip(candidate)
 
         # Make AppImage executable
         self._make_appimage_executable(candidate)
 
-        # Verify checksum if available
+        # Verify checksum if available, downloading the checksum file only without a digest
+        if digest_result is not None:
+            return digest_result
         return await self._handle_checksum_verification(candidate)
 
     def _validate_appimage_files_in_zip(self, zip_ref: zipfile.ZipFile, candidate: UpdateCandidate) -> str:
@@ -573,6 +660,38 @@ class Downloader:
                 hasher.update(chunk)
         return hasher.hexdigest().lower()
 
+    def _verify_digest(self, candidate: UpdateCandidate) -> ChecksumResult | None:
+        """Verify a download against its asset's repository digest.
+
+        Returns:
+            Verification result, or None when the asset has no digest in a supported algorithm
+        """
+        algorithm, _, expected_hash = (candidate.asset.digest or "").partition(":")
+        algorithm = algorithm.lower()
+        if not expected_hash or algorithm not in hashlib.algorithms_guaranteed:
+            return None
+
+        try:
+            actual_hash = self._calculate_file_hash(candidate.download_path, algorithm)
+        except OSError as e:
+            return ChecksumResult(
+                verified=False,
+                algorithm=algorithm,
+                error_message=f"Checksum verification failed: {e}",
+            )
+
+        expected_hash = expected_hash.strip().lower()
+        verified = actual_hash == expected_hash
+        result = ChecksumResult(
+            verified=verified,
+            expected=expected_hash,
+            actual=actual_hash,
+            algorithm=algorithm,
+            error_message=None if verified else "Checksum mismatch",
+        )
+        self._log_verification_result(candidate, result, algorithm)
+        return result
+
     async def _verify_download_checksum(
         self,
         candidate: UpdateCandidate,
@@ -592,6 +711,10 @@ class Downloader:
             if not success:
                 return self._create_download_failure_result()
 
+            if self._is_unlisted_in_manifest(candidate, checksum_path):
+                self._cleanup_checksum_file(checksum_path)
+                return None
+
             algorithm = self._determine_checksum_algorithm(candidate.asset.checksum_asset.name)
             result = self._perform_checksum_verification(candidate, checksum_path, algorithm)
 
@@ -607,6 +730,20 @@ class Downloader:
                 error_message=f"Checksum verification error: {e}",
             )
 
+    def _is_unlisted_in_manifest(self, candidate: UpdateCandidate, checksum_path: Path) -> bool:
+        """Check if the checksum file is a release manifest that does not list the download.
+
+        Manifests are associated with every asset lacking a checksum file of its own, so
+        an asset they leave out is unverified, as if there were no checksum file at all.
+        """
+        checksum_asset = candidate.asset.checksum_asset
+        if checksum_asset is None or not is_checksum_manifest(checksum_asset.name, candidate.asset.name):
+            return False
+        if self._parse_expected_checksum(checksum_path, candidate.download_path.name) is not None:
+            return False
+        logger.debug(f"Checksum manifest {checksum_asset.name} does not list {candidate.download_path.name}")
+        return True
+
     # noinspection PyMethodMayBeStatic
     def _get_checksum_file_path(self, candidate: UpdateCandidate) -> Path:
         """Get the path for the checksum file."""
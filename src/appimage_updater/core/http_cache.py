@@ -0,0 +1,368 @@
+"""Persistent conditional-request cache for HTTP GET responses.
+
+Responses carrying an ``ETag`` or ``Last-Modified`` validator are stored on disk,
+keyed by URL and authentication identity. Later requests for the same resource
+send ``If-None-Match``/``If-Modified-Since`` and, when the server answers
+``304 Not Modified``, the cached body is served instead. Unchanged release
+listings therefore cost almost no bandwidth and, on GitHub, no rate limit.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import (
+    dataclass,
+    field,
+)
+import hashlib
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import httpx
+from loguru import logger
+
+
+# Request headers that identify the caller; their values are hashed into the cache key
+_AUTH_HEADERS = ("authorization", "private-token")
+
+# Request headers that change the representation returned by the server
+_VARY_HEADERS = ("accept",)
+
+# Response headers preserved with the cached body
+_STORED_HEADERS = (
+    "content-type",
+    "etag",
+    "last-modified",
+    "link",
+)
+
+
+def get_default_cache_dir() -> Path:
+    """Get default directory for the HTTP response cache.
+
+    Honors the test configuration override and ``XDG_CACHE_HOME``.
+    """
+    test_config_dir = os.environ.get("APPIMAGE_UPDATER_TEST_CONFIG_DIR")
+    if test_config_dir:
+        return Path(test_config_dir) / "cache" / "http"
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base_dir / "appimage-updater" / "http"
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness for the current process."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counters as a dictionary for trace output."""
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_stores": self.stores,
+            "cache_evictions": self.evictions,
+        }
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with its validators."""
+
+    url: str
+    stored_at: float
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class HTTPResponseCache:
+    """On-disk cache of GET responses revalidated with conditional requests."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_entries: int = 2000,
+        max_bytes: int = 100 * 1024 * 1024,
+        max_age_seconds: float = 30 * 24 * 3600,
+        max_entry_bytes: int = 5 * 1024 * 1024,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (defaults to the user cache dir)
+            max_entries: Maximum number of entries kept on disk
+            max_bytes: Maximum total size of all entries on disk
+            max_age_seconds: Entries not revalidated for this long are evicted
+            max_entry_bytes: Responses larger than this are never cached
+        """
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.max_entry_bytes = max_entry_bytes
+        self.stats = CacheStats()
+        self._pruned = False
+
+    # noinspection PyMethodMayBeStatic
+    def make_key(self, url: str, params: Any = None, headers: Any = None) -> str:
+        """Build a cache key from the request URL, query parameters and identity headers."""
+        full_url = str(httpx.URL(url, params=params)) if params else url
+        request_headers = httpx.Headers(headers or {})
+
+        key_parts = [full_url]
+        key_parts.extend(f"{name}={request_headers.get(name, '')}" for name in _VARY_HEADERS)
+        key_parts.extend(self._identity_parts(request_headers))
+        return hashlib.sha256("\n".join(key_parts).encode()).hexdigest()
+
+    # noinspection PyMethodMayBeStatic
+    def _identity_parts(self, request_headers: httpx.Headers) -> list[str]:
+        """Get key parts identifying the caller; credentials are only kept as digests."""
+        return [
+            f"{name}={hashlib.sha256(request_headers[name].encode()).hexdigest()}"
+            for name in _AUTH_HEADERS
+            if request_headers.get(name)
+        ]
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Load a cache entry, discarding it when expired or unreadable."""
+        entry_path = self._entry_path(key)
+        if not entry_path.exists():
+            return None
+
+        try:
+            data = json.loads(entry_path.read_text(encoding="utf-8"))
+            entry = self._entry_from_dict(data, entry_path.stat().st_mtime)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Discarding unreadable cache entry {entry_path.name}: {e}")
+            self._remove_entry(entry_path)
+            return None
+
+        if self._is_expired(entry.stored_at):
+            self._remove_entry(entry_path)
+            return None
+
+        return entry
+
+    # noinspection PyMethodMayBeStatic
+    def conditional_headers(self, entry: CacheEntry) -> dict[str, str]:
+        """Get conditional request headers for revalidating an entry."""
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: str, url: str, response: httpx.Response) -> bool:
+        """Store a successful response if it carries validators.
+
+        Returns:
+            True if the response was written to the cache
+        """
+        if not self._is_cacheable(response):
+            return False
+
+        entry = CacheEntry(
+            url=url,
+            stored_at=time.time(),
+            content=response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            headers=self._stored_headers(response),
+        )
+
+        try:
+            self._write_entry(key, entry)
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry for {url}: {e}")
+            return False
+
+        self.stats.stores += 1
+        if not self._pruned:
+            self.prune()
+        return True
+
+    def refresh(self, key: str) -> None:
+        """Mark an entry as freshly revalidated so age-based eviction restarts."""
+        entry_path = self._entry_path(key)
+        try:
+            os.utime(entry_path)
+        except OSError as e:
+            logger.debug(f"Failed to refresh cache entry {entry_path.name}: {e}")
+
+    def resolve(self, key: str, url: str, entry: CacheEntry | None, response: Any) -> Any:
+        """Serve the cached entry for a 304 answer, otherwise store the fresh response.
+
+        Args:
+            key: Cache key of the request
+            url: Request URL
+            entry: Entry the request was revalidated against, if any
+            response: Response received from the server
+
+        Returns:
+            Response to hand to the caller
+        """
+        if entry is not None and response.status_code == 304:
+            self.record_hit()
+            self.refresh(key)
+            return self.build_response(entry, _get_response_request(response))
+
+        self.record_miss()
+        if isinstance(response, httpx.Response):
+            self.store(key, url, response)
+        return response
+
+    # noinspection PyMethodMayBeStatic
+    def build_response(self, entry: CacheEntry, request: httpx.Request | None) -> httpx.Response:
+        """Build a 200 response from a cached entry."""
+        headers = dict(entry.headers)
+        headers["x-appimage-updater-cache"] = "hit"
+        return httpx.Response(200, headers=headers, content=entry.content, request=request)
+
+    def record_hit(self) -> None:
+        """Count a response served from cache."""
+        self.stats.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a response fetched from the network."""
+        self.stats.misses += 1
+
+    def prune(self) -> int:
+        """Evict expired entries, then the least recently validated ones beyond the size limits.
+
+        Returns:
+            Number of evicted entries
+        """
+        self._pruned = True
+        entries = self._list_entries()
+        evicted = self._evict_expired(entries)
+        evicted += self._evict_over_limits([e for e in entries if e[0].exists()])
+        self.stats.evictions += evicted
+        if evicted:
+            logger.debug(f"Evicted {evicted} HTTP cache entries from {self.cache_dir}")
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for entry_path, _, _ in self._list_entries():
+            self._remove_entry(entry_path)
+
+    # noinspection PyMethodMayBeStatic
+    def _stored_headers(self, response: httpx.Response) -> dict[str, str]:
+        """Get the response headers preserved with a cached body."""
+        return {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+
+    def _is_cacheable(self, response: httpx.Response) -> bool:
+        """Check if a response can be stored."""
+        if response.status_code != 200:
+            return False
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return False
+        if not (response.headers.get("etag") or response.headers.get("last-modified")):
+            return False
+        return len(response.content) <= self.max_entry_bytes
+
+    def _is_expired(self, stored_at: float) -> bool:
+        """Check if an entry is older than the configured maximum age."""
+        return time.time() - stored_at > self.max_age_seconds
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def _write_entry(self, key: str, entry: CacheEntry) -> None:
+        """Atomically write an entry to disk."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._entry_to_dict(entry)), encoding="utf-8")
+        os.replace(tmp_path, entry_path)
+
+    # noinspection PyMethodMayBeStatic
+    def _entry_to_dict(self, entry: CacheEntry) -> dict[str, Any]:
+        """Serialize an entry for storage."""
+        return {
+            "url": entry.url,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "headers": entry.headers,
+            "content": base64.b64encode(entry.content).decode("ascii"),
+        }
+
+    # noinspection PyMethodMayBeStatic
+    def _entry_from_dict(self, data: dict[str, Any], mtime: float) -> CacheEntry:
+        """Deserialize an entry; the file modification time records the last validation."""
+        return CacheEntry(
+            url=data["url"],
+            stored_at=mtime,
+            content=base64.b64decode(data["content"]),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            headers=dict(data.get("headers") or {}),
+        )
+
+    def _list_entries(self) -> list[tuple[Path, float, int]]:
+        """List cache entries as (path, mtime, size) tuples."""
+        if not self.cache_dir.exists():
+            return []
+
+        entries: list[tuple[Path, float, int]] = []
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((entry_path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict_expired(self, entries: list[tuple[Path, float, int]]) -> int:
+        """Remove entries past the maximum age."""
+        evicted = 0
+        for entry_path, mtime, _ in entries:
+            if self._is_expired(mtime):
+                self._remove_entry(entry_path)
+                evicted += 1
+        return evicted
+
+    def _evict_over_limits(self, entries: list[tuple[Path, float, int]]) -> int:
+        """Remove oldest entries until count and total size are within limits."""
+        entries.sort(key=lambda e: e[1])
+        total_bytes = sum(size for _, _, size in entries)
+        count = len(entries)
+        evicted = 0
+
+        for entry_path, _, size in entries:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            self._remove_entry(entry_path)
+            count -= 1
+            total_bytes -= size
+            evicted += 1
+        return evicted
+
+    # noinspection PyMethodMayBeStatic
+    def _remove_entry(self, entry_path: Path) -> None:
+        """Delete an entry file, ignoring races with other processes."""
+        try:
+            entry_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Failed to remove cache entry {entry_path.name}: {e}")
+
+
+def _get_response_request(response: Any) -> httpx.Request | None:
+    """Get the request bound to a response, if any."""
+    try:
+        request: httpx.Request = response.request
+        return request
+    except RuntimeError:
+        return None
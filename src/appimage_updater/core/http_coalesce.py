@@ -0,0 +1,106 @@
+"""Single-flight coalescing of identical in-flight HTTP GET requests.
+
+When several applications share one upstream project, their release lookups are
+fired concurrently and would otherwise hit the same URL several times at once.
+The coalescer lets the first caller perform the request while identical
+concurrent callers await the same result, so one network round trip serves all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from loguru import logger
+
+
+@dataclass
+class _InFlightRequest:
+    """A shared request and the number of callers awaiting it."""
+
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class RequestCoalescer:
+    """Share one in-flight request between concurrent identical callers."""
+
+    def __init__(self) -> None:
+        """Initialize coalescer with no requests in flight."""
+        self._in_flight: dict[tuple[int, str], _InFlightRequest] = {}
+        self.coalesced = 0
+
+    # noinspection PyMethodMayBeStatic
+    def make_key(self, method: str, url: str, kwargs: dict[str, Any]) -> str:
+        """Build a key identifying a request by method, full URL, headers and remaining options.
+
+        The timeout is part of the options, so a caller never waits on a request
+        started with a longer timeout than its own.
+        """
+        request_kwargs = dict(kwargs)
+        params = request_kwargs.pop("params", None)
+        headers = httpx.Headers(request_kwargs.pop("headers", None) or {})
+
+        full_url = str(httpx.URL(url, params=params)) if params else url
+        header_items = sorted((name.lower(), value) for name, value in headers.multi_items())
+        option_items = sorted((name, repr(value)) for name, value in request_kwargs.items())
+        return f"{method.upper()} {full_url} {header_items!r} {option_items!r}"
+
+    async def run(self, key: str, request_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a request, or join an identical one already in flight.
+
+        Args:
+            key: Request key from make_key()
+            request_factory: Callable starting the request when none is in flight
+
+        Returns:
+            Response shared by all callers with the same key
+
+        A cancelled caller leaves the request running for the others; once the last
+        caller is gone, the request is cancelled too.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not running under asyncio, so there are no tasks to share
+            return await request_factory()
+
+        # Tasks are bound to their event loop, so only share within the same loop
+        loop_key = (id(loop), key)
+        request = self._in_flight.get(loop_key)
+
+        if request is None:
+            request = _InFlightRequest(asyncio.ensure_future(request_factory()))
+            self._in_flight[loop_key] = request
+            request.task.add_done_callback(lambda done: self._forget(loop_key, done))
+        else:
+            self.coalesced += 1
+            # The key embeds request headers, so it is not logged
+            logger.debug("Joined identical in-flight request")
+
+        request.waiters += 1
+        try:
+            # Shield so a cancelled caller does not cancel the request for the others
+            return await asyncio.shield(request.task)
+        finally:
+            request.waiters -= 1
+            if request.waiters == 0 and not request.task.done():
+                # Nobody is left to receive the response, and later callers start afresh
+                self._forget(loop_key, request.task)
+                request.task.cancel()
+
+    def _forget(self, loop_key: tuple[int, str], task: asyncio.Task[Any]) -> None:
+        """Drop a finished or abandoned request so later calls go to the network again."""
+        request = self._in_flight.get(loop_key)
+        if request is not None and request.task is task:
+            del self._in_flight[loop_key]
+
+    def get_stats(self) -> dict[str, int]:
+        """Return counters for trace output."""
+        return {"coalesced_requests": self.coalesced}
@@ -0,0 +1,133 @@
+"""Connection pool configuration and connection reuse statistics.
+
+Builds the pool options of the shared httpx client from the HTTP settings:
+optional HTTP/2 multiplexing, pool limits, keep-alive expiry and per-host
+connection caps. Per-host caps are implemented as separately mounted
+transports, each with its own pool, since an httpx pool only limits
+connections globally.
+
+Connection reuse is measured through the httpcore ``trace`` request extension,
+which reports when a request opens a TCP connection or performs a TLS handshake.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+import httpx
+from loguru import logger
+
+
+if TYPE_CHECKING:
+    from ..config.models import HTTPConfig
+
+
+# HTTP settings baked into the shared client when it is created
+POOL_SETTINGS = (
+    "http2",
+    "max_connections",
+    "max_keepalive_connections",
+    "keepalive_expiry_seconds",
+    "host_max_connections",
+    "max_redirects",
+)
+
+
+def pool_settings_changed(old: HTTPConfig, new: HTTPConfig) -> bool:
+    """Check if new settings require rebuilding the shared client and its pool."""
+    return any(getattr(old, name) != getattr(new, name) for name in POOL_SETTINGS)
+
+
+def http2_available() -> bool:
+    """Check if the optional HTTP/2 support (the h2 package) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_pool_options(settings: HTTPConfig) -> dict[str, Any]:
+    """Build connection pool options for httpx.AsyncClient from the HTTP settings.
+
+    Args:
+        settings: HTTP section of the global configuration
+
+    Returns:
+        Keyword arguments for httpx.AsyncClient (limits, http2, max_redirects and, with per-host caps, mounts)
+    """
+    http2 = _resolve_http2(settings.http2)
+    options: dict[str, Any] = {
+        "limits": _build_limits(settings, settings.max_connections),
+        "http2": http2,
+        "max_redirects": settings.max_redirects,
+    }
+
+    mounts = _build_host_mounts(settings, http2)
+    if mounts:
+        options["mounts"] = mounts
+    return options
+
+
+def _resolve_http2(requested: bool) -> bool:
+    """Enable HTTP/2 only when requested and supported."""
+    if requested and not http2_available():
+        logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+        return False
+    return requested
+
+
+def _build_limits(settings: HTTPConfig, max_connections: int) -> httpx.Limits:
+    """Build pool limits capped at max_connections."""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(settings.max_keepalive_connections, max_connections),
+        keepalive_expiry=settings.keepalive_expiry_seconds,
+    )
+
+
+def _build_host_mounts(settings: HTTPConfig, http2: bool) -> dict[str, httpx.AsyncBaseTransport]:
+    """Build one transport per capped host, matching the host and its subdomains."""
+    mounts: dict[str, httpx.AsyncBaseTransport] = {}
+    for host, max_connections in settings.host_max_connections.items():
+        transport = httpx.AsyncHTTPTransport(limits=_build_limits(settings, max_connections), http2=http2)
+        mounts[f"all://{host}"] = transport
+        mounts[f"all://*.{host}"] = transport
+    return mounts
+
+
+class ConnectionStats:
+    """Count new connections, TLS handshakes and reused connections of the shared pool."""
+
+    def __init__(self) -> None:
+        """Initialize connection counters."""
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self.http2_requests = 0
+
+    async def attach(self, request: httpx.Request) -> None:
+        """Request event hook installing the connection trace callback."""
+        request.extensions.setdefault("trace", self.trace)
+
+    async def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Record httpcore connection and request events."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+        elif event_name.endswith(".send_request_headers.started"):
+            self.requests_sent += 1
+            if event_name.startswith("http2."):
+                self.http2_requests += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Return counters for trace output."""
+        if not self.requests_sent:
+            return {}
+        return {
+            "connections_opened": self.connections_opened,
+            "connections_reused": max(self.requests_sent - self.connections_opened, 0),
+            "tls_handshakes": self.tls_handshakes,
+            "http2_requests": self.http2_requests,
+        }
@@ -0,0 +1,204 @@
+"""Host-aware rate limiting for HTTP requests.
+
+Each host gets a concurrency cap and a request budget learned from the rate limit
+headers of its responses (``X-RateLimit-*`` on GitHub, ``RateLimit-*`` on GitLab
+and IETF-style servers, and ``Retry-After``). Once a host reports its budget as
+exhausted, further requests are delayed until the advertised reset instead of
+failing with 403/429 halfway through a large check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Mapping,
+)
+import contextlib
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+import time
+from typing import Any
+from urllib.parse import urlparse
+import weakref
+
+from loguru import logger
+
+
+# Header names carrying the remaining budget and its reset time, in priority order
+_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+_RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset")
+
+# Reset values above this are epoch timestamps, smaller ones are delays in seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+@dataclass
+class HostBudget:
+    """Request budget advertised by a host."""
+
+    remaining: int | None = None
+    reset_at: float | None = None
+    blocked_until: float = 0.0
+
+
+class HostRateLimiter:
+    """Per-host concurrency caps and header-driven request budgets."""
+
+    def __init__(
+        self,
+        host_concurrency: dict[str, int] | None = None,
+        default_concurrency: int = 6,
+        max_wait_seconds: float = 60.0,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            host_concurrency: Maximum concurrent requests per host; subdomains inherit the limit
+            default_concurrency: Maximum concurrent requests for other hosts
+            max_wait_seconds: Longest delay accepted before sending a request anyway
+        """
+        self.host_concurrency = host_concurrency or {}
+        self.default_concurrency = default_concurrency
+        self.max_wait_seconds = max_wait_seconds
+        self.budgets: dict[str, HostBudget] = {}
+        self.delayed_requests = 0
+        self.delay_seconds = 0.0
+        # Semaphores are bound to the event loop they are first used in
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @contextlib.asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the URL's host, waiting for its budget if exhausted."""
+        host = _get_host(url)
+        semaphore = self._get_semaphore(host)
+        if semaphore is None:
+            yield
+            return
+
+        async with semaphore:
+            await self._wait_for_budget(host)
+            yield
+
+    def observe(self, url: str, response: Any) -> None:
+        """Learn the host's remaining budget from response headers."""
+        headers = getattr(response, "headers", None)
+        if not isinstance(headers, Mapping):
+            return
+
+        now = time.time()
+        budget = self.budgets.setdefault(_get_host(url), HostBudget())
+
+        remaining = _first_number(headers, _REMAINING_HEADERS)
+        if remaining is not None:
+            budget.remaining = int(remaining)
+            reset = _first_number(headers, _RESET_HEADERS)
+            budget.reset_at = _reset_to_epoch(reset, now) if reset is not None else None
+
+        retry_after = parse_retry_after(headers.get("retry-after"), now)
+        if retry_after is not None:
+            budget.blocked_until = max(budget.blocked_until, now + retry_after)
+
+    def get_concurrency(self, host: str) -> int:
+        """Get the concurrency cap for a host, using the most specific configured domain."""
+        matches = [domain for domain in self.host_concurrency if host == domain or host.endswith(f".{domain}")]
+        if not matches:
+            return self.default_concurrency
+        return self.host_concurrency[max(matches, key=len)]
+
+    def get_stats(self) -> dict[str, int]:
+        """Return counters for trace output."""
+        return {
+            "rate_limit_delays": self.delayed_requests,
+            "rate_limit_wait_seconds": round(self.delay_seconds),
+        }
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore | None:
+        """Get the concurrency semaphore for a host in the running asyncio event loop.
+
+        Returns:
+            Semaphore, or None when not running under asyncio (limits are then not enforced)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        loop_semaphores = self._semaphores.setdefault(loop, {})
+        if host not in loop_semaphores:
+            loop_semaphores[host] = asyncio.Semaphore(self.get_concurrency(host))
+        return loop_semaphores[host]
+
+    async def _wait_for_budget(self, host: str) -> None:
+        """Delay until the host accepts requests again, then reserve one request."""
+        budget = self.budgets.get(host)
+        if budget is None:
+            return
+
+        delay = self._compute_delay(budget, time.time())
+        if delay > self.max_wait_seconds:
+            logger.warning(f"Rate limit for {host} resets in {delay:.0f}s, sending request without waiting")
+        elif delay > 0:
+            logger.debug(f"Rate limit for {host} exhausted, waiting {delay:.1f}s")
+            self.delayed_requests += 1
+            self.delay_seconds += delay
+            await asyncio.sleep(delay)
+            self._expire_window(budget, time.time())
+
+        if budget.remaining is not None:
+            # Count in-flight requests against the budget until the server reports again
+            budget.remaining -= 1
+
+    def _compute_delay(self, budget: HostBudget, now: float) -> float:
+        """Get seconds until the host accepts requests."""
+        self._expire_window(budget, now)
+        delay = budget.blocked_until - now
+        if budget.remaining is not None and budget.remaining <= 0 and budget.reset_at is not None:
+            delay = max(delay, budget.reset_at - now)
+        return delay
+
+    # noinspection PyMethodMayBeStatic
+    def _expire_window(self, budget: HostBudget, now: float) -> None:
+        """Forget the remaining budget once its rate limit window has ended."""
+        if budget.reset_at is not None and now >= budget.reset_at:
+            budget.remaining = None
+            budget.reset_at = None
+
+
+def _get_host(url: str) -> str:
+    """Get the lowercase host name of a URL."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def _first_number(headers: Mapping[str, str], names: tuple[str, ...]) -> float | None:
+    """Get the first header among names holding a number."""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def _reset_to_epoch(reset: float, now: float) -> float:
+    """Convert a reset header value (epoch seconds or delay) to an epoch timestamp."""
+    return reset if reset > _EPOCH_THRESHOLD else now + reset
+
+
+def parse_retry_after(value: str | None, now: float) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
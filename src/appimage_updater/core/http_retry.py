@@ -0,0 +1,329 @@
+"""Central retry and hedging engine for HTTP requests.
+
+Idempotent requests failing with a transport error or a transient status
+(429/5xx) are retried with jittered exponential backoff, honouring
+``Retry-After`` when the server provides one. Timeouts are not retried unless
+enabled, since an unresponsive host would cost a full timeout per attempt.
+Operations spanning several requests, such as downloads, are retried through
+the same engine with RetryEngine.call(). Optionally, GET/HEAD requests are
+hedged: when a response takes longer than the observed p95 latency, a second
+identical request is fired and whichever answers first is used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Sequence,
+)
+from dataclasses import dataclass
+import math
+import random
+import time
+from typing import (
+    Any,
+    Generic,
+    TypeVar,
+)
+
+import httpx
+from loguru import logger
+
+from .http_rate_limit import parse_retry_after
+
+
+T = TypeVar("T")
+
+# Methods that can safely be sent more than once
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Methods worth hedging: cheap to duplicate and without side effects
+_HEDGEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+# Statuses signalling a transient server-side condition
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """Retry and hedging settings."""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retry_statuses: frozenset[int] = _RETRY_STATUSES
+    retry_timeouts: bool = False
+    hedge: bool = False
+    hedge_min_samples: int = 20
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+    """Get a full-jitter exponential backoff delay for a zero-based retry attempt."""
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))  # noqa: S311 - not used for security
+
+
+def is_retryable_error(
+    error: BaseException, retry_statuses: frozenset[int] = _RETRY_STATUSES, retry_timeouts: bool = True
+) -> bool:
+    """Check if an error is transient and worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in retry_statuses
+    if isinstance(error, httpx.TimeoutException):
+        return retry_timeouts
+    return isinstance(error, httpx.TransportError | OSError)
+
+
+class LatencyTracker:
+    """Rolling window of request latencies."""
+
+    def __init__(self, window: int = 200) -> None:
+        """Initialize tracker keeping the most recent latencies."""
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        """Record a request latency."""
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float, min_samples: int = 1) -> float | None:
+        """Get a latency percentile, or None with fewer than min_samples recorded."""
+        if len(self._samples) < max(min_samples, 1):
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1)
+        return ordered[max(index, 0)]
+
+
+class RetryEngine:
+    """Retry idempotent requests with jittered backoff and optionally hedge slow ones."""
+
+    def __init__(self, policy: RetryPolicy | None = None) -> None:
+        """Initialize retry engine.
+
+        Args:
+            policy: Retry and hedging settings (defaults to RetryPolicy())
+        """
+        self.policy = policy or RetryPolicy()
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+
+    async def run(self, method: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a request, retrying transient failures of idempotent methods.
+
+        Args:
+            method: HTTP method of the request
+            send: Callable sending the request once and returning the response
+
+        Returns:
+            The first response that is not retried
+        """
+        method = method.upper()
+        if method not in IDEMPOTENT_METHODS:
+            return await send()
+
+        attempt = 0
+        while True:
+            response, delay = await self._try_send(method, send, attempt)
+            if delay is None:
+                return response
+
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        retry_timeouts: bool | None = None,
+        on_retry: Callable[[BaseException], Any] | None = None,
+    ) -> T:
+        """Run an operation spanning several requests, retrying it on transient errors.
+
+        Args:
+            operation: Callable running the operation once, raising on failure
+            retry_timeouts: Whether timeouts are retried (defaults to the policy)
+            on_retry: Called with the error before each retry, e.g. to clean up
+
+        Returns:
+            Result of the first successful run
+        """
+        if retry_timeouts is None:
+            retry_timeouts = self.policy.retry_timeouts
+
+        attempt = 0
+        while True:
+            try:
+                return await operation()
+            except (httpx.HTTPError, OSError) as e:
+                if not self._can_retry_error(e, attempt, retry_timeouts):
+                    raise
+                delay = self._backoff(attempt)
+                logger.debug(f"Attempt {attempt + 1} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                if on_retry is not None:
+                    on_retry(e)
+                self.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def hedge(
+        self,
+        send: Callable[[], Awaitable[T]],
+        delays: Sequence[float],
+        hedge_on: tuple[type[BaseException], ...] = (httpx.TransportError,),
+    ) -> T:
+        """Race identical attempts, starting another after each delay without an answer.
+
+        An attempt failing with an error matching hedge_on starts the next attempt
+        immediately; any other error cancels the race and is raised.
+
+        Args:
+            send: Callable starting one attempt
+            delays: Seconds to wait before each additional attempt
+            hedge_on: Errors after which the remaining attempts keep running
+
+        Returns:
+            Result of the first successful attempt
+        """
+        race = _HedgeRace(asyncio.ensure_future(send()), list(delays))
+        try:
+            while race.tasks:
+                timeout = race.delays[0] if race.delays else None
+                done, _ = await asyncio.wait(race.tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                winner = race.collect(done, hedge_on)
+                if winner is not None:
+                    return self._hedge_result(race, winner)
+                if race.should_launch(done):
+                    self.hedged_requests += 1
+                    race.launch(asyncio.ensure_future(send()))
+        finally:
+            race.cancel()
+
+        raise race.error()
+
+    def get_stats(self) -> dict[str, int]:
+        """Return counters for trace output."""
+        return {
+            "retries": self.retries,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+        }
+
+    async def _try_send(
+        self, method: str, send: Callable[[], Awaitable[Any]], attempt: int
+    ) -> tuple[Any, float | None]:
+        """Send one attempt and get the delay before the next one, or None when done."""
+        try:
+            response = await self._send_once(method, send)
+        except httpx.TransportError as e:
+            if not self._can_retry_error(e, attempt, self.policy.retry_timeouts):
+                raise
+            delay = self._backoff(attempt)
+            logger.debug(f"{method} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            return None, delay
+
+        retry_delay = self._retry_delay(response, attempt)
+        if retry_delay is not None:
+            logger.debug(f"{method} returned {response.status_code}, retrying in {retry_delay:.1f}s")
+        return response, retry_delay
+
+    async def _send_once(self, method: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send one attempt, hedged after the p95 latency when enabled."""
+        hedge_after = self._hedge_delay(method)
+        if hedge_after is None:
+            return await self._timed(send)
+        return await self.hedge(lambda: self._timed(send), [hedge_after])
+
+    def _can_retry_error(self, error: BaseException, attempt: int, retry_timeouts: bool) -> bool:
+        """Check if an error is retried and attempts remain."""
+        return attempt + 1 < self.policy.max_attempts and is_retryable_error(
+            error, self.policy.retry_statuses, retry_timeouts
+        )
+
+    def _hedge_delay(self, method: str) -> float | None:
+        """Get the p95 latency after which to hedge, or None when hedging does not apply."""
+        if not self.policy.hedge or method not in _HEDGEABLE_METHODS:
+            return None
+        return self.latency.percentile(0.95, self.policy.hedge_min_samples)
+
+    def _hedge_result(self, race: _HedgeRace[T], winner: asyncio.Future[T]) -> T:
+        """Get the winning result, counting wins by a hedge over the original attempt."""
+        if winner is not race.first:
+            self.hedge_wins += 1
+        return winner.result()
+
+    async def _timed(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Send a request and record its latency."""
+        start_time = time.monotonic()
+        result = await send()
+        self.latency.record(time.monotonic() - start_time)
+        return result
+
+    def _retry_delay(self, response: Any, attempt: int) -> float | None:
+        """Get the delay before retrying a response, or None if it should be returned."""
+        status_code = getattr(response, "status_code", None)
+        if status_code not in self.policy.retry_statuses or attempt + 1 >= self.policy.max_attempts:
+            return None
+
+        retry_after = _get_retry_after(response)
+        if retry_after is None:
+            return self._backoff(attempt)
+        # Long waits are left to the rate limiter and the caller's error handling
+        return retry_after if retry_after <= self.policy.max_delay else None
+
+    def _backoff(self, attempt: int) -> float:
+        """Get the jittered backoff delay for a retry attempt."""
+        return backoff_delay(attempt, self.policy.base_delay, self.policy.max_delay)
+
+
+class _HedgeRace(Generic[T]):
+    """Attempts racing in RetryEngine.hedge()."""
+
+    def __init__(self, first: asyncio.Future[T], delays: list[float]) -> None:
+        self.first = first
+        self.tasks: list[asyncio.Future[T]] = [first]
+        self.delays = delays
+        self.last_error: BaseException | None = None
+
+    def collect(
+        self, done: set[asyncio.Future[T]], hedge_on: tuple[type[BaseException], ...]
+    ) -> asyncio.Future[T] | None:
+        """Remove finished attempts, returning a successful one and raising unexpected errors."""
+        for task in done:
+            self.tasks.remove(task)
+            error = task.exception()
+            if error is None:
+                return task
+            if not isinstance(error, hedge_on):
+                raise error
+            self.last_error = error
+        return None
+
+    def should_launch(self, done: set[asyncio.Future[T]]) -> bool:
+        """Check if the next attempt is due: its delay elapsed or every running attempt failed."""
+        return bool(self.delays) and (not done or not self.tasks)
+
+    def launch(self, task: asyncio.Future[T]) -> None:
+        """Add an attempt, consuming its delay."""
+        self.delays.pop(0)
+        self.tasks.append(task)
+
+    def cancel(self) -> None:
+        """Cancel attempts still running."""
+        for task in self.tasks:
+            task.cancel()
+
+    def error(self) -> BaseException:
+        """Get the error to raise once every attempt failed."""
+        return self.last_error or httpx.TransportError("All hedged attempts failed")
+
+
+def _get_retry_after(response: Any) -> float | None:
+    """Get the Retry-After delay of a response in seconds."""
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    return parse_retry_after(headers.get("retry-after"), time.time())
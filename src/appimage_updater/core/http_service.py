@@ -4,45 +4,153 @@ from __future__ import annotations
 
 import asyncio
 import atexit
-from collections.abc import Callable
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+)
 import contextlib
 from functools import lru_cache
 import time
 from typing import Any
 
 import httpx
-
+from loguru import logger
+
+from ..config.models import HTTPConfig
+from .http_cache import HTTPResponseCache
+from .http_coalesce import RequestCoalescer
+from .http_pool import (
+    ConnectionStats,
+    build_pool_options,
+    pool_settings_changed,
+)
+from .http_rate_limit import HostRateLimiter
+from .http_retry import (
+    RetryEngine,
+    RetryPolicy,
+)
 from .http_trace import getHTTPTrace
 
 
 # Global HTTP client factory for dependency injection
 _http_client_factory: Callable[..., Any] | None = None
 
+# Client options httpx also accepts per request; these are applied to every request
+# instead of the shared pool so each caller keeps its own timeout profile
+_REQUEST_OPTIONS = ("timeout", "follow_redirects", "headers")
 
-class TracingAsyncClient:
-    """HTTP client wrapper with optional tracing."""
 
-    def __init__(self, client: httpx.AsyncClient, tracer: Any | None = None):
+class TracingAsyncClient:
+    """HTTP client wrapper with optional tracing, response caching, GET coalescing, rate limiting and retries."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        tracer: Any | None = None,
+        cache: HTTPResponseCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        request_options: dict[str, Any] | None = None,
+        retry_engine: RetryEngine | None = None,
+    ) -> None:
         self._client = client
         self._tracer = tracer
+        self._cache = cache
+        self._coalescer = coalescer
+        self._rate_limiter = rate_limiter
+        self._request_options = request_options or {}
+        self._retry_engine = retry_engine
+
+    def _with_request_options(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Merge this client's per-request options (timeout, redirects, headers) into request kwargs."""
+        merged = {**self._request_options, **kwargs}
+        if "headers" in self._request_options and "headers" in kwargs:
+            merged["headers"] = {**dict(self._request_options["headers"]), **dict(kwargs["headers"] or {})}
+        return merged
 
     async def get(self, url: str, **kwargs: Any) -> Any:
-        """GET request with optional tracing."""
+        """GET request with optional tracing and conditional-request caching."""
+        kwargs = self._with_request_options(kwargs)
+        if self._cache is not None:
+            return await self._cached_get(self._cache, url, **kwargs)
         return await self._traced_request("GET", url, self._client.get, url, **kwargs)
 
+    async def _cached_get(self, cache: HTTPResponseCache, url: str, **kwargs: Any) -> Any:
+        """GET request revalidated against the response cache.
+
+        Cache entries are read and written in a worker thread so disk access
+        (including the first-store prune) never blocks the event loop.
+        """
+        key = cache.make_key(url, kwargs.get("params"), kwargs.get("headers"))
+        entry = await asyncio.to_thread(cache.lookup, key)
+        if entry is not None:
+            kwargs["headers"] = {**dict(kwargs.get("headers") or {}), **cache.conditional_headers(entry)}
+
+        response = await self._traced_request("GET", url, self._client.get, url, **kwargs)
+        return await asyncio.to_thread(cache.resolve, key, url, entry, response)
+
+    async def head(self, url: str, **kwargs: Any) -> Any:
+        """HEAD request with optional tracing."""
+        return await self._traced_request("HEAD", url, self._client.head, url, **self._with_request_options(kwargs))
+
     async def post(self, url: str, **kwargs: Any) -> Any:
         """POST request with optional tracing."""
-        return await self._traced_request("POST", url, self._client.post, url, **kwargs)
+        return await self._traced_request("POST", url, self._client.post, url, **self._with_request_options(kwargs))
 
     async def put(self, url: str, **kwargs: Any) -> Any:
         """PUT request with optional tracing."""
-        return await self._traced_request("PUT", url, self._client.put, url, **kwargs)
+        return await self._traced_request("PUT", url, self._client.put, url, **self._with_request_options(kwargs))
 
     async def delete(self, url: str, **kwargs: Any) -> Any:
         """DELETE request with optional tracing."""
-        return await self._traced_request("DELETE", url, self._client.delete, url, **kwargs)
+        return await self._traced_request("DELETE", url, self._client.delete, url, **self._with_request_options(kwargs))
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Streaming request within the host's rate limit, with optional tracing.
+
+        The response is opened like other requests, but is neither cached, shared
+        nor retried since the caller consumes its body as it arrives.
+        """
+        kwargs = self._with_request_options(kwargs)
+        follow_redirects = kwargs.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+        request = self._client.build_request(method, url, **kwargs)
+        response = await self._limited_request(
+            method, url, self._client.send, request, stream=True, follow_redirects=follow_redirects
+        )
+        try:
+            yield response
+        finally:
+            await response.aclose()
 
     async def _traced_request(self, method: str, url: str, request_func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Execute request with optional tracing, sharing identical concurrent GETs."""
+        if self._coalescer is not None and method == "GET":
+            key = self._coalescer.make_key(method, url, kwargs)
+            return await self._coalescer.run(
+                key, lambda: self._execute_request(method, url, request_func, *args, **kwargs)
+            )
+        return await self._execute_request(method, url, request_func, *args, **kwargs)
+
+    async def _execute_request(self, method: str, url: str, request_func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Execute request, retrying transient failures of idempotent methods."""
+        if self._retry_engine is None:
+            return await self._limited_request(method, url, request_func, *args, **kwargs)
+        return await self._retry_engine.run(
+            method, lambda: self._limited_request(method, url, request_func, *args, **kwargs)
+        )
+
+    async def _limited_request(self, method: str, url: str, request_func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Execute request within the host's rate limit, learning limits from the response."""
+        if self._rate_limiter is None:
+            return await self._send_request(method, url, request_func, *args, **kwargs)
+
+        async with self._rate_limiter.slot(url):
+            response = await self._send_request(method, url, request_func, *args, **kwargs)
+        self._rate_limiter.observe(url, response)
+        return response
+
+    async def _send_request(self, method: str, url: str, request_func: Any, *args: Any, **kwargs: Any) -> Any:
         """Execute request with optional tracing."""
         start_time = time.time()
 
@@ -81,22 +189,105 @@ class GlobalHTTPClientImpl:
 
     def __init__(self) -> None:
         self._client: httpx.AsyncClient | None = None
+        self._client_settings: HTTPConfig | None = None
+        self._retired_clients: list[httpx.AsyncClient] = []
         self._tracer: Any | None = None
         self._initialized = False
+        self._settings = HTTPConfig()
+        self._cache: HTTPResponseCache | None = None
+        self._coalescer = RequestCoalescer()
+        self._rate_limiter: HostRateLimiter | None = None
+        self._retry_engine: RetryEngine | None = None
+        self._connection_stats = ConnectionStats()
+
+    def configure(self, settings: HTTPConfig) -> None:
+        """Apply HTTP settings from the global configuration.
+
+        Changed connection pool settings rebuild the shared client on its next use.
+        Re-applying unchanged settings keeps the current cache, rate limiter and
+        retry engine, so every configuration load may call this.
+
+        Args:
+            settings: HTTP section of the global configuration
+        """
+        if settings == self._settings:
+            return
+
+        self._settings = settings
+        self._cache = None
+        self._rate_limiter = None
+        self._retry_engine = None
+
+    def _get_cache(self) -> HTTPResponseCache | None:
+        """Get the response cache, creating it on first use."""
+        if not self._settings.cache_enabled:
+            return None
+
+        if self._cache is None:
+            self._cache = HTTPResponseCache(
+                max_entries=self._settings.cache_max_entries,
+                max_bytes=self._settings.cache_max_size_mb * 1024 * 1024,
+                max_age_seconds=self._settings.cache_max_age_days * 24 * 3600,
+            )
+        return self._cache
+
+    def get_rate_limiter(self) -> HostRateLimiter | None:
+        """Get the per-host rate limiter, creating it on first use."""
+        if not self._settings.rate_limit_enabled:
+            return None
+
+        if self._rate_limiter is None:
+            self._rate_limiter = HostRateLimiter(
+                host_concurrency=dict(self._settings.host_concurrency),
+                default_concurrency=self._settings.default_host_concurrency,
+                max_wait_seconds=self._settings.rate_limit_max_wait_seconds,
+            )
+        return self._rate_limiter
+
+    def get_retry_engine(self) -> RetryEngine:
+        """Get the retry engine, creating it on first use."""
+        if self._retry_engine is None:
+            self._retry_engine = RetryEngine(
+                RetryPolicy(
+                    max_attempts=self._settings.retry_max_attempts,
+                    base_delay=self._settings.retry_backoff_seconds,
+                    max_delay=self._settings.retry_max_delay_seconds,
+                    retry_timeouts=self._settings.retry_timeouts,
+                    hedge=self._settings.hedge_requests,
+                )
+            )
+        return self._retry_engine
+
+    def get_stats(self) -> dict[str, int]:
+        """Get HTTP counters collected during this process (cache hits/misses, coalesced requests, ...)."""
+        stats: dict[str, int] = self._coalescer.get_stats()
+        if self._cache is not None:
+            stats.update(self._cache.stats.as_dict())
+        if self._rate_limiter is not None:
+            stats.update(self._rate_limiter.get_stats())
+        if self._retry_engine is not None:
+            stats.update(self._retry_engine.get_stats())
+        stats.update(self._connection_stats.get_stats())
+        return stats
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure the global client is initialized with the current pool settings."""
+        client_settings = self._client_settings
+        if self._client is not None and client_settings and pool_settings_changed(client_settings, self._settings):
+            # Requests still running on the old pool finish there; it is closed with the service
+            logger.debug("HTTP connection pool settings changed, rebuilding the shared client")
+            self._retired_clients.append(self._client)
+            self._client = None
 
-    async def _ensure_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
-        """Ensure the global client is initialized."""
         if self._client is None:
             # Default client configuration optimized for connection pooling
-            default_config: dict[str, Any] = {
-                "timeout": httpx.Timeout(30.0),
-                "follow_redirects": True,
-                "limits": httpx.Limits(max_keepalive_connections=20, max_connections=100),
-            }
-            # Merge with any provided kwargs
-            default_config.update(client_kwargs)
-
-            self._client = httpx.AsyncClient(**default_config)
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                follow_redirects=True,
+                event_hooks={"request": [self._connection_stats.attach]},
+                **build_pool_options(self._settings),
+            )
+            self._client_settings = self._settings
 
             # Register cleanup on exit
             if not self._initialized:
@@ -105,24 +296,70 @@ class GlobalHTTPClientImpl:
 
         return self._client
 
-    async def get_client(self, **kwargs: Any) -> TracingAsyncClient:
-        """Get the global HTTP client with tracing."""
-        client = await self._ensure_client(**kwargs)
-        return TracingAsyncClient(client, self._tracer)
+    async def get_client(self, coalesce: bool = True, retry: bool = True, **kwargs: Any) -> TracingAsyncClient:
+        """Get the global HTTP client with tracing.
+
+        Timeout, redirect and header options are applied to each request made through
+        the returned wrapper, so callers share one connection pool while keeping their
+        own timeouts. Pool-wide options (limits, HTTP/2, max_redirects) come from the
+        HTTP settings only.
+
+        Args:
+            coalesce: Let identical concurrent GETs share one request
+            retry: Retry transient failures through the retry engine
+            **kwargs: Per-request options (timeout, follow_redirects, headers)
+
+        Raises:
+            TypeError: If options other than per-request ones are given
+        """
+        client = await self._ensure_client()
+        return self.wrap_client(client, coalesce, retry, **kwargs)
+
+    def wrap_client(
+        self, client: httpx.AsyncClient, coalesce: bool = True, retry: bool = True, **kwargs: Any
+    ) -> TracingAsyncClient:
+        """Send a caller's own client's requests through the shared tracing, caching, coalescing, limits and retries.
+
+        For API clients that keep a connection pool of their own, e.g. with authentication headers.
+
+        Args:
+            client: Client sending the requests
+            coalesce: Let identical concurrent GETs share one request
+            retry: Retry transient failures through the retry engine
+            **kwargs: Per-request options (timeout, follow_redirects, headers)
+
+        Raises:
+            TypeError: If options other than per-request ones are given
+        """
+        unsupported = sorted(set(kwargs) - set(_REQUEST_OPTIONS))
+        if unsupported:
+            raise TypeError(f"Unsupported HTTP client options: {', '.join(unsupported)}")
+
+        return TracingAsyncClient(
+            client,
+            self._tracer,
+            self._get_cache(),
+            self._coalescer if coalesce else None,
+            self.get_rate_limiter(),
+            kwargs,
+            self.get_retry_engine() if retry else None,
+        )
 
     def set_tracer(self, tracer: Any | None) -> None:
         """Set the global tracer."""
         self._tracer = tracer
 
     async def close(self) -> None:
-        """Close the global HTTP client."""
+        """Close the global HTTP client and any client replaced after a settings change."""
+        while self._retired_clients:
+            await self._retired_clients.pop().aclose()
         if self._client:
             await self._client.aclose()
             self._client = None
 
     def _cleanup_sync(self) -> None:
         """Synchronous cleanup for atexit."""
-        if self._client:
+        if self._client or self._retired_clients:
             try:
                 self._attempt_graceful_close()
             except Exception:
@@ -186,11 +423,12 @@ def disable_global_trace() -> None:
     """Disable global HTTP tracing."""
 
     tracer = getHTTPTrace()
+    global_client = GlobalHTTPClient()
     if tracer.enabled and tracer.output_formatter:
+        tracer.trace_summary(global_client.get_stats())
         tracer.output_formatter.print_message("HTTP TRACE: Stopping request tracking")
     tracer.enabled = False
 
-    global_client = GlobalHTTPClient()
     global_client.set_tracer(None)
 
 
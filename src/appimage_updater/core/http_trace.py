@@ -92,6 +92,18 @@ class HTTPTraceImpl:
         """
         return "timeout" in error_str.lower() or "TimeoutException" in error_type
 
+    def trace_summary(self, stats: dict[str, int]) -> None:
+        """Print trace message summarizing HTTP counters (cache hits, misses, ...).
+
+        Args:
+            stats: Counter name to value mapping
+        """
+        if not (self.enabled and self.output_formatter) or not stats:
+            return
+
+        summary = ", ".join(f"{name.replace('_', ' ')}: {value}" for name, value in stats.items())
+        self.output_formatter.print_message(f"HTTP TRACE: {summary}")
+
     def set_output_formatter(self, output_formatter: Any) -> None:
         """Set the output formatter for trace messages."""
         self.output_formatter = output_formatter
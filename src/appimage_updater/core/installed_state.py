@@ -0,0 +1,249 @@
+"""Persistent index of the installed state of each application.
+
+Finding the installed version of an application means globbing its download
+directory for ``.info``, ``.current`` and AppImage files and parsing their
+names, for every application on every ``check``. This index keeps, per
+application, the version found together with the current file's path, size,
+modification time and hash, and the modification time of its download
+directory. Files are created, renamed and removed only through directory
+entries, which update the directory's modification time, so an entry whose
+directory, file and ``.info`` file are unchanged is still correct and is
+validated with a few ``stat`` calls instead of a rescan.
+
+A change made within RACY_MTIME_WINDOW_NS of recording may leave timestamps
+unchanged, so such "racy" entries, like one recorded right after an update, are
+confirmed against their ``.info`` file once and then re-stamped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from loguru import logger
+
+from ..config.models import ApplicationConfig
+from .http_cache import get_default_cache_dir
+
+
+# Bumped when the stored format changes, so older indexes are ignored
+INSTALLED_STATE_FORMAT = 1
+
+# Modification times this close to when an entry was recorded are not trusted:
+# file systems with coarse timestamps may not tell a later change apart from it
+RACY_MTIME_WINDOW_NS = 2 * 1_000_000_000
+
+
+def get_default_installed_state_path() -> Path:
+    """Get default path of the installed-state index, next to the HTTP response cache."""
+    return get_default_cache_dir().parent / "installed.json"
+
+
+@dataclass
+class InstalledState:
+    """Installed state of an application, as recorded in the index."""
+
+    version: str
+    download_dir: str
+    dir_mtime_ns: int
+    recorded_at_ns: int
+    file: str | None = None
+    size: int | None = None
+    mtime_ns: int | None = None
+    sha256: str | None = None
+    info_file: str | None = None
+    info_mtime_ns: int | None = None
+
+
+class InstalledStateIndex:
+    """On-disk index of the installed version and current file of each application.
+
+    The index is loaded on first use. Changes are kept in memory and written in
+    one atomic update by flush(), which commands call when they finish.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize installed-state index.
+
+        Args:
+            path: Index file (defaults to one in the user cache dir)
+        """
+        self.path = path
+        self._entries: dict[str, InstalledState] = {}
+        self._loaded_path: Path | None = None
+        self._dirty = False
+
+    def lookup(
+        self, app_config: ApplicationConfig, confirm: Callable[[InstalledState], bool] | None = None
+    ) -> InstalledState | None:
+        """Get the recorded state of an application if its files are unchanged since.
+
+        Args:
+            app_config: Application configuration
+            confirm: Check of a racy entry against file contents; racy entries are not used without it
+
+        Returns:
+            Recorded state, or None if the download directory must be rescanned
+        """
+        entry = self._get_entries().get(app_config.name)
+        if entry is None or entry.download_dir != str(app_config.download_dir):
+            return None
+        if not self._is_unchanged(entry):
+            logger.debug(f"Installed state of {app_config.name} is outdated, rescanning")
+            return None
+        if self._is_racy(entry):
+            if confirm is None or not confirm(entry):
+                logger.debug(f"Installed state of {app_config.name} was recorded too close to a change, rescanning")
+                return None
+            # Confirmed now that the window has passed, so timestamps alone suffice from here on
+            entry.recorded_at_ns = time.time_ns()
+            self._dirty = True
+        return entry
+
+    def record(
+        self,
+        app_config: ApplicationConfig,
+        version: str,
+        file_path: Path | None = None,
+        info_path: Path | None = None,
+        sha256: str | None = None,
+    ) -> bool:
+        """Record the installed state of an application.
+
+        Call this once all changes to the download directory are done.
+
+        Args:
+            app_config: Application configuration
+            version: Installed version
+            file_path: Current AppImage file the version belongs to
+            info_path: .info file the version was read from
+            sha256: Hash of the current file, kept from an earlier entry of the same file if not given
+
+        Returns:
+            True if the state was recorded
+        """
+        try:
+            entry = InstalledState(
+                version=version,
+                download_dir=str(app_config.download_dir),
+                dir_mtime_ns=app_config.download_dir.stat().st_mtime_ns,
+                recorded_at_ns=time.time_ns(),
+            )
+            if file_path is not None:
+                file_stat = file_path.stat()
+                entry.file, entry.size, entry.mtime_ns = str(file_path), file_stat.st_size, file_stat.st_mtime_ns
+                entry.sha256 = sha256 or self._get_known_hash(app_config, entry)
+            if info_path is not None:
+                entry.info_file, entry.info_mtime_ns = str(info_path), info_path.stat().st_mtime_ns
+
+            self._get_entries()[app_config.name] = entry
+            self._dirty = True
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to record installed state of {app_config.name}: {e}")
+            return False
+        return True
+
+    def invalidate(self, app_config: ApplicationConfig) -> None:
+        """Drop the recorded state of an application, forcing a rescan on next lookup."""
+        if self._get_entries().pop(app_config.name, None) is not None:
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write changes made since the last flush to disk in one atomic update."""
+        if not self._dirty:
+            return
+        try:
+            self._write_entries(self._entries)
+        except OSError as e:
+            logger.debug(f"Failed to update installed-state index: {e}")
+            return
+        self._dirty = False
+
+    def _get_path(self) -> Path:
+        """Get the index file, resolved on use so the cache dir may change between runs."""
+        return self.path or get_default_installed_state_path()
+
+    def _get_known_hash(self, app_config: ApplicationConfig, entry: InstalledState) -> str | None:
+        """Get the hash of an earlier entry describing the same, unchanged file."""
+        previous = self._get_entries().get(app_config.name)
+        if previous is None or (previous.file, previous.size, previous.mtime_ns) != (
+            entry.file,
+            entry.size,
+            entry.mtime_ns,
+        ):
+            return None
+        return previous.sha256
+
+    # noinspection PyMethodMayBeStatic
+    def _get_checks(self, entry: InstalledState) -> list[tuple[str, int | None, int | None]]:
+        """Get the (path, mtime, size) of the directory and files an entry depends on."""
+        checks: list[tuple[str, int | None, int | None]] = [(entry.download_dir, entry.dir_mtime_ns, None)]
+        if entry.file is not None:
+            checks.append((entry.file, entry.mtime_ns, entry.size))
+        if entry.info_file is not None:
+            checks.append((entry.info_file, entry.info_mtime_ns, None))
+        return checks
+
+    def _is_unchanged(self, entry: InstalledState) -> bool:
+        """Check that an entry's directory and files still have their recorded timestamps and sizes."""
+        for path, mtime_ns, size in self._get_checks(entry):
+            if mtime_ns is None:
+                return False
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if stat.st_mtime_ns != mtime_ns or (size is not None and stat.st_size != size):
+                return False
+        return True
+
+    def _is_racy(self, entry: InstalledState) -> bool:
+        """Check if any timestamp is too close to the recording time to rule out a later, unnoticed change."""
+        return any(
+            mtime_ns is not None and mtime_ns >= entry.recorded_at_ns - RACY_MTIME_WINDOW_NS
+            for _, mtime_ns, _ in self._get_checks(entry)
+        )
+
+    def _get_entries(self) -> dict[str, InstalledState]:
+        """Get the index entries, loading them from disk on first use."""
+        path = self._get_path()
+        if self._loaded_path != path:
+            self._entries = self._read_entries(path)
+            self._loaded_path = path
+            self._dirty = False
+        return self._entries
+
+    # noinspection PyMethodMayBeStatic
+    def _read_entries(self, path: Path) -> dict[str, InstalledState]:
+        """Read the index from disk, starting over when it is missing or unreadable."""
+        if not path.exists():
+            return {}
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("format") != INSTALLED_STATE_FORMAT:
+                return {}
+            return {name: InstalledState(**entry) for name, entry in data["apps"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug(f"Discarding unreadable installed-state index {path}: {e}")
+            return {}
+
+    def _write_entries(self, entries: dict[str, InstalledState]) -> None:
+        """Atomically write the index to disk."""
+        path = self._get_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data: dict[str, Any] = {
+            "format": INSTALLED_STATE_FORMAT,
+            "apps": {name: asdict(entry) for name, entry in entries.items()},
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
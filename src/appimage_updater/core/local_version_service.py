@@ -12,6 +12,10 @@ from loguru import logger
 
 from appimage_updater.config.models import ApplicationConfig
 from appimage_updater.core.info_file_service import InfoFileService
+from appimage_updater.core.installed_state import (
+    InstalledState,
+    InstalledStateIndex,
+)
 from appimage_updater.core.version_parser import VersionParser
 from appimage_updater.utils.version_file_utils import (
     extract_versions_from_files,
@@ -22,13 +26,25 @@ from appimage_updater.utils.version_file_utils import (
 class LocalVersionService:
     """Service for determining current installed version from local files."""
 
-    def __init__(self, version_parser: VersionParser | None = None, info_service: InfoFileService | None = None):
-        """Initialize with optional dependencies for testing."""
+    def __init__(
+        self,
+        version_parser: VersionParser | None = None,
+        info_service: InfoFileService | None = None,
+        installed_state: InstalledStateIndex | None = None,
+    ):
+        """Initialize with optional dependencies for testing.
+
+        Without an installed-state index, every lookup scans the download directory.
+        """
         self.version_parser = version_parser or VersionParser()
         self.info_service = info_service or InfoFileService()
+        self.installed_state = installed_state
 
     def get_current_version(self, app_config: ApplicationConfig) -> str | None:
-        """Get current version using priority: .info -> .current -> filename analysis.
+        """Get current version using priority: index -> .info -> .current -> filename analysis.
+
+        The installed-state index answers while the download directory is unchanged;
+        otherwise the directory is scanned and the index updated.
 
         Args:
             app_config: Application configuration
@@ -36,49 +52,91 @@ class LocalVersionService:
         Returns:
             Current version string or None if not determinable
         """
-        # Strategy 1: Try to get version from .info file
-        version = self._get_version_from_info_file(app_config)
+        if self.installed_state is not None:
+            state = self.installed_state.lookup(app_config, confirm=self._confirm_installed_state)
+            if state is not None:
+                logger.debug(f"Found version from installed-state index: {state.version}")
+                return state.version
+
+        version, file_path, info_path = self._scan_current_version(app_config)
+        if self.installed_state is not None:
+            if version:
+                self.installed_state.record(app_config, version, file_path, info_path)
+            else:
+                self.installed_state.invalidate(app_config)
+        return version
+
+    def record_installed_file(self, app_config: ApplicationConfig, file_path: Path, sha256: str | None = None) -> None:
+        """Record a newly installed file, and the version in its .info file, in the index.
+
+        Args:
+            app_config: Application configuration
+            file_path: Installed file, after rotation
+            sha256: Hash of the installed file
+        """
+        if self.installed_state is None:
+            return
+
+        info_path = file_path.with_name(f"{file_path.name}.info")
+        version = self._read_version_from_info_file(info_path)
         if version:
+            self.installed_state.record(app_config, version, file_path, info_path, sha256)
+        else:
+            self.installed_state.invalidate(app_config)
+
+    def _scan_current_version(self, app_config: ApplicationConfig) -> tuple[str | None, Path | None, Path | None]:
+        """Scan the download directory for the current version.
+
+        Returns:
+            Version, and the current file and .info file it was found from, if known
+        """
+        # Strategy 1: Try to get version from .info file
+        info_file = self.info_service.find_info_file(app_config)
+        version = self._read_version_from_info_file(info_file) if info_file else None
+        if version and info_file:
             logger.debug(f"Found version from .info file: {version}")
-            return version
+            info_target = info_file.with_suffix("")
+            return version, info_target if info_target.is_file() else None, info_file
 
         # Strategy 2: Try to parse version from .current file (if exists)
-        version = self._get_version_from_current_file(app_config)
+        version, current_file = self._get_version_from_current_file(app_config)
         if version:
             logger.debug(f"Found version from .current file: {version}")
-            return version
+            return version, current_file, None
 
         # Strategy 3: Analyze existing AppImage files to determine current version
         version = self._get_version_from_files(app_config)
         if version:
             logger.debug(f"Found version from file analysis: {version}")
-            return version
+            return version, None, None
 
         logger.debug("No current version could be determined")
-        return None
+        return None, None, None
 
-    def _get_version_from_info_file(self, app_config: ApplicationConfig) -> str | None:
-        """Get version from .info file."""
-        info_file = self.info_service.find_info_file(app_config)
-        if not info_file:
-            return None
+    def _confirm_installed_state(self, state: InstalledState) -> bool:
+        """Confirm a recently recorded state by re-reading the version from its .info file."""
+        if state.info_file is None:
+            return False
+        return self._read_version_from_info_file(Path(state.info_file)) == state.version
 
+    def _read_version_from_info_file(self, info_file: Path) -> str | None:
+        """Read and normalize the version of a .info file."""
         version = self.info_service.read_info_file(info_file)
         if version:
             return self.version_parser.normalize_version_string(version)
 
         return None
 
-    def _get_version_from_current_file(self, app_config: ApplicationConfig) -> str | None:
+    def _get_version_from_current_file(self, app_config: ApplicationConfig) -> tuple[str | None, Path | None]:
         """Extract version from .current file by parsing the filename."""
         download_dir = app_config.download_dir
         if not download_dir.exists():
-            return None
+            return None, None
 
         # Look for .current files
         current_files = list(download_dir.glob("*.current"))
         if not current_files:
-            return None
+            return None, None
 
         current_file = current_files[0]
         filename = current_file.name
@@ -87,10 +145,10 @@ class LocalVersionService:
         version = self.version_parser.extract_version_from_filename(filename)
         if version:
             logger.debug(f"Extracted version '{version}' from current file: {filename}")
-            return version
+            return version, current_file
 
         logger.debug(f"Could not extract version from current file: {filename}")
-        return None
+        return None, None
 
     def _get_version_from_files(self, app_config: ApplicationConfig) -> str | None:
         """Determine current version by analyzing existing files in download directory."""
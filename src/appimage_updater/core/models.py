@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 import re
@@ -14,9 +15,21 @@ from pydantic import (
     BaseModel,
     BeforeValidator,
     Field,
+    GetJsonSchemaHandler,
+    ModelWrapValidatorHandler,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+    model_validator,
 )
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
 
 from ..config.models import ApplicationConfig
+from .asset_attributes import (
+    AssetAttributes,
+    get_asset_attributes,
+)
 from .system_info import (
     get_system_info,
     is_compatible_architecture,
@@ -48,113 +61,200 @@ class Asset(BaseModel):
         default=None,
         description="Associated checksum file asset",
     )
+    digest: str | None = Field(
+        default=None,
+        description="Digest provided by the repository, as 'algorithm:hex' (e.g. 'sha256:...')",
+    )
 
     @property
     def download_url(self) -> str:
         """Get download URL (alias for url)."""
         return self.url
 
+    @property
+    def attributes(self) -> AssetAttributes:
+        """Get the attributes parsed from the filename (cached per filename)."""
+        return get_asset_attributes(self.name)
+
     @property
     def architecture(self) -> str | None:
         """Extract architecture from filename."""
-        return self._parse_architecture()
+        return self.attributes.architecture
 
     @property
     def platform(self) -> str | None:
         """Extract platform from filename."""
-        return self._parse_platform()
+        return self.attributes.platform
 
     @property
     def file_extension(self) -> str | None:
         """Extract file extension from filename."""
-        return self._parse_file_extension()
-
-    def _parse_architecture(self) -> str | None:
-        """Parse architecture from asset filename."""
-        filename = self.name.lower()
-
-        # Architecture patterns (ordered by specificity)
-        arch_patterns = [
-            r"x86_64",
-            r"amd64",
-            r"x64",
-            r"aarch64",
-            r"arm64",
-            r"armv7l",
-            r"armv7",
-            r"armhf",
-            r"i386",
-            r"i686",
-            r"x86",
-        ]
-
-        for pattern in arch_patterns:
-            if re.search(rf"\b{pattern}\b", filename):
-                return pattern
-
-        return None
-
-    def _parse_platform(self) -> str | None:
-        """Parse platform from asset filename."""
-        filename = self.name.lower()
-
-        # Platform patterns
-        # noinspection SpellCheckingInspection
-        platform_patterns = [
-            (r"\blinux\b", "linux"),
-            (r"\bdarwin\b|\bmacos\b", "darwin"),
-            (r"\bwindows?\b|\bwin32\b|\bwin64\b", "win32"),
-        ]
-
-        for pattern, platform_name in platform_patterns:
-            if re.search(pattern, filename):
-                return platform_name
-
-        return None
-
-    def _parse_file_extension(self) -> str | None:
-        """Parse file extension from asset filename."""
-        filename = self.name.lower()
-
-        # Complex extension patterns (check longer patterns first)
-        extensions = [
-            ".pkg.tar.zst",
-            ".pkg.tar.xz",
-            ".tar.gz",
-            ".tar.xz",
-            ".tar.bz2",
-            ".appimage",
-            ".deb",
-            ".rpm",
-            ".dmg",
-            ".pkg",
-            ".exe",
-            ".msi",
-            ".zip",
-        ]
-
-        for ext in extensions:
-            if filename.endswith(ext):
-                return ext
-
-        # Fallback to simple extension
-        if "." in filename:
-            return "." + filename.split(".")[-1]
-
-        return None
+        return self.attributes.file_extension
+
+
+class RawAsset:
+    """Unvalidated asset as listed by a repository API.
+
+    Releases often list dozens of files of which an application wants one, so
+    parsers keep assets in this compact form and only the assets that are
+    selected or displayed are converted to validated Asset models.
+    """
+
+    __slots__ = ("_asset", "checksum_asset", "created_at", "digest", "name", "size", "url")
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        size: int = 0,
+        created_at: datetime | str | None = None,
+        checksum_asset: RawAsset | None = None,
+        digest: str | None = None,
+    ) -> None:
+        """Initialize raw asset.
+
+        Args:
+            name: Asset filename
+            url: Download URL
+            size: File size in bytes (0 when unknown)
+            created_at: Creation time, as a datetime or ISO 8601 string (conversion time when unknown)
+            checksum_asset: Associated checksum file
+            digest: Digest provided by the repository, as "algorithm:hex"
+        """
+        self.name = name
+        self.url = url
+        self.size = size
+        self.created_at = created_at
+        self.checksum_asset = checksum_asset
+        self.digest = digest
+        self._asset: Asset | None = None
+
+    def to_asset(self) -> Asset:
+        """Get the validated Asset model, converting on first use."""
+        if self._asset is None:
+            self._asset = Asset(
+                name=self.name,
+                url=self.url,
+                size=self.size,
+                created_at=_parse_datetime(self.created_at or datetime.now()),
+                checksum_asset=self.checksum_asset.to_asset() if self.checksum_asset else None,
+                digest=self.digest,
+            )
+        return self._asset
+
+    def __eq__(self, other: object) -> bool:
+        """Compare raw assets by value, ignoring whether they were converted."""
+        if not isinstance(other, RawAsset):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _RAW_ASSET_FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show the raw asset fields."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _RAW_ASSET_FIELDS)
+        return f"RawAsset({fields})"
+
+
+_RAW_ASSET_FIELDS = ("name", "url", "size", "created_at", "checksum_asset", "digest")
+
+_ASSET_LIST_ADAPTER: TypeAdapter[list[Asset]] = TypeAdapter(list[Asset])
 
 
 class Release(BaseModel):
-    """Represents a software release."""
+    """Represents a software release.
+
+    Releases parsed from repository APIs hold their assets as RawAsset objects;
+    they are converted to Asset models when ``assets`` is first read (including
+    by model_dump()), or one by one as they pass filter_assets().
+    """
 
     version: str = Field(description="Release version")
     tag_name: str = Field(description="Git tag name")
     name: str | None = Field(default=None, description="Release name")
     published_at: datetime = Field(description="Release publication time")
-    assets: list[Asset] = Field(description="Available assets")
     is_prerelease: bool = Field(default=False, description="Is prerelease")
     is_draft: bool = Field(default=False, description="Is draft")
 
+    _assets: list[Asset] | None = PrivateAttr(default=None)
+    _raw_assets: list[RawAsset] = PrivateAttr(default_factory=list)
+
+    def __init__(
+        self,
+        assets: list[Asset] | None = None,
+        raw_assets: list[RawAsset] | None = None,
+        **data: Any,
+    ) -> None:
+        """Initialize release.
+
+        Args:
+            assets: Available assets
+            raw_assets: Available assets in unvalidated form, converted on demand
+            **data: Release fields
+        """
+        super().__init__(assets=assets, raw_assets=raw_assets, **data)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _validate_assets(cls, data: Any, handler: ModelWrapValidatorHandler[Release]) -> Release:
+        """Validate assets, and keep raw assets unconverted, alongside the other fields."""
+        if not isinstance(data, dict):
+            return handler(data)
+
+        data = dict(data)
+        assets = data.pop("assets", None)
+        raw_assets = data.pop("raw_assets", None)
+        release = handler(data)
+        if assets is not None:
+            release._assets = _ASSET_LIST_ADAPTER.validate_python(assets)
+        release._raw_assets = raw_assets or []
+        return release
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        """List assets in the input schema too, since the validator accepts them."""
+        json_schema = handler.resolve_ref_schema(handler(core_schema))
+        if handler.mode == "validation":
+            assets_schema = handler(_ASSET_LIST_ADAPTER.core_schema)
+            json_schema["properties"]["assets"] = {
+                **assets_schema,
+                "title": "Assets",
+                "description": "Available assets",
+            }
+        return json_schema
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def assets(self) -> list[Asset]:
+        """Get available assets, converting raw assets on first access."""
+        if self._assets is None:
+            self._assets = [raw_asset.to_asset() for raw_asset in self._raw_assets]
+        return self._assets
+
+    def __eq__(self, other: object) -> bool:
+        """Compare releases by value, including their assets however they were given."""
+        if not isinstance(other, Release):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__ and self.assets == other.assets
+
+    @property
+    def has_assets(self) -> bool:
+        """Check if the release has any assets, without converting them."""
+        return bool(self._assets if self._assets is not None else self._raw_assets)
+
+    def filter_assets(self, predicate: Callable[[str], Any]) -> list[Asset]:
+        """Get the assets whose names satisfy predicate, converting only those.
+
+        Args:
+            predicate: Test applied to each asset name
+
+        Returns:
+            List of matching assets, in release order
+        """
+        if self._assets is not None:
+            return [asset for asset in self._assets if predicate(asset.name)]
+        return [raw_asset.to_asset() for raw_asset in self._raw_assets if predicate(raw_asset.name)]
+
     def get_matching_assets(self, pattern: str, filter_compatible: bool = False) -> list[Asset]:
         """Get assets matching the given pattern.
 
@@ -165,8 +265,7 @@ class Release(BaseModel):
         Returns:
             List of matching assets, optionally filtered for compatibility
         """
-        regex = re.compile(pattern)
-        matching_assets = [asset for asset in self.assets if regex.search(asset.name)]
+        matching_assets = self.filter_assets(re.compile(pattern).search)
 
         if filter_compatible:
             return self._filter_compatible_assets(matching_assets)
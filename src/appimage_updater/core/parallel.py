@@ -3,27 +3,110 @@
 from __future__ import annotations
 
 import asyncio
+from collections import (
+    Counter,
+    deque,
+)
 from collections.abc import (
+    AsyncIterator,
     Callable,
     Coroutine,
 )
+import time
 from typing import Any
+from urllib.parse import urlparse
 
 from loguru import logger
 
 
+# Items processed at once, overall and per host
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_HOST_CONCURRENCY = 4
+
+
+def get_item_host(item: Any) -> str:
+    """Get the host of an item's URL (applications are scheduled per repository host)."""
+    return urlparse(getattr(item, "url", None) or "").netloc.lower()
+
+
+class _HostQueues:
+    """Pending items queued per host, handed out earliest-ranked first among hosts with free slots."""
+
+    def __init__(self, items: list[Any], host_key: Callable[[Any], str], priority: Callable[[Any], Any] | None) -> None:
+        order = list(range(len(items)))
+        if priority is not None:
+            order.sort(key=lambda index: (priority(items[index]), index))
+        self._rank = {index: rank for rank, index in enumerate(order)}
+        self._queues: dict[str, deque[int]] = {}
+        for index in order:
+            self._queues.setdefault(host_key(items[index]), deque()).append(index)
+        self.active: Counter[str] = Counter()
+
+    def __bool__(self) -> bool:
+        """Check if any items are pending."""
+        return any(self._queues.values())
+
+    def drain(self) -> list[int]:
+        """Remove and return all pending items, earliest-ranked first."""
+        indexes = sorted((index for queue in self._queues.values() for index in queue), key=self._rank.__getitem__)
+        self._queues.clear()
+        return indexes
+
+    def take(self, host_limit: int) -> tuple[int, str] | None:
+        """Take the next item of a host below host_limit, or None if every such host is idle or full."""
+        best: tuple[int, str] | None = None
+        for host, queue in self._queues.items():
+            if not queue or self.active[host] >= host_limit:
+                continue
+            if best is None or self._rank[queue[0]] < self._rank[best[0]]:
+                best = (queue[0], host)
+
+        if best is not None:
+            self._queues[best[1]].popleft()
+            self.active[best[1]] += 1
+        return best
+
+
 class ConcurrentProcessor:
-    """Handles concurrent processing of application checks using async concurrency.
+    """Handles concurrent processing of application checks using a bounded worker pool.
+
+    At most max_concurrency items are processed at once, and at most
+    host_concurrency of them for any one host, so hundreds of applications
+    neither open hundreds of connections at the same moment nor let one slow
+    host take every slot. Results are available as each item completes.
 
-    This processor uses asyncio.gather() to run multiple I/O-bound tasks concurrently,
-    which is ideal for network operations like checking GitHub repositories for updates.
+    Items can be given a time budget each, and the run as a whole a deadline.
+    Items exceeding either are cancelled and reported through on_timeout, so
+    one unresponsive host cannot stall the run.
     """
 
-    def __init__(self) -> None:
-        """Initialize the concurrent processor."""
-        pass
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+        host_key: Callable[[Any], str] = get_item_host,
+        item_timeout: float | None = None,
+        deadline: float | None = None,
+        on_timeout: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Initialize the concurrent processor.
+
+        Args:
+            max_concurrency: Maximum items processed at once
+            host_concurrency: Maximum items processed at once per host
+            host_key: Function giving the host an item is limited by
+            item_timeout: Seconds each item may take (None for no limit)
+            deadline: time.monotonic() value by which all items must be done (None for no limit)
+            on_timeout: Function giving the result of an item that ran out of time;
+                without it, running out of time raises TimeoutError
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.host_concurrency = max(host_concurrency, 1)
+        self.host_key = host_key
+        self.item_timeout = item_timeout
+        self.deadline = deadline
+        self.on_timeout = on_timeout
 
-    # noinspection PyMethodMayBeStatic
     async def process_items_async(
         self,
         items: list[Any],
@@ -38,7 +121,7 @@ class ConcurrentProcessor:
             progress_callback: Optional callback for progress updates (current, total, description)
 
         Returns:
-            List of processing results
+            List of processing results, in the order of the items
         """
         total_items = len(items)
 
@@ -47,6 +130,99 @@ class ConcurrentProcessor:
 
         return await self._process_concurrently(items, async_worker_func, progress_callback, total_items)
 
+    async def iter_completed(
+        self,
+        items: list[Any],
+        async_worker_func: Callable[[Any], Coroutine[Any, Any, Any]],
+        priority: Callable[[Any], Any] | None = None,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Process items concurrently, yielding (index, result) as each item completes.
+
+        Items start in list order, or by ascending priority if given, skipping
+        items of hosts already at their limit. Leaving the iteration early
+        cancels the items still running. Once the deadline passes, running
+        items are cancelled and they and the items not yet started are
+        yielded as timed out.
+
+        Args:
+            items: List of items to process
+            async_worker_func: Async function to process each item
+            priority: Optional function ranking items, lowest first
+
+        Raises:
+            Exception: The first exception raised by async_worker_func
+            TimeoutError: If an item runs out of time and no on_timeout is set
+        """
+        pending = _HostQueues(items, self.host_key, priority)
+        running: dict[asyncio.Task[Any], tuple[int, str]] = {}
+        try:
+            while pending or running:
+                while len(running) < self.max_concurrency:
+                    next_item = pending.take(self.host_concurrency)
+                    if next_item is None:
+                        break
+                    index, host = next_item
+                    running[asyncio.ensure_future(self._run_item(items[index], async_worker_func))] = (index, host)
+
+                done, _ = await asyncio.wait(
+                    running, timeout=self._get_remaining_time(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    index, host = running.pop(task)
+                    pending.active[host] -= 1
+                    yield index, task.result()
+
+            if running or pending:
+                logger.debug(f"Deadline reached with {len(running)} items running")
+                timed_out = [index for index, _ in running.values()] + pending.drain()
+                await self._cancel(running)
+                for index in timed_out:
+                    yield index, self._get_timeout_result(items[index])
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _run_item(self, item: Any, async_worker_func: Callable[[Any], Coroutine[Any, Any, Any]]) -> Any:
+        """Process an item within its time budget and the deadline."""
+        timeout = self._get_item_timeout()
+        if timeout is None:
+            return await async_worker_func(item)
+
+        try:
+            return await asyncio.wait_for(async_worker_func(item), timeout)
+        except TimeoutError:
+            logger.debug(f"{getattr(item, 'name', 'Item')} ran out of time after {timeout:.1f}s")
+            return self._get_timeout_result(item)
+
+    def _get_item_timeout(self) -> float | None:
+        """Get the seconds an item starting now may take, if limited."""
+        limits = [limit for limit in (self.item_timeout, self._get_remaining_time()) if limit is not None]
+        return min(limits) if limits else None
+
+    def _get_remaining_time(self) -> float | None:
+        """Get the seconds left until the deadline, if any."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def _get_timeout_result(self, item: Any) -> Any:
+        """Get the result of an item that ran out of time."""
+        if self.on_timeout is None:
+            msg = f"{getattr(item, 'name', 'Item')} did not complete in time"
+            raise TimeoutError(msg)
+        return self.on_timeout(item)
+
+    # noinspection PyMethodMayBeStatic
+    async def _cancel(self, running: dict[asyncio.Task[Any], tuple[int, str]]) -> None:
+        """Cancel running items and wait for them to finish unwinding."""
+        tasks = list(running)
+        running.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _process_sequentially(
         self,
         items: list[Any],
@@ -72,7 +248,7 @@ class ConcurrentProcessor:
             if progress_callback:
                 progress_callback(i, total_items, f"Checking {getattr(item, 'name', 'application')}")
 
-            result = await async_worker_func(item)
+            result = await self._run_item(item, async_worker_func)
             results.append(result)
 
             if progress_callback:
@@ -87,7 +263,7 @@ class ConcurrentProcessor:
         progress_callback: Callable[[int, int, str], None] | None,
         total_items: int,
     ) -> list[Any]:
-        """Process items concurrently.
+        """Process items concurrently, reporting progress as each one completes.
 
         Args:
             items: List of items to process
@@ -96,68 +272,22 @@ class ConcurrentProcessor:
             total_items: Total number of items
 
         Returns:
-            List of processing results
+            List of processing results, in the order of the items
         """
-        logger.debug(f"Processing {total_items} items concurrently with async tasks")
+        logger.debug(
+            f"Processing {total_items} items concurrently "
+            f"(at most {self.max_concurrency} at once, {self.host_concurrency} per host)"
+        )
 
         if progress_callback:
             progress_callback(0, total_items, "Starting concurrent checks")
-            return await self._process_with_progress(items, async_worker_func, progress_callback, total_items)
 
-        return await self._process_without_progress(items, async_worker_func)
-
-    async def _process_with_progress(
-        self,
-        items: list[Any],
-        async_worker_func: Callable[[Any], Coroutine[Any, Any, Any]],
-        progress_callback: Callable[[int, int, str], None],
-        total_items: int,
-    ) -> list[Any]:
-        """Process items with progress tracking.
-
-        Args:
-            items: List of items to process
-            async_worker_func: Async function to process each item
-            progress_callback: Callback for progress updates
-            total_items: Total number of items
-
-        Returns:
-            List of processing results
-        """
+        results: list[Any] = [None] * total_items
         completed_count = 0
-
-        async def progress_wrapper(item: Any, index: int) -> Any:
-            """Wrapper that tracks progress for each item."""
-            nonlocal completed_count
-            result = await async_worker_func(item)
+        async for index, result in self.iter_completed(items, async_worker_func):
+            results[index] = result
             completed_count += 1
-            item_name = getattr(item, "name", f"app {index + 1}")
-            progress_callback(completed_count, total_items, f"Completed {item_name}")
-            return result
-
-        tasks = [progress_wrapper(item, i) for i, item in enumerate(items)]
-        return await asyncio.gather(*tasks)
-
-    async def _process_without_progress(
-        self,
-        items: list[Any],
-        async_worker_func: Callable[[Any], Coroutine[Any, Any, Any]],
-    ) -> list[Any]:
-        """Process items without progress tracking.
-
-        Args:
-            items: List of items to process
-            async_worker_func: Async function to process each item
-
-        Returns:
-            List of processing results
-
-        Note:
-            Uses asyncio.gather() for concurrent processing:
-            1. Compatibility: gather() works with Python 3.7+, TaskGroup requires 3.11+
-            2. Simplicity: Perfect for straightforward I/O-bound network operations
-            3. Ordered results: Results match input order automatically
-            4. Clean error handling: Exceptions propagate naturally
-        """
-        tasks = [async_worker_func(item) for item in items]
-        return await asyncio.gather(*tasks)
+            if progress_callback:
+                item_name = getattr(items[index], "name", f"app {index + 1}")
+                progress_callback(completed_count, total_items, f"Completed {item_name}")
+        return results
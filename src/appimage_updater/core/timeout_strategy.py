@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from typing import (
+    Any,
+    TypeVar,
+)
 
 import httpx
 from loguru import logger
 
+from .http_retry import RetryEngine
 from .http_service import get_http_client
 
 
+T = TypeVar("T")
+
+
 class TimeoutStrategy:
     """Manages different timeout strategies for different types of HTTP operations."""
 
@@ -30,6 +41,9 @@ class TimeoutStrategy:
             "fallback": base_timeout,  # Default fallback timeout
         }
 
+        # Upper bound for establishing a connection, whatever the operation type
+        self.connect_timeout = 10
+
     def get_timeout(self, operation_type: str = "fallback") -> float:
         """Get timeout for a specific operation type.
 
@@ -41,9 +55,27 @@ class TimeoutStrategy:
         """
         return self.timeouts.get(operation_type, self.timeouts["fallback"])
 
+    def get_request_timeout(self, operation_type: str = "fallback") -> httpx.Timeout:
+        """Get the per-request timeout profile for a specific operation type.
+
+        Connection setup is capped so unreachable hosts fail fast, while reads
+        get the operation's full timeout.
+
+        Args:
+            operation_type: Type of operation (quick_check, page_scraping, api_request, download, fallback)
+
+        Returns:
+            httpx timeout applied to each request of this operation type
+        """
+        timeout = self.get_timeout(operation_type)
+        return httpx.Timeout(timeout, connect=min(timeout, self.connect_timeout))
+
     def create_client_config(self, operation_type: str = "fallback", **kwargs: Any) -> dict[str, Any]:
         """Create httpx client configuration with appropriate timeout.
 
+        The timeout is applied per request, so configurations for different
+        operation types can share the global connection pool.
+
         Args:
             operation_type: Type of operation
             **kwargs: Additional client configuration
@@ -51,16 +83,23 @@ class TimeoutStrategy:
         Returns:
             Dictionary of client configuration parameters
         """
-        timeout = self.get_timeout(operation_type)
+        timeout = self.get_request_timeout(operation_type)
 
         config = {"timeout": timeout, **kwargs}
 
-        logger.debug(f"Creating HTTP client config for {operation_type}: timeout={timeout}s")
+        logger.debug(f"Creating HTTP client config for {operation_type}: timeout={timeout.read}s")
         return config
 
 
 class ProgressiveTimeoutClient:
-    """HTTP client that tries operations with progressively longer timeouts."""
+    """HTTP client that tries operations with progressively longer timeouts.
+
+    Attempts overlap instead of running back to back: every attempt uses the most
+    patient timeout, and another one is started each time a shorter timeout
+    elapses without an answer. Attempts are sent on their own, bypassing request
+    coalescing and retries, so a dead host costs at most the longest timeout
+    (plus the hedge delays) rather than the sum of all of them.
+    """
 
     def __init__(self, timeout_strategy: TimeoutStrategy):
         """Initialize progressive timeout client.
@@ -69,6 +108,7 @@ class ProgressiveTimeoutClient:
             timeout_strategy: Timeout strategy to use
         """
         self.timeout_strategy = timeout_strategy
+        self.retry_engine = RetryEngine()
 
     async def get_with_progressive_timeout(
         self, url: str, operation_types: list[str] | None = None, **kwargs: Any
@@ -100,26 +140,51 @@ class ProgressiveTimeoutClient:
     async def _attempt_progressive_timeouts(
         self, url: str, operation_types: list[str], **kwargs: Any
     ) -> httpx.Response:
-        """Attempt requests with progressively longer timeouts."""
-        for i, operation_type in enumerate(operation_types):
-            try:
-                response = await self._attempt_single_timeout(url, operation_type, **kwargs)
-                return response
-            except (httpx.TimeoutException, httpx.ConnectTimeout, httpx.ReadTimeout) as e:
-                self._handle_timeout_error(e, operation_type, url, i, len(operation_types))
-            except httpx.HTTPError as e:
-                self._handle_http_error(e)
-
-        # If all attempts failed, raise the last timeout exception
-        raise httpx.TimeoutException(f"All timeout strategies failed for {url}")
+        """Race hedged attempts, starting a new one whenever a shorter timeout elapses."""
+        patient_type = operation_types[-1]
+        return await self.run_with_progressive_timeout(
+            url, lambda: self._attempt_single_timeout(url, patient_type, **kwargs), operation_types
+        )
+
+    async def run_with_progressive_timeout(
+        self, url: str, attempt: Callable[[], Awaitable[T]], operation_types: list[str] | None = None
+    ) -> T:
+        """Race hedged runs of any request, starting a new one whenever a shorter timeout elapses.
+
+        Lets callers that consume the response themselves, e.g. by streaming it,
+        use the same hedging as get_with_progressive_timeout().
+
+        Args:
+            url: URL requested, for logging
+            attempt: Callable starting one attempt with the most patient timeout
+            operation_types: Operation types whose timeouts set the hedge delays
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            httpx.HTTPError: If all attempts fail
+        """
+        operation_types = self._prepare_operation_types(operation_types)
+        hedge_delays = [self.timeout_strategy.get_timeout(operation_type) for operation_type in operation_types[:-1]]
+
+        try:
+            # Non-timeout HTTP errors are not retried with longer timeouts and end the race
+            return await self.retry_engine.hedge(attempt, hedge_delays, hedge_on=(httpx.TimeoutException,))
+        except httpx.TimeoutException:
+            logger.warning(f"All timeout attempts failed for {url}")
+            raise
 
     async def _attempt_single_timeout(self, url: str, operation_type: str, **kwargs: Any) -> httpx.Response:
         """Attempt a single request with the specified timeout."""
         timeout = self.timeout_strategy.get_timeout(operation_type)
         logger.debug(f"Attempting {url} with {operation_type} timeout ({timeout}s)")
 
+        # Each attempt is a separate request: coalescing would make hedges join the first
+        # attempt, and retrying timeouts would stack further attempts behind it
         client_config = self.timeout_strategy.create_client_config(
-            operation_type, follow_redirects=True, max_redirects=10, **kwargs
+            operation_type,
+            **{"follow_redirects": True, **kwargs, "coalesce": False, "retry": False},
         )
 
         async with get_http_client(**client_config) as client:
@@ -129,25 +194,6 @@ class ProgressiveTimeoutClient:
             logger.debug(f"Success with {operation_type} timeout: {response.status_code}")
             return response
 
-    def _handle_timeout_error(
-        self, error: Exception, operation_type: str, url: str, attempt_index: int, total_attempts: int
-    ) -> None:
-        """Handle timeout errors during progressive timeout attempts."""
-        timeout = self.timeout_strategy.get_timeout(operation_type)
-        logger.debug(f"Timeout with {operation_type} ({timeout}s): {error}")
-
-        # If this is the last attempt, re-raise the error
-        if attempt_index == total_attempts - 1:
-            logger.warning(f"All timeout attempts failed for {url}")
-            raise
-
-    # noinspection PyMethodMayBeStatic
-    def _handle_http_error(self, error: httpx.HTTPError) -> None:
-        """Handle non-timeout HTTP errors."""
-        # For non-timeout errors, don't retry with longer timeouts
-        logger.debug(f"HTTP error (not timeout-related): {error}")
-        raise
-
 
 # Global timeout strategy instance
 _default_timeout_strategy: TimeoutStrategy | None = None
@@ -7,9 +7,14 @@ and file rotation. Provides the primary workflows used by CLI commands.
 
 from __future__ import annotations
 
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+)
 from datetime import datetime
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from loguru import logger
@@ -19,6 +24,7 @@ import typer
 from appimage_updater.config.loader import ConfigLoadError
 from appimage_updater.config.manager import AppConfigs
 from appimage_updater.config.models import ApplicationConfig, Config
+from appimage_updater.core.check_cache import CheckResultCache
 from appimage_updater.core.downloader import Downloader
 from appimage_updater.core.info_operations import _execute_info_update_workflow
 from appimage_updater.core.models import Asset, CheckResult, InteractiveResult, UpdateCandidate
@@ -41,11 +47,19 @@ async def _check_updates(
     verbose: bool = False,
     info: bool = False,
     output_formatter: Any = None,
+    pipeline: bool = False,
+    deadline: float | None = None,
+    max_age: float | None = None,
+    cached_first: bool = False,
 ) -> bool:
     """Internal async function to check for updates.
 
     Args:
         app_names: List of app names, single app name, or None for all apps
+        pipeline: Download each update as soon as its check completes (with yes)
+        deadline: Seconds allowed for all checks; checks still running then are reported as timed out
+        max_age: Serve cached check results younger than this many seconds without checking
+        cached_first: Show cached results at once, then check again and show only the results that changed
 
     Returns:
         True if successful, False if applications not found
@@ -56,7 +70,19 @@ async def _check_updates(
     with OutputFormatterContext(output_formatter):
         try:
             return await _execute_check_workflow(
-                config_file, config_dir, app_names, verbose, dry_run, yes, no, no_interactive, info
+                config_file,
+                config_dir,
+                app_names,
+                verbose,
+                dry_run,
+                yes,
+                no,
+                no_interactive,
+                info,
+                pipeline,
+                deadline,
+                max_age,
+                cached_first,
             )
         except (ConfigLoadError, RepositoryError, OSError, ValueError) as e:
             _handle_check_errors(e)
@@ -73,6 +99,10 @@ async def _execute_check_workflow(
     no: bool,
     no_interactive: bool,
     info: bool,
+    pipeline: bool = False,
+    deadline: float | None = None,
+    max_age: float | None = None,
+    cached_first: bool = False,
 ) -> bool:
     """Execute the check workflow logic."""
     config, enabled_apps, disabled_apps = await _prepare_check_environment(
@@ -87,7 +117,19 @@ async def _execute_check_workflow(
     if info:
         await _execute_info_update_workflow(enabled_apps)
     else:
-        await _execute_update_workflow(config, enabled_apps, disabled_apps, dry_run, yes, no, no_interactive)
+        await _execute_update_workflow(
+            config,
+            enabled_apps,
+            disabled_apps,
+            dry_run,
+            yes,
+            no,
+            no_interactive,
+            pipeline,
+            deadline,
+            max_age,
+            cached_first,
+        )
     return True
 
 
@@ -129,16 +171,27 @@ async def _execute_update_workflow(
     yes: bool,
     no: bool,
     no_interactive: bool,
+    pipeline: bool = False,
+    deadline: float | None = None,
+    max_age: float | None = None,
+    cached_first: bool = False,
 ) -> None:
     """Execute the main update workflow."""
-    check_results = await _perform_update_checks(enabled_apps, no_interactive, dry_run)
+    deadline_at = _get_deadline_time(deadline)
+    cached_results = None
+    if cached_first and not dry_run:
+        cached_results = _display_cached_results(enabled_apps, disabled_apps)
+
+    if pipeline and yes and not dry_run:
+        await _execute_pipelined_update_workflow(
+            config, enabled_apps, disabled_apps, no_interactive, deadline_at, max_age, cached_results
+        )
+        return
 
-    # Add disabled apps to results for display
-    disabled_results = _create_disabled_results(disabled_apps)
-    all_results = check_results + disabled_results
+    check_results = await _perform_update_checks(enabled_apps, no_interactive, dry_run, config, deadline_at, max_age)
 
     # Display all results (enabled + disabled) and get candidates from enabled apps only
-    _display_check_results(all_results, dry_run)
+    _display_all_check_results(check_results, disabled_apps, dry_run, cached_results)
     candidates = _filter_update_candidates(check_results)
     _log_check_statistics(check_results, candidates)
     _display_update_summary(candidates)
@@ -162,6 +215,66 @@ async def _execute_update_workflow(
         logger.debug("Dry run mode enabled, skipping downloads")
 
 
+async def _execute_pipelined_update_workflow(
+    config: Config,
+    enabled_apps: list[Any],
+    disabled_apps: list[Any],
+    no_interactive: bool,
+    deadline_at: float | None = None,
+    max_age: float | None = None,
+    cached_results: dict[str, CheckResult] | None = None,
+) -> None:
+    """Check applications and download each update as soon as its check completes.
+
+    Downloads overlap with the remaining checks, so a slow application no
+    longer holds back the downloads of the others. Check and download results
+    are displayed together once both are done.
+    """
+    _display_check_start_message(enabled_apps)
+    version_checker = _create_version_checker(no_interactive, max_age)
+    _log_processing_method(enabled_apps)
+    version_checker.start_prefetch(enabled_apps, _get_remaining_time(deadline_at))
+
+    processor = _create_check_processor(config, deadline_at)
+    results_by_index: dict[int, CheckResult] = {}
+
+    async def completed_candidates() -> AsyncIterator[UpdateCandidate]:
+        async for index, result in processor.iter_completed(enabled_apps, version_checker.check_for_updates):
+            results_by_index[index] = result
+            if _is_update_candidate(result):
+                logger.debug(f"Queueing download for {result.app_name}")
+                yield result.candidate
+
+    downloader = _create_downloader(config)
+    console.print("\n[blue]Downloading updates as their checks complete...")
+    logger.debug("Starting pipelined checks and downloads")
+    try:
+        download_results = await downloader.download_as_available(
+            completed_candidates(), progress_callback=_create_progress_callback(enabled_apps)
+        )
+    finally:
+        await version_checker.stop_prefetch()
+        _save_check_results(version_checker, config)
+
+    # Every check yields a result, timed-out ones included; keep the configured order
+    check_results = [results_by_index[index] for index in sorted(results_by_index)]
+    if len(check_results) != len(enabled_apps):
+        logger.warning(f"Only {len(check_results)} of {len(enabled_apps)} update checks completed")
+    logger.debug(f"Completed {len(check_results)} update checks and {len(download_results)} downloads")
+
+    _display_all_check_results(check_results, disabled_apps, False, cached_results)
+    candidates = _filter_update_candidates(check_results)
+    _log_check_statistics(check_results, candidates)
+    _display_update_summary(candidates)
+
+    if not candidates:
+        await _handle_no_updates_scenario(config, enabled_apps)
+        return
+
+    display_download_results(download_results)
+    _log_download_summary(download_results)
+
+
 async def _perform_dry_run_checks(enabled_apps: list[Any], no_interactive: bool) -> list[Any]:
     """Perform dry-run checks showing current versions without HTTP requests."""
     logger.debug("Dry run mode: Skipping HTTP requests, showing current versions only")
@@ -180,30 +293,118 @@ async def _perform_dry_run_checks(enabled_apps: list[Any], no_interactive: bool)
     return dry_run_results
 
 
-async def _perform_real_update_checks(enabled_apps: list[Any], no_interactive: bool) -> list[Any]:
-    """Perform real update checks with HTTP requests."""
-    version_checker = VersionChecker(interactive=not no_interactive)
+async def _perform_real_update_checks(
+    enabled_apps: list[Any],
+    no_interactive: bool,
+    config: Config | None = None,
+    deadline_at: float | None = None,
+    max_age: float | None = None,
+) -> list[Any]:
+    """Perform real update checks with HTTP requests, or from the result cache within max_age."""
+    version_checker = _create_version_checker(no_interactive, max_age)
     _log_processing_method(enabled_apps)
+    version_checker.start_prefetch(enabled_apps, _get_remaining_time(deadline_at))
 
-    processor = ConcurrentProcessor()
+    processor = _create_check_processor(config, deadline_at)
+    progress_callback = _create_progress_callback(enabled_apps)
 
-    # Create progress callback if we have multiple apps and output formatter supports it
-    progress_callback = None
-    if len(enabled_apps) > 1:
-        output_formatter = get_output_formatter()
-        if not _should_suppress_console_output(output_formatter):
-
-            def progress_callback(current: int, total: int, description: str) -> None:
-                output_formatter.print_progress(current, total, description)
-
-    check_results = await processor.process_items_async(
-        enabled_apps, version_checker.check_for_updates, progress_callback
-    )
+    try:
+        check_results = await processor.process_items_async(
+            enabled_apps, version_checker.check_for_updates, progress_callback
+        )
+    finally:
+        await version_checker.stop_prefetch()
+        _save_check_results(version_checker, config)
 
     logger.debug(f"Completed {len(check_results)} update checks")
     return check_results
 
 
+def _create_progress_callback(items: list[Any]) -> Callable[[int, int, str], None] | None:
+    """Create a progress callback if there are multiple items and the output formatter shows progress."""
+    if len(items) <= 1:
+        return None
+    output_formatter = get_output_formatter()
+    if _should_suppress_console_output(output_formatter):
+        return None
+
+    def progress_callback(current: int, total: int, description: str) -> None:
+        output_formatter.print_progress(current, total, description)
+
+    return progress_callback
+
+
+def _save_check_results(version_checker: VersionChecker, config: Config | None) -> None:
+    """Write the check results cached during a run, dropping those of applications no longer configured."""
+    if version_checker.result_cache is not None:
+        version_checker.result_cache.flush(config.applications if config is not None else None)
+
+
+def _create_version_checker(no_interactive: bool, max_age: float | None = None) -> VersionChecker:
+    """Create the version checker for real checks, storing its results in the check result cache."""
+    return VersionChecker(interactive=not no_interactive, result_cache=CheckResultCache(), max_age=max_age)
+
+
+def _display_all_check_results(
+    check_results: list[Any],
+    disabled_apps: list[Any],
+    dry_run: bool,
+    cached_results: dict[str, CheckResult] | None = None,
+) -> None:
+    """Display check results, or only those that changed if cached results were already shown."""
+    if cached_results is not None:
+        _display_changed_results(check_results, cached_results)
+        return
+
+    # Add disabled apps to results for display
+    _display_check_results(check_results + _create_disabled_results(disabled_apps), dry_run)
+
+
+def _display_cached_results(enabled_apps: list[Any], disabled_apps: list[Any]) -> dict[str, CheckResult]:
+    """Display the cached results of applications before they are checked again.
+
+    The checks that follow run in the foreground, as usual; only the results
+    that changed are displayed once they are done.
+
+    Returns:
+        Cached results by application name
+    """
+    result_cache = CheckResultCache()
+    cached_results: dict[str, CheckResult] = {}
+    for app_config in enabled_apps:
+        cached = result_cache.lookup(app_config)
+        if cached is not None:
+            cached_results[app_config.name] = cached.result
+
+    output_formatter = get_output_formatter()
+    if not cached_results:
+        output_formatter.print_info("No cached results yet, checking for updates")
+        return cached_results
+
+    output_formatter.print_info(f"Cached results of {len(cached_results)} applications, checking again...")
+    _display_check_results(list(cached_results.values()) + _create_disabled_results(disabled_apps), False)
+    return cached_results
+
+
+def _display_changed_results(check_results: list[Any], cached_results: dict[str, CheckResult]) -> None:
+    """Display the fresh results that differ from the cached results shown before."""
+    changed_results = [
+        result
+        for result in check_results
+        if result.app_name not in cached_results
+        or _convert_check_results_to_dict([result]) != _convert_check_results_to_dict([cached_results[result.app_name]])
+    ]
+
+    output_formatter = get_output_formatter()
+    if not changed_results:
+        output_formatter.print_info("No changes since the cached results")
+        return
+
+    count = len(changed_results)
+    output_formatter.print_info("1 result changed" if count == 1 else f"{count} results changed")
+    _display_check_results(changed_results, False)
+
+
 def _display_check_results(check_results: list[Any], dry_run: bool) -> None:
     """Display check results."""
     logger.debug("Displaying check results: {}", check_results)
@@ -380,15 +581,17 @@ def _load_config_with_fallback(config_file: Path | None, config_dir: Path | None
     """Load configuration with fallback to empty config."""
     try:
         app_configs = AppConfigs(config_path=config_file or config_dir)
-        return app_configs._config
+        config = app_configs._config
     except ConfigLoadError as e:
         # Only handle gracefully if no explicit config file was specified
         if not config_file and "not found" in str(e):
-            return Config()
+            config = Config()
         else:
             # Re-raise for explicit config files or other errors
             raise
 
+    return config
+
 
 def _get_all_apps_for_check(config: Any, app_names: list[str] | None) -> tuple[list[Any], list[Any]] | None:
     """Get enabled and disabled applications for check command.
@@ -433,6 +636,9 @@ async def _perform_update_checks(
     enabled_apps: list[Any],
     no_interactive: bool = False,
     dry_run: bool = False,
+    config: Config | None = None,
+    deadline_at: float | None = None,
+    max_age: float | None = None,
 ) -> list[Any]:
     """Initialize clients and perform update checks."""
     _display_check_start_message(enabled_apps)
@@ -440,7 +646,7 @@ async def _perform_update_checks(
     if dry_run:
         return await _perform_dry_run_checks(enabled_apps, no_interactive)
     else:
-        return await _perform_real_update_checks(enabled_apps, no_interactive)
+        return await _perform_real_update_checks(enabled_apps, no_interactive, config, deadline_at, max_age)
 
 
 async def _handle_downloads(config: Any, candidates: list[Any], yes: bool = False) -> None:
@@ -578,11 +784,12 @@ def _extract_error_message(result: Any, result_dict: dict[str, Any]) -> None:
 def _filter_update_candidates(check_results: list[Any]) -> list[Any]:
     """Filter successful results with updates."""
     logger.debug("Filtering results for update candidates")
-    return [
-        result.candidate
-        for result in check_results
-        if result.success and result.candidate and result.candidate.needs_update
-    ]
+    return [result.candidate for result in check_results if _is_update_candidate(result)]
+
+
+def _is_update_candidate(result: Any) -> bool:
+    """Check if a result is a successful check with an update to download."""
+    return bool(result.success and result.candidate and result.candidate.needs_update)
 
 
 def _log_check_statistics(check_results: list[Any], candidates: list[Any]) -> None:
@@ -603,6 +810,34 @@ def _display_update_summary(candidates: list[Any]) -> None:
         logger.debug(f"Found {len(candidates)} updates available")
 
 
+def _create_check_processor(config: Config | None, deadline_at: float | None = None) -> ConcurrentProcessor:
+    """Create the processor running update checks, bounded by the configured concurrency and time budgets."""
+    if config is None:
+        return ConcurrentProcessor(deadline=deadline_at, on_timeout=_create_timeout_result)
+    return ConcurrentProcessor(
+        max_concurrency=config.global_config.concurrent_checks,
+        host_concurrency=config.global_config.concurrent_checks_per_host,
+        item_timeout=config.global_config.check_timeout_seconds,
+        deadline=deadline_at,
+        on_timeout=_create_timeout_result,
+    )
+
+
+def _create_timeout_result(app_config: Any) -> CheckResult:
+    """Create the result of an application whose check ran out of time."""
+    return CheckResult(app_name=app_config.name, success=False, error_message="timed out")
+
+
+def _get_deadline_time(deadline: float | None) -> float | None:
+    """Convert a deadline in seconds from now to a time.monotonic() value."""
+    return None if deadline is None else time.monotonic() + deadline
+
+
+def _get_remaining_time(deadline_at: float | None) -> float | None:
+    """Get the seconds left until a time.monotonic() deadline."""
+    return None if deadline_at is None else max(deadline_at - time.monotonic(), 0.0)
+
+
 def _create_downloader(config: Any) -> Downloader:
     """Create and configure downloader instance."""
     logger.debug("Initializing downloader")
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
 from pathlib import Path
 import re
 from typing import Any
+import urllib.parse
 
 from loguru import logger
 from packaging import version
@@ -18,7 +21,13 @@ from ..repositories.base import (
     RepositoryClient,
     RepositoryError,
 )
-from ..repositories.factory import get_repository_client_with_probing_sync
+from ..repositories.factory import get_repository_client_async
+from ..repositories.github.feed import (
+    GitHubFeedError,
+    GitHubReleaseFeed,
+)
+from ..repositories.github.repository import GitHubRepository
+from ..repositories.gitlab.repository import GitLabRepository
 from ..utils.version_file_utils import (
     extract_versions_from_files,
     select_newest_version,
@@ -27,6 +36,7 @@ from ..utils.version_utils import (
     create_nightly_version,
     normalize_version_string,
 )
+from .check_cache import CheckResultCache
 from .models import (
     Asset,
     CheckResult,
@@ -36,22 +46,170 @@ from .models import (
 from .version_service import version_service
 
 
+# Releases scanned for stable-only applications whose latest release is not usable
+STABLE_RELEASE_SCAN_LIMIT = 100
+
+# Source types whose releases are prefetched in batches
+_BATCHED_SOURCE_TYPES = frozenset({"github", "gitlab"})
+
+
 # noinspection PyMethodMayBeStatic
 class VersionChecker:
     """Handles version checking for applications."""
 
-    def __init__(self, repository_client: RepositoryClient | None = None, interactive: bool = True) -> None:
+    def __init__(
+        self,
+        repository_client: RepositoryClient | None = None,
+        interactive: bool = True,
+        result_cache: CheckResultCache | None = None,
+        max_age: float | None = None,
+    ) -> None:
         """Initialize version checker.
 
         Args:
             repository_client: Repository client instance (optional, will be created per-app if not provided)
             interactive: Whether to allow interactive distribution selection
+            result_cache: Cache storing successful check results (optional)
+            max_age: Serve cached results younger than this many seconds instead of checking (None to always check)
         """
         self.repository_client = repository_client
         self.interactive = interactive
+        self.result_cache = result_cache
+        self.max_age = max_age
+        self._prefetched_releases: dict[str, list[Release]] = {}
+        self._prefetch_task: asyncio.Task[None] | None = None
+        # URLs of applications whose checks wait for the running prefetch
+        self._prefetching_urls: frozenset[str] = frozenset()
+        self._release_feed = GitHubReleaseFeed()
+
+    def start_prefetch(self, app_configs: list[ApplicationConfig], timeout: float | None = None) -> None:
+        """Prefetch releases in the background while the checks start.
+
+        Checks of GitHub- and GitLab-hosted applications wait for the prefetch to
+        end; all other checks run alongside it. A prefetch still running after
+        timeout seconds is abandoned and its applications are checked individually.
+        """
+        self._prefetching_urls = frozenset(
+            app_config.url for app_config in app_configs if app_config.source_type in _BATCHED_SOURCE_TYPES
+        )
+        self._prefetch_task = asyncio.create_task(self._run_prefetch(app_configs, timeout))
+
+    async def stop_prefetch(self) -> None:
+        """Cancel the background prefetch if it is still running, e.g. when the checks ended early."""
+        task, self._prefetch_task = self._prefetch_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _run_prefetch(self, app_configs: list[ApplicationConfig], timeout: float | None) -> None:
+        """Prefetch releases, giving up after timeout seconds."""
+        try:
+            await asyncio.wait_for(self.prefetch_releases(app_configs), timeout)
+        except TimeoutError:
+            logger.debug("Release prefetch stopped at the deadline")
+        finally:
+            self._prefetching_urls = frozenset()
+
+    async def _wait_for_prefetch(self, app_config: ApplicationConfig) -> None:
+        """Wait for the background prefetch if it may cover an application."""
+        task = self._prefetch_task
+        if task is not None and not task.done() and app_config.url in self._prefetching_urls:
+            # Shielded, so a check cancelled while waiting leaves the prefetch to the others
+            await asyncio.shield(task)
+
+    async def prefetch_releases(self, app_configs: list[ApplicationConfig]) -> None:
+        """Fetch releases of GitHub- and GitLab-hosted applications in batched GraphQL queries.
+
+        Later checks use the prefetched releases instead of one REST request per
+        application. GitHub batches need a token; any application a batch could
+        not resolve is still checked individually.
+        """
+        if self.repository_client:
+            return
+
+        # Applications answered from the result cache need no releases
+        app_configs = [app_config for app_config in app_configs if self.get_cached_result(app_config) is None]
+        await self._prefetch_github_releases(app_configs)
+        await self._prefetch_gitlab_releases(app_configs)
+
+    async def _prefetch_github_releases(self, app_configs: list[ApplicationConfig]) -> None:
+        """Fetch releases of GitHub-hosted applications in batched GraphQL queries."""
+        github = GitHubRepository()
+        repo_urls = self._get_batchable_urls(github, app_configs)
+        if len(repo_urls) < 2:
+            return
+
+        try:
+            prefetched = await github.get_releases_batch(repo_urls)
+        except RepositoryError as e:
+            logger.debug(f"Batched GitHub release fetch failed, checking applications individually: {e}")
+            return
+        self._prefetched_releases.update(prefetched)
+        logger.debug(f"Prefetched releases for {len(prefetched)} GitHub applications")
+
+    async def _prefetch_gitlab_releases(self, app_configs: list[ApplicationConfig]) -> None:
+        """Fetch releases of GitLab-hosted applications in batched GraphQL queries, per instance.
+
+        Each instance is queried through the client later checks reuse, so project
+        IDs reported by the batch address that client's REST requests.
+        """
+        instances: dict[str, list[str]] = {}
+        for app in app_configs:
+            if app.source_type == "gitlab":
+                instances.setdefault(urllib.parse.urlparse(app.url).netloc.lower(), []).append(app.url)
+
+        for repo_urls in instances.values():
+            if len(repo_urls) < 2:
+                continue
+            try:
+                gitlab = await get_repository_client_async(repo_urls[0], source_type="gitlab")
+                if not isinstance(gitlab, GitLabRepository):
+                    continue
+                prefetched = await gitlab.get_releases_batch(repo_urls)
+            except RepositoryError as e:
+                logger.debug(f"Batched GitLab release fetch failed, checking applications individually: {e}")
+                continue
+            self._prefetched_releases.update(prefetched)
+            logger.debug(f"Prefetched releases for {len(prefetched)} GitLab applications")
+
+    def _get_batchable_urls(self, github: GitHubRepository, app_configs: list[ApplicationConfig]) -> list[str]:
+        """Get the repository URLs worth fetching in a GitHub batch (none without a token)."""
+        if not github.github_client.auth.is_authenticated:
+            return []
+
+        return [app.url for app in app_configs if self._is_batchable(github, app)]
+
+    def _is_batchable(self, github: GitHubRepository, app_config: ApplicationConfig) -> bool:
+        """Check if an application's releases can be fetched in a GitHub batch."""
+        return app_config.source_type == "github" and github.detect_repository_type(app_config.url)
+
+    def get_cached_result(self, app_config: ApplicationConfig) -> CheckResult | None:
+        """Get an application's cached result if it is younger than max_age and still applies.
+
+        A result no longer applies once the installed version has changed, e.g.
+        after its update was downloaded.
+        """
+        if self.result_cache is None or self.max_age is None:
+            return None
+
+        cached = self.result_cache.lookup(app_config)
+        if cached is None or cached.age > self.max_age:
+            return None
+        if cached.result.current_version != self._get_current_version(app_config):
+            logger.debug(f"Installed version of {app_config.name} changed, ignoring cached result")
+            return None
+
+        logger.debug(f"Using cached result of {app_config.name} from {cached.age:.0f}s ago")
+        return cached.result
 
     async def check_for_updates(self, app_config: ApplicationConfig) -> CheckResult:
         """Check for updates for a single application."""
+        cached_result = self.get_cached_result(app_config)
+        if cached_result is not None:
+            return cached_result
+
+        await self._wait_for_prefetch(app_config)
         event_bus = get_event_bus()
 
         # Publish start event
@@ -76,6 +234,8 @@ class VersionChecker:
             )
             event_bus.publish(completion_event)
 
+            if self.result_cache is not None:
+                self.result_cache.store(app_config, result)
             return result
         except (RepositoryError, OSError, ValueError) as e:
             # Publish error event
@@ -94,22 +254,114 @@ class VersionChecker:
             )
 
     async def _get_repository_releases(self, app_config: ApplicationConfig) -> list[Release]:
-        """Get releases from repository client."""
-        if self.repository_client:
-            repo_client = self.repository_client
-        else:
-            # Use probing factory for better repository detection
-            repo_client = get_repository_client_with_probing_sync(app_config.url, source_type=app_config.source_type)
+        """Get releases from repository client.
+
+        Prefetched releases only cover the newest few of each repository; when none of
+        them is usable, the releases are looked up as if nothing had been prefetched.
+        """
+        prefetched = self._prefetched_releases.get(app_config.url)
+        if prefetched is not None:
+            if any(self._is_release_usable(release, app_config) for release in prefetched):
+                return prefetched
+            logger.debug(f"No usable prefetched release for {app_config.name}, looking further")
+
+        repo_client = await self._get_repository_client(app_config)
+        if not app_config.prerelease:
+            latest = await self._get_latest_stable_release(repo_client, app_config)
+            if latest is not None:
+                return [latest]
+            match = await self._find_matching_release(repo_client, app_config)
+            if match is not None:
+                return [match]
+        # Nothing matched (or prereleases are tracked): list recent releases as before
         return await repo_client.get_releases(app_config.url)
 
+    async def _find_matching_release(
+        self, repo_client: RepositoryClient, app_config: ApplicationConfig
+    ) -> Release | None:
+        """Scan releases newest first, stopping at the first one the application can use.
+
+        Further pages are only fetched while no stable release matching the version
+        pattern and carrying an asset matching the pattern has turned up.
+        """
+        return await repo_client.find_release(
+            app_config.url,
+            lambda release: self._is_release_usable(release, app_config),
+            max_releases=STABLE_RELEASE_SCAN_LIMIT,
+        )
+
+    def _is_release_usable(self, release: Release, app_config: ApplicationConfig) -> bool:
+        """Check if a release matches the application's configuration and has a matching asset."""
+        return (
+            release.has_assets
+            and self._is_release_compatible_with_config(release, app_config)
+            and bool(self._filter_assets_by_pattern(release, app_config.pattern))
+        )
+
+    async def _get_repository_client(self, app_config: ApplicationConfig) -> RepositoryClient:
+        """Get the injected repository client or one matching the application's URL."""
+        if self.repository_client:
+            return self.repository_client
+        # Resolved in the running event loop; clients are reused per host across applications
+        return await get_repository_client_async(app_config.url, source_type=app_config.source_type)
+
+    async def _get_latest_stable_release(
+        self, repo_client: RepositoryClient, app_config: ApplicationConfig
+    ) -> Release | None:
+        """Get the latest stable release with a single request, if it has an asset matching the pattern.
+
+        Returns None, leaving the caller to scan recent releases, when the repository
+        has no latest release endpoint, the request fails (e.g. no stable release yet),
+        the latest release does not match the version pattern or does not carry the
+        application's asset.
+        """
+        try:
+            release = await repo_client.get_latest_release_direct(app_config.url)
+        except RepositoryError as e:
+            logger.debug(f"Latest release lookup failed for {app_config.name}, scanning releases: {e}")
+            return None
+
+        if release is None or not self._is_release_compatible_with_config(release, app_config):
+            return None
+        if not self._filter_assets_by_pattern(release, app_config.pattern):
+            logger.debug(f"Latest release {release.tag_name} of {app_config.name} has no matching asset")
+            return None
+        return release
+
+    async def _is_unchanged_on_feed(self, app_config: ApplicationConfig, current_version: str | None) -> bool:
+        """Check if the newest release on a GitHub repository's feed is the installed version.
+
+        The feed is read outside the API rate limit and revalidated with its ETag, so
+        unchanged repositories need no release lookup at all. Any doubt (no installed
+        version, prefetched releases, feed unavailable, different tag) means a full check.
+        """
+        if self.repository_client or not current_version or app_config.source_type != "github":
+            return False
+        if app_config.url in self._prefetched_releases:
+            return False
+
+        try:
+            newest_tag = await self._release_feed.get_newest_tag(app_config.url)
+        except GitHubFeedError as e:
+            logger.debug(f"Release feed check failed for {app_config.name}, checking releases: {e}")
+            return False
+
+        if not newest_tag or normalize_version_string(newest_tag) != normalize_version_string(current_version):
+            return False
+        logger.debug(f"Newest release {newest_tag} of {app_config.name} is already installed, skipping API lookup")
+        return True
+
     async def _check_repository_updates(self, app_config: ApplicationConfig) -> CheckResult:
         """Check for updates from repository."""
         try:
+            current_version = self._get_current_version(app_config)
+            if await self._is_unchanged_on_feed(app_config, current_version):
+                return self._create_unchanged_result(app_config, current_version)
+
             releases = await self._get_repository_releases(app_config)
             if not releases:
                 return self._create_no_releases_result(app_config)
 
-            current_version = self._get_current_version(app_config)
             update_candidates = self._find_update_candidates(releases, app_config, current_version)
 
             if not update_candidates:
@@ -141,6 +393,17 @@ class VersionChecker:
             message="No suitable updates found",
         )
 
+    def _create_unchanged_result(self, app_config: ApplicationConfig, current_version: str | None) -> CheckResult:
+        """Create result for when the release feed shows nothing newer than the installed version."""
+        return CheckResult(
+            app_name=app_config.name,
+            success=True,
+            current_version=current_version,
+            available_version=current_version,
+            update_available=False,
+            message="No new releases",
+        )
+
     def _create_update_available_result(
         self, app_config: ApplicationConfig, current_version: str | None, update_candidates: list[Any]
     ) -> CheckResult:
@@ -281,23 +544,18 @@ class VersionChecker:
 
         return candidates
 
-    def _filter_assets_by_pattern(self, assets: list[Asset], pattern: str) -> list[Asset]:
-        """Filter assets by the configured URL pattern."""
+    def _filter_assets_by_pattern(self, release: Release, pattern: str) -> list[Asset]:
+        """Filter a release's assets by the configured URL pattern, converting only the matches."""
         if not pattern:
-            return assets
-
-        filtered_assets = []
-        for asset in assets:
-            if re.match(pattern, asset.name, re.IGNORECASE):
-                filtered_assets.append(asset)
+            return release.assets
 
-        return filtered_assets
+        return release.filter_assets(re.compile(pattern, re.IGNORECASE).match)
 
     def _process_release_for_candidate(
         self, release: Release, app_config: ApplicationConfig, current_version: str | None
     ) -> UpdateCandidate | None:
         """Process a single release to create an update candidate."""
-        if not release.assets:
+        if not release.has_assets:
             return None
 
         # Filter and validate the release
@@ -318,7 +576,7 @@ class VersionChecker:
 
     def _filter_and_validate_release_assets(self, release: Release, app_config: ApplicationConfig) -> list[Any] | None:
         """Filter release assets by pattern and validate."""
-        pattern_filtered_assets = self._filter_assets_by_pattern(release.assets, app_config.pattern)
+        pattern_filtered_assets = self._filter_assets_by_pattern(release, app_config.pattern)
         if not pattern_filtered_assets:
             logger.debug(f"No assets match pattern for release {release.tag_name}")
             return None
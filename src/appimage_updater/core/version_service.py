@@ -13,6 +13,7 @@ from packaging import version
 
 from appimage_updater.config.models import ApplicationConfig
 from appimage_updater.core.info_file_service import InfoFileService
+from appimage_updater.core.installed_state import InstalledStateIndex
 from appimage_updater.core.local_version_service import LocalVersionService
 from appimage_updater.core.models import Asset
 from appimage_updater.core.repository_version_service import RepositoryVersionService
@@ -30,17 +31,22 @@ class VersionService:
         """Initialize with all required services."""
         self.parser = VersionParser()
         self.info_service = InfoFileService()
-        self.local_service = LocalVersionService(self.parser, self.info_service)
+        self.installed_state = InstalledStateIndex()
+        self.local_service = LocalVersionService(self.parser, self.info_service, self.installed_state)
         self.repository_service = RepositoryVersionService(self.parser)
 
     # Local Version Operations
     def get_current_version(self, app_config: ApplicationConfig) -> str | None:
         """Get current installed version.
 
-        Uses priority: .info file -> .current file -> filename analysis
+        Uses priority: installed-state index -> .info file -> .current file -> filename analysis
         """
         return self.local_service.get_current_version(app_config)
 
+    def record_installed_file(self, app_config: ApplicationConfig, file_path: Path, sha256: str | None = None) -> None:
+        """Record a newly installed file in the installed-state index."""
+        self.local_service.record_installed_file(app_config, file_path, sha256)
+
     # Repository Version Operations
     async def get_latest_version(self, app_config: ApplicationConfig) -> str | None:
         """Get latest version from repository."""
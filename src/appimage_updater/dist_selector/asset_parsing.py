@@ -1,13 +1,13 @@
 """Asset parsing utilities for the distribution selector.
 
 This module contains functions for parsing asset filenames to extract
-distribution, version, architecture, and format information.
+distribution, version, architecture, and format information. Filenames are
+parsed once by core.asset_attributes and shared with the compatibility checks.
 """
 
-import re
-
 from loguru import logger
 
+from ..core.asset_attributes import get_asset_attributes
 from ..core.models import Asset
 from .models import AssetInfo
 
@@ -27,56 +27,26 @@ def _parse_asset_info(asset: Asset) -> AssetInfo:
 
 def _extract_distribution_info(filename: str, info: AssetInfo) -> None:
     """Extract distribution and version information from filename."""
-    distrib_patterns = [
-        (r"ubuntu[-_](\d+\.?\d*)", "ubuntu"),
-        (r"fedora[-_]?v?([\d.]+)", "fedora"),  # Match fedora with optional version like fedora-v02.02.01.60
-        (r"centos[-_](\d+)", "centos"),
-        (r"rhel[-_](\d+)", "rhel"),
-        (r"debian[-_](\d+)", "debian"),
-        (r"arch[-_](\w+)", "arch"),
-        (r"opensuse[-_](\d+\.?\d*)", "opensuse"),
-        (r"suse[-_](\d+\.?\d*)", "suse"),
-    ]
-
-    for pattern, distrib in distrib_patterns:
-        match = re.search(pattern, filename)
-        if match:
-            info.distribution = distrib
-            if distrib != "arch":  # arch uses rolling releases
-                info.version = match.group(1)
-                if info.version:
-                    info.version_numeric = _parse_version_number(info.version)
-            break
+    attributes = get_asset_attributes(filename)
+    if attributes.distribution:
+        info.distribution = attributes.distribution
+        info.version = attributes.distribution_version
+        if info.version:
+            info.version_numeric = _parse_version_number(info.version)
 
 
 def _extract_architecture_info(filename: str, info: AssetInfo) -> None:
     """Extract architecture information from filename."""
-    arch_patterns = [
-        r"x86_64",
-        r"amd64",
-        r"x64",
-        r"i386",
-        r"i686",
-        r"arm64",
-        r"aarch64",
-        r"armv7l",
-        r"armhf",
-    ]
-
-    for arch_pattern in arch_patterns:
-        if re.search(arch_pattern, filename):
-            info.arch = arch_pattern
-            break
+    architecture = get_asset_attributes(filename).architecture_hint
+    if architecture:
+        info.arch = architecture
 
 
 def _extract_format_info(filename: str, info: AssetInfo) -> None:
     """Extract file format information from filename."""
-    if filename.endswith(".appimage"):
-        info.format = "appimage"
-    elif filename.endswith(".zip"):
-        info.format = "zip"
-    elif filename.endswith(".tar.gz"):
-        info.format = "tar.gz"
+    asset_format = get_asset_attributes(filename).format
+    if asset_format:
+        info.format = asset_format
 
 
 def _parse_version_number(version_str: str) -> float:
@@ -10,16 +10,63 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from typing import Any
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+)
+import math
+from typing import (
+    Any,
+    TypeVar,
+)
+
+import httpx
+from loguru import logger
 
 from .._version import __version__
 from ..core.models import Release
 
 
+T = TypeVar("T")
+
+# Releases scanned at most when looking for a stable release
+PRERELEASE_SCAN_LIMIT = 1600
+
+
 class RepositoryError(Exception):
     """Base exception for repository operations."""
 
 
+def get_next_page_url(response: httpx.Response, page_length: int, page_size: int) -> str | None:
+    """Get the URL of the next page from a paginated API response's Link header.
+
+    Args:
+        response: Response of the current page
+        page_length: Number of items on the current page
+        page_size: Requested page size
+
+    Returns:
+        Next page URL, or None on the last page (a short page or no rel="next" link)
+    """
+    if page_length < page_size:
+        return None
+    next_url = response.links.get("next", {}).get("url")
+    return next_url if isinstance(next_url, str) else None
+
+
+async def take_releases(releases: AsyncIterator[T], max_releases: int | None) -> AsyncIterator[T]:
+    """Yield from a release iterator, stopping (and fetching no further pages) after max_releases."""
+    limit = math.inf if max_releases is None else max_releases
+    if limit <= 0:
+        return
+    count = 0
+    async for release in releases:
+        yield release
+        count += 1
+        if count >= limit:
+            return
+
+
 class RepositoryClient(ABC):
     """Abstract base class for repository clients.
 
@@ -98,6 +145,60 @@ class RepositoryClient(ABC):
             RepositoryError: If the operation fails
         """
 
+    async def get_latest_release_direct(self, repo_url: str) -> Release | None:
+        """Get the latest stable release with a single request to a dedicated endpoint.
+
+        Clients of APIs with a "latest release" endpoint override this; the
+        default returns None so callers fall back to scanning get_releases().
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            The latest stable release, or None if the API has no such endpoint
+
+        Raises:
+            RepositoryError: If the operation fails
+        """
+        return None
+
+    async def iter_releases(self, repo_url: str, max_releases: int | None = None) -> AsyncIterator[Release]:
+        """Iterate over releases, newest first, fetching further pages only as they are consumed.
+
+        The default implementation fetches a single batch with get_releases();
+        clients of paginated APIs override it to follow the API's pagination.
+
+        Args:
+            repo_url: Repository URL
+            max_releases: Maximum number of releases to yield (None for a single default batch)
+
+        Raises:
+            RepositoryError: If fetching a page fails
+        """
+        for release in await self.get_releases(repo_url, limit=max_releases or 100):
+            yield release
+
+    async def find_release(
+        self, repo_url: str, predicate: Callable[[Release], bool], max_releases: int | None = None
+    ) -> Release | None:
+        """Get the newest release matching predicate, stopping pagination at the first match.
+
+        Args:
+            repo_url: Repository URL
+            predicate: Release filter (first stable release, first matching asset, ...)
+            max_releases: Maximum number of releases to scan
+
+        Returns:
+            The first matching release, or None if none matches
+
+        Raises:
+            RepositoryError: If fetching a page fails
+        """
+        async for release in self.iter_releases(repo_url, max_releases):
+            if predicate(release):
+                return release
+        return None
+
     @abstractmethod
     def parse_repo_url(self, url: str) -> tuple[str, str]:
         """Parse repository URL to extract owner and repo name.
@@ -156,6 +257,20 @@ class RepositoryClient(ABC):
             Regex pattern string or None if generation fails
         """
 
+    async def _has_only_prereleases(self, url: str, max_releases: int = PRERELEASE_SCAN_LIMIT) -> bool:
+        """Check if a repository has prereleases but no stable release, stopping at the first stable one."""
+        found_prerelease = False
+        async for release in self.iter_releases(url, max_releases):
+            if release.is_draft:
+                continue
+            if not release.is_prerelease:
+                logger.debug(f"Found stable release {release.tag_name} for {url}")
+                return False
+            found_prerelease = True
+
+        logger.debug(f"No stable release for {url} (prereleases found: {found_prerelease})")
+        return found_prerelease
+
     # noinspection PyMethodMayBeStatic
     def _get_default_user_agent(self) -> str:
         """Get default User-Agent string for API requests."""
@@ -0,0 +1,105 @@
+"""Association of release assets with their checksum files.
+
+Releases publish checksums either per file (``App.AppImage.sha256``,
+``App-SHA256.txt``) or as one manifest covering every file (``SHA256SUMS``,
+``checksums.txt``, ``app-1.0.sha256sum``). Asset names are classified in a
+single pass with one compiled pattern and indexed by the file they cover, so
+pairing is linear in the number of assets for any repository backend.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+import re
+from typing import TypeVar
+
+from loguru import logger
+
+from ..core.models import Asset, RawAsset
+
+
+AssetT = TypeVar("AssetT", RawAsset, Asset)
+
+_ALGORITHM = r"(?:sha256|sha1|md5)"
+
+_CHECKSUM_FILE_PATTERN = re.compile(
+    rf"^(?:(?P<manifest>{_ALGORITHM}sums?(?:\.txt)?|checksums?(?:\.txt)?)"
+    rf"|(?P<base>.+)(?:[-_]{_ALGORITHM}\.txt|\.{_ALGORITHM}(?P<sums>sums?)?))$",
+    re.IGNORECASE,
+)
+
+# Extensions dropped when looking up checksum files named after the bare file name
+_ASSET_EXTENSIONS = (".AppImage", ".tar.gz", ".zip", ".deb", ".rpm")
+
+
+def is_checksum_file(name: str) -> bool:
+    """Check if a file name is a checksum file or checksum manifest."""
+    return _CHECKSUM_FILE_PATTERN.match(name) is not None
+
+
+def is_checksum_manifest(checksum_name: str, asset_name: str) -> bool:
+    """Check if an asset's checksum file is a manifest of the release rather than named after the asset."""
+    match = _CHECKSUM_FILE_PATTERN.match(checksum_name)
+    return match is not None and (bool(match["manifest"]) or match["base"] not in _checksum_base_names(asset_name))
+
+
+def associate_checksum_files(assets: list[AssetT]) -> None:
+    """Set each asset's checksum_asset from the checksum files in the same release.
+
+    A checksum file named after the asset wins; otherwise the release's checksum
+    manifest is used, since it lists every file.
+
+    Args:
+        assets: All assets of one release, checksum files included
+    """
+    checksum_files = [(asset, match) for asset in assets if (match := _CHECKSUM_FILE_PATTERN.match(asset.name))]
+    if not checksum_files:
+        return
+
+    checksum_ids = {id(asset) for asset, _ in checksum_files}
+    per_file = {match["base"]: asset for asset, match in checksum_files if not match["manifest"]}
+    unmatched, used = _pair_per_file_checksums([asset for asset in assets if id(asset) not in checksum_ids], per_file)
+
+    manifest = _find_manifest(checksum_files, used)
+    if manifest is not None and unmatched:
+        for asset in unmatched:
+            asset.checksum_asset = manifest
+        logger.debug(f"Associated checksum manifest {manifest.name} with {len(unmatched)} assets")
+
+
+def _pair_per_file_checksums(files: list[AssetT], per_file: dict[str, AssetT]) -> tuple[list[AssetT], set[int]]:
+    """Pair assets with the checksum files named after them.
+
+    Returns:
+        Assets left without a checksum file, and the ids of the checksum files paired
+    """
+    unmatched: list[AssetT] = []
+    used: set[int] = set()
+    for asset in files:
+        checksum_asset = _find_checksum_for_asset(asset.name, per_file)
+        if checksum_asset is None:
+            unmatched.append(asset)
+            continue
+        asset.checksum_asset = checksum_asset
+        used.add(id(checksum_asset))
+        logger.debug(f"Associated checksum: {asset.name} -> {checksum_asset.name}")
+    return unmatched, used
+
+
+def _find_manifest(checksum_files: list[tuple[AssetT, re.Match[str]]], used: set[int]) -> AssetT | None:
+    """Get the release's manifest: a named one, else a sums file that covers no single asset."""
+    manifests = (asset for asset, match in checksum_files if match["manifest"])
+    # "name.sha256sum" covers "name" if it is an asset, else it is a manifest
+    sum_files = (asset for asset, match in checksum_files if match["sums"] and id(asset) not in used)
+    return next(chain(manifests, sum_files), None)
+
+
+def _checksum_base_names(asset_name: str) -> list[str]:
+    """Get the names a checksum file of an asset may be named after, with or without its extension."""
+    extension = next((extension for extension in _ASSET_EXTENSIONS if asset_name.endswith(extension)), None)
+    return [asset_name, asset_name[: -len(extension)]] if extension else [asset_name]
+
+
+def _find_checksum_for_asset(asset_name: str, per_file: dict[str, AssetT]) -> AssetT | None:
+    """Find the checksum file named after an asset, with or without its extension."""
+    return next((per_file[name] for name in _checksum_base_names(asset_name) if name in per_file), None)
@@ -26,24 +26,23 @@ from ..core.models import (
     Asset,
     Release,
 )
-from ..core.timeout_strategy import create_progressive_client
+from ..core.timeout_strategy import (
+    create_progressive_client,
+    get_default_timeout_strategy,
+)
 from ..utils.version_utils import normalize_version_string
 from .base import (
     RepositoryClient,
     RepositoryError,
 )
+from .page_links import scan_page_links
 
 
-class DirectDownloadRepository(RepositoryClient):
-    """Repository client for direct download URLs with static patterns."""
-
-    def __init__(self, timeout: int = 30, user_agent: str | None = None, **kwargs: Any):
-        super().__init__(timeout, user_agent, **kwargs)
-
-    def detect_repository_type(self, url: str) -> bool:
-        """Detect if URL is a direct download pattern."""
-        # Patterns that indicate direct downloads
-        direct_patterns = [
+# Patterns that indicate direct downloads, compiled once
+_DIRECT_URL_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in [
             r".*-latest.*\.AppImage$",  # YubiKey Manager pattern
             r".*\.AppImage$",  # Direct AppImage links
             r".*/download/?$",  # Generic download pages
@@ -51,8 +50,20 @@ class DirectDownloadRepository(RepositoryClient):
             r".*/releases\.html?$",  # Generic releases pages
             r".*/releases/?$",  # Generic releases directories
         ]
+    ),
+    re.IGNORECASE,
+)
 
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in direct_patterns)
+
+class DirectDownloadRepository(RepositoryClient):
+    """Repository client for direct download URLs with static patterns."""
+
+    def __init__(self, timeout: int = 30, user_agent: str | None = None, **kwargs: Any):
+        super().__init__(timeout, user_agent, **kwargs)
+
+    def detect_repository_type(self, url: str) -> bool:
+        """Detect if URL is a direct download pattern."""
+        return _DIRECT_URL_PATTERN.match(url) is not None
 
     async def get_latest_release(self, url: str) -> Release:
         """Get the latest release for direct download URL."""
@@ -209,23 +220,12 @@ class DirectDownloadRepository(RepositoryClient):
 
     async def _handle_releases_page_progressive(self, progressive_client: Any, url: str) -> list[Release]:
         """Handle releases pages with progressive timeout strategy."""
-        # Try with quick timeout first, then fallback to longer timeout
-        response = await progressive_client.get_with_progressive_timeout(
-            url, operation_types=["page_scraping", "fallback"]
+        # Only the first AppImage link (the most recent/latest) is used, so stop reading there
+        client_config = progressive_client.timeout_strategy.create_client_config("fallback", follow_redirects=True)
+        page = await progressive_client.run_with_progressive_timeout(
+            url, lambda: scan_page_links(url, max_links=1, **client_config), ["page_scraping", "fallback"]
         )
-
-        content = response.text
-
-        # Look for AppImage download links in both HTML and Markdown formats
-        html_quoted_pattern = r'href="([^"]*\.AppImage[^"]*)"'
-        html_unquoted_pattern = r"href=([^\s>]*\.AppImage[^\s>]*)"
-        markdown_pattern = r"\]\(([^)]*\.AppImage[^)]*)\)"
-
-        html_quoted_matches = re.findall(html_quoted_pattern, content, re.IGNORECASE)
-        html_unquoted_matches = re.findall(html_unquoted_pattern, content, re.IGNORECASE)
-        markdown_matches = re.findall(markdown_pattern, content, re.IGNORECASE)
-
-        matches = html_quoted_matches + html_unquoted_matches + markdown_matches
+        matches = page.links
 
         if not matches:
             raise RepositoryError(f"No AppImage downloads found on {url}")
@@ -365,14 +365,14 @@ class DirectDownloadRepository(RepositoryClient):
         """
         try:
             # Try HEAD request first (most efficient)
-            response = await self._make_head_request(url, follow_redirects=True)
+            response = await self._make_head_request(url)
             response.raise_for_status()
             return response
         except (httpx.HTTPError, httpx.RequestError):
             # Fall back to GET with range header to get minimal data
             try:
                 headers = {"Range": "bytes=0-0"}  # Request only first byte
-                response = await self._make_get_request(url, headers=headers, follow_redirects=True)
+                response = await self._make_get_request(url, headers=headers)
                 response.raise_for_status()
                 return response
             except (httpx.HTTPError, httpx.RequestError):
@@ -534,8 +534,10 @@ class DirectDownloadRepository(RepositoryClient):
             return None
 
     async def _make_head_request(self, url: str, **kwargs: Any) -> httpx.Response:
-        """Make a HEAD request using the same client configuration as progressive timeout."""
-        client_config = {"timeout": self.timeout, "follow_redirects": True, "max_redirects": 10, **kwargs}
+        """Make a metadata HEAD request with the quick_check timeout profile."""
+        client_config = get_default_timeout_strategy(self.timeout).create_client_config(
+            "quick_check", **{"follow_redirects": True, **kwargs}
+        )
 
         async with get_http_client(**client_config) as client:
             response = await client.head(url)
@@ -543,8 +545,10 @@ class DirectDownloadRepository(RepositoryClient):
             return cast(httpx.Response, response)
 
     async def _make_get_request(self, url: str, **kwargs: Any) -> httpx.Response:
-        """Make a GET request using the same client configuration as progressive timeout."""
-        client_config = {"timeout": self.timeout, "follow_redirects": True, "max_redirects": 10, **kwargs}
+        """Make a metadata GET request with the quick_check timeout profile."""
+        client_config = get_default_timeout_strategy(self.timeout).create_client_config(
+            "quick_check", **{"follow_redirects": True, **kwargs}
+        )
 
         async with get_http_client(**client_config) as client:
             response = await client.get(url)
@@ -1,7 +1,17 @@
-"""Domain knowledge service for intelligent repository detection."""
+"""Domain knowledge service for intelligent repository detection.
+
+Known domains are kept in a process-wide index mapping each host to its handler.
+The index is loaded from the global config once; domains learned or forgotten
+during a run are buffered and written back in a single atomic update when the
+command finishes, so concurrent checks never read or rewrite config.json.
+"""
 
 from __future__ import annotations
 
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
@@ -12,11 +22,191 @@ from ..config.models import DomainKnowledge
 from .registry import RepositoryHandler, get_repository_registry
 
 
+# Handlers with a domain list in DomainKnowledge, in lookup precedence order
+_DOMAIN_LISTS = {
+    "github": "github_domains",
+    "gitlab": "gitlab_domains",
+    "direct_download": "direct_domains",
+    "dynamic_download": "dynamic_domains",
+}
+
+# Handlers whose known domains also cover their subdomains, e.g. self-hosted forges
+_SUBDOMAIN_HANDLERS = frozenset({"github", "gitlab"})
+
+
+class DomainIndex:
+    """In-memory map from host to handler name with buffered write-back."""
+
+    def __init__(self, config_path: Path | None = None, knowledge: DomainKnowledge | None = None) -> None:
+        """Initialize domain index.
+
+        Args:
+            config_path: Global config file updates are written to (defaults to config.json)
+            knowledge: Initial domain knowledge (loaded from config_path on first use if omitted)
+        """
+        self.config_path = config_path or GlobalConfigManager.get_default_config_path()
+        self._hosts: dict[str, str] | None = None
+        self._knowledge = knowledge
+        # (handler name, domain) -> True to learn, False to forget
+        self._pending: dict[tuple[str, str], bool] = {}
+
+    def lookup(self, host: str) -> str | None:
+        """Get the handler name for a host.
+
+        An entry for the exact host always wins. Otherwise subdomains match the nearest
+        parent domain of a self-hosted forge; parent domains learned for direct or dynamic
+        downloads never capture their subdomains.
+
+        Args:
+            host: Lowercase host name, e.g. "gitlab.example.com"
+
+        Returns:
+            Handler name, or None for unknown hosts
+        """
+        hosts = self._get_hosts()
+        handler_name = hosts.get(host)
+        if handler_name:
+            return handler_name
+
+        labels = host.split(".")
+        # Walk "a.b.example.com" -> "b.example.com" -> "example.com", never a bare TLD
+        for start in range(1, len(labels) - 1):
+            handler_name = hosts.get(".".join(labels[start:]))
+            if handler_name in _SUBDOMAIN_HANDLERS:
+                return handler_name
+        return None
+
+    def learn(self, host: str, handler_name: str) -> bool:
+        """Record a host as served by a handler.
+
+        Returns:
+            True if the index changed
+        """
+        if handler_name not in _DOMAIN_LISTS:
+            return False
+
+        hosts = self._get_hosts()
+        if host in hosts:
+            return False
+
+        hosts[host] = handler_name
+        self._buffer(handler_name, host, True)
+        return True
+
+    def forget(self, host: str, handler_name: str) -> bool:
+        """Remove a host from a handler's known domains.
+
+        Returns:
+            True if the index changed
+        """
+        hosts = self._get_hosts()
+        if hosts.get(host) != handler_name:
+            return False
+
+        del hosts[host]
+        self._buffer(handler_name, host, False)
+        return True
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Check if learned or forgotten domains are waiting to be written."""
+        return bool(self._pending)
+
+    def flush(self) -> None:
+        """Apply buffered changes to the config file in one atomic write.
+
+        The file is re-read first, so settings saved by others during the run are kept.
+        """
+        if not self._pending:
+            return
+
+        try:
+            data = self._read_config_file()
+            global_config = data.setdefault("global_config", {})
+            knowledge = DomainKnowledge(**global_config.get("domain_knowledge", {}))
+            self._apply_pending(knowledge)
+            global_config["domain_knowledge"] = knowledge.model_dump()
+            self._write_config_file(data)
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Failed to save domain knowledge to {self.config_path}: {e}")
+            return
+
+        logger.debug(f"Saved {len(self._pending)} domain knowledge updates to {self.config_path}")
+        self._pending.clear()
+
+    def _get_hosts(self) -> dict[str, str]:
+        """Get the host map, building it on first use."""
+        if self._hosts is None:
+            knowledge = self._knowledge or self._load_knowledge()
+            self._hosts = {}
+            for handler_name, list_name in _DOMAIN_LISTS.items():
+                for domain in getattr(knowledge, list_name):
+                    self._hosts.setdefault(domain.lower(), handler_name)
+        return self._hosts
+
+    def _load_knowledge(self) -> DomainKnowledge:
+        """Load domain knowledge from the global config file."""
+        try:
+            return GlobalConfigManager(self.config_path).config.global_config.domain_knowledge
+        except Exception as e:
+            logger.debug(f"Error loading domain knowledge: {e}")
+            return DomainKnowledge()
+
+    def _buffer(self, handler_name: str, host: str, learned: bool) -> None:
+        """Remember a change for the next flush."""
+        self._pending[(handler_name, host)] = learned
+
+    def _apply_pending(self, knowledge: DomainKnowledge) -> None:
+        """Apply buffered changes to domain knowledge loaded from disk."""
+        for (handler_name, host), learned in self._pending.items():
+            domains: list[str] = getattr(knowledge, _DOMAIN_LISTS[handler_name])
+            if learned and host not in domains:
+                domains.append(host)
+            elif not learned and host in domains:
+                domains.remove(host)
+
+    def _read_config_file(self) -> dict[str, Any]:
+        """Read the config file, or an empty config when it does not exist yet."""
+        if not self.config_path.exists():
+            return {}
+        data = json.loads(self.config_path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            msg = f"Expected a JSON object in {self.config_path}"
+            raise ValueError(msg)
+        return data
+
+    def _write_config_file(self, data: dict[str, Any]) -> None:
+        """Atomically replace the config file."""
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.config_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp_path, self.config_path)
+
+
+@lru_cache(maxsize=1)
+def get_domain_index() -> DomainIndex:
+    """Get the process-wide domain index (cached)."""
+    return DomainIndex()
+
+
 class DomainKnowledgeService:
     """Service for managing domain knowledge and repository detection."""
 
-    def __init__(self, config_manager: GlobalConfigManager | None = None):
-        self.config_manager = config_manager or GlobalConfigManager()
+    def __init__(self, config_manager: GlobalConfigManager | None = None, index: DomainIndex | None = None):
+        """Initialize domain knowledge service.
+
+        Args:
+            config_manager: Global config to read and save domain knowledge with
+                (defaults to the process-wide index over config.json)
+            index: Domain index to use instead of one built from config_manager
+        """
+        self.config_manager = config_manager
+        if index is None and config_manager is not None:
+            index = DomainIndex(
+                config_path=config_manager._resolve_config_path(),
+                knowledge=config_manager.config.global_config.domain_knowledge,
+            )
+        self.index = index or get_domain_index()
         self.registry = get_repository_registry()
 
     def _extract_domain(self, url: str) -> str:
@@ -33,38 +223,14 @@ class DomainKnowledgeService:
         if not domain:
             return None
 
-        try:
-            knowledge = self._load_domain_knowledge()
-            return self._find_handler_for_domain(domain, knowledge)
-        except Exception as e:
-            logger.debug(f"Error loading domain knowledge: {e}")
+        handler_name = self.index.lookup(domain)
+        if not handler_name:
             return None
 
-    def _load_domain_knowledge(self) -> DomainKnowledge:
-        """Load domain knowledge from configuration."""
-        config = self.config_manager.load_config()
-        return config.global_config.domain_knowledge
-
-    def _get_domain_mappings(self, knowledge: Any) -> dict[str, list[str]]:
-        """Get domain mappings for known repository types."""
-        return {
-            "github": knowledge.github_domains,
-            "gitlab": knowledge.gitlab_domains,
-            "direct_download": knowledge.direct_domains,
-            "dynamic_download": knowledge.dynamic_domains,
-        }
-
-    def _find_handler_for_domain(self, domain: str, knowledge: Any) -> RepositoryHandler | None:
-        """Find a handler for the given domain using domain knowledge."""
-        domain_mappings = self._get_domain_mappings(knowledge)
-
-        for handler_name, domains in domain_mappings.items():
-            if domain in domains:
-                handler = self.registry.get_handler(handler_name)
-                if handler:
-                    logger.debug(f"Fast-path: {domain} -> {handler_name}")
-                    return handler
-        return None
+        handler = self.registry.get_handler(handler_name)
+        if handler:
+            logger.debug(f"Fast-path: {domain} -> {handler_name}")
+        return handler
 
     def get_handlers_for_url(self, url: str) -> list[RepositoryHandler]:
         """Get all handlers that can handle the URL, with domain knowledge optimization."""
@@ -76,68 +242,14 @@ class DomainKnowledgeService:
         # Fall back to registry-based detection
         return self.registry.get_handlers_for_url(url)
 
-    def _get_domain_list_for_handler(self, knowledge: Any, handler_name: str) -> list[str] | None:
-        """Get the appropriate domain list for a handler."""
-        domain_mapping = {
-            "github": knowledge.github_domains,
-            "gitlab": knowledge.gitlab_domains,
-            "direct_download": knowledge.direct_domains,
-            "dynamic_download": knowledge.dynamic_domains,
-        }
-        return domain_mapping.get(handler_name)
-
-    def _add_domain_to_knowledge(self, knowledge: Any, handler_name: str, domain: str) -> bool:
-        """Add domain to appropriate knowledge list if not already present."""
-        domain_list = self._get_domain_list_for_handler(knowledge, handler_name)
-        if domain_list is not None and domain not in domain_list:
-            domain_list.append(domain)
-            return True
-        return False
-
     async def learn_domain(self, url: str, handler_name: str) -> None:
-        """Persist successful domain detection."""
+        """Remember a successful domain detection; saved when the command finishes."""
         domain = self._extract_domain(url)
-        if not domain:
-            return
-
-        try:
-            config = self.config_manager.load_config()
-            knowledge = config.global_config.domain_knowledge
-
-            # Add to appropriate domain list
-            updated = self._add_domain_to_knowledge(knowledge, handler_name, domain)
-
-            if updated:
-                self.config_manager.save()
-                logger.debug(f"Learned domain: {domain} -> {handler_name}")
-
-        except Exception as e:
-            logger.error(f"Failed to learn domain {domain}: {e}")
-
-    def _remove_domain_from_knowledge(self, knowledge: Any, handler_name: str, domain: str) -> bool:
-        """Remove domain from appropriate knowledge list if present."""
-        domain_list = self._get_domain_list_for_handler(knowledge, handler_name)
-        if domain_list is not None and domain in domain_list:
-            domain_list.remove(domain)
-            return True
-        return False
+        if domain and self.index.learn(domain, handler_name):
+            logger.debug(f"Learned domain: {domain} -> {handler_name}")
 
     async def forget_domain(self, url: str, failed_handler_name: str) -> None:
-        """Remove domain from knowledge due to API failure."""
+        """Remove domain from knowledge due to API failure; saved when the command finishes."""
         domain = self._extract_domain(url)
-        if not domain:
-            return
-
-        try:
-            config = self.config_manager.load_config()
-            knowledge = config.global_config.domain_knowledge
-
-            # Remove from failed handler's domain list
-            updated = self._remove_domain_from_knowledge(knowledge, failed_handler_name, domain)
-
-            if updated:
-                self.config_manager.save()
-                logger.warning(f"Forgot domain: {domain} (failed as {failed_handler_name})")
-
-        except Exception as e:
-            logger.error(f"Failed to forget domain {domain}: {e}")
+        if domain and self.index.forget(domain, failed_handler_name):
+            logger.warning(f"Forgot domain: {domain} (failed as {failed_handler_name})")
@@ -17,13 +17,13 @@ from urllib.parse import (
 
 import httpx
 
-from appimage_updater.core.http_service import get_http_client
 from appimage_updater.core.models import (
     Asset,
     Release,
 )
 from appimage_updater.core.version_service import version_service
 from appimage_updater.repositories.base import RepositoryClient, RepositoryError
+from appimage_updater.repositories.page_links import scan_page_links
 from appimage_updater.utils.version_utils import normalize_version_string
 
 
@@ -64,46 +64,43 @@ class DynamicDownloadRepository(RepositoryClient):
 
     async def _handle_generic_dynamic(self, url: str) -> list[Release]:
         """Handle generic dynamic download pages."""
-        async with get_http_client(timeout=self.timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-            content = response.text
-
-            # Look for AppImage download links
-            appimage_pattern = r'href="([^"]*\.AppImage[^"]*)"'
-            matches = re.findall(appimage_pattern, content, re.IGNORECASE)
-
-            if not matches:
-                raise RepositoryError(f"No AppImage downloads found on {url}")
-
-            # Use the first match
-            download_url = matches[0]
-            if not download_url.startswith("http"):
-                download_url = urljoin(url, download_url)
-
-            # Extract version from URL or content
-            version = self._extract_version_from_content(content, download_url)
-
-            asset = Asset(
-                name=self._extract_filename_from_url(download_url),
-                url=download_url,
-                size=0,
-                created_at=datetime.now(),
-            )
-
-            # Create release with normalized version
-            normalized_version = normalize_version_string(version)
-            release = Release(
-                version=normalized_version,
-                tag_name=normalized_version,
-                published_at=datetime.now(),
-                assets=[asset],
-                is_prerelease=False,
-                is_draft=False,
-            )
-
-            return [release]
+        # Only the first AppImage link is used, so the page is read up to there
+        page = await scan_page_links(url, max_links=1, timeout=self.timeout)
+        if not page.links:
+            raise RepositoryError(f"No AppImage downloads found on {url}")
+
+        # Use the first match
+        download_url = page.links[0]
+        if not download_url.startswith("http"):
+            download_url = urljoin(url, download_url)
+
+        if page.complete:
+            version = self._extract_version_from_content(page.text, download_url)
+        else:
+            # Only the page up to the link was read, so versions further down are unseen; trust the link's own
+            version = self._extract_version_from_url(download_url)
+            if version == "latest":
+                version = self._extract_version_from_content(page.text, download_url)
+
+        asset = Asset(
+            name=self._extract_filename_from_url(download_url),
+            url=download_url,
+            size=0,
+            created_at=datetime.now(),
+        )
+
+        # Create release with normalized version
+        normalized_version = normalize_version_string(version)
+        release = Release(
+            version=normalized_version,
+            tag_name=normalized_version,
+            published_at=datetime.now(),
+            assets=[asset],
+            is_prerelease=False,
+            is_draft=False,
+        )
+
+        return [release]
 
     def parse_repo_url(self, url: str) -> tuple[str, str]:
         """Parse dynamic download URL to extract meaningful components."""
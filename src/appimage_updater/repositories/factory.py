@@ -2,6 +2,9 @@
 
 This module provides factory functions to create the correct repository client
 based on URL patterns and repository types using a dynamic registry system.
+
+Clients keep no per-repository state, so the async factory reuses one instance per
+handler, host and authentication options within an event loop.
 """
 
 from __future__ import annotations
@@ -9,16 +12,55 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 from typing import Any
+from urllib.parse import urlparse
+import weakref
 
 from loguru import logger
 
 from .base import RepositoryClient, RepositoryError
 from .domain_service import DomainKnowledgeService
-from .registry import get_repository_registry
+from .registry import RepositoryHandler, get_repository_registry
+
+
+# Clients may hold HTTP connections bound to the event loop they were first used in
+_client_cache: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[Any, ...], RepositoryClient]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client_cache_key(
+    handler_name: str, url: str, timeout: int, user_agent: str | None, kwargs: dict[str, Any]
+) -> tuple[Any, ...]:
+    """Build the key identifying interchangeable clients: handler, host, timeout and auth options."""
+    host = urlparse(url).netloc.lower()
+    options = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+    return handler_name, host, timeout, user_agent, options
+
+
+def _create_client(
+    handler: RepositoryHandler, url: str, timeout: int, user_agent: str | None, **kwargs: Any
+) -> RepositoryClient:
+    """Create a client with the handler, reusing an earlier one for the same host in this event loop."""
+    try:
+        loop_clients = _client_cache.setdefault(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        return handler.create_client(timeout=timeout, user_agent=user_agent, **kwargs)
+
+    key = _get_client_cache_key(handler.metadata.name, url, timeout, user_agent, kwargs)
+    client = loop_clients.get(key)
+    if client is None:
+        client = handler.create_client(timeout=timeout, user_agent=user_agent, **kwargs)
+        loop_clients[key] = client
+    return client
+
+
+def clear_repository_client_cache() -> None:
+    """Forget all reused repository clients."""
+    _client_cache.clear()
 
 
 async def _try_explicit_source_type(
-    source_type: str, timeout: int, user_agent: str | None, **kwargs: Any
+    url: str, source_type: str, timeout: int, user_agent: str | None, **kwargs: Any
 ) -> RepositoryClient:
     """Try to create client using explicit source type."""
     registry = get_repository_registry()
@@ -27,7 +69,7 @@ async def _try_explicit_source_type(
         handler = registry.get_handler("direct_download")
 
     if handler:
-        return handler.create_client(timeout=timeout, user_agent=user_agent, **kwargs)
+        return _create_client(handler, url, timeout, user_agent, **kwargs)
     else:
         raise RepositoryError(f"Unsupported source type: {source_type}")
 
@@ -40,7 +82,7 @@ async def _try_domain_knowledge(
     if not known_handler:
         return None
     try:
-        client = known_handler.create_client(timeout=timeout, user_agent=user_agent, **kwargs)
+        client = _create_client(known_handler, url, timeout, user_agent, **kwargs)
         # Skip validation to avoid event loop issues with Python 3.13 + httpx/anyio
         # await _validate_client(client, url)
         return client
@@ -60,7 +102,7 @@ async def _try_registry_handlers(
     for handler in handlers:
         try:
             if handler.can_handle_url(url):
-                client = handler.create_client(timeout=timeout, user_agent=user_agent, **kwargs)
+                client = _create_client(handler, url, timeout, user_agent, **kwargs)
                 await domain_service.learn_domain(url, handler.metadata.name)
                 return client
         except Exception as e:
@@ -75,7 +117,7 @@ async def _try_fallback_handler(url: str, timeout: int, user_agent: str | None,
     fallback_handler = registry.get_handler("dynamic_download")
     if fallback_handler:
         logger.warning(f"No specific repository handler found for {url}, using dynamic download")
-        return fallback_handler.create_client(timeout=timeout, user_agent=user_agent, **kwargs)
+        return _create_client(fallback_handler, url, timeout, user_agent, **kwargs)
     raise RepositoryError(f"No repository handler available for {url}")
 
 
@@ -88,11 +130,11 @@ async def get_repository_client_async_impl(
     **kwargs: Any,
 ) -> RepositoryClient:
     """Get repository client with intelligent domain knowledge and optional probing."""
-    domain_service = DomainKnowledgeService()
-
-    # 1. Handle explicit source type (highest priority)
+    # 1. Handle explicit source type (highest priority), no domain knowledge needed
     if source_type:
-        return await _try_explicit_source_type(source_type, timeout, user_agent, **kwargs)
+        return await _try_explicit_source_type(url, source_type, timeout, user_agent, **kwargs)
+
+    domain_service = DomainKnowledgeService()
 
     # 2. Fast-path: Try domain knowledge first
     client = await _try_domain_knowledge(url, domain_service, timeout, user_agent, **kwargs)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 import re
 from typing import Any
@@ -12,12 +13,31 @@ from loguru import logger
 from pydantic import ValidationError
 
 from appimage_updater._version import __version__
-from appimage_updater.core.models import Asset, Release
+from appimage_updater.core.models import RawAsset, Release
 from appimage_updater.utils.version_utils import normalize_version_string
 
 from ...core.http_service import get_http_client
+from ..base import (
+    get_next_page_url,
+    take_releases,
+)
+from ..checksums import associate_checksum_files
 from ..protocol import AuthProtocol
 from .auth import GitHubAuth, get_github_auth
+from .graphql import (
+    GitHubGraphQLClient,
+    GitHubGraphQLError,
+)
+
+
+# Largest page size the GitHub REST API accepts
+GITHUB_MAX_PER_PAGE = 100
+
+# git@host:owner/repo[.git]
+_SSH_REPO_URL = re.compile(r"git@[^:]+:([^/]+)/([^/]+?)(?:\.git)?$")
+
+# scheme://host/owner/repo[.git][/] on GitHub and compatible forges, e.g. self-hosted Gitea
+_HTTP_REPO_URL = re.compile(r"https?://[^/]+/([^/]+)/([^/]+?)(?:\.git)?/?$")
 
 
 class GitHubClientError(Exception):
@@ -140,44 +160,107 @@ class GitHubClient:
         return [self._parse_release(release_data) for release_data in releases_data]
 
     async def get_releases(self, repo_url: str, limit: int = 10) -> list[Release]:
-        """Get recent releases for a repository."""
-        owner, repo = self._parse_repo_url(repo_url)
-        api_base = self._get_api_base_url(repo_url)
-        api_url = f"{api_base}/repos/{owner}/{repo}/releases"
+        """Get recent releases for a repository, following pagination beyond GitHub's page size."""
+        if limit > GITHUB_MAX_PER_PAGE:
+            return await self._collect_releases(repo_url, limit)
+
+        response = await self._request_releases(
+            repo_url, self._get_releases_api_url(repo_url), {"per_page": str(limit)}
+        )
+        return self._validate_and_parse_releases_response(response)
 
+    async def iter_releases(self, repo_url: str, per_page: int = GITHUB_MAX_PER_PAGE) -> AsyncIterator[Release]:
+        """Iterate over releases, newest first, requesting the next page only once this one is consumed.
+
+        Args:
+            repo_url: Repository URL
+            per_page: Releases per request (GitHub allows at most 100)
+        """
+        page_size = min(per_page, GITHUB_MAX_PER_PAGE)
+        next_url: str | None = self._get_releases_api_url(repo_url)
+        params: dict[str, str] | None = {"per_page": str(page_size)}
+        while next_url:
+            response = await self._request_releases(repo_url, next_url, params)
+            releases = self._validate_and_parse_releases_response(response)
+            for release in releases:
+                yield release
+            # The next link carries the query parameters
+            next_url, params = get_next_page_url(response, len(releases), page_size), None
+
+    async def _collect_releases(self, repo_url: str, limit: int) -> list[Release]:
+        """Collect up to limit releases across pages."""
+        return [release async for release in take_releases(self.iter_releases(repo_url), limit)]
+
+    async def _request_releases(self, repo_url: str, api_url: str, params: dict[str, str] | None) -> httpx.Response:
+        """Request a page of releases."""
+        owner, repo = self._parse_repo_url(repo_url)
         async with get_http_client(timeout=self.timeout) as client:
             try:
                 # Use dynamic authentication based on URL
                 forge_auth = self.dynamic_auth.get_auth_for_url(repo_url)
                 headers = forge_auth.get_auth_headers()
-                response = await client.get(
+                response: httpx.Response = await client.get(
                     api_url,
                     headers=headers,
-                    params={"per_page": str(limit)},
+                    params=params,
                 )
                 response.raise_for_status()
             except httpx.HTTPError as e:
                 self._handle_releases_request_error(e, owner, repo)
 
-        return self._validate_and_parse_releases_response(response)
+        return response
+
+    def _get_releases_api_url(self, repo_url: str) -> str:
+        """Get the releases API URL of a repository."""
+        owner, repo = self._parse_repo_url(repo_url)
+        return f"{self._get_api_base_url(repo_url)}/repos/{owner}/{repo}/releases"
+
+    async def get_releases_batch(self, repo_urls: list[str], limit: int = 10) -> dict[str, list[Release]]:
+        """Get recent releases for several GitHub repositories using batched GraphQL queries.
+
+        Requires authentication. Repositories the batch could not resolve are left
+        out of the result so callers can fall back to get_releases().
+        """
+        graphql = GitHubGraphQLClient(timeout=self.timeout, auth=self.github_auth)
+        if not graphql.is_available:
+            msg = "GitHub GraphQL API requires authentication"
+            raise GitHubClientError(msg)
+
+        repositories = self._parse_repo_urls(repo_urls)
+        try:
+            fetched = await graphql.fetch_releases(list(dict.fromkeys(repositories.values())), limit=limit)
+        except GitHubGraphQLError as e:
+            raise GitHubClientError(str(e)) from e
+
+        return self._parse_batch_releases(repositories, fetched)
+
+    def _parse_batch_releases(
+        self, repositories: dict[str, tuple[str, str]], fetched: dict[tuple[str, str], list[dict[str, Any]]]
+    ) -> dict[str, list[Release]]:
+        """Parse batched releases, keyed by the repository URLs they were requested for."""
+        return {
+            repo_url: [self._parse_release(release_data) for release_data in fetched[repository]]
+            for repo_url, repository in repositories.items()
+            if repository in fetched
+        }
+
+    def _parse_repo_urls(self, repo_urls: list[str]) -> dict[str, tuple[str, str]]:
+        """Parse repository URLs to (owner, repo) pairs, skipping URLs that cannot be parsed."""
+        repositories: dict[str, tuple[str, str]] = {}
+        for repo_url in repo_urls:
+            try:
+                repositories[repo_url] = self._parse_repo_url(repo_url)
+            except GitHubClientError as e:
+                logger.debug(f"Skipping {repo_url} in batched release fetch: {e}")
+        return repositories
 
     # noinspection PyMethodMayBeStatic
     def _parse_repo_url(self, url: str) -> tuple[str, str]:
         """Parse repository URL to extract owner and repo name."""
-        # Handle various repository URL formats (GitHub, Gitea, Forgejo, Codeberg, etc.)
-        patterns = [
-            # GitHub formats
-            r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$",
-            r"git@github\.com:([^/]+)/([^/]+?)(?:\.git)?$",
-            # Generic Git hosting formats (Gitea, Forgejo, Codeberg, etc.)
-            r"https?://[^/]+/([^/]+)/([^/]+?)(?:\.git)?/?$",
-            r"git@[^:]+:([^/]+)/([^/]+?)(?:\.git)?$",
-        ]
-
-        for pattern in patterns:
-            match = re.match(pattern, url)
-            if match:
-                return match.group(1), match.group(2)
+        # Handles GitHub, Gitea, Forgejo, Codeberg, etc. over HTTP(S) or SSH
+        match = _HTTP_REPO_URL.match(url) or _SSH_REPO_URL.match(url)
+        if match:
+            return match.group(1), match.group(2)
 
         msg = f"Invalid repository URL: {url}"
         raise GitHubClientError(msg)
@@ -199,19 +282,20 @@ class GitHubClient:
             logger.debug(
                 f"Parsing release {data.get('tag_name', 'unknown')}: prerelease={data.get('prerelease', 'missing')}"
             )
-            # Parse assets first
-            assets = []
-            for asset_data in data.get("assets", []):
-                asset = Asset(
+            # Parse assets first, leaving validation to the assets that are selected
+            assets = [
+                RawAsset(
                     name=asset_data["name"],
                     url=asset_data["browser_download_url"],
                     size=asset_data["size"],
-                    created_at=datetime.fromisoformat(asset_data["created_at"].replace("Z", "+00:00")),
+                    created_at=asset_data["created_at"],
+                    digest=asset_data.get("digest"),
                 )
-                assets.append(asset)
+                for asset_data in data.get("assets", [])
+            ]
 
             # Associate checksum files with their corresponding assets
-            self._associate_checksum_files(assets)
+            associate_checksum_files(assets)
 
             # Parse release with normalized versions
             raw_version = data["name"] or data["tag_name"]
@@ -222,79 +306,10 @@ class GitHubClient:
                 tag_name=normalize_version_string(raw_tag_name),
                 name=normalize_version_string(data["name"]) if data["name"] else None,
                 published_at=datetime.fromisoformat(data["published_at"].replace("Z", "+00:00")),
-                assets=assets,
+                raw_assets=assets,
                 is_prerelease=data.get("prerelease", False),
                 is_draft=data.get("draft", False),
             )
         except (KeyError, ValidationError, ValueError) as e:
             msg = f"Failed to parse release data: {e}"
             raise GitHubClientError(msg) from e
-
-    def _associate_checksum_files(self, assets: list[Asset]) -> None:
-        """Associate checksum files with their corresponding assets."""
-        # Find checksum files and create mapping
-        checksum_candidates = self._find_checksum_candidates(assets)
-        logger.debug(f"Total checksum candidates: {len(checksum_candidates)}")
-
-        # Associate each asset with its checksum file
-        self._associate_assets_with_checksums(assets, checksum_candidates)
-
-    # noinspection PyMethodMayBeStatic
-    def _find_checksum_candidates(self, assets: list[Asset]) -> dict[str, Asset]:
-        """Find potential checksum files and map them to their base names."""
-        checksum_patterns = [
-            r"^(.+)-(?:SHA256|sha256)\.txt$",  # filename-SHA256.txt
-            r"^(.+)-(?:SHA1|sha1)\.txt$",  # filename-SHA1.txt
-            r"^(.+)-(?:MD5|md5)\.txt$",  # filename-MD5.txt
-            r"^(.+)_(?:SHA256|sha256)\.txt$",  # filename_SHA256.txt
-            r"^(.+)_(?:SHA1|sha1)\.txt$",  # filename_SHA1.txt
-            r"^(.+)_(?:MD5|md5)\.txt$",  # filename_MD5.txt
-            r"^(.+)\.sha256$",  # filename.sha256
-            r"^(.+)\.sha1$",  # filename.sha1
-            r"^(.+)\.md5$",  # filename.md5
-        ]
-
-        checksum_candidates = {}
-        for asset in assets:
-            for pattern in checksum_patterns:
-                match = re.match(pattern, asset.name)
-                if match:
-                    base_name = match.group(1)
-                    checksum_candidates[base_name] = asset
-                    logger.debug(f"Found checksum candidate: {asset.name} -> {base_name}")
-                    break
-
-        return checksum_candidates
-
-    def _associate_assets_with_checksums(self, assets: list[Asset], checksum_candidates: dict[str, Asset]) -> None:
-        """Associate each asset with its corresponding checksum file."""
-        for asset in assets:
-            if asset not in checksum_candidates.values():
-                # This is not a checksum file itself, look for its checksum
-                base_name = asset.name
-                logger.debug(f"Looking for checksum for asset: {base_name}")
-
-                # Try to find checksum file for this asset
-                checksum_asset = self._find_checksum_for_asset(base_name, checksum_candidates)
-                if checksum_asset:
-                    asset.checksum_asset = checksum_asset
-                    logger.debug(f"Associated checksum: {checksum_asset.name}")
-                else:
-                    logger.debug(f"No checksum found for {base_name}")
-
-    # noinspection PyMethodMayBeStatic
-    def _find_checksum_for_asset(self, asset_name: str, checksum_candidates: dict[str, Asset]) -> Asset | None:
-        """Find checksum file for a specific asset."""
-        # Try exact match first
-        if asset_name in checksum_candidates:
-            return checksum_candidates[asset_name]
-
-        # Try removing common extensions and matching
-        extensions = [".AppImage", ".tar.gz", ".zip", ".deb", ".rpm"]
-        for ext in extensions:
-            if asset_name.endswith(ext):
-                name_without_ext = asset_name[: -len(ext)]
-                if name_without_ext in checksum_candidates:
-                    return checksum_candidates[name_without_ext]
-
-        return None
@@ -0,0 +1,102 @@
+"""GitHub release Atom feed reader for cheap change detection.
+
+``https://github.com/{owner}/{repo}/releases.atom`` lists a repository's releases,
+newest first. It is served by github.com rather than the REST API, so reading it
+does not count against the API rate limit, and the shared HTTP client's response
+cache revalidates it with ``If-None-Match``. Only the newest entry's tag is
+extracted; the feed carries no prerelease flag or assets, so it can tell that
+nothing changed but never replaces a real release lookup.
+"""
+
+from __future__ import annotations
+
+import re
+import urllib.parse
+import xml.etree.ElementTree as ET
+
+import httpx
+from loguru import logger
+
+from ...core.http_service import get_http_client
+
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+_GITHUB_REPO_PATTERN = re.compile(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+
+class GitHubFeedError(Exception):
+    """Raised when a release feed cannot be fetched or parsed."""
+
+
+def get_feed_url(repo_url: str) -> str | None:
+    """Get the release feed URL of a github.com repository, or None for other URLs."""
+    match = _GITHUB_REPO_PATTERN.match(repo_url)
+    if not match:
+        return None
+    owner, repo = match.groups()
+    return f"https://github.com/{owner}/{repo}/releases.atom"
+
+
+def parse_newest_tag(content: bytes) -> str | None:
+    """Get the tag of the newest release in a feed, or None when the feed has no entries."""
+    try:
+        root = ET.fromstring(content)  # noqa: S314 - GitHub's own feed, no DTDs
+    except ET.ParseError as e:
+        msg = f"Invalid release feed: {e}"
+        raise GitHubFeedError(msg) from e
+
+    entry = root.find(f"{_ATOM_NS}entry")
+    if entry is None:
+        return None
+    return _get_entry_tag(entry)
+
+
+def _get_entry_tag(entry: ET.Element) -> str | None:
+    """Get an entry's tag from its release link, falling back to the entry id."""
+    link = entry.find(f"{_ATOM_NS}link")
+    href = link.get("href", "") if link is not None else ""
+    if "/releases/tag/" in href:
+        return urllib.parse.unquote(href.rsplit("/releases/tag/", 1)[1])
+
+    # Entry ids look like "tag:github.com,2008:Repository/123456/v1.2.3"
+    entry_id = entry.findtext(f"{_ATOM_NS}id") or ""
+    _, _, tag = entry_id.rpartition("/")
+    return tag or None
+
+
+class GitHubReleaseFeed:
+    """Read the newest release tag of GitHub repositories from their Atom feeds."""
+
+    def __init__(self, timeout: int = 10) -> None:
+        """Initialize release feed reader.
+
+        Args:
+            timeout: Request timeout in seconds
+        """
+        self.timeout = timeout
+
+    async def get_newest_tag(self, repo_url: str) -> str | None:
+        """Get the tag of a repository's newest release.
+
+        Returns:
+            The newest tag, or None for repositories without releases or not hosted on github.com
+
+        Raises:
+            GitHubFeedError: If the feed cannot be fetched or parsed
+        """
+        feed_url = get_feed_url(repo_url)
+        if feed_url is None:
+            return None
+
+        async with get_http_client(timeout=self.timeout) as client:
+            try:
+                response = await client.get(feed_url, headers={"Accept": "application/atom+xml"})
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                msg = f"Failed to fetch release feed {feed_url}: {e}"
+                raise GitHubFeedError(msg) from e
+
+        tag = parse_newest_tag(response.content)
+        logger.debug(f"Newest release on {feed_url}: {tag}")
+        return tag
@@ -0,0 +1,182 @@
+"""GitHub GraphQL client for fetching releases of many repositories at once.
+
+The REST API needs one request per repository and returns full release bodies
+and every asset field. A single GraphQL query can instead cover dozens of
+repositories, selecting only the fields GitHubClient._parse_release() uses.
+The GraphQL API requires authentication, so this is only used with a token.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from ...core.http_service import get_http_client
+from .auth import (
+    GitHubAuth,
+    get_github_auth,
+)
+
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Repositories per query, keeping each query well below GitHub's node limits
+GRAPHQL_BATCH_SIZE = 25
+
+# Assets fetched per release (the REST API's default page size)
+GRAPHQL_MAX_ASSETS = 100
+
+_RELEASES_FRAGMENT = f"""
+fragment releaseFields on Repository {{
+  releases(first: $limit, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+    nodes {{
+      tagName
+      name
+      publishedAt
+      createdAt
+      isPrerelease
+      isDraft
+      releaseAssets(first: {GRAPHQL_MAX_ASSETS}) {{
+        nodes {{ name downloadUrl size createdAt }}
+      }}
+    }}
+  }}
+}}
+"""
+
+
+class GitHubGraphQLError(Exception):
+    """Raised when a GitHub GraphQL request fails."""
+
+
+def build_releases_query(repositories: list[tuple[str, str]]) -> str:
+    """Build a query fetching the releases of several repositories, aliased r0, r1, ...
+
+    Owners and names are passed as variables ($owner0, $name0, ...) rather than
+    embedded in the query text.
+    """
+    variables = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(len(repositories)))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...releaseFields }}" for i in range(len(repositories))
+    )
+    return f"query($limit: Int!, {variables}) {{\n{fields}\n}}\n{_RELEASES_FRAGMENT}"
+
+
+def build_releases_variables(repositories: list[tuple[str, str]], limit: int) -> dict[str, Any]:
+    """Build the variables for build_releases_query()."""
+    variables: dict[str, Any] = {"limit": limit}
+    for i, (owner, name) in enumerate(repositories):
+        variables[f"owner{i}"] = owner
+        variables[f"name{i}"] = name
+    return variables
+
+
+def to_rest_release(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL release node to the REST API's release format."""
+    return {
+        "tag_name": node["tagName"],
+        "name": node.get("name"),
+        # Drafts have no publication date yet
+        "published_at": node.get("publishedAt") or node["createdAt"],
+        "prerelease": node.get("isPrerelease", False),
+        "draft": node.get("isDraft", False),
+        "assets": [
+            {
+                "name": asset["name"],
+                "browser_download_url": asset["downloadUrl"],
+                "size": asset["size"],
+                "created_at": asset["createdAt"],
+            }
+            for asset in node["releaseAssets"]["nodes"]
+        ],
+    }
+
+
+class GitHubGraphQLClient:
+    """Fetch releases of many GitHub repositories in batched GraphQL queries."""
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        auth: GitHubAuth | None = None,
+        batch_size: int = GRAPHQL_BATCH_SIZE,
+    ) -> None:
+        """Initialize GitHub GraphQL client.
+
+        Args:
+            timeout: Request timeout in seconds
+            auth: GitHubAuth instance for authentication
+            batch_size: Maximum repositories per query
+        """
+        self.timeout = timeout
+        self.auth = auth or get_github_auth()
+        self.batch_size = max(batch_size, 1)
+
+    @property
+    def is_available(self) -> bool:
+        """Check if GraphQL can be used (it requires a token)."""
+        return self.auth.is_authenticated
+
+    async def fetch_releases(
+        self, repositories: list[tuple[str, str]], limit: int = 10
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Fetch recent releases of several repositories.
+
+        Args:
+            repositories: (owner, name) pairs
+            limit: Releases per repository
+
+        Returns:
+            Releases in the REST API's format per (owner, name); repositories
+            that could not be resolved (missing, private, ...) are left out
+        """
+        results: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for start in range(0, len(repositories), self.batch_size):
+            batch = repositories[start : start + self.batch_size]
+            data = await self._execute(build_releases_query(batch), build_releases_variables(batch, limit))
+            results.update(self._collect_batch(batch, data))
+        return results
+
+    async def _execute(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Execute a query and return its data, tolerating per-repository errors."""
+        headers = {**self.auth.get_auth_headers(), "Authorization": f"bearer {self.auth.token}"}
+        async with get_http_client(timeout=self.timeout) as client:
+            try:
+                response = await client.post(
+                    GRAPHQL_URL, json={"query": query, "variables": variables}, headers=headers
+                )
+                response.raise_for_status()
+                payload = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                msg = f"GitHub GraphQL request failed: {e}"
+                raise GitHubGraphQLError(msg) from e
+
+        return _get_query_data(payload)
+
+    # noinspection PyMethodMayBeStatic
+    def _collect_batch(
+        self, batch: list[tuple[str, str]], data: dict[str, Any]
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Map the aliased repositories of a query result back to (owner, name)."""
+        results: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for i, repository in enumerate(batch):
+            node = data.get(f"r{i}")
+            if node is None:
+                continue
+            results[repository] = [to_rest_release(release) for release in node["releases"]["nodes"]]
+        return results
+
+
+def _get_query_data(payload: Any) -> dict[str, Any]:
+    """Get the data of a GraphQL response, raising when the query failed as a whole."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+        errors = payload.get("errors") if isinstance(payload, dict) else payload
+        msg = f"GitHub GraphQL query returned no data: {errors}"
+        raise GitHubGraphQLError(msg)
+
+    if payload.get("errors"):
+        logger.debug(f"GitHub GraphQL query returned partial data: {payload['errors']}")
+    data: dict[str, Any] = payload["data"]
+    return data
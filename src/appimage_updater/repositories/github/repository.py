@@ -6,6 +6,7 @@ wrapping the existing GitHub client functionality.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 import re
 from typing import Any
 import urllib.parse
@@ -16,10 +17,12 @@ from appimage_updater.core.models import Release
 from appimage_updater.repositories.base import (
     RepositoryClient,
     RepositoryError,
+    take_releases,
 )
 
 from .auth import GitHubAuth
 from .client import (
+    GITHUB_MAX_PER_PAGE,
     GitHubClient,
     GitHubClientError,
 )
@@ -63,6 +66,10 @@ class GitHubRepository(RepositoryClient):
         except GitHubClientError as e:
             raise RepositoryError(str(e)) from e
 
+    async def get_latest_release_direct(self, repo_url: str) -> Release | None:
+        """Get the latest stable release from the /releases/latest endpoint (GitHub and Gitea)."""
+        return await self.get_latest_release(repo_url)
+
     async def get_latest_release_including_prerelease(self, repo_url: str) -> Release:
         """Get the latest release including prereleases for a GitHub repository."""
         try:
@@ -80,6 +87,28 @@ class GitHubRepository(RepositoryClient):
         except GitHubClientError as e:
             raise RepositoryError(str(e)) from e
 
+    async def iter_releases(self, repo_url: str, max_releases: int | None = None) -> AsyncIterator[Release]:
+        """Iterate over releases of a GitHub repository, following pagination until max_releases."""
+        per_page = min(max_releases or GITHUB_MAX_PER_PAGE, GITHUB_MAX_PER_PAGE)
+        releases = self._github_client.iter_releases(repo_url, per_page=per_page)
+        try:
+            async for release in take_releases(releases, max_releases):
+                yield self._convert_nightly_version(release)
+        except GitHubClientError as e:
+            raise RepositoryError(str(e)) from e
+
+    async def get_releases_batch(self, repo_urls: list[str], limit: int = 10) -> dict[str, list[Release]]:
+        """Get recent releases for several GitHub repositories in batched GraphQL queries."""
+        try:
+            releases_by_url = await self._github_client.get_releases_batch(repo_urls, limit=limit)
+        except GitHubClientError as e:
+            raise RepositoryError(str(e)) from e
+
+        return {
+            repo_url: [self._convert_nightly_version(release) for release in releases]
+            for repo_url, releases in releases_by_url.items()
+        }
+
     def parse_repo_url(self, url: str) -> tuple[str, str]:
         """Parse GitHub repository URL to extract owner and repo name."""
         try:
@@ -228,8 +257,7 @@ class GitHubRepository(RepositoryClient):
         Returns True if the repository only has prerelease versions (like continuous builds)
         and no stable releases, indicating that prerelease support should be enabled.
 
-        Uses progressive fetching: starts with 100 releases and doubles the limit
-        if no stable release is found but more releases may exist.
+        Scans releases page by page, stopping at the first stable release.
 
         Args:
             url: Repository URL
@@ -238,55 +266,11 @@ class GitHubRepository(RepositoryClient):
             bool: True if only prereleases are found, False if stable releases exist or on error
         """
         try:
-            return await self._progressive_prerelease_check(url)
+            return await self._has_only_prereleases(url)
         except (RepositoryError, ValueError, AttributeError) as e:
             logger.debug(f"Error checking prerelease status for {url}: {e}")
             return False
 
-    async def _progressive_prerelease_check(self, url: str) -> bool:
-        """Progressively fetch releases to check for stable versions."""
-        limit = 100
-        max_limit = 1600
-
-        while limit <= max_limit:
-            result = await self._check_releases_for_stable(url, limit)
-            if result is not None:
-                return result
-            limit *= 2
-
-        logger.debug(f"No stable releases found in first {max_limit} releases for {url}")
-        return True
-
-    async def _check_releases_for_stable(self, url: str, limit: int) -> bool | None:
-        """Check a batch of releases for stable versions. Returns None to continue searching."""
-        releases = await self.get_releases(url, limit=limit)
-        valid_releases = self._filter_valid_releases(releases, url) if releases else []
-        return self._evaluate_release_batch(valid_releases, len(releases) if releases else 0, limit, url)
-
-    def _evaluate_release_batch(
-        self, valid_releases: list[Release], total_count: int, limit: int, url: str
-    ) -> bool | None:
-        """Evaluate a batch of releases and determine next action."""
-        if not valid_releases:
-            return False
-
-        stable_count = self._count_stable_releases(valid_releases)
-        if stable_count > 0:
-            logger.debug(f"Found {stable_count} stable releases for {url}")
-            return False
-
-        return self._determine_next_action(total_count, limit, url)
-
-    def _count_stable_releases(self, releases: list[Release]) -> int:
-        """Count non-prerelease releases."""
-        return sum(1 for r in releases if not r.is_prerelease)
-
-    def _determine_next_action(self, total_count: int, limit: int, url: str) -> bool | None:
-        """Determine whether to return True (only prereleases) or None (continue searching)."""
-        all_fetched = total_count < limit - 1
-        logger.debug(f"No stable in {total_count} releases for {url}, {'done' if all_fetched else 'expanding'}")
-        return True if all_fetched else None
-
     def _collect_release_files(self, releases: list[Release]) -> dict[str, list[str]]:
         """Collect filenames grouped by stability and extension."""
         groups: dict[str, list[str]] = {
@@ -345,15 +329,6 @@ class GitHubRepository(RepositoryClient):
             return target[:3]  # Limit to 3 files for pattern generation
         return None
 
-    # noinspection PyMethodMayBeStatic
-    def _filter_valid_releases(self, releases: list[Release], url: str) -> list[Release]:
-        """Filter out draft releases and return valid releases."""
-        valid_releases = [r for r in releases if not r.is_draft]
-
-        logger.debug(f"Found {len(valid_releases)} valid releases (non-draft) for {url}")
-
-        return valid_releases
-
     # noinspection PyMethodMayBeStatic
     def _analyze_prerelease_status(self, valid_releases: list[Release], url: str) -> bool:
         """Analyze releases to determine if only prereleases exist."""
@@ -6,6 +6,7 @@ supporting both gitlab.com and self-hosted GitLab instances.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 import re
 from typing import Any, NoReturn
 import urllib.parse
@@ -14,8 +15,22 @@ import httpx
 from loguru import logger
 
 from appimage_updater._version import __version__
+from appimage_updater.core.http_service import GlobalHTTPClient
 
+from ..base import (
+    PRERELEASE_SCAN_LIMIT,
+    get_next_page_url,
+    take_releases,
+)
 from .auth import GitLabAuth
+from .graphql import (
+    GitLabGraphQLClient,
+    GitLabGraphQLError,
+)
+
+
+# Largest page size the GitLab API accepts
+GITLAB_MAX_PER_PAGE = 100
 
 
 class GitLabClientError(Exception):
@@ -54,6 +69,9 @@ class GitLabClient:
             timeout=timeout, headers={"User-Agent": self.user_agent, **self.auth.get_headers()}
         )
 
+        # Project API URLs per (base URL, project path), by numeric ID once a GraphQL batch reported it
+        self._project_api_urls: dict[tuple[str, str], str] = {}
+
         logger.debug(f"GitLab client initialized with timeout={timeout}s, auth={self.auth.is_authenticated()}")
 
     def _get_default_user_agent(self) -> str:
@@ -71,6 +89,16 @@ class GitLabClient:
         """Async context manager exit."""
         await self._client.aclose()
 
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET request through the shared tracing, caching, coalescing, rate limits and retries.
+
+        The request goes out on this client's own connection pool. The authentication
+        headers are sent per request too, so they are part of the coalescing and cache keys.
+        """
+        client = GlobalHTTPClient().wrap_client(self._client, headers=self.auth.get_headers())
+        response: httpx.Response = await client.get(url, **kwargs)
+        return response
+
     def _get_base_url(self, repo_url: str) -> str:
         """Extract base URL from repository URL.
 
@@ -116,12 +144,11 @@ class GitLabClient:
         Raises:
             GitLabClientError: If the API request fails or no releases found
         """
-        project_path = self._url_encode_project_path(owner, repo)
-        api_url = f"{base_url}/api/v4/projects/{project_path}/releases/permalink/latest"
+        api_url = f"{self._get_project_api_url(owner, repo, base_url)}/releases/permalink/latest"
 
         try:
             logger.debug(f"Fetching latest GitLab release: {api_url}")
-            response = await self._client.get(api_url)
+            response = await self._get(api_url)
             response.raise_for_status()
 
             release_info: dict[str, Any] = response.json()
@@ -172,24 +199,113 @@ class GitLabClient:
         Raises:
             GitLabClientError: If the API request fails
         """
-        project_path = self._url_encode_project_path(owner, repo)
-        api_url = f"{base_url}/api/v4/projects/{project_path}/releases"
-        params = self._build_releases_params(limit)
+        if limit > GITLAB_MAX_PER_PAGE:
+            return await self._collect_releases(owner, repo, base_url, limit)
+
+        api_url = self._get_releases_api_url(owner, repo, base_url)
+        releases, _ = await self._fetch_releases_page(api_url, self._build_releases_params(limit), owner, repo, limit)
+        return releases[:limit]  # Ensure we don't exceed requested limit
+
+    async def iter_releases(
+        self, owner: str, repo: str, base_url: str = "https://gitlab.com", per_page: int = GITLAB_MAX_PER_PAGE
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over releases, newest first, requesting the next page only once this one is consumed.
+
+        Args:
+            owner: Project owner/namespace
+            repo: Repository name
+            base_url: GitLab instance base URL
+            per_page: Releases per request (GitLab allows at most 100)
 
+        Raises:
+            GitLabClientError: If the API request fails
+        """
+        page_size = min(per_page, GITLAB_MAX_PER_PAGE)
+        next_url: str | None = self._get_releases_api_url(owner, repo, base_url)
+        params: dict[str, str | int] | None = self._build_releases_params(page_size)
+        while next_url:
+            releases, next_url = await self._fetch_releases_page(next_url, params, owner, repo, page_size)
+            for release in releases:
+                yield release
+            # The next link carries the query parameters
+            params = None
+
+    async def _collect_releases(self, owner: str, repo: str, base_url: str, limit: int) -> list[dict[str, Any]]:
+        """Collect up to limit releases across pages."""
+        return [release async for release in take_releases(self.iter_releases(owner, repo, base_url), limit)]
+
+    async def _fetch_releases_page(
+        self, api_url: str, params: dict[str, str | int] | None, owner: str, repo: str, page_size: int
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Fetch a page of releases and the URL of the next page."""
         try:
-            logger.debug(f"Fetching GitLab releases: {api_url} (limit={limit})")
-            response = await self._client.get(api_url, params=params)
+            logger.debug(f"Fetching GitLab releases: {api_url} (per_page={page_size})")
+            response = await self._get(api_url, params=params)
             response.raise_for_status()
-
             releases: list[dict[str, Any]] = response.json()
-            logger.debug(f"Retrieved {len(releases)} releases for {owner}/{repo}")
-            return releases[:limit]  # Ensure we don't exceed requested limit
-
         except httpx.HTTPStatusError as e:
-            return self._handle_get_releases_error(e, owner, repo)
+            return self._handle_get_releases_error(e, owner, repo), None
         except httpx.RequestError as e:
             raise GitLabClientError(f"GitLab API request failed: {e}") from e
 
+        logger.debug(f"Retrieved {len(releases)} releases for {owner}/{repo}")
+        return releases, get_next_page_url(response, len(releases), page_size)
+
+    def _get_releases_api_url(self, owner: str, repo: str, base_url: str) -> str:
+        """Get the releases API URL of a project."""
+        return f"{self._get_project_api_url(owner, repo, base_url)}/releases"
+
+    def _get_project_api_url(self, owner: str, repo: str, base_url: str) -> str:
+        """Get the API URL of a project, built once per instance and project.
+
+        Projects are addressed by numeric ID only after get_releases_batch() has
+        reported it; REST responses carry no project ID, so projects only ever
+        fetched over REST keep their URL-encoded path.
+        """
+        key = (base_url, f"{owner}/{repo}")
+        api_url = self._project_api_urls.get(key)
+        if api_url is None:
+            api_url = f"{base_url}/api/v4/projects/{self._url_encode_project_path(owner, repo)}"
+            self._project_api_urls[key] = api_url
+        return api_url
+
+    def _remember_project_id(self, base_url: str, project_path: str, project_id: int) -> None:
+        """Address a project by the numeric ID a GraphQL batch reported from now on."""
+        self._project_api_urls[(base_url, project_path)] = f"{base_url}/api/v4/projects/{project_id}"
+
+    async def get_releases_batch(
+        self, projects: list[tuple[str, str]], base_url: str = "https://gitlab.com", limit: int = 10
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Get recent releases for several projects on one instance using batched GraphQL queries.
+
+        Args:
+            projects: (owner, repo) pairs
+            base_url: GitLab instance base URL
+            limit: Maximum number of releases per project
+
+        Returns:
+            Releases in the REST API's format per (owner, repo); projects the
+            batch could not resolve are left out so callers can fall back to
+            get_releases()
+
+        Raises:
+            GitLabClientError: If the GraphQL request fails
+        """
+        paths = {f"{owner}/{repo}": (owner, repo) for owner, repo in projects}
+        graphql = GitLabGraphQLClient(timeout=self.timeout, auth=self.auth)
+        try:
+            fetched = await graphql.fetch_releases(base_url, list(paths), limit=min(limit, GITLAB_MAX_PER_PAGE))
+        except GitLabGraphQLError as e:
+            raise GitLabClientError(str(e)) from e
+
+        results: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for project_path, project in fetched.items():
+            if project.project_id is not None:
+                self._remember_project_id(base_url, project_path, project.project_id)
+            results[paths[project_path]] = project.releases
+        logger.debug(f"Retrieved releases for {len(results)} of {len(paths)} GitLab projects on {base_url}")
+        return results
+
     def _build_releases_params(self, limit: int) -> dict[str, str | int]:
         """Build query parameters for releases API request.
 
@@ -200,7 +316,7 @@ class GitLabClient:
             Dictionary of query parameters
         """
         return {
-            "per_page": min(limit, 100),  # GitLab API max per_page is 100
+            "per_page": min(limit, GITLAB_MAX_PER_PAGE),
             "order_by": "released_at",
             "sort": "desc",
         }
@@ -234,9 +350,8 @@ class GitLabClient:
     async def should_enable_prerelease(self, owner: str, repo: str, base_url: str = "https://gitlab.com") -> bool:
         """Check if prerelease should be automatically enabled for a repository.
 
-        This method examines releases to determine if only prereleases exist.
-        Uses progressive fetching: starts with 100 releases and doubles the limit
-        if no stable release is found but more releases may exist.
+        This method examines releases to determine if only prereleases exist,
+        scanning page by page and stopping at the first stable release.
 
         Args:
             owner: Project owner/namespace
@@ -247,65 +362,22 @@ class GitLabClient:
             True if only prereleases are found, False if stable releases exist
         """
         try:
-            return await self._progressive_prerelease_check(owner, repo, base_url)
+            return await self._has_only_prereleases(owner, repo, base_url)
         except GitLabClientError:
             logger.debug(f"Could not analyze releases for {owner}/{repo}, defaulting prerelease=False")
             return False
 
-    async def _progressive_prerelease_check(self, owner: str, repo: str, base_url: str) -> bool:
-        """Progressively fetch releases to check for stable versions."""
-        limit = 100
-        max_limit = 1600
-
-        while limit <= max_limit:
-            result = await self._check_releases_for_stable(owner, repo, base_url, limit)
-            if result is not None:
-                return result
-            limit *= 2
-
-        logger.debug(f"No stable releases found in first {max_limit} releases for {owner}/{repo}")
-        return True
-
-    async def _check_releases_for_stable(self, owner: str, repo: str, base_url: str, limit: int) -> bool | None:
-        """Check a batch of releases for stable versions. Returns None to continue searching."""
-        releases = await self.get_releases(owner, repo, base_url, limit=limit)
-
-        if not releases:
-            logger.debug(f"No releases found for {owner}/{repo}, prerelease detection inconclusive")
-            return False
-
-        stable_count, prerelease_count = self._count_release_types(releases)
-
-        if stable_count > 0:
-            logger.debug(f"Found {stable_count} stable releases for {owner}/{repo}")
-            return False
-
-        if len(releases) < limit - 1:
-            logger.debug(f"No stable releases found in all {len(releases)} releases for {owner}/{repo}")
-            return prerelease_count > 0
-
-        logger.debug(f"No stable in first {len(releases)} releases, expanding search for {owner}/{repo}")
-        return None  # Continue searching
-
-    def _count_release_types(self, releases: list[dict[str, Any]]) -> tuple[int, int]:
-        """Count stable and prerelease versions in releases.
-
-        Args:
-            releases: List of release dictionaries
-
-        Returns:
-            Tuple of (stable_count, prerelease_count)
-        """
-        stable_count = 0
-        prerelease_count = 0
-
-        for release in releases:
-            if self._is_prerelease_version(release):
-                prerelease_count += 1
-            else:
-                stable_count += 1
-
-        return stable_count, prerelease_count
+    async def _has_only_prereleases(self, owner: str, repo: str, base_url: str) -> bool:
+        """Scan releases until the first stable one, up to PRERELEASE_SCAN_LIMIT releases."""
+        scanned = 0
+        async for release in take_releases(self.iter_releases(owner, repo, base_url), PRERELEASE_SCAN_LIMIT):
+            if not self._is_prerelease_version(release):
+                logger.debug(f"Found stable release {release.get('tag_name')} for {owner}/{repo}")
+                return False
+            scanned += 1
+
+        logger.debug(f"No stable release in {scanned} releases for {owner}/{repo}")
+        return scanned > 0
 
     def _is_prerelease_version(self, release: dict[str, Any]) -> bool:
         """Check if a release is a prerelease version.
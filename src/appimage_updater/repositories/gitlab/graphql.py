@@ -0,0 +1,204 @@
+"""GitLab GraphQL client for fetching releases of many projects at once.
+
+The REST API needs one request per project, addressed by its URL-encoded path.
+A single GraphQL query can instead cover dozens of projects on the same
+instance, returning the release fields and asset links that
+GitLabRepository._map_gitlab_release_to_release() uses along with each
+project's numeric ID. Public projects can be queried without a token.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    NamedTuple,
+)
+
+import httpx
+from loguru import logger
+
+from ...core.http_service import get_http_client
+from .auth import GitLabAuth
+
+
+# Projects per query, keeping each query well below GitLab's complexity limit
+GRAPHQL_BATCH_SIZE = 20
+
+# Asset links fetched per release (the largest page GitLab allows)
+GRAPHQL_MAX_LINKS = 100
+
+_PROJECT_GID_PREFIX = "gid://gitlab/Project/"
+
+_RELEASES_FRAGMENT = f"""
+fragment releaseFields on Project {{
+  id
+  releases(first: $limit, sort: RELEASED_AT_DESC) {{
+    nodes {{
+      tagName
+      name
+      releasedAt
+      createdAt
+      assets {{
+        links(first: {GRAPHQL_MAX_LINKS}) {{ nodes {{ name url directAssetUrl linkType }} }}
+        sources {{ nodes {{ format url }} }}
+      }}
+    }}
+  }}
+}}
+"""
+
+
+class GitLabGraphQLError(Exception):
+    """Raised when a GitLab GraphQL request fails."""
+
+
+class GitLabProjectReleases(NamedTuple):
+    """Releases of one project fetched in a batch, with the project's numeric ID."""
+
+    project_id: int | None
+    releases: list[dict[str, Any]]
+
+
+def get_graphql_url(base_url: str) -> str:
+    """Get the GraphQL endpoint of a GitLab instance."""
+    return f"{base_url}/api/graphql"
+
+
+def build_releases_query(project_paths: list[str]) -> str:
+    """Build a query fetching the releases of several projects, aliased p0, p1, ...
+
+    Project paths are passed as variables ($path0, $path1, ...) rather than
+    embedded in the query text.
+    """
+    variables = ", ".join(f"$path{i}: ID!" for i in range(len(project_paths)))
+    fields = "\n".join(f"  p{i}: project(fullPath: $path{i}) {{ ...releaseFields }}" for i in range(len(project_paths)))
+    return f"query($limit: Int!, {variables}) {{\n{fields}\n}}\n{_RELEASES_FRAGMENT}"
+
+
+def build_releases_variables(project_paths: list[str], limit: int) -> dict[str, Any]:
+    """Build the variables for build_releases_query()."""
+    variables: dict[str, Any] = {"limit": limit}
+    for i, project_path in enumerate(project_paths):
+        variables[f"path{i}"] = project_path
+    return variables
+
+
+def parse_project_id(global_id: str | None) -> int | None:
+    """Get the numeric project ID from a GraphQL global ID (gid://gitlab/Project/123)."""
+    if not global_id or not global_id.startswith(_PROJECT_GID_PREFIX):
+        return None
+    project_id = global_id.removeprefix(_PROJECT_GID_PREFIX)
+    return int(project_id) if project_id.isdigit() else None
+
+
+def to_rest_release(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL release node to the REST API's release format."""
+    assets = node.get("assets") or {}
+    return {
+        "tag_name": node["tagName"],
+        "name": node.get("name"),
+        "created_at": node.get("createdAt"),
+        # Upcoming releases have no release date yet
+        "released_at": node.get("releasedAt") or node.get("createdAt"),
+        "assets": {
+            "links": [
+                {
+                    "name": link["name"],
+                    "url": link["url"],
+                    "direct_asset_url": link.get("directAssetUrl"),
+                    "link_type": (link.get("linkType") or "other").lower(),
+                }
+                for link in (assets.get("links") or {}).get("nodes", [])
+            ],
+            "sources": [
+                {"format": source["format"], "url": source["url"]}
+                for source in (assets.get("sources") or {}).get("nodes", [])
+            ],
+        },
+    }
+
+
+class GitLabGraphQLClient:
+    """Fetch releases of many projects on a GitLab instance in batched GraphQL queries."""
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        auth: GitLabAuth | None = None,
+        batch_size: int = GRAPHQL_BATCH_SIZE,
+    ) -> None:
+        """Initialize GitLab GraphQL client.
+
+        Args:
+            timeout: Request timeout in seconds
+            auth: GitLabAuth instance for authentication
+            batch_size: Maximum projects per query
+        """
+        self.timeout = timeout
+        self.auth = auth or GitLabAuth()
+        self.batch_size = max(batch_size, 1)
+
+    async def fetch_releases(
+        self, base_url: str, project_paths: list[str], limit: int = 10
+    ) -> dict[str, GitLabProjectReleases]:
+        """Fetch recent releases of several projects on one instance.
+
+        Args:
+            base_url: GitLab instance base URL
+            project_paths: Full project paths (namespace/project)
+            limit: Releases per project
+
+        Returns:
+            Releases in the REST API's format per project path; projects that
+            could not be resolved (missing, private, ...) are left out
+        """
+        results: dict[str, GitLabProjectReleases] = {}
+        for start in range(0, len(project_paths), self.batch_size):
+            batch = project_paths[start : start + self.batch_size]
+            data = await self._execute(
+                get_graphql_url(base_url), build_releases_query(batch), build_releases_variables(batch, limit)
+            )
+            results.update(self._collect_batch(batch, data))
+        return results
+
+    async def _execute(self, graphql_url: str, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Execute a query and return its data, tolerating per-project errors."""
+        # The token, if any, authenticates like it does for the REST API
+        headers = self.auth.get_headers()
+        async with get_http_client(timeout=self.timeout) as client:
+            try:
+                response = await client.post(
+                    graphql_url, json={"query": query, "variables": variables}, headers=headers
+                )
+                response.raise_for_status()
+                payload = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                msg = f"GitLab GraphQL request failed: {e}"
+                raise GitLabGraphQLError(msg) from e
+
+        return _get_query_data(payload)
+
+    # noinspection PyMethodMayBeStatic
+    def _collect_batch(self, batch: list[str], data: dict[str, Any]) -> dict[str, GitLabProjectReleases]:
+        """Map the aliased projects of a query result back to their paths."""
+        results: dict[str, GitLabProjectReleases] = {}
+        for i, project_path in enumerate(batch):
+            node = data.get(f"p{i}")
+            if node is None or node.get("releases") is None:
+                continue
+            releases = [to_rest_release(release) for release in node["releases"]["nodes"]]
+            results[project_path] = GitLabProjectReleases(parse_project_id(node.get("id")), releases)
+        return results
+
+
+def _get_query_data(payload: Any) -> dict[str, Any]:
+    """Get the data of a GraphQL response, raising when the query failed as a whole."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+        errors = payload.get("errors") if isinstance(payload, dict) else payload
+        msg = f"GitLab GraphQL query returned no data: {errors}"
+        raise GitLabGraphQLError(msg)
+
+    if payload.get("errors"):
+        logger.debug(f"GitLab GraphQL query returned partial data: {payload['errors']}")
+    data: dict[str, Any] = payload["data"]
+    return data
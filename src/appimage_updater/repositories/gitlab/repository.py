@@ -6,6 +6,7 @@ supporting both gitlab.com and self-hosted GitLab instances.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 import re
 from typing import Any
@@ -13,11 +14,29 @@ import urllib.parse
 
 from loguru import logger
 
-from appimage_updater.core.models import Asset, Release
-from appimage_updater.repositories.base import RepositoryClient, RepositoryError
+from appimage_updater.core.models import RawAsset, Release
+from appimage_updater.repositories.base import (
+    RepositoryClient,
+    RepositoryError,
+    take_releases,
+)
+from appimage_updater.repositories.checksums import associate_checksum_files
 
 from .auth import GitLabAuth
-from .client import GitLabClient, GitLabClientError
+from .client import GITLAB_MAX_PER_PAGE, GitLabClient, GitLabClientError
+
+
+# Common self-hosted GitLab URL patterns, compiled once
+_GITLAB_URL_PATTERN = re.compile(
+    "|".join(
+        [
+            r"gitlab\.",  # gitlab.example.com
+            r"/gitlab/",  # example.com/gitlab/
+            r"git\..*\.com",  # git.company.com
+        ]
+    ),
+    re.IGNORECASE,
+)
 
 
 class GitLabRepository(RepositoryClient):
@@ -50,6 +69,9 @@ class GitLabRepository(RepositoryClient):
         # Initialize GitLab client
         self._gitlab_client = GitLabClient(timeout=timeout, user_agent=user_agent, auth=self._auth)
 
+        # (owner, repo, base_url) per repository URL, parsed once
+        self._projects: dict[str, tuple[str, str, str]] = {}
+
         logger.debug(f"GitLab repository client initialized (authenticated: {self._auth.is_authenticated()})")
 
     def detect_repository_type(self, url: str) -> bool:
@@ -66,13 +88,7 @@ class GitLabRepository(RepositoryClient):
             return True
 
         # Check for common GitLab URL patterns
-        gitlab_patterns = [
-            r"gitlab\.",  # gitlab.example.com
-            r"/gitlab/",  # example.com/gitlab/
-            r"git\..*\.com",  # git.company.com
-        ]
-
-        return any(re.search(pattern, url, re.IGNORECASE) for pattern in gitlab_patterns)
+        return _GITLAB_URL_PATTERN.search(url) is not None
 
     def parse_repo_url(self, url: str) -> tuple[str, str]:
         """Parse repository URL to extract owner and repo name.
@@ -254,8 +270,7 @@ class GitLabRepository(RepositoryClient):
             RepositoryError: If the operation fails
         """
         try:
-            owner, repo = self.parse_repo_url(repo_url)
-            base_url = self._get_base_url(repo_url)
+            owner, repo, base_url = self._resolve_project(repo_url)
 
             gitlab_release = await self._gitlab_client.get_latest_release(owner, repo, base_url)
             return self._map_gitlab_release_to_release(gitlab_release)
@@ -263,6 +278,20 @@ class GitLabRepository(RepositoryClient):
         except GitLabClientError as e:
             raise RepositoryError(f"Failed to get latest release from GitLab: {e}") from e
 
+    async def get_latest_release_direct(self, repo_url: str) -> Release | None:
+        """Get the latest release from the releases/permalink/latest endpoint.
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            Release object with release information
+
+        Raises:
+            RepositoryError: If the operation fails
+        """
+        return await self.get_latest_release(repo_url)
+
     async def get_latest_release_including_prerelease(self, repo_url: str) -> Release:
         """Get the latest release including prereleases.
 
@@ -279,8 +308,7 @@ class GitLabRepository(RepositoryClient):
             RepositoryError: If the operation fails
         """
         try:
-            owner, repo = self.parse_repo_url(repo_url)
-            base_url = self._get_base_url(repo_url)
+            owner, repo, base_url = self._resolve_project(repo_url)
 
             # Get recent releases and return the first (most recent) one
             releases = await self._gitlab_client.get_releases(owner, repo, base_url, limit=1)
@@ -307,8 +335,7 @@ class GitLabRepository(RepositoryClient):
             RepositoryError: If the operation fails
         """
         try:
-            owner, repo = self.parse_repo_url(repo_url)
-            base_url = self._get_base_url(repo_url)
+            owner, repo, base_url = self._resolve_project(repo_url)
 
             gitlab_releases = await self._gitlab_client.get_releases(owner, repo, base_url, limit)
             return [self._map_gitlab_release_to_release(release) for release in gitlab_releases]
@@ -316,6 +343,67 @@ class GitLabRepository(RepositoryClient):
         except GitLabClientError as e:
             raise RepositoryError(f"Failed to get releases from GitLab: {e}") from e
 
+    async def iter_releases(self, repo_url: str, max_releases: int | None = None) -> AsyncIterator[Release]:
+        """Iterate over releases of a GitLab project, following pagination until max_releases.
+
+        Args:
+            repo_url: Repository URL
+            max_releases: Maximum number of releases to yield (None for all)
+
+        Raises:
+            RepositoryError: If fetching a page fails
+        """
+        try:
+            owner, repo, base_url = self._resolve_project(repo_url)
+
+            per_page = min(max_releases or GITLAB_MAX_PER_PAGE, GITLAB_MAX_PER_PAGE)
+            gitlab_releases = self._gitlab_client.iter_releases(owner, repo, base_url, per_page)
+            async for gitlab_release in take_releases(gitlab_releases, max_releases):
+                yield self._map_gitlab_release_to_release(gitlab_release)
+
+        except GitLabClientError as e:
+            raise RepositoryError(f"Failed to get releases from GitLab: {e}") from e
+
+    async def get_releases_batch(self, repo_urls: list[str], limit: int = 10) -> dict[str, list[Release]]:
+        """Get recent releases for several GitLab projects in batched GraphQL queries.
+
+        Projects are grouped by instance, with one query per batch of projects on
+        each instance.
+
+        Args:
+            repo_urls: Repository URLs
+            limit: Maximum number of releases per project
+
+        Returns:
+            Releases per repository URL; projects the batch could not resolve are
+            left out so callers can fall back to get_releases()
+
+        Raises:
+            RepositoryError: If a GraphQL request fails
+        """
+        instances: dict[str, dict[str, tuple[str, str]]] = {}
+        for repo_url in repo_urls:
+            try:
+                owner, repo, base_url = self._resolve_project(repo_url)
+            except (RepositoryError, ValueError) as e:
+                logger.debug(f"Skipping {repo_url} in batched release fetch: {e}")
+                continue
+            instances.setdefault(base_url, {})[repo_url] = (owner, repo)
+
+        results: dict[str, list[Release]] = {}
+        for base_url, projects in instances.items():
+            try:
+                fetched = await self._gitlab_client.get_releases_batch(
+                    list(dict.fromkeys(projects.values())), base_url, limit=limit
+                )
+            except GitLabClientError as e:
+                raise RepositoryError(f"Failed to get releases from GitLab: {e}") from e
+
+            for repo_url, project in projects.items():
+                if project in fetched:
+                    results[repo_url] = [self._map_gitlab_release_to_release(release) for release in fetched[project]]
+        return results
+
     async def should_enable_prerelease(self, url: str) -> bool:
         """Check if prerelease should be automatically enabled for a repository.
 
@@ -326,8 +414,7 @@ class GitLabRepository(RepositoryClient):
             True if only prereleases are found, False if stable releases exist
         """
         try:
-            owner, repo = self.parse_repo_url(url)
-            base_url = self._get_base_url(url)
+            owner, repo, base_url = self._resolve_project(url)
 
             return await self._gitlab_client.should_enable_prerelease(owner, repo, base_url)
 
@@ -408,6 +495,15 @@ class GitLabRepository(RepositoryClient):
         parsed = urllib.parse.urlparse(repo_url)
         return f"{parsed.scheme}://{parsed.netloc}"
 
+    def _resolve_project(self, repo_url: str) -> tuple[str, str, str]:
+        """Get the owner, repo and instance base URL of a repository URL, parsed once per URL."""
+        project = self._projects.get(repo_url)
+        if project is None:
+            owner, repo = self.parse_repo_url(repo_url)
+            project = (owner, repo, self._get_base_url(repo_url))
+            self._projects[repo_url] = project
+        return project
+
     def _map_gitlab_release_to_release(self, gitlab_release: dict[str, Any]) -> Release:
         """Convert GitLab release format to AppImage Updater Release model.
 
@@ -431,13 +527,13 @@ class GitLabRepository(RepositoryClient):
             tag_name=tag_name,
             name=name,
             published_at=self._parse_datetime(published_at),
-            assets=assets,
+            raw_assets=assets,
             is_prerelease=self._is_prerelease(tag_name, name),
             is_draft=False,  # GitLab doesn't have draft releases in the same way
         )
 
-    def _map_gitlab_assets(self, gitlab_assets: dict[str, Any]) -> list[Asset]:
-        """Map GitLab assets structure to AppImage Updater Asset objects.
+    def _map_gitlab_assets(self, gitlab_assets: dict[str, Any]) -> list[RawAsset]:
+        """Map GitLab assets structure to AppImage Updater raw assets.
 
         GitLab has two types of assets:
         1. sources: Auto-generated source archives (zip, tar.gz, etc.)
@@ -449,18 +545,14 @@ class GitLabRepository(RepositoryClient):
             gitlab_assets: GitLab assets dictionary
 
         Returns:
-            List of Asset objects
+            List of raw assets, validated only once selected
         """
-        assets: list[Asset] = []
+        assets: list[RawAsset] = []
 
         # Process custom linked assets first (higher priority for AppImages)
         for link in gitlab_assets.get("links", []):
-            asset = Asset(
-                name=link.get("name", ""),
-                url=link.get("url", ""),
-                size=0,  # GitLab doesn't provide size in links
-                created_at=datetime.now(),  # Use current time as fallback
-            )
+            # GitLab doesn't provide size or creation time in links
+            asset = RawAsset(name=link.get("name", ""), url=link.get("url", ""))
 
             # Prioritize AppImage files by inserting at the beginning
             if asset.name.lower().endswith(".appimage"):
@@ -468,14 +560,12 @@ class GitLabRepository(RepositoryClient):
             else:
                 assets.append(asset)
 
+        # Associate checksum files with the linked assets they cover
+        associate_checksum_files(assets)
+
         # Add auto-generated source archives as fallback
         for source in gitlab_assets.get("sources", []):
-            asset = Asset(
-                name=f"Source ({source.get('format', 'unknown')})",
-                url=source.get("url", ""),
-                size=0,  # GitLab doesn't provide size for sources
-                created_at=datetime.now(),  # Use current time as fallback
-            )
+            asset = RawAsset(name=f"Source ({source.get('format', 'unknown')})", url=source.get("url", ""))
             assets.append(asset)
 
         return assets
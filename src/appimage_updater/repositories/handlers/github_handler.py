@@ -25,6 +25,7 @@ class GitHubHandler(RepositoryHandler):
             ],
             description="GitHub repository handler with releases API support",
             version="1.0.0",
+            owner_repo_urls=True,
         )
 
     def create_client(self, **kwargs: Any) -> RepositoryClient:
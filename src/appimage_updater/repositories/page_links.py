@@ -0,0 +1,139 @@
+"""Streaming extraction of AppImage download links from web pages.
+
+Direct download, dynamic download and SourceForge pages carry no release API,
+so their AppImage links are scraped from HTML (or Markdown) pages, some of
+which are several megabytes. Rather than loading the page into memory and
+running several regular expressions over it, the body is streamed through an
+incremental link collector. Reading stops once enough links are found or a
+byte limit is reached, bounding both memory and latency on heavy pages.
+"""
+
+from __future__ import annotations
+
+import codecs
+from dataclasses import (
+    dataclass,
+    field,
+)
+from html.parser import HTMLParser
+import re
+from typing import Any
+
+from ..core.http_service import get_http_client
+
+
+# Most of a page that is read when looking for links
+PAGE_SCAN_MAX_BYTES = 4 * 1024 * 1024
+
+# Markdown links, for pages serving a README or changelog as text
+_MARKDOWN_LINK_PATTERN = re.compile(r"\]\(([^)]*\.AppImage[^)]*)\)", re.IGNORECASE)
+
+# Text kept between chunks so Markdown links split across chunks are still found
+_MARKDOWN_CARRY_CHARS = 2048
+
+
+@dataclass
+class PageLinks:
+    """AppImage links found on a page, in document order."""
+
+    links: list[str] = field(default_factory=list)
+    text: str = ""  # Decoded part of the page that was read
+    complete: bool = True  # False if reading stopped before the end of the page
+
+
+class AppImageLinkCollector(HTMLParser):
+    """Incremental parser collecting hrefs and Markdown links that point to AppImages.
+
+    Feed it the page in chunks of any size; duplicate links are kept once.
+    """
+
+    def __init__(self, max_links: int | None = None) -> None:
+        """Initialize the collector.
+
+        Args:
+            max_links: Number of links after which the collector is done (None for all)
+        """
+        super().__init__(convert_charrefs=True)
+        self.max_links = max_links
+        self.links: list[str] = []
+        self._seen: set[str] = set()
+        self._text_tail = ""
+
+    @property
+    def done(self) -> bool:
+        """Check if enough links have been collected."""
+        return self.max_links is not None and len(self.links) >= self.max_links
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Collect the href of any element linking to an AppImage."""
+        self._text_tail = ""
+        for name, value in attrs:
+            if name == "href" and value:
+                self._add_link(value.strip())
+
+    def handle_data(self, data: str) -> None:
+        """Collect Markdown links from text, including links split across chunks."""
+        text = self._text_tail + data
+        end = 0
+        for match in _MARKDOWN_LINK_PATTERN.finditer(text):
+            self._add_link(match.group(1))
+            end = match.end()
+        self._text_tail = text[end:][-_MARKDOWN_CARRY_CHARS:]
+
+    def _add_link(self, link: str) -> None:
+        """Add a link if it points to an AppImage."""
+        if self.done or ".appimage" not in link.lower() or link in self._seen:
+            return
+        self._seen.add(link)
+        self.links.append(link)
+
+
+def extract_page_links(content: str, max_links: int | None = None) -> list[str]:
+    """Extract the AppImage links of a page that is already in memory."""
+    collector = AppImageLinkCollector(max_links=max_links)
+    collector.feed(content)
+    collector.close()
+    return collector.links
+
+
+async def scan_page_links(
+    url: str,
+    max_links: int | None = None,
+    max_bytes: int = PAGE_SCAN_MAX_BYTES,
+    **client_config: Any,
+) -> PageLinks:
+    """Stream a page and collect its AppImage links.
+
+    Args:
+        url: Page URL
+        max_links: Stop reading once this many links are found (None for all)
+        max_bytes: Stop reading after this many bytes
+        **client_config: Options for get_http_client()
+
+    Returns:
+        Links found and the text read
+
+    Raises:
+        httpx.HTTPError: If the page cannot be fetched
+    """
+    collector = AppImageLinkCollector(max_links=max_links)
+    chunks: list[str] = []
+    received = 0
+
+    async with get_http_client(**client_config) as client, client.stream("GET", url) as response:
+        response.raise_for_status()
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        async for chunk in response.aiter_bytes():
+            text = decoder.decode(chunk[: max_bytes - received])
+            received += len(chunk)
+            chunks.append(text)
+            collector.feed(text)
+            if collector.done or received >= max_bytes:
+                break
+        else:
+            chunks.append(decoder.decode(b"", final=True))
+            collector.feed(chunks[-1])
+            collector.close()
+            return PageLinks(collector.links, "".join(chunks))
+
+    return PageLinks(collector.links, "".join(chunks), complete=False)
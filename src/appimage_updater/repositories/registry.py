@@ -2,6 +2,10 @@
 
 This module provides a plugin-like architecture for repository handlers,
 allowing new repository types to be added without modifying core code.
+
+URL routing is compiled once: handler URL patterns are precompiled, handlers are
+indexed by their supported domains, and each URL is resolved to its compatible
+handlers and parsed owner/repo in a single pass that is cached per URL.
 """
 
 from __future__ import annotations
@@ -11,6 +15,7 @@ from dataclasses import dataclass, field
 from functools import lru_cache
 import re
 from typing import Any
+from urllib.parse import urlparse
 
 from loguru import logger
 
@@ -27,10 +32,44 @@ class RepositoryHandlerMetadata:
     supported_url_patterns: list[str] = field(default_factory=list)
     description: str = ""
     version: str = "1.0.0"
+    # Whether repository URLs have the scheme://host/owner/repo layout of GitHub-style forges
+    owner_repo_urls: bool = False
 
     def can_handle_url_pattern(self, url: str) -> bool:
         """Check if this handler can handle a URL pattern."""
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in self.supported_url_patterns)
+        return any(_compile_url_pattern(pattern).match(url) for pattern in self.supported_url_patterns)
+
+
+@lru_cache(maxsize=256)
+def _compile_url_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a handler URL pattern once."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# scheme://host/owner/repo[.git][/], the layout shared by GitHub-style forges
+_OWNER_REPO_PATH = re.compile(r"^/([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+# Resolved URLs kept per registry; URLs come from a bounded set of app configs
+_MAX_RESOLVED_URLS = 4096
+
+
+@dataclass(frozen=True)
+class ResolvedRepositoryURL:
+    """A repository URL resolved to its compatible handlers and parsed components.
+
+    Owner and repo are only parsed for URLs a forge handler (GitHub, GitLab) accepts.
+    """
+
+    url: str
+    handler_names: tuple[str, ...]
+    base_url: str
+    owner: str | None = None
+    repo: str | None = None
+
+    @property
+    def handler_name(self) -> str | None:
+        """Get the preferred handler's name, if any handler is compatible."""
+        return self.handler_names[0] if self.handler_names else None
 
 
 class RepositoryHandler(ABC):
@@ -62,6 +101,10 @@ class RepositoryHandlerRegistry:
     def __init__(self) -> None:
         self._handlers: dict[str, RepositoryHandler] = {}
         self._initialized = False
+        # Dispatch table, rebuilt whenever a handler is registered
+        self._by_priority: list[RepositoryHandler] = []
+        self._domain_handlers: dict[str, set[str]] = {}
+        self._resolved: dict[str, ResolvedRepositoryURL] = {}
 
     def register(self, handler: RepositoryHandler) -> None:
         """Register a repository handler."""
@@ -70,8 +113,18 @@ class RepositoryHandlerRegistry:
             logger.warning(f"Repository handler '{name}' is already registered, replacing")
 
         self._handlers[name] = handler
+        self._build_dispatch_table()
         logger.debug(f"Registered repository handler: {name} (priority: {handler.metadata.priority})")
 
+    def _build_dispatch_table(self) -> None:
+        """Sort handlers by priority and index them by supported domain."""
+        self._by_priority = sorted(self._handlers.values(), key=lambda h: h.metadata.priority)
+        self._domain_handlers = {}
+        for handler in self._by_priority:
+            for domain in handler.metadata.supported_domains:
+                self._domain_handlers.setdefault(domain.lower(), set()).add(handler.metadata.name)
+        self._resolved.clear()
+
     def get_handler(self, name: str) -> RepositoryHandler | None:
         """Get a specific handler by name."""
         self._ensure_initialized()
@@ -79,13 +132,53 @@ class RepositoryHandlerRegistry:
 
     def get_handlers_for_url(self, url: str) -> list[RepositoryHandler]:
         """Get all handlers that can handle the given URL, sorted by priority."""
-        self._ensure_initialized()
+        return [self._handlers[name] for name in self.resolve_url(url).handler_names]
 
-        compatible_handlers = [handler for handler in self._handlers.values() if handler.can_handle_url(url)]
+    def resolve_url(self, url: str) -> ResolvedRepositoryURL:
+        """Resolve a URL to its compatible handlers and owner/repo, parsing it only once."""
+        self._ensure_initialized()
 
-        # Sort by priority (lower numbers first)
-        compatible_handlers.sort(key=lambda h: h.metadata.priority)
-        return compatible_handlers
+        resolved = self._resolved.get(url)
+        if resolved is None:
+            resolved = self._resolve(url)
+            if len(self._resolved) >= _MAX_RESOLVED_URLS:
+                self._resolved.clear()
+            self._resolved[url] = resolved
+        return resolved
+
+    def _resolve(self, url: str) -> ResolvedRepositoryURL:
+        """Match a URL against the dispatch table."""
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return ResolvedRepositoryURL(url=url, handler_names=(), base_url="")
+
+        handler_names = tuple(handler.metadata.name for handler in self._match_handlers(url, parsed.hostname or ""))
+
+        base_url = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme and parsed.netloc else ""
+        # Only forge URLs name a repository; a direct download's path is just a file location
+        is_forge_url = any(self._handlers[name].metadata.owner_repo_urls for name in handler_names)
+        has_extras = parsed.query or parsed.fragment
+        path_match = _OWNER_REPO_PATH.match(parsed.path) if is_forge_url and base_url and not has_extras else None
+        owner, repo = path_match.groups() if path_match else (None, None)
+        return ResolvedRepositoryURL(url=url, handler_names=handler_names, base_url=base_url, owner=owner, repo=repo)
+
+    def _match_handlers(self, url: str, hostname: str) -> list[RepositoryHandler]:
+        """Get the handlers compatible with a URL, in priority order.
+
+        The domain map is authoritative: a host listed there belongs to its owning handlers
+        alone, and only the domain-less fallback handlers are asked about it. Domain-owning
+        handlers are only probed for hosts none of them lists.
+        """
+        domain_matches = self._domain_handlers.get(hostname.lower())
+        if domain_matches is not None:
+            return [
+                handler
+                for handler in self._by_priority
+                if handler.metadata.name in domain_matches
+                or (not handler.metadata.supported_domains and handler.can_handle_url(url))
+            ]
+        return [handler for handler in self._by_priority if handler.can_handle_url(url)]
 
     def _ensure_initialized(self) -> None:
         """Ensure the registry is initialized with default handlers."""
@@ -3,10 +3,14 @@
 This module provides support for downloading AppImages from SourceForge projects.
 SourceForge URLs typically follow the pattern:
 https://sourceforge.net/projects/{project}/files/{path}/
+
+Files are listed from the project's RSS file feed, which includes sizes and dates.
+The files page is scraped only when the feed is unavailable or lists no AppImages.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import re
 from typing import Any
@@ -17,9 +21,23 @@ from loguru import logger
 
 from appimage_updater.core.http_service import get_http_client
 from appimage_updater.core.models import Asset, Release
+from appimage_updater.core.timeout_strategy import get_default_timeout_strategy
 from appimage_updater.repositories.base import RepositoryClient, RepositoryError
+from appimage_updater.repositories.checksums import associate_checksum_files, is_checksum_file
+from appimage_updater.repositories.page_links import extract_page_links, scan_page_links
 from appimage_updater.utils.version_utils import normalize_version_string
 
+from .rss import (
+    SourceForgeFeedError,
+    SourceForgeFile,
+    get_feed_url,
+    parse_files,
+)
+
+
+# Concurrent HEAD requests used to size the files of a scraped page
+HEAD_PROBE_CONCURRENCY = 8
+
 
 class SourceForgeRepository(RepositoryClient):
     """SourceForge repository implementation."""
@@ -151,12 +169,73 @@ class SourceForgeRepository(RepositoryClient):
         """
         try:
             project, file_path = self.parse_repo_url(repo_url)
+            releases = await self._fetch_feed_releases(project, file_path, limit)
+            if releases:
+                return releases
             return await self._fetch_sourceforge_releases(repo_url, project, file_path, limit)
 
         except (httpx.HTTPError, httpx.TimeoutException, OSError) as e:
             logger.error(f"Failed to get releases for {repo_url}: {e}")
             raise RepositoryError(f"Failed to fetch release information: {e}") from e
 
+    async def _fetch_feed_releases(self, project: str, file_path: str, limit: int) -> list[Release]:
+        """Fetch releases from the project's file feed in a single request.
+
+        Args:
+            project: Project name
+            file_path: File path within project
+            limit: Maximum number of releases to fetch
+
+        Returns:
+            List of Release objects, empty when the feed is unavailable or lists no AppImages
+        """
+        feed_url = get_feed_url(project, file_path)
+        try:
+            async with get_http_client(timeout=self.timeout) as client:
+                response = await client.get(feed_url)
+                response.raise_for_status()
+            files = parse_files(response.content)
+        except (httpx.HTTPError, SourceForgeFeedError) as e:
+            logger.debug(f"SourceForge file feed unavailable for {project}, scraping files page: {e}")
+            return []
+
+        assets = [
+            self._create_feed_asset(feed_file)
+            for feed_file in files
+            if self._is_appimage_name(feed_file.name) or is_checksum_file(feed_file.name)
+        ]
+        releases = self._create_releases(assets, "", limit)
+        logger.debug(f"Found {len(releases)} releases for {project} in file feed")
+        return releases
+
+    def _create_feed_asset(self, feed_file: SourceForgeFile) -> Asset:
+        """Create an asset from a file feed entry.
+
+        Args:
+            feed_file: File listed in the feed
+
+        Returns:
+            Asset object
+        """
+        return Asset(
+            name=feed_file.name,
+            url=self._convert_to_direct_download_url(feed_file.url),
+            size=feed_file.size,
+            created_at=feed_file.published_at or datetime.now(),
+            digest=f"md5:{feed_file.md5}" if feed_file.md5 else None,
+        )
+
+    def _is_appimage_name(self, name: str) -> bool:
+        """Check if a file name refers to an AppImage (or one of its companion files).
+
+        Args:
+            name: File name
+
+        Returns:
+            True if the name contains the AppImage extension
+        """
+        return ".appimage" in name.lower()
+
     async def _fetch_sourceforge_releases(
         self, repo_url: str, project: str, file_path: str, limit: int
     ) -> list[Release]:
@@ -171,37 +250,47 @@ class SourceForgeRepository(RepositoryClient):
         Returns:
             List of Release objects
         """
-        async with get_http_client(timeout=self.timeout) as client:
-            response = await client.get(repo_url)
-            response.raise_for_status()
-
-            content = response.text
-
-            # Find AppImage download links
-            assets = await self._extract_appimage_assets(content, repo_url)
-
-            if not assets:
-                raise RepositoryError(f"No AppImage downloads found on {repo_url}")
-
-            # Create releases from assets (limit to requested number)
-            releases = []
-            for asset in assets[:limit]:
-                version = self._extract_version_from_asset(asset, content)
-                normalized_version = normalize_version_string(version)
-
-                release = Release(
-                    version=normalized_version,
-                    tag_name=normalized_version,
-                    name=asset.name,
-                    published_at=asset.created_at,
-                    assets=[asset],
-                    is_prerelease=self._is_prerelease(normalized_version),
-                    is_draft=False,
-                )
-                releases.append(release)
-
-            logger.debug(f"Found {len(releases)} releases for {project}")
-            return releases
+        # The files page is streamed, reading at most PAGE_SCAN_MAX_BYTES of it
+        page = await scan_page_links(repo_url, timeout=self.timeout)
+        assets = await self._create_assets_from_links(page.links, repo_url)
+
+        if not assets:
+            raise RepositoryError(f"No AppImage downloads found on {repo_url}")
+
+        releases = self._create_releases(assets, page.text, limit)
+        logger.debug(f"Found {len(releases)} releases for {project}")
+        return releases
+
+    def _create_releases(self, assets: list[Asset], content: str, limit: int) -> list[Release]:
+        """Create one release per asset, with checksum files attached to the assets they cover.
+
+        Args:
+            assets: Assets in listing order, checksum files included
+            content: HTML content for additional version context
+            limit: Maximum number of releases to create
+
+        Returns:
+            List of Release objects
+        """
+        associate_checksum_files(assets)
+        files = [asset for asset in assets if not is_checksum_file(asset.name)]
+
+        releases = []
+        for asset in files[:limit]:
+            version = self._extract_version_from_asset(asset, content)
+            normalized_version = normalize_version_string(version)
+
+            release = Release(
+                version=normalized_version,
+                tag_name=normalized_version,
+                name=asset.name,
+                published_at=asset.created_at,
+                assets=[asset],
+                is_prerelease=self._is_prerelease(normalized_version),
+                is_draft=False,
+            )
+            releases.append(release)
+        return releases
 
     async def _extract_appimage_assets(self, content: str, base_url: str) -> list[Asset]:
         """Extract AppImage assets from HTML content.
@@ -213,40 +302,56 @@ class SourceForgeRepository(RepositoryClient):
         Returns:
             List of Asset objects
         """
-        assets = []
+        return await self._create_assets_from_links(extract_page_links(content), base_url)
 
-        # SourceForge uses various patterns for download links
-        # Pattern 1: Direct download links
-        appimage_pattern = r'href="([^"]*\.AppImage[^"]*)"'
-        matches = re.findall(appimage_pattern, content, re.IGNORECASE)
+    async def _create_assets_from_links(self, links: list[str], base_url: str) -> list[Asset]:
+        """Create assets from the AppImage links of a page.
 
-        # Pattern 2: SourceForge download URLs
-        sf_download_pattern = r'href="(/projects/[^"]+/files/[^"]+\.AppImage[^"]*)"'
-        sf_matches = re.findall(sf_download_pattern, content, re.IGNORECASE)
-        matches.extend(sf_matches)
+        Args:
+            links: Links as found on the page, relative or absolute
+            base_url: Base URL for resolving relative links
 
-        for match in matches:
-            download_url = match
+        Returns:
+            List of Asset objects
+        """
+        download_urls = []
+        for link in links:
+            download_url = link
             if not download_url.startswith("http"):
                 download_url = urljoin(base_url, download_url)
 
             # Convert SourceForge file URLs to direct download URLs
-            download_url = self._convert_to_direct_download_url(download_url)
+            download_urls.append(self._convert_to_direct_download_url(download_url))
 
-            filename = self._extract_filename_from_url(download_url)
+        # The page lists no sizes, so fetch them via concurrent HEAD requests
+        file_sizes = await self._get_file_sizes(download_urls)
 
-            # Fetch file size via HEAD request
-            file_size = await self._get_file_size(download_url)
-
-            asset = Asset(
-                name=filename,
+        return [
+            Asset(
+                name=self._extract_filename_from_url(download_url),
                 url=download_url,
                 size=file_size,
                 created_at=datetime.now(),
             )
-            assets.append(asset)
+            for download_url, file_size in zip(download_urls, file_sizes, strict=True)
+        ]
 
-        return assets
+    async def _get_file_sizes(self, urls: list[str]) -> list[int]:
+        """Get file sizes via HEAD requests, at most HEAD_PROBE_CONCURRENCY at a time.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            File sizes in the order of the URLs (0 where unknown)
+        """
+        semaphore = asyncio.Semaphore(HEAD_PROBE_CONCURRENCY)
+
+        async def probe(url: str) -> int:
+            async with semaphore:
+                return await self._get_file_size(url)
+
+        return list(await asyncio.gather(*(probe(url) for url in urls)))
 
     async def _get_file_size(self, url: str) -> int:
         """Get file size via HEAD request.
@@ -258,7 +363,8 @@ class SourceForgeRepository(RepositoryClient):
             File size in bytes, or 0 if unable to determine
         """
         try:
-            async with get_http_client(timeout=self.timeout) as client:
+            client_config = get_default_timeout_strategy(self.timeout).create_client_config("quick_check")
+            async with get_http_client(**client_config) as client:
                 response = await client.head(url, follow_redirects=True)
                 response.raise_for_status()
 
@@ -332,8 +438,7 @@ class SourceForgeRepository(RepositoryClient):
     async def should_enable_prerelease(self, url: str) -> bool:
         """Check if prerelease should be automatically enabled for a repository.
 
-        Uses progressive fetching: starts with 100 releases and doubles the limit
-        if no stable release is found but more releases may exist.
+        The files page is scraped once and scanned until the first stable release.
 
         Args:
             url: Repository URL
@@ -342,53 +447,11 @@ class SourceForgeRepository(RepositoryClient):
             True if only prereleases are found, False if stable releases exist
         """
         try:
-            return await self._progressive_prerelease_check(url)
+            return await self._has_only_prereleases(url)
         except Exception as e:
             logger.debug(f"Could not determine prerelease status for {url}: {e}")
             return False
 
-    async def _progressive_prerelease_check(self, url: str) -> bool:
-        """Progressively fetch releases to check for stable versions."""
-        limit = 100
-        max_limit = 1600
-
-        while limit <= max_limit:
-            result = await self._check_releases_for_stable(url, limit)
-            if result is not None:
-                return result
-            limit *= 2
-
-        logger.debug(f"No stable releases found in first {max_limit} releases for {url}")
-        return True
-
-    async def _check_releases_for_stable(self, url: str, limit: int) -> bool | None:
-        """Check a batch of releases for stable versions. Returns None to continue searching."""
-        releases = await self.get_releases(url, limit=limit)
-        return self._evaluate_release_batch(releases, limit, url)
-
-    def _evaluate_release_batch(self, releases: list[Release] | None, limit: int, url: str) -> bool | None:
-        """Evaluate a batch of releases and determine next action."""
-        if not releases:
-            logger.debug(f"No releases found for {url}, prerelease detection inconclusive")
-            return False
-
-        stable_count = self._count_stable_releases(releases)
-        if stable_count > 0:
-            logger.debug(f"Found {stable_count} stable releases for {url}")
-            return False
-
-        return self._determine_next_action(releases, limit, url)
-
-    def _count_stable_releases(self, releases: list[Release]) -> int:
-        """Count non-prerelease releases."""
-        return sum(1 for r in releases if not r.is_prerelease)
-
-    def _determine_next_action(self, releases: list[Release], limit: int, url: str) -> bool | None:
-        """Determine whether to return True (only prereleases) or None (continue searching)."""
-        all_fetched = len(releases) < limit - 1
-        logger.debug(f"No stable in {len(releases)} releases for {url}, {'done' if all_fetched else 'expanding'}")
-        return any(r.is_prerelease for r in releases) if all_fetched else None
-
     async def get_latest_release_including_prerelease(self, repo_url: str) -> Release:
         """Get the latest release including prereleases.
 
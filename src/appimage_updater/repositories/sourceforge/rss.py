@@ -0,0 +1,100 @@
+"""SourceForge file feed parsing.
+
+Every SourceForge project publishes an RSS feed of its files,
+``https://sourceforge.net/projects/{project}/rss?path=/{path}``, newest first.
+Unlike the files page, each item carries the file's size, upload date and MD5
+digest, so one request describes a whole directory without probing each file.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+import xml.etree.ElementTree as ET
+
+
+_MEDIA_NS = "{http://video.search.yahoo.com/mrss/}"
+
+
+class SourceForgeFeedError(Exception):
+    """Raised when a SourceForge file feed cannot be parsed."""
+
+
+@dataclass
+class SourceForgeFile:
+    """A file listed in a SourceForge file feed."""
+
+    name: str
+    url: str
+    size: int
+    published_at: datetime | None = None
+    md5: str | None = None
+
+
+def get_feed_url(project: str, file_path: str) -> str:
+    """Get the file feed URL of a project directory."""
+    return f"https://sourceforge.net/projects/{project}/rss?path=/{file_path}"
+
+
+def parse_files(content: bytes) -> list[SourceForgeFile]:
+    """Parse the files listed in a feed, newest first."""
+    try:
+        root = ET.fromstring(content)  # noqa: S314 - SourceForge's own feed, no DTDs
+    except ET.ParseError as e:
+        msg = f"Invalid SourceForge file feed: {e}"
+        raise SourceForgeFeedError(msg) from e
+
+    files: list[SourceForgeFile] = []
+    for item in root.iter("item"):
+        feed_file = _parse_item(item)
+        if feed_file is not None:
+            files.append(feed_file)
+    return files
+
+
+def _parse_item(item: ET.Element) -> SourceForgeFile | None:
+    """Parse a feed item, or None when it does not describe a file."""
+    link = (item.findtext("link") or "").strip()
+    # Titles hold the file's path within the project, e.g. "/1.7.0/scribus-1.7.0.AppImage"
+    title = (item.findtext("title") or "").strip()
+    name = title.rstrip("/").rsplit("/", 1)[-1]
+    if not link or not name:
+        return None
+
+    media = item.find(f"{_MEDIA_NS}content")
+    return SourceForgeFile(
+        name=name,
+        url=link,
+        size=_parse_size(media.get("filesize") if media is not None else None),
+        published_at=_parse_date(item.findtext("pubDate")),
+        md5=_parse_md5(media),
+    )
+
+
+def _parse_size(value: str | None) -> int:
+    """Parse a file size attribute, 0 when missing or invalid."""
+    try:
+        return int(value) if value else 0
+    except ValueError:
+        return 0
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    """Parse an RFC 2822 publication date."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_md5(media: ET.Element | None) -> str | None:
+    """Get the MD5 digest listed for a file, if any."""
+    if media is None:
+        return None
+    for digest in media.iter(f"{_MEDIA_NS}hash"):
+        if digest.get("algo", "").lower() == "md5" and digest.text:
+            return digest.text.strip()
+    return None
@@ -399,6 +399,21 @@ def isolated_config_dir() -> Any:
                 os.environ.pop("APPIMAGE_UPDATER_TEST_CONFIG_DIR", None)
 
 
+@pytest.fixture(autouse=True)
+def reset_global_http_client() -> Any:
+    """Give each test a fresh GlobalHTTPClient singleton.
+
+    Commands apply the loaded configuration's HTTP settings to the singleton, so a
+    test passing a mocked configuration would otherwise leak it (and the rate
+    limiter, cache and retry engine built from it) into later tests.
+    """
+    from appimage_updater.core.http_service import GlobalHTTPClient
+
+    GlobalHTTPClient.cache_clear()
+    yield
+    GlobalHTTPClient.cache_clear()
+
+
 def discover_cli_commands() -> dict[str, list[str]]:
     """Discover CLI commands from source code analysis.
 
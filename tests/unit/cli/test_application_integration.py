@@ -138,3 +138,29 @@ class TestAppImageUpdaterCLI:
             debug_messages = [call[0][0] for call in debug_calls]
             handler_messages = [msg for msg in debug_messages if "Registered command handler" in msg]
             assert len(handler_messages) >= 8
+
+    def test_command_state_saved_when_command_finishes(self) -> None:
+        """Test that indexes updated by a command are written once it finishes, even on failure."""
+        from typer.testing import CliRunner
+
+        cli = AppImageUpdaterCLI()
+        with (
+            patch("appimage_updater.cli.application._save_command_state") as mock_save,
+            patch("appimage_updater.cli.application._ensure_config_directory_exists"),
+        ):
+            CliRunner().invoke(cli.app, ["list", "--config-dir", "/nonexistent"])
+
+        mock_save.assert_called_once_with()
+
+    def test_save_command_state_flushes_indexes(self) -> None:
+        """Test that the installed-state and domain indexes are both flushed."""
+        from appimage_updater.cli.application import _save_command_state
+
+        with (
+            patch("appimage_updater.cli.application.version_service") as mock_version_service,
+            patch("appimage_updater.cli.application.get_domain_index") as mock_get_domain_index,
+        ):
+            _save_command_state()
+
+        mock_version_service.installed_state.flush.assert_called_once_with()
+        mock_get_domain_index.return_value.flush.assert_called_once_with()
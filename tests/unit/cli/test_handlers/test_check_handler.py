@@ -8,7 +8,10 @@ from unittest.mock import Mock, patch
 import pytest
 import typer
 
-from appimage_updater.cli.handlers.check_handler import CheckCommandHandler
+from appimage_updater.cli.handlers.check_handler import (
+    CheckCommandHandler,
+    parse_duration,
+)
 from appimage_updater.commands.base import CommandResult
 from appimage_updater.ui.output.interface import OutputFormat
 
@@ -102,6 +105,44 @@ class TestCheckCommandHandler:
             assert "mutually exclusive" in error_message
             assert "--yes and --no" in error_message
 
+    def test_validate_options_pipeline_requires_yes(self) -> None:
+        """Test that --pipeline is only accepted together with --yes."""
+        with patch("appimage_updater.cli.handlers.check_handler.Console"):
+            handler = CheckCommandHandler()
+
+            handler.validate_options(yes=True, no=False, pipeline=True)
+            with pytest.raises(typer.Exit) as exc_info:
+                handler.validate_options(yes=False, no=False, pipeline=True)
+
+            assert exc_info.value.exit_code == 1
+            error_message = handler.console.print.call_args[0][0]  # type: ignore[attr-defined]
+            assert "--pipeline requires --yes" in error_message
+
+    @pytest.mark.parametrize(
+        ("value", "seconds"),
+        [("90", 90.0), ("60s", 60.0), ("1.5m", 90.0), ("2H", 7200.0), (" 30 s ", 30.0)],
+    )
+    def test_parse_duration(self, value: str, seconds: float) -> None:
+        """Test parsing --deadline values."""
+        assert parse_duration(value) == seconds
+
+    @pytest.mark.parametrize("value", ["", "0", "-5s", "10d", "soon"])
+    def test_parse_duration_invalid(self, value: str) -> None:
+        """Test that invalid durations are rejected."""
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_duration(value)
+
+    def test_validate_options_invalid_deadline(self) -> None:
+        """Test that an invalid --deadline is reported as a usage error."""
+        with patch("appimage_updater.cli.handlers.check_handler.Console"):
+            handler = CheckCommandHandler()
+
+            handler.validate_options(yes=False, no=False, deadline="60s")
+            with pytest.raises(typer.Exit) as exc_info:
+                handler.validate_options(yes=False, no=False, deadline="soon")
+
+            assert exc_info.value.exit_code == 1
+
     @patch("appimage_updater.cli.handlers.check_handler.asyncio.run")
     @patch("appimage_updater.cli.handlers.check_handler.create_output_formatter_from_params")
     @patch("appimage_updater.cli.handlers.check_handler.CommandFactory.create_check_command_with_instrumentation")
@@ -340,6 +340,20 @@ class TestCheckCommand:
 
         mock_formatter.print_message.assert_called_once_with("  ... and 3 more requests")
 
+    def test_display_connection_stats(self) -> None:
+        """Test connection reuse display from the shared HTTP client counters."""
+        command = CheckCommand(CheckParams())
+        mock_formatter = Mock()
+        stats = {"connections_opened": 2, "connections_reused": 9, "tls_handshakes": 2, "http2_requests": 0}
+
+        with patch("appimage_updater.commands.check_command.GlobalHTTPClient") as mock_client:
+            mock_client.return_value.get_stats.return_value = stats
+            command._display_connection_stats(mock_formatter)
+
+        mock_formatter.print_message.assert_called_once_with(
+            "Connections opened: 2, reused: 9, TLS handshakes: 2, HTTP/2 requests: 0"
+        )
+
     def test_display_remaining_count_no_remaining(self) -> None:
         """Test remaining count display when there are 5 or fewer requests."""
         params = CheckParams()
@@ -408,6 +422,10 @@ class TestCheckCommand:
             no_interactive=True,
             verbose=True,
             info=True,
+            pipeline=False,
+            deadline=None,
+            max_age=None,
+            cached_first=False,
             output_formatter=mock_formatter,
         )
 
@@ -435,6 +453,10 @@ class TestCheckCommand:
             no_interactive=False,
             verbose=False,
             info=False,
+            pipeline=False,
+            deadline=None,
+            max_age=None,
+            cached_first=False,
             output_formatter=None,
         )
 
@@ -462,6 +484,10 @@ class TestCheckCommand:
             no_interactive=False,
             verbose=False,
             info=False,
+            pipeline=False,
+            deadline=None,
+            max_age=None,
+            cached_first=False,
             output_formatter=None,
         )
 
@@ -0,0 +1,62 @@
+"""Tests for asset attributes parsed from filenames."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from appimage_updater.core.asset_attributes import get_asset_attributes
+from appimage_updater.core.models import Asset
+
+
+class TestGetAssetAttributes:
+    """Tests for filename parsing."""
+
+    @pytest.mark.parametrize(
+        ("filename", "architecture"),
+        [
+            ("App-1.0-x86_64.AppImage", "x86_64"),
+            ("app-armv7l.AppImage", "armv7l"),
+            ("app-armv7.AppImage", "armv7"),
+            ("app-x86-and-amd64.AppImage", "amd64"),  # Most specific token wins, not the first one
+            ("App_x86_64.AppImage", None),  # Not a whole word
+            ("app.AppImage", None),
+        ],
+    )
+    def test_architecture(self, filename: str, architecture: str | None) -> None:
+        """Test that the most specific whole-word architecture token is found."""
+        assert get_asset_attributes(filename).architecture == architecture
+
+    @pytest.mark.parametrize(
+        ("filename", "platform"),
+        [
+            ("app-linux-x86_64.tar.gz", "linux"),
+            ("app-macos.dmg", "darwin"),
+            ("app-win64.zip", "win32"),
+            ("app-windows-linux.zip", "linux"),
+            ("app.AppImage", None),
+        ],
+    )
+    def test_platform(self, filename: str, platform: str | None) -> None:
+        """Test that platforms are found, preferring linux."""
+        assert get_asset_attributes(filename).platform == platform
+
+    def test_distribution_selector_attributes(self) -> None:
+        """Test the distribution, loose architecture and format used by the distribution selector."""
+        attributes = get_asset_attributes("MyApp-Ubuntu-24.04_x86_64.AppImage")
+
+        assert attributes.architecture is None
+        assert attributes.architecture_hint == "x86_64"
+        assert attributes.distribution == "ubuntu"
+        assert attributes.distribution_version == "24.04"
+        assert attributes.format == "appimage"
+        assert attributes.file_extension == ".appimage"
+
+    def test_parsed_once_per_filename(self) -> None:
+        """Test that assets with the same name share one parsed descriptor."""
+        first = Asset(name="App-2.0-aarch64.AppImage", url="https://example.com/1", size=1, created_at=datetime.now())
+        second = Asset(name="App-2.0-aarch64.AppImage", url="https://example.com/2", size=1, created_at=datetime.now())
+
+        assert first.attributes is second.attributes
+        assert (first.architecture, first.platform, first.file_extension) == ("aarch64", None, ".appimage")
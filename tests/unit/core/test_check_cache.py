@@ -0,0 +1,179 @@
+"""Tests for the persistent check result cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+from appimage_updater.config.models import (
+    ApplicationConfig,
+    ChecksumConfig,
+)
+from appimage_updater.core.check_cache import (
+    CHECK_CACHE_FORMAT,
+    CheckResultCache,
+)
+from appimage_updater.core.models import (
+    Asset,
+    CheckResult,
+    Release,
+    UpdateCandidate,
+)
+
+
+def make_app(pattern: str = r"App-.*\.AppImage$", prerelease: bool = False, **kwargs: Any) -> ApplicationConfig:
+    """Create an application configuration."""
+    return ApplicationConfig(
+        name="App",
+        source_type="github",
+        url="https://github.com/o/app",
+        download_dir=Path("apps"),
+        pattern=pattern,
+        prerelease=prerelease,
+        **kwargs,
+    )
+
+
+def make_result(app_config: ApplicationConfig) -> CheckResult:
+    """Create a successful result with an update candidate."""
+    asset = Asset(
+        name="App-2.0.AppImage", url="https://example.com/App-2.0.AppImage", size=1, created_at=datetime.now()
+    )
+    candidate = UpdateCandidate(
+        app_name="App",
+        current_version="1.0",
+        latest_version="2.0",
+        asset=asset,
+        download_path=Path("apps/App-2.0.AppImage"),
+        is_newer=True,
+        app_config=app_config,
+        release=Release(version="2.0", tag_name="v2.0", published_at=datetime.now(), assets=[asset]),
+    )
+    return CheckResult(
+        app_name="App",
+        success=True,
+        current_version="1.0",
+        available_version="2.0",
+        update_available=True,
+        asset=asset,
+        candidate=candidate,
+    )
+
+
+class TestCheckResultCache:
+    """Tests for storing and loading check results."""
+
+    def test_round_trip_uses_current_config(self, tmp_path: Path) -> None:
+        """Test that results are restored with the application's current configuration."""
+        cache = CheckResultCache(tmp_path / "checks.json")
+        app_config = make_app()
+        assert cache.store(app_config, make_result(app_config))
+        cache.flush()
+
+        current_config = make_app()
+        cached = CheckResultCache(tmp_path / "checks.json").lookup(current_config)
+
+        assert cached is not None
+        assert cached.age < 60
+        assert cached.result.available_version == "2.0"
+        assert cached.result.candidate is not None
+        assert cached.result.candidate.asset.name == "App-2.0.AppImage"
+        assert cached.result.candidate.app_config is current_config
+        assert "app_config" not in (tmp_path / "checks.json").read_text()
+
+    def test_round_trip_keeps_release_assets(self, tmp_path: Path) -> None:
+        """Test that the candidate's release comes back with its assets."""
+        cache = CheckResultCache(tmp_path / "checks.json")
+        app_config = make_app()
+        result = make_result(app_config)
+        cache.store(app_config, result)
+
+        cached = cache.lookup(app_config)
+
+        assert cached is not None
+        assert cached.result.candidate is not None
+        assert cached.result.candidate.release is not None
+        assert result.candidate is not None and result.candidate.release is not None
+        assert cached.result.candidate.release.assets == result.candidate.release.assets
+
+    def test_failed_results_not_stored(self, tmp_path: Path) -> None:
+        """Test that only successful results are cached."""
+        cache = CheckResultCache(tmp_path / "checks.json")
+
+        assert not cache.store(make_app(), CheckResult(app_name="App", success=False, error_message="boom"))
+        assert cache.lookup(make_app()) is None
+
+    def test_key_covers_pattern_and_prerelease(self, tmp_path: Path) -> None:
+        """Test that a different pattern or prerelease flag misses the cache."""
+        cache = CheckResultCache(tmp_path / "checks.json")
+        cache.store(make_app(), make_result(make_app()))
+
+        assert cache.lookup(make_app(pattern=r"App-.*-x86_64\.AppImage$")) is None
+        assert cache.lookup(make_app(prerelease=True)) is None
+
+    def test_key_covers_version_pattern_and_checksum_settings(self, tmp_path: Path) -> None:
+        """Test that a different version pattern or checksum setting misses the cache."""
+        cache = CheckResultCache(tmp_path / "checks.json")
+        cache.store(make_app(), make_result(make_app()))
+
+        assert cache.lookup(make_app(version_pattern=r"^1\.")) is None
+        assert cache.lookup(make_app(checksum=ChecksumConfig(required=True))) is None
+        assert cache.lookup(make_app(checksum=ChecksumConfig(pattern="{filename}.sha256"))) is None
+        assert cache.lookup(make_app()) is not None
+
+    def test_unreadable_entry_discarded(self, tmp_path: Path) -> None:
+        """Test that a corrupt entry is removed instead of raising."""
+        cache_path = tmp_path / "checks.json"
+        cache = CheckResultCache(cache_path)
+        key = cache.make_key(make_app())
+        cache_path.write_text(json.dumps({"format": CHECK_CACHE_FORMAT, "entries": {key: {"result": "boom"}}}))
+
+        assert cache.lookup(make_app()) is None
+        cache.flush()
+        assert json.loads(cache_path.read_text())["entries"] == {}
+
+    def test_age_from_store_time(self, tmp_path: Path) -> None:
+        """Test that an entry's age counts from when it was stored, not from the file time."""
+        cache = CheckResultCache(tmp_path / "checks.json")
+        app_config = make_app()
+        cache.store(app_config, make_result(app_config))
+        cache.flush()
+        os.utime(tmp_path / "checks.json", (time.time() + 3600, time.time() + 3600))
+
+        cached = CheckResultCache(tmp_path / "checks.json").lookup(app_config)
+
+        assert cached is not None
+        assert cached.age < 60
+
+    def test_results_written_on_flush(self, tmp_path: Path) -> None:
+        """Test that results are kept in memory until flushed, merging those stored by other runs."""
+        cache_path = tmp_path / "checks.json"
+        other_app = make_app(pattern=r"Other-.*\.AppImage$")
+        other_run = CheckResultCache(cache_path)
+        other_run.store(other_app, make_result(other_app))
+        other_run.flush()
+        cache = CheckResultCache(cache_path)
+
+        cache.store(make_app(), make_result(make_app()))
+        assert CheckResultCache(cache_path).lookup(make_app()) is None
+
+        cache.flush()
+        assert CheckResultCache(cache_path).lookup(make_app()) is not None
+        assert CheckResultCache(cache_path).lookup(other_app) is not None
+
+    def test_flush_drops_results_of_removed_apps(self, tmp_path: Path) -> None:
+        """Test that results of applications no longer configured, or configured differently, are dropped."""
+        cache_path = tmp_path / "checks.json"
+        removed_app = make_app(pattern=r"Removed-.*\.AppImage$")
+        cache = CheckResultCache(cache_path)
+        cache.store(make_app(), make_result(make_app()))
+        cache.store(removed_app, make_result(removed_app))
+
+        cache.flush([make_app()])
+
+        assert CheckResultCache(cache_path).lookup(make_app()) is not None
+        assert CheckResultCache(cache_path).lookup(removed_app) is None
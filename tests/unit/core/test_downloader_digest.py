@@ -0,0 +1,122 @@
+"""Tests for verifying downloads against repository-provided digests."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import hashlib
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from appimage_updater.core.downloader import Downloader
+from appimage_updater.core.models import Asset, UpdateCandidate
+
+
+CONTENT = b"AppImage content"
+
+
+def make_candidate(
+    tmp_path: Path, digest: str | None, checksum_required: bool = False, checksum_name: str = "app.AppImage.sha256"
+) -> UpdateCandidate:
+    """Create a candidate whose download already exists on disk."""
+    download_path = tmp_path / "app.AppImage"
+    download_path.write_bytes(CONTENT)
+    checksum_asset = Asset(
+        name=checksum_name, url=f"https://example.com/{checksum_name}", size=1, created_at=datetime.now()
+    )
+    asset = Asset(
+        name="app.AppImage",
+        url="https://example.com/app.AppImage",
+        size=len(CONTENT),
+        created_at=datetime.now(),
+        checksum_asset=checksum_asset,
+        digest=digest,
+    )
+    return UpdateCandidate(
+        app_name="TestApp",
+        current_version="1.0.0",
+        latest_version="1.1.0",
+        asset=asset,
+        download_path=download_path,
+        is_newer=True,
+        checksum_required=checksum_required,
+    )
+
+
+class TestDigestVerification:
+    """Tests for digest verification in download post-processing."""
+
+    @pytest.mark.anyio
+    async def test_matching_digest_skips_checksum_file(self, tmp_path: Path) -> None:
+        """Test that a digest is verified without downloading the checksum file."""
+        candidate = make_candidate(tmp_path, f"sha256:{hashlib.sha256(CONTENT).hexdigest()}")
+        downloader = Downloader()
+
+        with patch.object(downloader, "_download_checksum_file", new=AsyncMock()) as mock_download:
+            result = await downloader._post_process_download(candidate)
+
+        assert result is not None
+        assert result.verified
+        assert result.algorithm == "sha256"
+        mock_download.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_mismatched_required_digest_fails(self, tmp_path: Path) -> None:
+        """Test that a wrong digest fails a download requiring checksums."""
+        candidate = make_candidate(tmp_path, f"md5:{'0' * 32}", checksum_required=True)
+
+        with pytest.raises(Exception, match="Checksum mismatch"):
+            await Downloader()._post_process_download(candidate)
+
+    @pytest.mark.anyio
+    async def test_unsupported_digest_falls_back_to_checksum_file(self, tmp_path: Path) -> None:
+        """Test that the checksum file is used when the digest algorithm is unknown."""
+        candidate = make_candidate(tmp_path, "blake9:abc")
+        downloader = Downloader()
+
+        with patch.object(downloader, "_download_checksum_file", new=AsyncMock(return_value=False)) as mock_download:
+            result = await downloader._post_process_download(candidate)
+
+        mock_download.assert_awaited_once()
+        assert result is not None
+        assert result.error_message == "Failed to download checksum file"
+
+
+def serve_checksum_file(content: str) -> AsyncMock:
+    """Create a _download_checksum_file() replacement writing the given content."""
+
+    async def download(checksum_url: str, checksum_path: Path) -> bool:
+        checksum_path.write_text(content)
+        return True
+
+    return AsyncMock(side_effect=download)
+
+
+class TestChecksumManifest:
+    """Tests for verifying downloads against a release's checksum manifest."""
+
+    @pytest.mark.anyio
+    async def test_asset_listed_in_manifest_verified(self, tmp_path: Path) -> None:
+        """Test that a download listed in the manifest is verified against its entry."""
+        candidate = make_candidate(tmp_path, None, checksum_required=True, checksum_name="SHA256SUMS")
+        manifest = f"{'0' * 64}  other.AppImage\n{hashlib.sha256(CONTENT).hexdigest()}  app.AppImage\n"
+        downloader = Downloader()
+
+        with patch.object(downloader, "_download_checksum_file", new=serve_checksum_file(manifest)):
+            result = await downloader._post_process_download(candidate)
+
+        assert result is not None
+        assert result.verified
+
+    @pytest.mark.anyio
+    async def test_asset_missing_from_manifest_unverified(self, tmp_path: Path) -> None:
+        """Test that a manifest not listing the download leaves it unverified instead of failing."""
+        candidate = make_candidate(tmp_path, None, checksum_required=True, checksum_name="checksums.txt")
+        downloader = Downloader()
+
+        with patch.object(downloader, "_download_checksum_file", new=serve_checksum_file(f"{'0' * 64}  other.zip\n")):
+            result = await downloader._post_process_download(candidate)
+
+        assert result is None
+        assert not (tmp_path / "app.AppImage.checksum").exists()
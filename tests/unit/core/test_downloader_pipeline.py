@@ -0,0 +1,104 @@
+"""Tests for downloading updates as their candidates arrive."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from appimage_updater.core.downloader import Downloader
+
+
+class TestDownloadAsAvailable:
+    """Tests for Downloader.download_as_available()."""
+
+    @pytest.mark.anyio
+    async def test_downloads_start_before_all_candidates_arrive(self) -> None:
+        """Test that each download starts when its candidate arrives, within max_concurrent."""
+        events: list[str] = []
+        running = 0
+        peak = 0
+
+        async def candidates() -> AsyncIterator[Mock]:
+            for name in ["a", "b", "c"]:
+                events.append(f"checked {name}")
+                yield Mock(app_name=name)
+                await asyncio.sleep(0.01)
+
+        async def download_single(candidate: Any, progress: Any = None) -> Mock:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            events.append(f"downloading {candidate.app_name}")
+            await asyncio.sleep(0.05)
+            running -= 1
+            return Mock(app_name=candidate.app_name, success=True)
+
+        downloader = Downloader(max_concurrent=2)
+        with patch.object(downloader, "_download_single", side_effect=download_single):
+            results = await downloader.download_as_available(candidates(), show_progress=False)
+
+        assert [result.app_name for result in results] == ["a", "b", "c"]
+        assert events.index("downloading a") < events.index("checked b")
+        assert peak == 2
+
+    @pytest.mark.anyio
+    async def test_progress_reported_as_downloads_finish(self) -> None:
+        """Test that the progress callback hears of each finished download."""
+        reported: list[tuple[int, int, str]] = []
+
+        async def candidates() -> AsyncIterator[Mock]:
+            for name in ["a", "b"]:
+                yield Mock(app_name=name)
+
+        async def download_single(candidate: Any, progress: Any = None) -> Mock:
+            return Mock(app_name=candidate.app_name, success=True)
+
+        downloader = Downloader()
+        with patch.object(downloader, "_download_single", side_effect=download_single):
+            await downloader.download_as_available(
+                candidates(), show_progress=False, progress_callback=lambda *args: reported.append(args)
+            )
+
+        assert reported == [(1, 2, "a"), (2, 2, "b")]
+
+    @pytest.mark.anyio
+    async def test_no_candidates(self) -> None:
+        """Test that nothing is downloaded when no candidate arrives."""
+
+        async def candidates() -> AsyncIterator[Mock]:
+            return
+            yield
+
+        assert await Downloader().download_as_available(candidates(), show_progress=False) == []
+
+    @pytest.mark.anyio
+    async def test_failing_source_cancels_downloads(self) -> None:
+        """Test that started downloads are cancelled when the candidates fail."""
+        cancelled = asyncio.Event()
+
+        async def candidates() -> AsyncIterator[Mock]:
+            yield Mock(app_name="a")
+            await asyncio.sleep(0)
+            raise RuntimeError("check failed")
+
+        async def download_single(candidate: Any, progress: Any = None) -> Mock:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return Mock()
+
+        downloader = Downloader()
+        with (
+            patch.object(downloader, "_download_single", side_effect=download_single),
+            pytest.raises(RuntimeError, match="check failed"),
+        ):
+            await downloader.download_as_available(candidates(), show_progress=False)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
@@ -0,0 +1,157 @@
+"""Tests for the persistent HTTP response cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from appimage_updater.core.http_cache import HTTPResponseCache
+from appimage_updater.core.http_service import TracingAsyncClient
+
+
+URL = "https://api.github.com/repos/owner/repo/releases"
+
+
+def _response(status_code: int, content: bytes = b"", headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status_code, content=content, headers=headers, request=httpx.Request("GET", URL))
+
+
+class StubClient:
+    """Minimal async client returning queued responses and recording request headers."""
+
+    def __init__(self, responses: list[httpx.Response]) -> None:
+        self.responses = responses
+        self.sent_headers: list[dict[str, str]] = []
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.sent_headers.append(dict(kwargs.get("headers") or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> HTTPResponseCache:
+    """Create a cache rooted in a temporary directory."""
+    return HTTPResponseCache(cache_dir=tmp_path / "http")
+
+
+class TestHTTPResponseCache:
+    """Tests for HTTPResponseCache storage and eviction."""
+
+    def test_key_depends_on_auth_identity(self, cache: HTTPResponseCache) -> None:
+        """Test that different tokens produce different keys and tokens are not stored verbatim."""
+        anonymous = cache.make_key(URL)
+        token_a = cache.make_key(URL, headers={"Authorization": "token a"})
+        token_b = cache.make_key(URL, headers={"Authorization": "token b"})
+
+        assert len({anonymous, token_a, token_b}) == 3
+        assert "token a" not in token_a
+
+    def test_key_includes_params(self, cache: HTTPResponseCache) -> None:
+        """Test that query parameters are part of the key."""
+        assert cache.make_key(URL, params={"per_page": "10"}) != cache.make_key(URL, params={"per_page": "20"})
+
+    def test_store_requires_validators(self, cache: HTTPResponseCache) -> None:
+        """Test that responses without ETag or Last-Modified are not cached."""
+        key = cache.make_key(URL)
+
+        assert cache.store(key, URL, _response(200, b"[]")) is False
+        assert cache.lookup(key) is None
+
+    def test_store_and_lookup_roundtrip(self, cache: HTTPResponseCache) -> None:
+        """Test that stored entries keep body and validators."""
+        key = cache.make_key(URL)
+        response = _response(200, b'[{"tag_name": "v1"}]', {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024"})
+
+        assert cache.store(key, URL, response) is True
+        entry = cache.lookup(key)
+
+        assert entry is not None
+        assert entry.content == b'[{"tag_name": "v1"}]'
+        assert cache.conditional_headers(entry) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+
+    def test_no_store_is_respected(self, cache: HTTPResponseCache) -> None:
+        """Test that Cache-Control: no-store prevents caching."""
+        key = cache.make_key(URL)
+        response = _response(200, b"[]", {"ETag": '"abc"', "Cache-Control": "no-store"})
+
+        assert cache.store(key, URL, response) is False
+
+    def test_expired_entries_are_discarded(self, cache: HTTPResponseCache) -> None:
+        """Test that entries older than max age are treated as missing."""
+        key = cache.make_key(URL)
+        cache.store(key, URL, _response(200, b"[]", {"ETag": '"abc"'}))
+        old = time.time() - cache.max_age_seconds - 10
+        os.utime(cache.cache_dir / f"{key}.json", (old, old))
+
+        assert cache.lookup(key) is None
+        assert not (cache.cache_dir / f"{key}.json").exists()
+
+    def test_prune_evicts_oldest_beyond_max_entries(self, tmp_path: Path) -> None:
+        """Test that pruning keeps only the most recently validated entries."""
+        cache = HTTPResponseCache(cache_dir=tmp_path / "http", max_entries=2)
+        keys = [cache.make_key(f"{URL}/{i}") for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.store(key, URL, _response(200, b"[]", {"ETag": f'"{i}"'}))
+            stamp = time.time() - (10 - i)
+            os.utime(cache.cache_dir / f"{key}.json", (stamp, stamp))
+
+        evicted = cache.prune()
+
+        assert evicted == 1
+        assert cache.lookup(keys[0]) is None
+        assert cache.lookup(keys[2]) is not None
+        assert cache.stats.evictions == 1
+
+
+class TestTracingClientCaching:
+    """Tests for conditional requests issued through TracingAsyncClient."""
+
+    @pytest.mark.anyio
+    async def test_not_modified_serves_cached_body(self, cache: HTTPResponseCache) -> None:
+        """Test that a 304 answer is replaced by the cached 200 response."""
+        stub = StubClient(
+            [
+                _response(200, b'[{"tag_name": "v1"}]', {"ETag": '"abc"'}),
+                _response(304, headers={"ETag": '"abc"'}),
+            ]
+        )
+        client = TracingAsyncClient(stub, cache=cache)  # type: ignore[arg-type]
+
+        first = await client.get(URL, headers={"Authorization": "token x"})
+        second = await client.get(URL, headers={"Authorization": "token x"})
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json() == [{"tag_name": "v1"}]
+        assert "If-None-Match" not in stub.sent_headers[0]
+        assert stub.sent_headers[1]["If-None-Match"] == '"abc"'
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    @pytest.mark.anyio
+    async def test_changed_resource_replaces_entry(self, cache: HTTPResponseCache) -> None:
+        """Test that a fresh 200 answer updates the stored body."""
+        stub = StubClient(
+            [
+                _response(200, b"[1]", {"ETag": '"one"'}),
+                _response(200, b"[2]", {"ETag": '"two"'}),
+            ]
+        )
+        client = TracingAsyncClient(stub, cache=cache)  # type: ignore[arg-type]
+
+        await client.get(URL)
+        second = await client.get(URL)
+        entry = cache.lookup(cache.make_key(URL))
+
+        assert second.json() == [2]
+        assert entry is not None
+        assert entry.etag == '"two"'
+        assert cache.stats.misses == 2
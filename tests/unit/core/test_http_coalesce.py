@@ -0,0 +1,140 @@
+"""Tests for single-flight coalescing of identical in-flight GET requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from appimage_updater.core.http_coalesce import RequestCoalescer
+from appimage_updater.core.http_service import TracingAsyncClient
+
+
+URL = "https://api.github.com/repos/owner/repo/releases"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Coalescing relies on asyncio tasks, so run only on the asyncio backend."""
+    return "asyncio"
+
+
+class SlowStubClient:
+    """Async client stub that counts calls and yields before answering."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=[{"tag_name": "v1"}], request=httpx.Request("GET", url))
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(201, request=httpx.Request("POST", url))
+
+
+class TestRequestCoalescer:
+    """Tests for RequestCoalescer keys."""
+
+    def test_key_includes_headers_and_params(self) -> None:
+        """Test that requests differing in headers or params are not merged."""
+        coalescer = RequestCoalescer()
+        base = coalescer.make_key("GET", URL, {"headers": {"Authorization": "token a"}})
+
+        assert base == coalescer.make_key("get", URL, {"headers": {"authorization": "token a"}})
+        assert base != coalescer.make_key("GET", URL, {"headers": {"Authorization": "token b"}})
+        assert base != coalescer.make_key("GET", URL, {"headers": {"Authorization": "token a"}, "params": {"page": 2}})
+
+    def test_key_includes_timeout(self) -> None:
+        """Test that requests with different timeouts are not merged."""
+        coalescer = RequestCoalescer()
+
+        assert coalescer.make_key("GET", URL, {"timeout": 5}) != coalescer.make_key("GET", URL, {"timeout": 60})
+
+
+class TestTracingClientCoalescing:
+    """Tests for coalescing through TracingAsyncClient."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_identical_gets_share_one_request(self) -> None:
+        """Test that concurrent identical GETs trigger a single network call."""
+        stub = SlowStubClient()
+        coalescer = RequestCoalescer()
+        client = TracingAsyncClient(stub, coalescer=coalescer)  # type: ignore[arg-type]
+
+        responses = await asyncio.gather(*(client.get(URL) for _ in range(5)))
+
+        assert stub.calls == 1
+        assert all(response is responses[0] for response in responses)
+        assert coalescer.get_stats() == {"coalesced_requests": 4}
+
+    @pytest.mark.anyio
+    async def test_sequential_gets_are_not_coalesced(self) -> None:
+        """Test that a finished request is not reused by later callers."""
+        stub = SlowStubClient()
+        coalescer = RequestCoalescer()
+        client = TracingAsyncClient(stub, coalescer=coalescer)  # type: ignore[arg-type]
+
+        await client.get(URL)
+        await client.get(URL)
+
+        assert stub.calls == 2
+        assert coalescer.coalesced == 0
+
+    @pytest.mark.anyio
+    async def test_post_requests_are_never_coalesced(self) -> None:
+        """Test that non-idempotent requests always reach the network."""
+        stub = SlowStubClient()
+        coalescer = RequestCoalescer()
+        client = TracingAsyncClient(stub, coalescer=coalescer)  # type: ignore[arg-type]
+
+        await asyncio.gather(client.post(URL), client.post(URL))
+
+        assert stub.calls == 2
+        assert coalescer.coalesced == 0
+
+    @pytest.mark.anyio
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Test that cancelling one waiter leaves the shared request running."""
+        stub = SlowStubClient()
+        client = TracingAsyncClient(stub, coalescer=RequestCoalescer())  # type: ignore[arg-type]
+
+        first = asyncio.ensure_future(client.get(URL))
+        second = asyncio.ensure_future(client.get(URL))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        response = await second
+
+        assert response.status_code == 200
+        assert stub.calls == 1
+
+    @pytest.mark.anyio
+    async def test_request_cancelled_with_last_caller(self) -> None:
+        """Test that the shared request is cancelled once every caller has gone away."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        coalescer = RequestCoalescer()
+
+        async def request() -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.ensure_future(coalescer.run("key", request)) for _ in range(2)]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert coalescer._in_flight == {}
@@ -0,0 +1,99 @@
+"""Tests for connection pool options and connection statistics."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from appimage_updater.config.models import HTTPConfig
+from appimage_updater.core.http_pool import (
+    ConnectionStats,
+    build_pool_options,
+)
+
+
+class TestBuildPoolOptions:
+    """Tests for building httpx pool options from settings."""
+
+    def test_defaults(self) -> None:
+        """Test default limits over HTTP/1.1 without per-host pools."""
+        options = build_pool_options(HTTPConfig())
+
+        assert options["limits"] == httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5)
+        assert options["http2"] is False
+        assert options["max_redirects"] == 10
+        assert "mounts" not in options
+
+    def test_http2_enabled_when_available(self) -> None:
+        """Test that HTTP/2 is enabled when requested and h2 is installed."""
+        with patch("appimage_updater.core.http_pool.http2_available", return_value=True):
+            options = build_pool_options(HTTPConfig(http2=True))
+
+        assert options["http2"] is True
+
+    def test_http2_falls_back_without_h2(self) -> None:
+        """Test that a missing h2 package falls back to HTTP/1.1."""
+        with patch("appimage_updater.core.http_pool.http2_available", return_value=False):
+            options = build_pool_options(HTTPConfig(http2=True))
+
+        assert options["http2"] is False
+
+    def test_host_caps_mount_dedicated_pools(self) -> None:
+        """Test that capped hosts and their subdomains share a dedicated transport."""
+        options = build_pool_options(HTTPConfig(host_max_connections={"github.com": 4}))
+
+        mounts = options["mounts"]
+        assert set(mounts) == {"all://github.com", "all://*.github.com"}
+        assert mounts["all://github.com"] is mounts["all://*.github.com"]
+
+
+class TestConnectionStats:
+    """Tests for connection reuse counters."""
+
+    @pytest.mark.anyio
+    async def test_counts_new_and_reused_connections(self) -> None:
+        """Test counting opened, reused and TLS connections from trace events."""
+        stats = ConnectionStats()
+        events = [
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+            "http11.send_request_headers.started",
+            "http11.send_request_headers.started",
+            "http11.send_request_headers.started",
+        ]
+        for event in events:
+            await stats.trace(event, {})
+
+        assert stats.get_stats() == {
+            "connections_opened": 1,
+            "connections_reused": 2,
+            "tls_handshakes": 1,
+            "http2_requests": 0,
+        }
+
+    @pytest.mark.anyio
+    async def test_counts_http2_requests(self) -> None:
+        """Test that multiplexed HTTP/2 requests are counted."""
+        stats = ConnectionStats()
+        await stats.trace("http2.send_request_headers.started", {})
+
+        assert stats.get_stats()["http2_requests"] == 1
+
+    def test_no_stats_without_requests(self) -> None:
+        """Test that nothing is reported before any request was sent."""
+        assert ConnectionStats().get_stats() == {}
+
+    @pytest.mark.anyio
+    async def test_attach_keeps_existing_trace(self) -> None:
+        """Test that the request hook installs its trace unless one is already set."""
+        stats = ConnectionStats()
+        request = httpx.Request("GET", "https://example.com")
+        await stats.attach(request)
+
+        assert request.extensions["trace"] == stats.trace
+
+        other = ConnectionStats()
+        await other.attach(request)
+        assert request.extensions["trace"] == stats.trace
@@ -0,0 +1,167 @@
+"""Tests for host-aware HTTP rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.core.http_rate_limit import HostRateLimiter
+from appimage_updater.core.http_service import TracingAsyncClient
+
+
+URL = "https://api.github.com/repos/owner/repo/releases"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Rate limiting relies on asyncio primitives, so run only on the asyncio backend."""
+    return "asyncio"
+
+
+def _response(headers: dict[str, str], status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", URL))
+
+
+class TestHostRateLimiterHeaders:
+    """Tests for learning budgets from response headers."""
+
+    def test_learns_github_headers(self) -> None:
+        """Test X-RateLimit-Remaining with an epoch reset."""
+        limiter = HostRateLimiter()
+        reset = int(time.time()) + 120
+
+        limiter.observe(URL, _response({"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": str(reset)}))
+
+        budget = limiter.budgets["api.github.com"]
+        assert budget.remaining == 42
+        assert budget.reset_at == reset
+
+    def test_learns_ietf_headers_with_relative_reset(self) -> None:
+        """Test RateLimit-Remaining with a reset given in seconds."""
+        limiter = HostRateLimiter()
+
+        limiter.observe(
+            "https://gitlab.com/api/v4/projects", _response({"RateLimit-Remaining": "0", "RateLimit-Reset": "30"})
+        )
+
+        budget = limiter.budgets["gitlab.com"]
+        assert budget.remaining == 0
+        assert budget.reset_at is not None
+        assert 25 < budget.reset_at - time.time() <= 30
+
+    def test_learns_retry_after(self) -> None:
+        """Test that Retry-After blocks the host."""
+        limiter = HostRateLimiter()
+
+        limiter.observe(URL, _response({"Retry-After": "10"}, status_code=429))
+
+        assert limiter.budgets["api.github.com"].blocked_until - time.time() > 9
+
+    def test_ignores_responses_without_headers(self) -> None:
+        """Test that mocked responses without real headers are ignored."""
+        limiter = HostRateLimiter()
+
+        limiter.observe(URL, object())
+
+        assert limiter.budgets == {}
+
+    def test_concurrency_uses_most_specific_domain(self) -> None:
+        """Test concurrency lookup with subdomain inheritance."""
+        limiter = HostRateLimiter(
+            host_concurrency={"sourceforge.net": 2, "downloads.sourceforge.net": 4},
+            default_concurrency=6,
+        )
+
+        assert limiter.get_concurrency("sourceforge.net") == 2
+        assert limiter.get_concurrency("master.dl.sourceforge.net") == 2
+        assert limiter.get_concurrency("downloads.sourceforge.net") == 4
+        assert limiter.get_concurrency("notsourceforge.net") == 6
+
+
+class TestHostRateLimiterScheduling:
+    """Tests for delaying and capping requests."""
+
+    @pytest.mark.anyio
+    async def test_waits_for_reset_when_budget_exhausted(self) -> None:
+        """Test that an exhausted budget delays the next request until reset."""
+        limiter = HostRateLimiter()
+        limiter.observe(URL, _response({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}))
+
+        with patch("appimage_updater.core.http_rate_limit.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            async with limiter.slot(URL):
+                pass
+
+        mock_sleep.assert_awaited_once()
+        assert 4 < mock_sleep.await_args.args[0] <= 5
+        assert limiter.get_stats()["rate_limit_delays"] == 1
+
+    @pytest.mark.anyio
+    async def test_does_not_wait_beyond_max_wait(self) -> None:
+        """Test that a reset far in the future does not stall the request."""
+        limiter = HostRateLimiter(max_wait_seconds=10)
+        limiter.observe(URL, _response({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3600"}))
+
+        with patch("appimage_updater.core.http_rate_limit.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            async with limiter.slot(URL):
+                pass
+
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_in_flight_requests_consume_budget(self) -> None:
+        """Test that the remaining budget is reserved before responses arrive."""
+        limiter = HostRateLimiter()
+        limiter.observe(URL, _response({"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "60"}))
+
+        async with limiter.slot(URL):
+            pass
+        async with limiter.slot(URL):
+            pass
+
+        assert limiter.budgets["api.github.com"].remaining == 0
+
+    @pytest.mark.anyio
+    async def test_caps_concurrent_requests_per_host(self) -> None:
+        """Test that no more than the configured number of requests run at once."""
+        limiter = HostRateLimiter(host_concurrency={"api.github.com": 2})
+        active = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal active, peak
+            async with limiter.slot(URL):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+
+
+class TestTracingClientRateLimiting:
+    """Tests for rate limiting through TracingAsyncClient."""
+
+    @pytest.mark.anyio
+    async def test_responses_update_budget(self) -> None:
+        """Test that responses seen by the client feed the limiter."""
+
+        class StubClient:
+            async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+                return _response({"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": "60"})
+
+        limiter = HostRateLimiter()
+        client = TracingAsyncClient(StubClient(), rate_limiter=limiter)  # type: ignore[arg-type]
+
+        await client.get(URL)
+
+        assert limiter.budgets["api.github.com"].remaining == 7
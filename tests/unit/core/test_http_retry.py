@@ -0,0 +1,268 @@
+"""Tests for the central HTTP retry and hedging engine."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.core.http_retry import (
+    LatencyTracker,
+    RetryEngine,
+    RetryPolicy,
+    backoff_delay,
+    is_retryable_error,
+)
+
+
+URL = "https://mirror.example.com/releases"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Hedging relies on asyncio tasks, so run only on the asyncio backend."""
+    return "asyncio"
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", URL))
+
+
+class ScriptedSender:
+    """Callable returning or raising queued outcomes, one per call."""
+
+    def __init__(self, *outcomes: httpx.Response | Exception) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self) -> httpx.Response:
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class TestHelpers:
+    """Tests for backoff and error classification helpers."""
+
+    def test_backoff_delay_is_jittered_and_capped(self) -> None:
+        """Test full-jitter bounds and the maximum delay."""
+        for attempt in range(6):
+            delay = backoff_delay(attempt, base_delay=1.0, max_delay=10.0)
+            assert 0 <= delay <= min(10.0, 2**attempt)
+
+    def test_is_retryable_error(self) -> None:
+        """Test that only transient failures are retryable."""
+        request = httpx.Request("GET", URL)
+
+        assert is_retryable_error(httpx.ConnectError("refused", request=request))
+        assert is_retryable_error(httpx.HTTPStatusError("busy", request=request, response=_response(503)))
+        assert not is_retryable_error(httpx.HTTPStatusError("missing", request=request, response=_response(404)))
+        assert not is_retryable_error(httpx.ReadTimeout("slow", request=request), retry_timeouts=False)
+
+    def test_latency_percentile(self) -> None:
+        """Test p95 latency with a minimum number of samples."""
+        tracker = LatencyTracker()
+        for value in range(1, 101):
+            tracker.record(value / 100)
+
+        assert tracker.percentile(0.95) == 0.95
+        assert LatencyTracker().percentile(0.95) is None
+
+
+class TestRetryEngineRun:
+    """Tests for retrying requests."""
+
+    @pytest.mark.anyio
+    async def test_retries_transient_status_then_succeeds(self) -> None:
+        """Test that a 503 is retried and the later success returned."""
+        engine = RetryEngine()
+        send = ScriptedSender(_response(503), _response(200))
+
+        with patch("appimage_updater.core.http_retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            response = await engine.run("GET", send)
+
+        assert response.status_code == 200
+        assert send.calls == 2
+        assert engine.retries == 1
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_honours_retry_after(self) -> None:
+        """Test that Retry-After replaces the backoff delay."""
+        engine = RetryEngine()
+        send = ScriptedSender(_response(429, {"Retry-After": "7"}), _response(200))
+
+        with patch("appimage_updater.core.http_retry.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await engine.run("GET", send)
+
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    @pytest.mark.anyio
+    async def test_long_retry_after_is_not_waited_for(self) -> None:
+        """Test that a Retry-After beyond max_delay returns the response as is."""
+        engine = RetryEngine(RetryPolicy(max_delay=30))
+        send = ScriptedSender(_response(429, {"Retry-After": "3600"}))
+
+        response = await engine.run("GET", send)
+
+        assert response.status_code == 429
+        assert engine.retries == 0
+
+    @pytest.mark.anyio
+    async def test_transport_errors_raise_after_max_attempts(self) -> None:
+        """Test that the last transport error propagates once attempts are exhausted."""
+        engine = RetryEngine(RetryPolicy(max_attempts=2))
+        request = httpx.Request("GET", URL)
+        send = ScriptedSender(httpx.ConnectError("a", request=request), httpx.ConnectError("b", request=request))
+
+        with (
+            patch("appimage_updater.core.http_retry.asyncio.sleep", new=AsyncMock()),
+            pytest.raises(httpx.ConnectError, match="b"),
+        ):
+            await engine.run("GET", send)
+
+        assert send.calls == 2
+
+    @pytest.mark.anyio
+    async def test_non_idempotent_methods_are_not_retried(self) -> None:
+        """Test that POST is sent exactly once."""
+        engine = RetryEngine()
+        send = ScriptedSender(_response(503))
+
+        response = await engine.run("POST", send)
+
+        assert response.status_code == 503
+        assert send.calls == 1
+
+    @pytest.mark.anyio
+    async def test_timeouts_not_retried_by_default(self) -> None:
+        """Test that an unresponsive host costs one timeout, not one per attempt."""
+        engine = RetryEngine()
+        request = httpx.Request("GET", URL)
+        send = ScriptedSender(httpx.ReadTimeout("slow", request=request), _response(200))
+
+        with pytest.raises(httpx.ReadTimeout):
+            await engine.run("GET", send)
+
+        assert send.calls == 1
+        assert engine.retries == 0
+
+    @pytest.mark.anyio
+    async def test_timeouts_retried_when_enabled(self) -> None:
+        """Test that timeouts are retried when the policy allows it."""
+        engine = RetryEngine(RetryPolicy(retry_timeouts=True))
+        request = httpx.Request("GET", URL)
+        send = ScriptedSender(httpx.ConnectTimeout("slow", request=request), _response(200))
+
+        with patch("appimage_updater.core.http_retry.asyncio.sleep", new=AsyncMock()):
+            response = await engine.run("GET", send)
+
+        assert response.status_code == 200
+        assert send.calls == 2
+
+
+class TestRetryEngineCall:
+    """Tests for retrying operations spanning several requests."""
+
+    @pytest.mark.anyio
+    async def test_transient_errors_retried_with_cleanup(self) -> None:
+        """Test that a failed run is cleaned up and retried, timeouts included when asked."""
+        engine = RetryEngine()
+        request = httpx.Request("GET", URL)
+        send = ScriptedSender(httpx.ReadTimeout("stalled", request=request), _response(200))
+        cleaned_up: list[BaseException] = []
+
+        with patch("appimage_updater.core.http_retry.asyncio.sleep", new=AsyncMock()):
+            response = await engine.call(send, retry_timeouts=True, on_retry=cleaned_up.append)
+
+        assert response.status_code == 200
+        assert len(cleaned_up) == 1
+        assert engine.retries == 1
+
+    @pytest.mark.anyio
+    async def test_permanent_errors_raised_at_once(self) -> None:
+        """Test that an error such as 404 is not retried."""
+        engine = RetryEngine()
+        error = httpx.HTTPStatusError("missing", request=httpx.Request("GET", URL), response=_response(404))
+        send = ScriptedSender(error)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await engine.call(send)
+
+        assert send.calls == 1
+
+
+class TestRetryEngineHedge:
+    """Tests for hedged requests."""
+
+    @pytest.mark.anyio
+    async def test_hedge_wins_when_original_is_slow(self) -> None:
+        """Test that a hedged attempt answering first is used."""
+        engine = RetryEngine()
+        calls = 0
+
+        async def send() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1)
+                return "original"
+            return "hedge"
+
+        result = await engine.hedge(send, [0.01])
+
+        assert result == "hedge"
+        assert engine.get_stats()["hedged_requests"] == 1
+        assert engine.get_stats()["hedge_wins"] == 1
+
+    @pytest.mark.anyio
+    async def test_fast_original_is_not_hedged(self) -> None:
+        """Test that no hedge is sent when the first attempt answers in time."""
+        engine = RetryEngine()
+        send = ScriptedSender(_response(200))
+
+        response = await engine.hedge(send, [1.0])
+
+        assert response.status_code == 200
+        assert send.calls == 1
+        assert engine.hedged_requests == 0
+
+    @pytest.mark.anyio
+    async def test_unexpected_error_ends_race(self) -> None:
+        """Test that errors outside hedge_on are raised immediately."""
+        engine = RetryEngine()
+        request = httpx.Request("GET", URL)
+        error = httpx.HTTPStatusError("missing", request=request, response=_response(404))
+        send = ScriptedSender(error)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await engine.hedge(send, [1.0], hedge_on=(httpx.TimeoutException,))
+
+        assert send.calls == 1
+
+    @pytest.mark.anyio
+    async def test_run_hedges_after_p95_latency(self) -> None:
+        """Test that hedged mode kicks in once enough latencies are known."""
+        engine = RetryEngine(RetryPolicy(hedge=True, hedge_min_samples=1))
+        engine.latency.record(0.01)
+        calls = 0
+
+        async def send() -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1)
+            return _response(200)
+
+        response = await engine.run("GET", send)
+
+        assert response.status_code == 200
+        assert calls == 2
+        assert engine.hedge_wins == 1
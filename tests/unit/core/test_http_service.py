@@ -0,0 +1,194 @@
+"""Tests for the shared HTTP client service."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.config.models import HTTPConfig
+from appimage_updater.core.http_rate_limit import HostRateLimiter
+from appimage_updater.core.http_service import (
+    GlobalHTTPClientImpl,
+    TracingAsyncClient,
+)
+
+
+URL = "https://example.com/file.AppImage"
+
+
+class RecordingClient:
+    """Async client stub recording request keyword arguments."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.calls.append(kwargs)
+        return httpx.Response(200, request=httpx.Request("GET", url))
+
+    async def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.calls.append(kwargs)
+        return httpx.Response(200, request=httpx.Request("HEAD", url))
+
+    def build_request(self, method: str, url: str, **kwargs: Any) -> httpx.Request:
+        self.calls.append(kwargs)
+        return httpx.Request(method, url)
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return httpx.Response(200, content=b"body", request=request)
+
+
+class RecordingTracer:
+    """Tracer stub recording traced requests."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    def trace_request(self, method: str, url: str) -> None:
+        self.events.append(("request", method))
+
+    def trace_response(self, method: str, url: str, status_code: int, elapsed: float) -> None:
+        self.events.append(("response", method))
+
+
+class TestRequestOptions:
+    """Tests for per-request timeout profiles on the shared pool."""
+
+    @pytest.mark.anyio
+    async def test_options_applied_to_each_request(self) -> None:
+        """Test that client options are sent with every request."""
+        stub = RecordingClient()
+        timeout = httpx.Timeout(5, connect=5)
+        client = TracingAsyncClient(stub, request_options={"timeout": timeout})  # type: ignore[arg-type]
+
+        await client.get(URL)
+        await client.head(URL)
+
+        assert stub.calls == [{"timeout": timeout}, {"timeout": timeout}]
+
+    @pytest.mark.anyio
+    async def test_call_arguments_override_options_and_merge_headers(self) -> None:
+        """Test that explicit request arguments win and headers are merged."""
+        stub = RecordingClient()
+        client = TracingAsyncClient(
+            stub,  # type: ignore[arg-type]
+            request_options={"timeout": 5, "headers": {"User-Agent": "ua", "Range": "bytes=0-0"}},
+        )
+
+        await client.get(URL, timeout=60, headers={"Range": "bytes=0-1"})
+
+        assert stub.calls[0]["timeout"] == 60
+        assert stub.calls[0]["headers"] == {"User-Agent": "ua", "Range": "bytes=0-1"}
+
+    @pytest.mark.anyio
+    async def test_stream_uses_options(self) -> None:
+        """Test that streaming downloads get the caller's timeout rather than the pool default."""
+        stub = RecordingClient()
+        client = TracingAsyncClient(stub, request_options={"timeout": 300})  # type: ignore[arg-type]
+
+        async with client.stream("GET", URL) as response:
+            assert await response.aread() == b"body"
+
+        assert stub.calls == [{"timeout": 300}]
+
+    @pytest.mark.anyio
+    async def test_stream_traced_and_rate_limited(self) -> None:
+        """Test that streaming requests are traced and opened within the host's rate limit."""
+        tracer = RecordingTracer()
+        rate_limiter = HostRateLimiter()
+        client = TracingAsyncClient(RecordingClient(), tracer=tracer, rate_limiter=rate_limiter)  # type: ignore[arg-type]
+
+        with patch.object(rate_limiter, "observe") as mock_observe:
+            async with client.stream("GET", URL) as response:
+                assert await response.aread() == b"body"
+
+        assert tracer.events == [("request", "GET"), ("response", "GET")]
+        mock_observe.assert_called_once_with(URL, response)
+        assert response.is_closed
+
+    @pytest.mark.anyio
+    async def test_get_client_keeps_timeouts_per_caller(self) -> None:
+        """Test that later callers' timeouts are not dropped once the pool exists."""
+        manager = GlobalHTTPClientImpl()
+        manager._client = RecordingClient()  # type: ignore[assignment]
+
+        quick = await manager.get_client(timeout=5, follow_redirects=True)
+        slow = await manager.get_client(timeout=300)
+
+        assert quick._request_options == {"timeout": 5, "follow_redirects": True}
+        assert slow._request_options == {"timeout": 300}
+        assert quick._client is slow._client
+
+    @pytest.mark.anyio
+    async def test_get_client_without_coalescing_or_retries(self) -> None:
+        """Test that callers can send requests on their own, bypassing coalescing and retries."""
+        manager = GlobalHTTPClientImpl()
+        manager._client = RecordingClient()  # type: ignore[assignment]
+
+        shared = await manager.get_client()
+        independent = await manager.get_client(coalesce=False, retry=False)
+
+        assert shared._coalescer is not None and shared._retry_engine is not None
+        assert independent._coalescer is None and independent._retry_engine is None
+
+
+class TestConfigure:
+    """Tests for applying HTTP settings to the shared client."""
+
+    def test_unchanged_settings_keep_shared_state(self) -> None:
+        """Test that re-applying the same settings on each config load keeps the rate limiter."""
+        manager = GlobalHTTPClientImpl()
+        limiter = manager.get_rate_limiter()
+
+        manager.configure(HTTPConfig())
+
+        assert manager.get_rate_limiter() is limiter
+
+    def test_changed_settings_rebuild_shared_state(self) -> None:
+        """Test that new settings replace the rate limiter built from the old ones."""
+        manager = GlobalHTTPClientImpl()
+        limiter = manager.get_rate_limiter()
+
+        manager.configure(HTTPConfig(default_host_concurrency=1))
+
+        assert manager.get_rate_limiter() is not limiter
+
+    @pytest.mark.anyio
+    async def test_changed_pool_settings_rebuild_client(self) -> None:
+        """Test that pool settings applied after the first request take effect on the next one."""
+        manager = GlobalHTTPClientImpl()
+        with patch("appimage_updater.core.http_service.httpx.AsyncClient", side_effect=lambda **_: AsyncMock()) as cls:
+            first = await manager._ensure_client()
+            manager.configure(HTTPConfig(max_redirects=3))
+            second = await manager._ensure_client()
+
+        assert second is not first
+        assert cls.call_args.kwargs["max_redirects"] == 3
+        await manager.close()
+        first.aclose.assert_awaited_once()
+        second.aclose.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_unrelated_settings_keep_client(self) -> None:
+        """Test that settings outside the pool do not rebuild the shared client."""
+        manager = GlobalHTTPClientImpl()
+        first = await manager._ensure_client()
+
+        manager.configure(HTTPConfig(cache_enabled=False))
+
+        assert await manager._ensure_client() is first
+        await manager.close()
+
+    @pytest.mark.anyio
+    async def test_get_client_rejects_pool_options(self) -> None:
+        """Test that pool-wide options cannot be passed per call, where they would be ignored."""
+        manager = GlobalHTTPClientImpl()
+
+        with pytest.raises(TypeError, match="max_redirects"):
+            await manager.get_client(timeout=5, max_redirects=3)
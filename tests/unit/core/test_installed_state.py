@@ -0,0 +1,162 @@
+"""Tests for the persistent installed-state index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import time
+from types import SimpleNamespace
+
+from appimage_updater.core.installed_state import (
+    RACY_MTIME_WINDOW_NS,
+    InstalledStateIndex,
+)
+
+
+def make_app(download_dir: Path, name: str = "TestApp") -> SimpleNamespace:
+    """Create an application configuration-like object."""
+    return SimpleNamespace(name=name, download_dir=download_dir)
+
+
+def age_paths(*paths: Path) -> None:
+    """Move modification times well before now, out of the racy window."""
+    old_ns = time.time_ns() - 10 * RACY_MTIME_WINDOW_NS
+    for path in paths:
+        os.utime(path, ns=(old_ns, old_ns))
+
+
+def install(download_dir: Path, version: str = "1.0") -> tuple[Path, Path]:
+    """Create a rotated AppImage and its .info file, with settled modification times."""
+    download_dir.mkdir(exist_ok=True)
+    current = download_dir / f"TestApp-{version}.AppImage.current"
+    current.write_bytes(b"appimage")
+    info = download_dir / f"{current.name}.info"
+    info.write_text(f"Version: {version}\n")
+    age_paths(current, info, download_dir)
+    return current, info
+
+
+class TestInstalledStateIndex:
+    """Tests for recording and validating installed state."""
+
+    def test_unchanged_directory_is_served_from_index(self, tmp_path: Path) -> None:
+        """Test that a recorded state is returned, also by a new index reading it from disk."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        index_path = tmp_path / "installed.json"
+
+        index = InstalledStateIndex(index_path)
+        assert index.record(app, "1.0", current, info, sha256="abc")  # type: ignore[arg-type]
+        index.flush()
+        state = InstalledStateIndex(index_path).lookup(app)  # type: ignore[arg-type]
+
+        assert state is not None
+        assert state.version == "1.0"
+        assert state.file == str(current)
+        assert state.size == len(b"appimage")
+        assert state.sha256 == "abc"
+
+    def test_directory_change_invalidates(self, tmp_path: Path) -> None:
+        """Test that adding, removing or renaming files makes the entry outdated."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        index.record(app, "1.0", current, info)  # type: ignore[arg-type]
+
+        current.rename(app.download_dir / "TestApp-1.0.AppImage.old")
+
+        assert index.lookup(app) is None  # type: ignore[arg-type]
+
+    def test_rewritten_info_file_invalidates(self, tmp_path: Path) -> None:
+        """Test that a .info file rewritten in place, which leaves the directory alone, is noticed."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        index.record(app, "1.0", current, info)  # type: ignore[arg-type]
+
+        info.write_text("Version: 1.1\n")
+        age_paths(app.download_dir)
+
+        assert index.lookup(app) is None  # type: ignore[arg-type]
+
+    def test_recent_changes_are_not_trusted(self, tmp_path: Path) -> None:
+        """Test that entries recorded right after a change are revalidated by a rescan."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        (app.download_dir / "new.AppImage").touch()
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        index.record(app, "1.0", current, info)  # type: ignore[arg-type]
+
+        assert index.lookup(app) is None  # type: ignore[arg-type]
+
+    def test_racy_entry_used_once_confirmed(self, tmp_path: Path) -> None:
+        """Test that an entry recorded right after an update is used once confirmed, then re-stamped."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        index.record(app, "1.0", current, info, sha256="abc")  # type: ignore[arg-type]
+        # Recorded as if right after the files were written
+        entry = index.lookup(app)  # type: ignore[arg-type]
+        assert entry is not None
+        entry.recorded_at_ns = entry.dir_mtime_ns
+        confirmed: list[str] = []
+
+        assert index.lookup(app, confirm=lambda _: False) is None  # type: ignore[arg-type]
+        state = index.lookup(app, confirm=lambda e: confirmed.append(e.version) or True)  # type: ignore[arg-type]
+
+        assert state is not None and state.sha256 == "abc"
+        assert confirmed == ["1.0"]
+        assert index.lookup(app) is state  # type: ignore[arg-type]
+
+    def test_changes_written_on_flush(self, tmp_path: Path) -> None:
+        """Test that records and invalidations are kept in memory until flushed, in one write."""
+        app = make_app(tmp_path / "app")
+        other = make_app(tmp_path / "other", name="Other")
+        current, info = install(app.download_dir)
+        other_current, other_info = install(other.download_dir)
+        index_path = tmp_path / "installed.json"
+        index = InstalledStateIndex(index_path)
+
+        index.record(app, "1.0", current, info)  # type: ignore[arg-type]
+        index.record(other, "1.0", other_current, other_info)  # type: ignore[arg-type]
+        index.invalidate(other)  # type: ignore[arg-type]
+        assert not index_path.exists()
+
+        index.flush()
+        assert list(json.loads(index_path.read_text())["apps"]) == ["TestApp"]
+
+    def test_hash_kept_for_unchanged_file(self, tmp_path: Path) -> None:
+        """Test that re-recording the same file after a rescan keeps its known hash."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        index.record(app, "1.0", current, info, sha256="abc")  # type: ignore[arg-type]
+
+        index.record(app, "1.0", current, info)  # type: ignore[arg-type]
+
+        assert index.lookup(app).sha256 == "abc"  # type: ignore[arg-type,union-attr]
+
+    def test_moved_download_dir_and_invalidate(self, tmp_path: Path) -> None:
+        """Test that entries of another download directory or invalidated ones are not used."""
+        app = make_app(tmp_path / "app")
+        current, info = install(app.download_dir)
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        index.record(app, "1.0", current, info)  # type: ignore[arg-type]
+        index.flush()
+
+        assert index.lookup(make_app(tmp_path / "elsewhere")) is None  # type: ignore[arg-type]
+        index.invalidate(app)  # type: ignore[arg-type]
+        index.flush()
+        assert InstalledStateIndex(tmp_path / "installed.json").lookup(app) is None  # type: ignore[arg-type]
+
+    def test_unreadable_index_starts_over(self, tmp_path: Path) -> None:
+        """Test that a corrupt or older-format index is ignored."""
+        app = make_app(tmp_path / "app")
+        index_path = tmp_path / "installed.json"
+
+        index_path.write_text("{not json")
+        assert InstalledStateIndex(index_path).lookup(app) is None  # type: ignore[arg-type]
+
+        index_path.write_text(json.dumps({"format": 0, "apps": {"TestApp": {}}}))
+        assert InstalledStateIndex(index_path).lookup(app) is None  # type: ignore[arg-type]
@@ -1,10 +1,14 @@
+import os
 from pathlib import Path
+import time
 from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from appimage_updater.config.models import ApplicationConfig
 from appimage_updater.core.info_file_service import InfoFileService
+from appimage_updater.core.installed_state import RACY_MTIME_WINDOW_NS, InstalledStateIndex
 from appimage_updater.core.local_version_service import LocalVersionService
 from appimage_updater.core.version_parser import VersionParser
 
@@ -64,7 +68,9 @@ class TestLocalVersionService:
         # the filename without applying normalize_version_string.
         assert result == "0.9"
 
-    def test_get_current_version_uses_file_analysis_as_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_get_current_version_uses_file_analysis_as_fallback(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         download_dir = tmp_path / "downloads"
         download_dir.mkdir()
         app_file = download_dir / "TestApp_1.0_x86_64.AppImage"
@@ -101,3 +107,56 @@ class TestLocalVersionService:
         result = svc.get_current_version(app_config)  # type: ignore[arg-type]
 
         assert result is None
+
+
+class TestLocalVersionServiceIndex:
+    def test_scan_result_recorded_and_reused(self, tmp_path: Path) -> None:
+        download_dir = tmp_path / "downloads"
+        download_dir.mkdir()
+        current_file = download_dir / "TestApp_0.9_x86_64.AppImage.current"
+        current_file.touch()
+        old_ns = time.time_ns() - 10 * RACY_MTIME_WINDOW_NS
+        os.utime(current_file, ns=(old_ns, old_ns))
+        os.utime(download_dir, ns=(old_ns, old_ns))
+
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        parser = DummyVersionParser(filename_version="0.9")
+        svc = LocalVersionService(
+            version_parser=parser, info_service=DummyInfoFileService(None, None), installed_state=index
+        )
+        app_config = SimpleNamespace(name="TestApp", download_dir=download_dir)
+
+        assert svc.get_current_version(app_config) == "0.9"  # type: ignore[arg-type]
+        assert index.lookup(app_config).file == str(current_file)  # type: ignore[arg-type,union-attr]
+
+        parser._filename_version = None
+        assert svc.get_current_version(app_config) == "0.9"  # type: ignore[arg-type]
+
+    def test_installed_file_recorded_from_info_file(self, tmp_path: Path) -> None:
+        current_file = tmp_path / "TestApp-2.0.AppImage.current"
+        current_file.touch()
+        info_file = tmp_path / f"{current_file.name}.info"
+        info_file.write_text("Version: v2.0\n")
+
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        svc = LocalVersionService(installed_state=index)
+        app_config = SimpleNamespace(name="TestApp", download_dir=tmp_path)
+
+        svc.record_installed_file(app_config, current_file, sha256="abc")  # type: ignore[arg-type]
+
+        entry = index._get_entries()["TestApp"]
+        assert (entry.version, entry.info_file, entry.sha256) == ("2.0", str(info_file), "abc")
+
+    def test_recorded_install_used_by_next_lookup(self, tmp_path: Path) -> None:
+        current_file = tmp_path / "TestApp-2.0.AppImage.current"
+        current_file.touch()
+        info_file = tmp_path / f"{current_file.name}.info"
+        info_file.write_text("Version: v2.0\n")
+
+        index = InstalledStateIndex(tmp_path / "installed.json")
+        svc = LocalVersionService(installed_state=index)
+        app_config = SimpleNamespace(name="TestApp", download_dir=tmp_path)
+        svc.record_installed_file(app_config, current_file, sha256="abc")  # type: ignore[arg-type]
+
+        with patch.object(svc, "_scan_current_version", side_effect=AssertionError("rescanned")):
+            assert svc.get_current_version(app_config) == "2.0"  # type: ignore[arg-type]
@@ -0,0 +1,129 @@
+"""Tests for release and asset models."""
+
+from __future__ import annotations
+
+from datetime import (
+    UTC,
+    datetime,
+)
+
+from appimage_updater.core.models import (
+    Asset,
+    RawAsset,
+    Release,
+)
+
+
+def make_release(raw_assets: list[RawAsset]) -> Release:
+    """Create a release holding raw assets."""
+    return Release(
+        version="1.0.0",
+        tag_name="v1.0.0",
+        published_at=datetime(2024, 1, 1, tzinfo=UTC),
+        raw_assets=raw_assets,
+    )
+
+
+class TestRawAssets:
+    """Tests for releases built from raw assets."""
+
+    def test_filter_converts_only_matching_assets(self) -> None:
+        """Test that filtering by name leaves other assets unconverted."""
+        app = RawAsset("App-x86_64.AppImage", "https://example.com/app", 10, "2024-01-01T00:00:00Z")
+        other = RawAsset("App-arm64.AppImage", "https://example.com/arm", 10, "2024-01-01T00:00:00Z")
+        release = make_release([app, other])
+
+        assets = release.get_matching_assets(r"x86_64")
+
+        assert [asset.name for asset in assets] == ["App-x86_64.AppImage"]
+        assert assets[0].created_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert other._asset is None
+
+    def test_assets_converted_in_order_on_access(self) -> None:
+        """Test that reading assets converts all of them once, in release order."""
+        release = make_release(
+            [RawAsset("a.AppImage", "https://example.com/a"), RawAsset("b.zip", "https://example.com/b")]
+        )
+
+        assets = release.assets
+
+        assert [asset.name for asset in assets] == ["a.AppImage", "b.zip"]
+        assert all(isinstance(asset, Asset) for asset in assets)
+        assert release.assets is assets
+        assert release.filter_assets(lambda name: name.endswith(".zip")) == [assets[1]]
+
+    def test_checksum_asset_converted_with_asset(self) -> None:
+        """Test that an associated checksum file is converted along with its asset."""
+        checksum = RawAsset("app.AppImage.sha256", "https://example.com/app.sha256")
+        release = make_release([RawAsset("app.AppImage", "https://example.com/app", checksum_asset=checksum), checksum])
+
+        (asset,) = release.filter_assets(lambda name: name == "app.AppImage")
+
+        assert asset.checksum_asset is not None
+        assert asset.checksum_asset.name == "app.AppImage.sha256"
+
+    def test_has_assets_without_conversion(self) -> None:
+        """Test that checking for assets converts nothing."""
+        raw_asset = RawAsset("app.AppImage", "https://example.com/app")
+
+        assert make_release([raw_asset]).has_assets
+        assert not make_release([]).has_assets
+        assert raw_asset._asset is None
+
+    def test_validated_assets_still_accepted(self) -> None:
+        """Test that releases can still be created from Asset models."""
+        asset = Asset(name="app.AppImage", url="https://example.com/app", size=1, created_at=datetime(2024, 1, 1))
+
+        release = Release(
+            version="1.0.0",
+            tag_name="v1.0.0",
+            published_at=datetime(2024, 1, 1, tzinfo=UTC),
+            assets=[asset],
+        )
+
+        assert release.assets == [asset]
+        assert release.has_assets
+
+    def test_assets_survive_dump_and_validate(self) -> None:
+        """Test that raw assets are serialized and restored by model_dump() and model_validate()."""
+        checksum = RawAsset("app.AppImage.sha256", "https://example.com/app.sha256")
+        release = make_release(
+            [RawAsset("app.AppImage", "https://example.com/app", 10, "2024-01-01T00:00:00Z", checksum), checksum]
+        )
+
+        restored = Release.model_validate(release.model_dump())
+        restored_from_json = Release.model_validate_json(release.model_dump_json())
+
+        assert restored.assets == release.assets
+        assert restored_from_json.assets == release.assets
+        assert restored.assets[0].checksum_asset is not None
+
+    def test_releases_from_same_raw_assets_compare_equal(self) -> None:
+        """Test that releases compare by value whether or not their assets were converted."""
+        raw_assets = [RawAsset("app.AppImage", "https://example.com/app", 10, "2024-01-01T00:00:00Z")]
+        copied_assets = [RawAsset("app.AppImage", "https://example.com/app", 10, "2024-01-01T00:00:00Z")]
+        release = make_release(raw_assets)
+        copy = make_release(copied_assets)
+
+        assert release == copy
+        _ = release.assets
+        assert release == copy
+        assert release == Release.model_validate(release.model_dump())
+        assert release != make_release([RawAsset("other.AppImage", "https://example.com/other")])
+
+    def test_raw_assets_compare_by_value(self) -> None:
+        """Test that raw assets compare and print by value."""
+        raw_asset = RawAsset("app.AppImage", "https://example.com/app", 10)
+        same = RawAsset("app.AppImage", "https://example.com/app", 10)
+        same.to_asset()
+
+        assert raw_asset == same
+        assert raw_asset != RawAsset("app.AppImage", "https://example.com/app", 11)
+        assert "name='app.AppImage'" in repr(raw_asset)
+
+    def test_schema_lists_assets(self) -> None:
+        """Test that the release JSON schema documents the assets field."""
+        schema = Release.model_json_schema()
+
+        assert schema["properties"]["assets"]["items"] == {"$ref": "#/$defs/Asset"}
+        assert "Asset" in schema["$defs"]
@@ -0,0 +1,185 @@
+"""Tests for the bounded, per-host fair ConcurrentProcessor."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from appimage_updater.core.parallel import (
+    ConcurrentProcessor,
+    get_item_host,
+)
+
+
+def make_app(name: str, host: str = "github.com", delay: float = 0.0) -> SimpleNamespace:
+    """Create an application-like item on the given host."""
+    return SimpleNamespace(name=name, url=f"https://{host}/owner/{name}", delay=delay)
+
+
+class ConcurrencyTracker:
+    """Worker recording how many items run at once, overall and per host."""
+
+    def __init__(self) -> None:
+        self.running: Counter[str] = Counter()
+        self.peak = 0
+        self.host_peak: Counter[str] = Counter()
+        self.started: list[str] = []
+
+    async def __call__(self, item: Any) -> str:
+        host = get_item_host(item)
+        self.started.append(item.name)
+        self.running[host] += 1
+        self.peak = max(self.peak, sum(self.running.values()))
+        self.host_peak[host] = max(self.host_peak[host], self.running[host])
+        try:
+            await asyncio.sleep(item.delay)
+        finally:
+            self.running[host] -= 1
+        return item.name
+
+
+class TestConcurrentProcessor:
+    """Tests for ConcurrentProcessor scheduling."""
+
+    def test_item_host(self) -> None:
+        """Test that items are keyed by the host of their URL."""
+        assert get_item_host(make_app("a", host="GitLab.com")) == "gitlab.com"
+        assert get_item_host(SimpleNamespace(name="no-url")) == ""
+
+    @pytest.mark.anyio
+    async def test_global_limit(self) -> None:
+        """Test that no more than max_concurrency items run at once."""
+        items = [make_app(f"app{i}", host=f"host{i}.example.com", delay=0.01) for i in range(10)]
+        tracker = ConcurrencyTracker()
+
+        results = await ConcurrentProcessor(max_concurrency=3).process_items_async(items, tracker)
+
+        assert results == [item.name for item in items]
+        assert tracker.peak == 3
+
+    @pytest.mark.anyio
+    async def test_host_limit_leaves_slots_to_other_hosts(self) -> None:
+        """Test that a busy host is capped while items of other hosts keep starting."""
+        slow = [make_app(f"slow{i}", host="slow.example.com", delay=0.05) for i in range(6)]
+        fast = [make_app(f"fast{i}", host="fast.example.com", delay=0.0) for i in range(3)]
+        tracker = ConcurrencyTracker()
+        processor = ConcurrentProcessor(max_concurrency=4, host_concurrency=2)
+
+        completed = [items_index async for items_index, _ in processor.iter_completed(slow + fast, tracker)]
+
+        assert tracker.host_peak["slow.example.com"] == 2
+        # The fast host is not stuck behind the slow host's queue
+        assert tracker.started[:3] == ["slow0", "slow1", "fast0"]
+        assert sorted(completed[:3]) == [6, 7, 8]
+
+    @pytest.mark.anyio
+    async def test_results_yielded_in_completion_order(self) -> None:
+        """Test that iter_completed() yields each result as soon as it is ready."""
+        items = [make_app("late", "a.example.com", 0.05), make_app("early", "b.example.com", 0.0)]
+        tracker = ConcurrencyTracker()
+
+        completed = [pair async for pair in ConcurrentProcessor().iter_completed(items, tracker)]
+
+        assert completed == [(1, "early"), (0, "late")]
+
+    @pytest.mark.anyio
+    async def test_priority_orders_start(self) -> None:
+        """Test that items start by ascending priority."""
+        items = [make_app("c"), make_app("a"), make_app("b")]
+        tracker = ConcurrencyTracker()
+        processor = ConcurrentProcessor(max_concurrency=1)
+
+        _ = [pair async for pair in processor.iter_completed(items, tracker, priority=lambda item: item.name)]
+
+        assert tracker.started == ["a", "b", "c"]
+
+    @pytest.mark.anyio
+    async def test_progress_reported_per_completed_item(self) -> None:
+        """Test that progress is reported once per completed item."""
+        items = [make_app(f"app{i}", host=f"host{i}.example.com") for i in range(3)]
+        calls: list[tuple[int, int, str]] = []
+
+        await ConcurrentProcessor().process_items_async(
+            items, ConcurrencyTracker(), lambda current, total, description: calls.append((current, total, description))
+        )
+
+        assert calls[0] == (0, 3, "Starting concurrent checks")
+        assert [call[0] for call in calls[1:]] == [1, 2, 3]
+
+    @pytest.mark.anyio
+    async def test_exception_cancels_running_items(self) -> None:
+        """Test that a failing item propagates its exception and cancels the others."""
+        cancelled: list[str] = []
+
+        async def worker(item: Any) -> str:
+            if item.name == "bad":
+                raise ValueError("boom")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(item.name)
+                raise
+            return str(item.name)
+
+        items = [make_app("bad", "a.example.com"), make_app("good", "b.example.com")]
+
+        with pytest.raises(ValueError, match="boom"):
+            await ConcurrentProcessor().process_items_async(items, worker)
+        await asyncio.sleep(0)
+
+        assert cancelled == ["good"]
+
+
+class TestTimeBudgets:
+    """Tests for per-item time budgets and the run deadline."""
+
+    @pytest.mark.anyio
+    async def test_item_timeout_reports_timed_out_items(self) -> None:
+        """Test that items over their budget are cancelled and reported through on_timeout."""
+        items = [make_app("slow", "a.example.com", 1.0), make_app("fast", "b.example.com", 0.0)]
+        processor = ConcurrentProcessor(item_timeout=0.05, on_timeout=lambda item: f"{item.name} timed out")
+
+        results = await processor.process_items_async(items, ConcurrencyTracker())
+
+        assert results == ["slow timed out", "fast"]
+
+    @pytest.mark.anyio
+    async def test_single_item_within_budget(self) -> None:
+        """Test that a single item is held to its budget too."""
+        processor = ConcurrentProcessor(item_timeout=0.05, on_timeout=lambda item: "timed out")
+
+        assert await processor.process_items_async([make_app("slow", delay=1.0)], ConcurrencyTracker()) == [
+            "timed out"
+        ]
+
+    @pytest.mark.anyio
+    async def test_deadline_reports_running_and_pending_items(self) -> None:
+        """Test that at the deadline, finished results are kept and the rest reported as timed out."""
+        items = [
+            make_app("fast", "a.example.com", 0.0),
+            make_app("slow", "b.example.com", 1.0),
+            make_app("queued", "b.example.com", 0.0),
+        ]
+        tracker = ConcurrencyTracker()
+        processor = ConcurrentProcessor(
+            host_concurrency=1, deadline=time.monotonic() + 0.1, on_timeout=lambda item: f"{item.name} timed out"
+        )
+
+        completed = [pair async for pair in processor.iter_completed(items, tracker)]
+
+        assert completed == [(0, "fast"), (1, "slow timed out"), (2, "queued timed out")]
+        assert "queued" not in tracker.started
+        assert sum(tracker.running.values()) == 0
+
+    @pytest.mark.anyio
+    async def test_timeout_without_handler_raises(self) -> None:
+        """Test that running out of time raises TimeoutError when no on_timeout is set."""
+        items = [make_app("slow", "a.example.com", 1.0), make_app("fast", "b.example.com", 0.0)]
+
+        with pytest.raises(TimeoutError):
+            await ConcurrentProcessor(item_timeout=0.05).process_items_async(items, ConcurrencyTracker())
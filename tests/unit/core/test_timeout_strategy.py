@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from appimage_updater.core.http_service import GlobalHTTPClient
 from appimage_updater.core.timeout_strategy import (
     ProgressiveTimeoutClient,
     TimeoutStrategy,
@@ -10,6 +18,18 @@ from appimage_updater.core.timeout_strategy import (
 )
 
 
+class DeadHostClient:
+    """Async client stub whose GETs hang until their read timeout, then time out."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(kwargs["timeout"].read)
+        raise httpx.ReadTimeout("timed out", request=httpx.Request("GET", url))
+
+
 class TestTimeoutStrategy:
     """Tests for TimeoutStrategy class."""
 
@@ -97,13 +117,24 @@ class TestTimeoutStrategy:
 
         assert timeout == 30  # fallback
 
+    def test_get_request_timeout_caps_connect(self) -> None:
+        """Test that request timeouts fail fast on connect but keep the operation's read timeout."""
+        strategy = TimeoutStrategy(base_timeout=30)
+
+        quick = strategy.get_request_timeout("quick_check")
+        download = strategy.get_request_timeout("download")
+
+        assert quick == httpx.Timeout(5)
+        assert download.read == 300
+        assert download.connect == 10
+
     def test_create_client_config_basic(self) -> None:
         """Test creating basic client config."""
         strategy = TimeoutStrategy()
 
         config = strategy.create_client_config("api_request")
 
-        assert config["timeout"] == 15
+        assert config["timeout"] == httpx.Timeout(15, connect=10)
         assert len(config) == 1
 
     def test_create_client_config_with_kwargs(self) -> None:
@@ -112,7 +143,7 @@ class TestTimeoutStrategy:
 
         config = strategy.create_client_config("download", follow_redirects=True, max_redirects=10)
 
-        assert config["timeout"] == 300
+        assert config["timeout"] == httpx.Timeout(300, connect=10)
         assert config["follow_redirects"] is True
         assert config["max_redirects"] == 10
 
@@ -122,7 +153,7 @@ class TestTimeoutStrategy:
 
         config = strategy.create_client_config()
 
-        assert config["timeout"] == 30  # fallback
+        assert config["timeout"] == httpx.Timeout(30, connect=10)  # fallback
 
 
 class TestProgressiveTimeoutClient:
@@ -154,6 +185,22 @@ class TestProgressiveTimeoutClient:
 
         assert types == custom_types
 
+    @pytest.mark.anyio
+    async def test_dead_host_costs_at_most_longest_timeout(self) -> None:
+        """Test that hedged attempts are separate requests, neither coalesced nor retried."""
+        dead_host = DeadHostClient()
+        GlobalHTTPClient()._client = dead_host  # type: ignore[assignment]
+        strategy = TimeoutStrategy()
+        strategy.timeouts.update({"quick_check": 0.05, "fallback": 0.2})
+
+        start = time.monotonic()
+        with pytest.raises(httpx.TimeoutException):
+            await ProgressiveTimeoutClient(strategy).get_with_progressive_timeout("https://dead.example.com/App")
+        elapsed = time.monotonic() - start
+
+        assert dead_host.calls == 2
+        assert elapsed < 0.2 + 0.05 + 0.15
+
 
 class TestGlobalFunctions:
     """Tests for global timeout strategy functions."""
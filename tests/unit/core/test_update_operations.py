@@ -18,14 +18,18 @@ from appimage_updater.ui.output.rich_formatter import RichOutputFormatter
 from appimage_updater.core.update_operations import (
     _check_updates,
     _convert_check_results_to_dict,
+    _create_check_processor,
     _create_disabled_results,
     _create_downloader,
     _create_dry_run_result,
+    _display_cached_results,
+    _display_changed_results,
     _display_check_results,
     _display_check_start_message,
     _display_check_verbose_info,
     _display_update_summary,
     _execute_check_workflow,
+    _execute_pipelined_update_workflow,
     _execute_update_workflow,
     _extract_application_name,
     _extract_candidate_download_url,
@@ -613,6 +617,41 @@ class TestCreateDownloader:
         )
 
 
+class TestCreateCheckProcessor:
+    """Tests for _create_check_processor function."""
+
+    def test_limits_from_config(self, mock_config: Config) -> None:
+        """Test that concurrency and time budgets come from the global config."""
+        mock_config.global_config.concurrent_checks = 8
+        mock_config.global_config.concurrent_checks_per_host = 2
+        mock_config.global_config.check_timeout_seconds = 45
+
+        processor = _create_check_processor(mock_config, deadline_at=1234.5)
+
+        assert processor.max_concurrency == 8
+        assert processor.host_concurrency == 2
+        assert processor.item_timeout == 45
+        assert processor.deadline == 1234.5
+
+    def test_no_check_timeout_by_default(self, mock_config: Config) -> None:
+        """Test that checks are not timed out unless a check timeout or deadline is set."""
+        processor = _create_check_processor(mock_config)
+
+        assert processor.item_timeout is None
+        assert processor.deadline is None
+
+    def test_timed_out_checks_are_failed_results(self, mock_app_config: ApplicationConfig) -> None:
+        """Test that a check running out of time is reported as a failed result."""
+        processor = _create_check_processor(None)
+
+        assert processor.on_timeout is not None
+        result = processor.on_timeout(mock_app_config)
+
+        assert result == CheckResult(
+            app_name="TestApp", success=False, error_message="timed out", checked_at=result.checked_at
+        )
+
+
 class TestRotationHelpers:
     """Tests for rotation helper functions."""
 
@@ -1172,6 +1211,70 @@ class TestAsyncFunctions:
 
         mock_downloads.assert_called_once()
 
+    @pytest.mark.anyio
+    @patch("appimage_updater.core.update_operations._execute_pipelined_update_workflow")
+    @patch("appimage_updater.core.update_operations._perform_update_checks")
+    async def test_execute_update_workflow_pipeline(self, mock_checks: Mock, mock_pipelined: Mock) -> None:
+        """Test that --yes --pipeline runs the pipelined workflow and --pipeline alone does not."""
+        mock_checks.return_value = []
+        config, apps = Mock(), [Mock()]
+
+        await _execute_update_workflow(config, apps, [], False, True, False, False, True)
+        mock_pipelined.assert_awaited_once_with(config, apps, [], False, None, None, None)
+
+        with OutputFormatterContext(RichOutputFormatter()):
+            with patch("appimage_updater.core.update_operations._handle_no_updates_scenario"):
+                await _execute_update_workflow(config, apps, [], False, False, False, False, True)
+        mock_pipelined.assert_awaited_once()
+        mock_checks.assert_awaited_once()
+
+    @pytest.mark.anyio
+    @patch("appimage_updater.core.update_operations.display_download_results")
+    @patch("appimage_updater.core.update_operations._create_downloader")
+    @patch("appimage_updater.core.update_operations.VersionChecker")
+    @patch("appimage_updater.core.update_operations.console")
+    async def test_pipelined_workflow_downloads_candidates_as_checked(
+        self,
+        mock_console: Mock,
+        mock_checker_class: Mock,
+        mock_create_downloader: Mock,
+        mock_display_downloads: Mock,
+        mock_config: Config,
+        mock_update_candidate: UpdateCandidate,
+    ) -> None:
+        """Test that only updates found by checks are downloaded and all results displayed once."""
+        current = CheckResult(app_name="Current", success=True, current_version="1.0", available_version="1.0")
+        update = CheckResult(app_name="TestApp", success=True, candidate=mock_update_candidate)
+        results = {"Current": current, "TestApp": update}
+        mock_checker = mock_checker_class.return_value
+        mock_checker.stop_prefetch = AsyncMock()
+        mock_checker.check_for_updates = AsyncMock(side_effect=lambda app: results[app.name])
+        received: list[UpdateCandidate] = []
+        progress_callbacks: list[Any] = []
+
+        async def download_as_available(candidates: Any, progress_callback: Any = None) -> list[Any]:
+            progress_callbacks.append(progress_callback)
+            async for candidate in candidates:
+                received.append(candidate)
+            return [Mock(success=True)]
+
+        mock_create_downloader.return_value.download_as_available = download_as_available
+        apps = [Mock(url="https://example.com/current"), Mock(url="https://example.com/app")]
+        apps[0].name, apps[1].name = "Current", "TestApp"
+
+        with (
+            OutputFormatterContext(RichOutputFormatter()),
+            patch("appimage_updater.core.update_operations._display_check_results") as mock_display_checks,
+        ):
+            await _execute_pipelined_update_workflow(mock_config, apps, [], True)
+
+        assert received == [mock_update_candidate]
+        assert mock_display_checks.call_args.args[0] == [current, update]
+        assert progress_callbacks[0] is not None
+        mock_checker.start_prefetch.assert_called_once_with(apps, None)
+        mock_checker.stop_prefetch.assert_awaited_once_with()
+        mock_display_downloads.assert_called_once()
+
     @pytest.mark.anyio
     @patch("appimage_updater.core.update_operations._perform_dry_run_checks")
     async def test_perform_update_checks_dry_run(self, mock_dry_run: Mock) -> None:
@@ -1199,9 +1302,7 @@ class TestAsyncFunctions:
     @pytest.mark.anyio
     @patch("appimage_updater.core.update_operations.VersionChecker")
     @patch("appimage_updater.core.update_operations.console")
-    async def test_perform_dry_run_checks(
-        self, mock_console: Mock, mock_checker_class: Mock, tmp_path: Path
-    ) -> None:
+    async def test_perform_dry_run_checks(self, mock_console: Mock, mock_checker_class: Mock, tmp_path: Path) -> None:
         """Test performing dry run checks."""
         mock_checker = Mock()
         mock_checker._get_current_version.return_value = "1.0.0"
@@ -1229,12 +1330,32 @@ class TestAsyncFunctions:
         mock_processor = Mock()
         mock_processor.process_items_async = AsyncMock(return_value=[])
         mock_processor_class.return_value = mock_processor
+        mock_checker_class.return_value.stop_prefetch = AsyncMock()
+        apps = [Mock()]
 
-        result = await _perform_real_update_checks([Mock()], False)
+        result = await _perform_real_update_checks(apps, False)
 
         assert result == []
+        mock_checker_class.return_value.start_prefetch.assert_called_once_with(apps, None)
+        mock_checker_class.return_value.stop_prefetch.assert_awaited_once_with()
         mock_processor.process_items_async.assert_called_once()
 
+    @pytest.mark.anyio
+    @patch("appimage_updater.core.update_operations.VersionChecker")
+    @patch("appimage_updater.core.update_operations.ConcurrentProcessor")
+    async def test_real_update_checks_save_cached_results(
+        self, mock_processor_class: Mock, mock_checker_class: Mock
+    ) -> None:
+        """Test that check results are written once, pruned to the configured applications, even on failure."""
+        mock_processor_class.return_value.process_items_async = AsyncMock(side_effect=TimeoutError)
+        mock_checker_class.return_value.stop_prefetch = AsyncMock()
+        config = Mock(applications=[Mock()])
+
+        with pytest.raises(TimeoutError):
+            await _perform_real_update_checks([Mock()], False, config)
+
+        mock_checker_class.return_value.result_cache.flush.assert_called_once_with(config.applications)
+
     @pytest.mark.anyio
     @patch("appimage_updater.core.update_operations._prompt_for_download_confirmation")
     @patch("appimage_updater.core.update_operations._create_downloader")
@@ -1386,6 +1507,52 @@ class TestDisplayCheckResults:
             _display_check_results(results, False)
 
 
+class TestCachedFirst:
+    """Tests for showing cached results and then only the changed ones."""
+
+    def test_cached_results_displayed_first(self, mock_app_config: ApplicationConfig) -> None:
+        """Test that cached results are displayed and returned by application name."""
+        cached = CheckResult(app_name="TestApp", success=True, current_version="1.0", available_version="1.0")
+        formatter = Mock()
+
+        with (
+            OutputFormatterContext(formatter),
+            patch("appimage_updater.core.update_operations.CheckResultCache") as mock_cache_class,
+        ):
+            mock_cache_class.return_value.lookup.return_value = Mock(result=cached)
+            cached_results = _display_cached_results([mock_app_config], [])
+
+        assert cached_results == {"TestApp": cached}
+        assert formatter.print_check_results.call_args.args[0][0]["Application"] == "TestApp"
+
+    def test_only_changed_results_displayed(self) -> None:
+        """Test that refreshed results equal to the cached ones are not displayed again."""
+        unchanged = CheckResult(app_name="Same", success=True, current_version="1.0", available_version="1.0")
+        cached_update = CheckResult(app_name="New", success=True, current_version="1.0", available_version="1.0")
+        fresh_update = CheckResult(
+            app_name="New", success=True, current_version="1.0", available_version="2.0", update_available=True
+        )
+        formatter = Mock()
+
+        with OutputFormatterContext(formatter):
+            _display_changed_results([unchanged.model_copy(), fresh_update], {"Same": unchanged, "New": cached_update})
+
+        displayed = formatter.print_check_results.call_args.args[0]
+        assert [row["Application"] for row in displayed] == ["New"]
+        formatter.print_info.assert_called_once_with("1 result changed")
+
+    def test_no_changes_reported(self) -> None:
+        """Test that an unchanged refresh is reported without a table."""
+        result = CheckResult(app_name="Same", success=True, current_version="1.0", available_version="1.0")
+        formatter = Mock()
+
+        with OutputFormatterContext(formatter):
+            _display_changed_results([result], {"Same": result})
+
+        formatter.print_check_results.assert_not_called()
+        formatter.print_info.assert_called_once_with("No changes since the cached results")
+
+
 class TestLoadAndFilterConfig:
     """Tests for _load_and_filter_config function."""
 
@@ -0,0 +1,94 @@
+"""Tests for associating release assets with checksum files."""
+
+from __future__ import annotations
+
+import pytest
+
+from appimage_updater.core.models import RawAsset
+from appimage_updater.repositories.checksums import (
+    associate_checksum_files,
+    is_checksum_file,
+    is_checksum_manifest,
+)
+
+
+def associate(names: list[str]) -> dict[str, str | None]:
+    """Associate checksum files among assets with the given names."""
+    assets = [RawAsset(name, f"https://example.com/{name}") for name in names]
+    associate_checksum_files(assets)
+    return {asset.name: asset.checksum_asset.name if asset.checksum_asset else None for asset in assets}
+
+
+class TestIsChecksumFile:
+    """Tests for recognizing checksum files."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["App.AppImage.sha256", "App-SHA256.txt", "App_md5.txt", "SHA256SUMS", "sha1sums.txt", "checksums.txt"],
+    )
+    def test_checksum_files(self, name: str) -> None:
+        """Test that per-file checksums and manifests are recognized."""
+        assert is_checksum_file(name)
+
+    @pytest.mark.parametrize("name", ["App.AppImage", "App-sha256.AppImage", "sums.txt"])
+    def test_other_files(self, name: str) -> None:
+        """Test that other files are not mistaken for checksums."""
+        assert not is_checksum_file(name)
+
+
+class TestIsChecksumManifest:
+    """Tests for telling release manifests from checksum files named after an asset."""
+
+    @pytest.mark.parametrize(
+        ("checksum_name", "expected"),
+        [
+            ("SHA256SUMS", True),
+            ("checksums.txt", True),
+            ("app-1.0.sha256sum", True),
+            ("App.AppImage.sha256sum", False),
+            ("App.AppImage.sha256", False),
+            ("App-SHA256.txt", False),
+        ],
+    )
+    def test_manifests(self, checksum_name: str, expected: bool) -> None:
+        """Test that only files listing other files too are manifests."""
+        assert is_checksum_manifest(checksum_name, "App.AppImage") is expected
+
+
+class TestAssociateChecksumFiles:
+    """Tests for pairing assets with checksum files."""
+
+    def test_per_file_checksums(self) -> None:
+        """Test that checksum files named after an asset, with or without extension, are paired."""
+        associations = associate(["App.AppImage", "App.AppImage.sha256", "Tool.AppImage", "Tool-SHA1.txt", "x.zip"])
+
+        assert associations == {
+            "App.AppImage": "App.AppImage.sha256",
+            "App.AppImage.sha256": None,
+            "Tool.AppImage": "Tool-SHA1.txt",
+            "Tool-SHA1.txt": None,
+            "x.zip": None,
+        }
+
+    def test_manifest_covers_remaining_assets(self) -> None:
+        """Test that a release manifest is used where no per-file checksum exists."""
+        associations = associate(
+            ["App-x86_64.AppImage", "App-x86_64.AppImage.sha256", "App-arm64.AppImage", "SHA256SUMS"]
+        )
+
+        assert associations["App-x86_64.AppImage"] == "App-x86_64.AppImage.sha256"
+        assert associations["App-arm64.AppImage"] == "SHA256SUMS"
+
+    def test_sum_file_named_after_release_is_manifest(self) -> None:
+        """Test that a .sha256sum file covering no single asset serves as the manifest."""
+        associations = associate(["App-x86_64.AppImage", "App-arm64.AppImage", "app-1.0.sha256sum"])
+
+        assert associations["App-x86_64.AppImage"] == "app-1.0.sha256sum"
+        assert associations["App-arm64.AppImage"] == "app-1.0.sha256sum"
+
+    def test_sum_file_of_other_asset_not_shared(self) -> None:
+        """Test that another asset's .sha256sum file is not used as a manifest."""
+        associations = associate(["App-x86_64.AppImage", "App-x86_64.AppImage.sha256sum", "App-arm64.AppImage"])
+
+        assert associations["App-x86_64.AppImage"] == "App-x86_64.AppImage.sha256sum"
+        assert associations["App-arm64.AppImage"] is None
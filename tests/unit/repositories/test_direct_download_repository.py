@@ -0,0 +1,48 @@
+"""Tests for direct download URL handling."""
+
+from __future__ import annotations
+
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.repositories.direct_download_repository import DirectDownloadRepository
+
+
+def mock_http_client(response: httpx.Response) -> AsyncMock:
+    """Create a get_http_client() result answering HEAD requests with the given response."""
+    client = AsyncMock()
+    client.head = AsyncMock(return_value=response)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+class TestDirectDownloadReleases:
+    """Tests for DirectDownloadRepository.get_releases() on direct AppImage URLs."""
+
+    @pytest.mark.anyio
+    async def test_latest_url_resolved_through_head_request(self) -> None:
+        """Test that a 'latest' URL is resolved with a redirect-following quick_check HEAD request."""
+        final_url = "https://example.com/downloads/App-2.1.0-x86_64.AppImage"
+        response = httpx.Response(200, headers={"content-length": "1024"}, request=httpx.Request("HEAD", final_url))
+        client = mock_http_client(response)
+
+        with patch(
+            "appimage_updater.repositories.direct_download_repository.get_http_client", return_value=client
+        ) as mock_get_client:
+            releases = await DirectDownloadRepository().get_releases(
+                "https://example.com/downloads/App-latest.AppImage"
+            )
+
+        client_config = mock_get_client.call_args.kwargs
+        assert client_config["follow_redirects"] is True
+        assert "max_redirects" not in client_config
+        assert isinstance(client_config["timeout"], httpx.Timeout)
+        assert releases[0].assets[0].name == "App-2.1.0-x86_64.AppImage"
+        assert releases[0].assets[0].url == final_url
+        assert releases[0].assets[0].size == 1024
@@ -0,0 +1,136 @@
+"""Tests for the domain knowledge index and service."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from appimage_updater.config.manager import GlobalConfigManager
+from appimage_updater.config.models import DomainKnowledge
+from appimage_updater.repositories.domain_service import (
+    DomainIndex,
+    DomainKnowledgeService,
+)
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> DomainIndex:
+    """Create an index writing to a temporary config file."""
+    knowledge = DomainKnowledge(
+        gitlab_domains=["gitlab.com", "git.example.org"],
+        dynamic_domains=["example.com"],
+        github_domains=["github.com", "git.example.com"],
+    )
+    return DomainIndex(config_path=tmp_path / "config.json", knowledge=knowledge)
+
+
+class TestDomainIndex:
+    """Tests for host lookups and buffered updates."""
+
+    def test_lookup_exact_host(self, index: DomainIndex) -> None:
+        """Test that known hosts map to their handler."""
+        assert index.lookup("github.com") == "github"
+        assert index.lookup("git.example.org") == "gitlab"
+
+    def test_lookup_subdomain_of_known_domain(self, index: DomainIndex) -> None:
+        """Test that subdomains of self-hosted domains match."""
+        assert index.lookup("code.git.example.org") == "gitlab"
+
+    def test_lookup_unknown_host(self, index: DomainIndex) -> None:
+        """Test that unknown hosts and bare TLDs do not match."""
+        assert index.lookup("example.org") is None
+        assert index.lookup("com") is None
+
+    def test_exact_host_wins_over_parent_domain(self, index: DomainIndex) -> None:
+        """Test that a host's own entry wins over the entry of its parent domain."""
+        assert index.lookup("git.example.com") == "github"
+        assert index.lookup("ci.git.example.com") == "github"
+
+    def test_download_domains_do_not_capture_subdomains(self, index: DomainIndex) -> None:
+        """Test that a learned direct or dynamic parent domain only matches itself."""
+        assert index.lookup("example.com") == "dynamic_download"
+        assert index.lookup("gitlab.example.com") is None
+
+    def test_learn_and_forget_update_index_without_writing(self, index: DomainIndex) -> None:
+        """Test that changes apply immediately but only reach disk on flush."""
+        assert index.learn("forge.example.net", "gitlab") is True
+        assert index.learn("forge.example.net", "github") is False
+        assert index.forget("gitlab.com", "gitlab") is True
+
+        assert index.lookup("forge.example.net") == "gitlab"
+        assert index.lookup("gitlab.com") is None
+        assert index.has_pending_changes
+        assert not index.config_path.exists()
+
+    def test_unsupported_handler_not_learned(self, index: DomainIndex) -> None:
+        """Test that handlers without a domain list are not recorded."""
+        assert index.learn("sourceforge.net", "sourceforge") is False
+        assert not index.has_pending_changes
+
+    def test_flush_merges_into_config_file(self, index: DomainIndex) -> None:
+        """Test that a flush keeps other settings and applies all buffered changes at once."""
+        global_config = {"timeout_seconds": 99, "domain_knowledge": {"gitlab_domains": ["gitlab.com"]}}
+        index.config_path.write_text(json.dumps({"global_config": global_config}))
+        index.learn("forge.example.net", "gitlab")
+        index.forget("gitlab.com", "gitlab")
+
+        index.flush()
+
+        data = json.loads(index.config_path.read_text())
+        assert data["global_config"]["timeout_seconds"] == 99
+        assert data["global_config"]["domain_knowledge"]["gitlab_domains"] == ["forge.example.net"]
+        assert not index.has_pending_changes
+
+    def test_flush_creates_missing_config_file(self, index: DomainIndex) -> None:
+        """Test that a flush creates the config file when none exists."""
+        index.learn("files.example.com", "direct_download")
+
+        index.flush()
+
+        data = json.loads(index.config_path.read_text())
+        assert data["global_config"]["domain_knowledge"]["direct_domains"] == ["files.example.com"]
+
+    def test_knowledge_loaded_once(self, tmp_path: Path) -> None:
+        """Test that the config file is read on first lookup only."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"global_config": {"domain_knowledge": {"github_domains": ["gh.local"]}}}))
+        index = DomainIndex(config_path=config_path)
+
+        assert index.lookup("gh.local") == "github"
+        config_path.unlink()
+        assert index.lookup("gh.local") == "github"
+
+
+class TestDomainKnowledgeService:
+    """Tests for handler detection through the index."""
+
+    def test_handler_from_url(self, index: DomainIndex) -> None:
+        """Test that a URL on a known domain resolves to its handler."""
+        service = DomainKnowledgeService(index=index)
+
+        handler = service.get_handler_by_domain_knowledge("https://git.example.org/team/app")
+
+        assert handler is not None
+        assert handler.metadata.name == "gitlab"
+
+    @pytest.mark.anyio
+    async def test_learn_domain_buffers_update(self, index: DomainIndex) -> None:
+        """Test that learning a domain updates the index without writing config."""
+        service = DomainKnowledgeService(index=index)
+
+        await service.learn_domain("https://Forge.Example.NET/team/app", "gitlab")
+
+        assert index.lookup("forge.example.net") == "gitlab"
+        assert not index.config_path.exists()
+
+    def test_config_manager_still_accepted(self, tmp_path: Path) -> None:
+        """Test that the service can still be built from a global config manager."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"global_config": {"domain_knowledge": {"gitlab_domains": ["forge.local"]}}}))
+
+        service = DomainKnowledgeService(GlobalConfigManager(config_path))
+
+        assert service.index.config_path == config_path
+        assert service.index.lookup("forge.local") == "gitlab"
@@ -0,0 +1,57 @@
+"""Tests for dynamic download page handling."""
+
+from __future__ import annotations
+
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+import pytest
+
+from appimage_updater.repositories.dynamic_download_repository import DynamicDownloadRepository
+from appimage_updater.repositories.page_links import PageLinks
+
+
+class TestGenericDynamicVersion:
+    """Tests for the version of releases found on dynamic download pages."""
+
+    @pytest.mark.anyio
+    async def test_partly_read_page_uses_link_version(self) -> None:
+        """Test that the link's version wins when the page was only read up to the link."""
+        page = PageLinks(["/files/App-2.1.0.AppImage"], '<p>Supports 1.2.3 files</p><a href="', complete=False)
+
+        with patch(
+            "appimage_updater.repositories.dynamic_download_repository.scan_page_links",
+            new=AsyncMock(return_value=page),
+        ):
+            releases = await DynamicDownloadRepository().get_releases("https://example.com/download")
+
+        assert releases[0].version == "2.1.0"
+        assert releases[0].assets[0].url == "https://example.com/files/App-2.1.0.AppImage"
+
+    @pytest.mark.anyio
+    async def test_partly_read_page_without_link_version_uses_page(self) -> None:
+        """Test that the text read before the link is searched when the link carries no version."""
+        page = PageLinks(["/files/App.AppImage"], "<h1>App version 3.0.1</h1>", complete=False)
+
+        with patch(
+            "appimage_updater.repositories.dynamic_download_repository.scan_page_links",
+            new=AsyncMock(return_value=page),
+        ):
+            releases = await DynamicDownloadRepository().get_releases("https://example.com/download")
+
+        assert releases[0].version == "3.0.1"
+
+    @pytest.mark.anyio
+    async def test_whole_page_version_found_first(self) -> None:
+        """Test that a fully read page is searched for the version before the link."""
+        page = PageLinks(["/files/App-2.1.0.AppImage"], "<h1>App version 3.0.1</h1>")
+
+        with patch(
+            "appimage_updater.repositories.dynamic_download_repository.scan_page_links",
+            new=AsyncMock(return_value=page),
+        ):
+            releases = await DynamicDownloadRepository().get_releases("https://example.com/download")
+
+        assert releases[0].version == "3.0.1"
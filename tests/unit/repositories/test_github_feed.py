@@ -0,0 +1,106 @@
+"""Tests for the GitHub release Atom feed reader."""
+
+from __future__ import annotations
+
+from unittest.mock import (
+    AsyncMock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.repositories.github.feed import (
+    GitHubFeedError,
+    GitHubReleaseFeed,
+    get_feed_url,
+    parse_newest_tag,
+)
+
+
+FEED_URL = "https://github.com/o/app/releases.atom"
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="en-US">
+  <id>tag:github.com,2008:https://github.com/o/app/releases</id>
+  <title>Release notes from app</title>
+  <entry>
+    <id>tag:github.com,2008:Repository/1/v2.1</id>
+    <link rel="alternate" type="text/html" href="https://github.com/o/app/releases/tag/v2.1"/>
+    <title>App 2.1</title>
+  </entry>
+  <entry>
+    <id>tag:github.com,2008:Repository/1/v2.0</id>
+    <link rel="alternate" type="text/html" href="https://github.com/o/app/releases/tag/v2.0"/>
+    <title>App 2.0</title>
+  </entry>
+</feed>
+"""
+
+
+def mock_http_client(response: httpx.Response) -> AsyncMock:
+    """Create a get_http_client() result answering GETs with the given response."""
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=response)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+class TestFeedParsing:
+    """Tests for feed URLs and entry parsing."""
+
+    def test_feed_url_for_github_repository(self) -> None:
+        """Test that github.com repositories map to their release feed."""
+        assert get_feed_url("https://github.com/o/app.git") == FEED_URL
+
+    def test_no_feed_url_for_other_hosts(self) -> None:
+        """Test that other forges have no feed URL."""
+        assert get_feed_url("https://codeberg.org/o/app") is None
+
+    def test_newest_tag_from_first_entry(self) -> None:
+        """Test that the first entry's release link gives the tag."""
+        assert parse_newest_tag(FEED) == "v2.1"
+
+    def test_tag_falls_back_to_entry_id(self) -> None:
+        """Test that entries without a release link use their id."""
+        feed = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+          <entry><id>tag:github.com,2008:Repository/1/nightly</id></entry>
+        </feed>"""
+
+        assert parse_newest_tag(feed) == "nightly"
+
+    def test_empty_feed(self) -> None:
+        """Test that a feed without releases has no newest tag."""
+        assert parse_newest_tag(b'<feed xmlns="http://www.w3.org/2005/Atom"></feed>') is None
+
+    def test_invalid_feed(self) -> None:
+        """Test that malformed XML raises GitHubFeedError."""
+        with pytest.raises(GitHubFeedError):
+            parse_newest_tag(b"<html>")
+
+
+class TestGitHubReleaseFeed:
+    """Tests for fetching release feeds."""
+
+    @pytest.mark.anyio
+    async def test_get_newest_tag(self) -> None:
+        """Test that the feed is fetched and its newest tag returned."""
+        client = mock_http_client(httpx.Response(200, content=FEED, request=httpx.Request("GET", FEED_URL)))
+
+        with patch("appimage_updater.repositories.github.feed.get_http_client", return_value=client):
+            tag = await GitHubReleaseFeed().get_newest_tag("https://github.com/o/app")
+
+        assert tag == "v2.1"
+        assert client.get.await_args.args[0] == FEED_URL
+
+    @pytest.mark.anyio
+    async def test_http_error_raises(self) -> None:
+        """Test that failed requests raise GitHubFeedError."""
+        client = mock_http_client(httpx.Response(404, request=httpx.Request("GET", FEED_URL)))
+
+        with (
+            patch("appimage_updater.repositories.github.feed.get_http_client", return_value=client),
+            pytest.raises(GitHubFeedError),
+        ):
+            await GitHubReleaseFeed().get_newest_tag("https://github.com/o/app")
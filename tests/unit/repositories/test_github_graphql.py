@@ -0,0 +1,158 @@
+"""Tests for batched GitHub GraphQL release fetching."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.repositories.github.auth import GitHubAuth
+from appimage_updater.repositories.github.client import (
+    GitHubClient,
+    GitHubClientError,
+)
+from appimage_updater.repositories.github.graphql import (
+    GRAPHQL_URL,
+    GitHubGraphQLClient,
+    GitHubGraphQLError,
+    build_releases_query,
+    build_releases_variables,
+    to_rest_release,
+)
+
+
+def make_node(tag: str, published_at: str | None = "2024-05-01T10:00:00Z") -> dict[str, Any]:
+    """Create a GraphQL release node."""
+    return {
+        "tagName": tag,
+        "name": f"Release {tag}",
+        "publishedAt": published_at,
+        "createdAt": "2024-04-30T10:00:00Z",
+        "isPrerelease": False,
+        "isDraft": published_at is None,
+        "releaseAssets": {
+            "nodes": [
+                {
+                    "name": f"App-{tag}.AppImage",
+                    "downloadUrl": f"https://github.com/o/r/releases/download/{tag}/App-{tag}.AppImage",
+                    "size": 1024,
+                    "createdAt": "2024-05-01T09:00:00Z",
+                }
+            ]
+        },
+    }
+
+
+def mock_http_client(*payloads: Any) -> AsyncMock:
+    """Create a get_http_client() result answering POSTs with the given JSON payloads."""
+    client = AsyncMock()
+    client.post = AsyncMock(
+        side_effect=[
+            httpx.Response(200, json=payload, request=httpx.Request("POST", GRAPHQL_URL)) for payload in payloads
+        ]
+    )
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+class TestQueryBuilding:
+    """Tests for query text and variables."""
+
+    def test_query_aliases_each_repository(self) -> None:
+        """Test that each repository gets its own alias and variables."""
+        query = build_releases_query([("a", "b"), ("c", "d")])
+
+        assert "r0: repository(owner: $owner0, name: $name0)" in query
+        assert "r1: repository(owner: $owner1, name: $name1)" in query
+        assert "fragment releaseFields on Repository" in query
+        assert "body" not in query
+
+    def test_variables_carry_names_and_limit(self) -> None:
+        """Test that owners and names are passed as variables."""
+        variables = build_releases_variables([("a", "b"), ("c", "d")], limit=5)
+
+        assert variables == {"limit": 5, "owner0": "a", "name0": "b", "owner1": "c", "name1": "d"}
+
+    def test_to_rest_release(self) -> None:
+        """Test conversion to the REST release format."""
+        release = to_rest_release(make_node("v1.0"))
+
+        assert release["tag_name"] == "v1.0"
+        assert release["published_at"] == "2024-05-01T10:00:00Z"
+        assert release["assets"][0]["browser_download_url"].endswith("App-v1.0.AppImage")
+
+    def test_to_rest_release_draft_uses_created_at(self) -> None:
+        """Test that drafts without a publication date use their creation date."""
+        release = to_rest_release(make_node("v2.0", published_at=None))
+
+        assert release["published_at"] == "2024-04-30T10:00:00Z"
+        assert release["draft"] is True
+
+
+class TestGitHubGraphQLClient:
+    """Tests for executing batched queries."""
+
+    @pytest.mark.anyio
+    async def test_fetch_releases_in_batches(self) -> None:
+        """Test that repositories are split into batches and missing ones left out."""
+        client = mock_http_client(
+            {"data": {"r0": {"releases": {"nodes": [make_node("v1")]}}, "r1": None}},
+            {"data": {"r0": {"releases": {"nodes": []}}}},
+        )
+        graphql = GitHubGraphQLClient(auth=GitHubAuth(token="t"), batch_size=2)
+
+        with patch("appimage_updater.repositories.github.graphql.get_http_client", return_value=client):
+            results = await graphql.fetch_releases([("o", "one"), ("o", "missing"), ("o", "three")])
+
+        assert client.post.await_count == 2
+        assert set(results) == {("o", "one"), ("o", "three")}
+        assert results[("o", "one")][0]["tag_name"] == "v1"
+        headers = client.post.await_args.kwargs["headers"]
+        assert headers["Authorization"] == "bearer t"
+
+    @pytest.mark.anyio
+    async def test_query_without_data_raises(self) -> None:
+        """Test that a query failing as a whole raises GitHubGraphQLError."""
+        client = mock_http_client({"errors": [{"message": "Bad credentials"}]})
+        graphql = GitHubGraphQLClient(auth=GitHubAuth(token="t"))
+
+        with (
+            patch("appimage_updater.repositories.github.graphql.get_http_client", return_value=client),
+            pytest.raises(GitHubGraphQLError, match="Bad credentials"),
+        ):
+            await graphql.fetch_releases([("o", "r")])
+
+
+class TestGitHubClientBatch:
+    """Tests for GitHubClient.get_releases_batch()."""
+
+    @pytest.mark.anyio
+    async def test_releases_mapped_to_urls(self) -> None:
+        """Test that releases are parsed and keyed by the requested URLs."""
+        github = GitHubClient(token="t")
+        fetched = {("o", "r"): [to_rest_release(make_node("v1.2.3"))]}
+        urls = ["https://github.com/o/r", "https://github.com/o/r.git", "https://github.com/o/gone"]
+
+        with patch.object(GitHubGraphQLClient, "fetch_releases", new=AsyncMock(return_value=fetched)) as mock_fetch:
+            results = await github.get_releases_batch(urls)
+
+        mock_fetch.assert_awaited_once_with([("o", "r"), ("o", "gone")], limit=10)
+        assert set(results) == {"https://github.com/o/r", "https://github.com/o/r.git"}
+        assert results["https://github.com/o/r"][0].version == "1.2.3"
+
+    @pytest.mark.anyio
+    async def test_requires_token(self) -> None:
+        """Test that batching is refused without authentication."""
+        auth = Mock(spec=GitHubAuth)
+        auth.is_authenticated = False
+        github = GitHubClient(auth=auth)
+
+        with pytest.raises(GitHubClientError, match="requires authentication"):
+            await github.get_releases_batch(["https://github.com/o/r"])
@@ -1,16 +1,23 @@
-"""Tests for GitHub repository prerelease detection with progressive fetching."""
+"""Tests for GitHub repository prerelease detection and paginated release iteration."""
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from appimage_updater.core.models import Asset, Release
+from appimage_updater.repositories.github.client import GitHubClient
 from appimage_updater.repositories.github.repository import GitHubRepository
 
 
+RELEASES_URL = "https://api.github.com/repos/test/repo/releases"
+
+
 def make_release(version: str, is_prerelease: bool = False) -> Release:
     """Create a mock release for testing."""
     now = datetime.now()
@@ -31,147 +38,172 @@ def make_release(version: str, is_prerelease: bool = False) -> Release:
     )
 
 
-class TestShouldEnablePrereleaseProgressiveFetching:
-    """Tests for progressive fetching in should_enable_prerelease."""
+def make_release_data(tag: str, is_prerelease: bool = False) -> dict[str, Any]:
+    """Create release data as returned by the GitHub REST API."""
+    return {
+        "tag_name": tag,
+        "name": tag,
+        "published_at": "2024-05-01T10:00:00Z",
+        "prerelease": is_prerelease,
+        "draft": False,
+        "assets": [],
+    }
+
+
+def make_page(releases: list[dict[str, Any]], next_page: int | None = None) -> httpx.Response:
+    """Create a releases page response, with a Link header when there is a next page."""
+    headers = {"Link": f'<{RELEASES_URL}?per_page=100&page={next_page}>; rel="next"'} if next_page else {}
+    return httpx.Response(200, json=releases, headers=headers, request=httpx.Request("GET", RELEASES_URL))
+
+
+def mock_http_client(*pages: httpx.Response) -> AsyncMock:
+    """Create a get_http_client() result answering GETs with the given pages."""
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=list(pages))
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+def prerelease_page(start: int, count: int = 100) -> list[dict[str, Any]]:
+    """Create a full page of weekly prerelease builds."""
+    return [make_release_data(f"weekly-{i}", is_prerelease=True) for i in range(start, start + count)]
+
+
+async def iterate(releases: list[Release]) -> AsyncIterator[Release]:
+    """Yield the given releases from an async iterator."""
+    for release in releases:
+        yield release
+
+
+class TestShouldEnablePrereleaseScan:
+    """Tests for the early-exit release scan in should_enable_prerelease."""
 
     @pytest.fixture
     def github_repo(self) -> GitHubRepository:
         return GitHubRepository()
 
     @pytest.mark.anyio
-    async def test_finds_stable_release_in_first_batch(self, github_repo: GitHubRepository) -> None:
-        """Test that stable release found in first 100 releases returns False."""
-        releases = [make_release("v1.0.0", is_prerelease=False)]
+    async def test_stable_release_found_returns_false(self, github_repo: GitHubRepository) -> None:
+        """Test that a stable release returns False."""
+        releases = [make_release("v1.0.0-beta", is_prerelease=True), make_release("v0.9.0")]
 
-        with patch.object(github_repo, "get_releases", new=AsyncMock(return_value=releases)) as mock:
+        with patch.object(github_repo, "iter_releases", return_value=iterate(releases)):
             result = await github_repo.should_enable_prerelease("https://github.com/test/repo")
 
-            assert result is False
-            # Should only fetch once since stable was found
-            mock.assert_called_once()
+        assert result is False
 
     @pytest.mark.anyio
-    async def test_returns_true_when_all_prereleases_and_fewer_than_limit(
-        self, github_repo: GitHubRepository
-    ) -> None:
-        """Test returns True when only prereleases and count < limit (all fetched)."""
-        # 50 prereleases - fewer than 100, so we know we've fetched all
+    async def test_only_prereleases_returns_true(self, github_repo: GitHubRepository) -> None:
+        """Test returns True when only prereleases exist."""
         releases = [make_release(f"v1.0.0-beta{i}", is_prerelease=True) for i in range(50)]
 
-        with patch.object(github_repo, "get_releases", new=AsyncMock(return_value=releases)):
+        with patch.object(github_repo, "iter_releases", return_value=iterate(releases)):
             result = await github_repo.should_enable_prerelease("https://github.com/test/repo")
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.anyio
-    async def test_expands_search_when_limit_reached_without_stable(
-        self, github_repo: GitHubRepository
-    ) -> None:
-        """Test that search expands when limit reached without finding stable."""
-        # First call: 100 prereleases (exactly at limit, might be more)
-        first_batch = [make_release(f"weekly-{i}", is_prerelease=True) for i in range(100)]
-        # Second call: 150 releases including 1 stable (found stable, stop)
-        second_batch = [make_release(f"weekly-{i}", is_prerelease=True) for i in range(149)]
-        second_batch.append(make_release("v1.0.0", is_prerelease=False))
-
-        call_count = 0
-
-        async def mock_get_releases(url: str, limit: int = 100) -> list[Release]:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                assert limit == 100
-                return first_batch
-            else:
-                assert limit == 200  # Doubled
-                return second_batch
-
-        with patch.object(github_repo, "get_releases", side_effect=mock_get_releases):
+    async def test_handles_empty_releases(self, github_repo: GitHubRepository) -> None:
+        """Test returns False when no releases found."""
+        with patch.object(github_repo, "iter_releases", return_value=iterate([])):
             result = await github_repo.should_enable_prerelease("https://github.com/test/repo")
 
-            assert result is False  # Found stable in second batch
-            assert call_count == 2
+        assert result is False
 
     @pytest.mark.anyio
-    async def test_stops_at_max_limit(self, github_repo: GitHubRepository) -> None:
-        """Test that search stops at max limit (1600) even without stable."""
-        # Always return exactly limit prereleases to trigger expansion
-        async def mock_get_releases(url: str, limit: int = 100) -> list[Release]:
-            return [make_release(f"weekly-{i}", is_prerelease=True) for i in range(limit)]
+    async def test_stable_release_without_assets_counts(self, github_repo: GitHubRepository) -> None:
+        """Test that a stable release without assets still rules out prerelease-only."""
+        now = datetime.now()
+        no_asset_release = Release(
+            version="v1.0.0", tag_name="v1.0.0", published_at=now, assets=[], is_prerelease=False, is_draft=False
+        )
 
-        with patch.object(github_repo, "get_releases", side_effect=mock_get_releases):
+        with patch.object(github_repo, "iter_releases", return_value=iterate([no_asset_release])):
             result = await github_repo.should_enable_prerelease("https://github.com/test/repo")
 
-            # Should return True (no stable found) and stop at max limit
-            assert result is True
+        assert result is False
 
     @pytest.mark.anyio
-    async def test_handles_empty_releases(self, github_repo: GitHubRepository) -> None:
-        """Test returns False when no releases found."""
-        with patch.object(github_repo, "get_releases", new=AsyncMock(return_value=[])):
-            result = await github_repo.should_enable_prerelease("https://github.com/test/repo")
+    async def test_stable_buried_under_weeklies_fetches_second_page(self, github_repo: GitHubRepository) -> None:
+        """Test FreeCAD-like repos: the scan pages on and stops at the first stable release."""
+        client = mock_http_client(
+            make_page(prerelease_page(0), next_page=2),
+            make_page([*prerelease_page(100, 10), make_release_data("1.0.2")], next_page=3),
+        )
+
+        with patch("appimage_updater.repositories.github.client.get_http_client", return_value=client):
+            result = await github_repo.should_enable_prerelease("https://github.com/FreeCAD/FreeCAD")
 
-            assert result is False
+        assert result is False
+        assert client.get.await_count == 2
+        assert client.get.await_args.args[0] == f"{RELEASES_URL}?per_page=100&page=2"
+        assert client.get.await_args.kwargs["params"] is None
 
     @pytest.mark.anyio
-    async def test_filters_valid_releases(self, github_repo: GitHubRepository) -> None:
-        """Test that releases without AppImage assets are filtered out."""
-        # Release with no assets
-        now = datetime.now()
-        no_asset_release = Release(
-            version="v1.0.0",
-            tag_name="v1.0.0",
-            published_at=now,
-            assets=[],
-            is_prerelease=False,
-            is_draft=False,
-        )
-        # Only release with no assets
-        releases = [no_asset_release]
+    async def test_scan_stops_at_limit(self, github_repo: GitHubRepository) -> None:
+        """Test that the scan gives up after PRERELEASE_SCAN_LIMIT releases."""
+        pages = [make_page(prerelease_page(i * 100), next_page=i + 2) for i in range(20)]
+        client = mock_http_client(*pages)
 
-        with patch.object(github_repo, "get_releases", new=AsyncMock(return_value=releases)):
+        with patch("appimage_updater.repositories.github.client.get_http_client", return_value=client):
             result = await github_repo.should_enable_prerelease("https://github.com/test/repo")
 
-            # No valid releases, should return False
-            assert result is False
+        assert result is True
+        assert client.get.await_count == 16
 
 
-class TestShouldEnablePrereleaseRealWorldScenarios:
-    """Tests simulating real-world scenarios like FreeCAD."""
+class TestIterReleases:
+    """Tests for paginated release iteration."""
 
-    @pytest.fixture
-    def github_repo(self) -> GitHubRepository:
-        return GitHubRepository()
+    @pytest.mark.anyio
+    async def test_short_page_ends_iteration(self) -> None:
+        """Test that a page shorter than requested is treated as the last one."""
+        client = mock_http_client(make_page([make_release_data("v2.0"), make_release_data("v1.0")], next_page=2))
+
+        with patch("appimage_updater.repositories.github.client.get_http_client", return_value=client):
+            releases = [release async for release in GitHubClient().iter_releases("https://github.com/test/repo")]
+
+        assert [release.tag_name for release in releases] == ["2.0", "1.0"]
+        client.get.assert_awaited_once()
 
     @pytest.mark.anyio
-    async def test_freecad_scenario_stable_buried_under_weeklies(
-        self, github_repo: GitHubRepository
-    ) -> None:
-        """Test FreeCAD-like scenario where stable is buried under many weekly builds."""
-        # Simulate FreeCAD: ~25 weekly builds before 1 stable release
-
-        async def mock_get_releases(url: str, limit: int = 100) -> list[Release]:
-            releases = []
-            # 25 weekly builds (all prereleases)
-            for i in range(25):
-                releases.append(make_release(f"weekly-2025.12.{i:02d}", is_prerelease=True))
-            # Then a stable release
-            releases.append(make_release("1.0.2", is_prerelease=False))
-            return releases[:limit]
-
-        with patch.object(github_repo, "get_releases", side_effect=mock_get_releases):
-            result = await github_repo.should_enable_prerelease("https://github.com/FreeCAD/FreeCAD")
+    async def test_max_releases_stops_before_next_page(self) -> None:
+        """Test that the repository iterator requests no page beyond max_releases."""
+        client = mock_http_client(make_page(prerelease_page(0, 5), next_page=2), make_page(prerelease_page(5, 5)))
+
+        with patch("appimage_updater.repositories.github.client.get_http_client", return_value=client):
+            repo = GitHubRepository()
+            releases = [release async for release in repo.iter_releases("https://github.com/test/repo", 5)]
+
+        assert len(releases) == 5
+        client.get.assert_awaited_once()
+        assert client.get.await_args.kwargs["params"] == {"per_page": "5"}
 
-            # Should find the stable release and return False
-            assert result is False
+    @pytest.mark.anyio
+    async def test_get_releases_beyond_page_size(self) -> None:
+        """Test that get_releases() follows pagination for limits above 100."""
+        client = mock_http_client(make_page(prerelease_page(0), next_page=2), make_page(prerelease_page(100)))
+
+        with patch("appimage_updater.repositories.github.client.get_http_client", return_value=client):
+            releases = await GitHubClient().get_releases("https://github.com/test/repo", limit=150)
+
+        assert len(releases) == 150
+        assert client.get.await_count == 2
 
     @pytest.mark.anyio
-    async def test_continuous_build_only_repo(self, github_repo: GitHubRepository) -> None:
-        """Test repo that only has continuous/prerelease builds."""
-        # All releases are prereleases, fewer than limit
-        releases = [make_release(f"continuous-{i}", is_prerelease=True) for i in range(10)]
+    async def test_find_release_stops_at_first_match(self) -> None:
+        """Test that find_release() returns the first match without fetching further pages."""
+        client = mock_http_client(
+            make_page([*prerelease_page(0, 99), make_release_data("v1.0")], next_page=2),
+            make_page(prerelease_page(100)),
+        )
 
-        with patch.object(github_repo, "get_releases", new=AsyncMock(return_value=releases)):
-            result = await github_repo.should_enable_prerelease("https://github.com/test/continuous")
+        with patch("appimage_updater.repositories.github.client.get_http_client", return_value=client):
+            release = await GitHubRepository().find_release(
+                "https://github.com/test/repo", lambda release: not release.is_prerelease
+            )
 
-            assert result is True
+        assert release is not None
+        assert release.tag_name == "1.0"
+        client.get.assert_awaited_once()
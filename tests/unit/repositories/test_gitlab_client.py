@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import httpx
 import pytest
 
+from appimage_updater.core.http_service import GlobalHTTPClient
 from appimage_updater.repositories.gitlab.auth import GitLabAuth
 from appimage_updater.repositories.gitlab.client import GitLabClient, GitLabClientError
 
@@ -357,6 +358,26 @@ class TestGetReleases:
             with pytest.raises(GitLabClientError, match="request failed"):
                 await gitlab_client.get_releases("owner", "repo")
 
+    @pytest.mark.anyio
+    async def test_get_releases_follows_pagination(self, gitlab_client: GitLabClient) -> None:
+        """Test that limits above GitLab's page size follow the Link header."""
+        url = "https://gitlab.com/api/v4/projects/owner%2Frepo/releases"
+        request = httpx.Request("GET", url)
+        first = httpx.Response(
+            200,
+            json=[{"tag_name": f"v{i}"} for i in range(100)],
+            headers={"Link": f'<{url}?page=2&per_page=100>; rel="next"'},
+            request=request,
+        )
+        second = httpx.Response(200, json=[{"tag_name": f"v{i}"} for i in range(100, 130)], request=request)
+        mock_get = AsyncMock(side_effect=[first, second])
+
+        with patch.object(gitlab_client._client, "get", new=mock_get):
+            result = await gitlab_client.get_releases("owner", "repo", limit=120)
+
+        assert len(result) == 120
+        assert mock_get.await_args_list[1].args[0] == f"{url}?page=2&per_page=100"
+
 
 class TestBuildReleasesParams:
     """Tests for _build_releases_params method."""
@@ -456,54 +477,6 @@ class TestShouldEnablePrerelease:
             assert result is False
 
 
-class TestCountReleaseTypes:
-    """Tests for _count_release_types method."""
-
-    def test_count_release_types_all_stable(self, gitlab_client: GitLabClient) -> None:
-        """Test counting all stable releases."""
-        releases = [
-            {"tag_name": "v1.0.0", "name": "Release 1.0.0"},
-            {"tag_name": "v0.9.0", "name": "Release 0.9.0"},
-        ]
-
-        stable, prerelease = gitlab_client._count_release_types(releases)
-
-        assert stable == 2
-        assert prerelease == 0
-
-    def test_count_release_types_all_prerelease(self, gitlab_client: GitLabClient) -> None:
-        """Test counting all prerelease versions."""
-        releases = [
-            {"tag_name": "v1.0.0-beta", "name": "Beta"},
-            {"tag_name": "v1.0.0-alpha", "name": "Alpha"},
-        ]
-
-        stable, prerelease = gitlab_client._count_release_types(releases)
-
-        assert stable == 0
-        assert prerelease == 2
-
-    def test_count_release_types_mixed(self, gitlab_client: GitLabClient) -> None:
-        """Test counting mixed releases."""
-        releases = [
-            {"tag_name": "v1.0.0", "name": "Stable"},
-            {"tag_name": "v1.0.0-beta", "name": "Beta"},
-            {"tag_name": "v0.9.0", "name": "Stable"},
-        ]
-
-        stable, prerelease = gitlab_client._count_release_types(releases)
-
-        assert stable == 2
-        assert prerelease == 1
-
-    def test_count_release_types_empty(self, gitlab_client: GitLabClient) -> None:
-        """Test counting empty releases list."""
-        stable, prerelease = gitlab_client._count_release_types([])
-
-        assert stable == 0
-        assert prerelease == 0
-
-
 class TestIsPrereleaseVersion:
     """Tests for _is_prerelease_version method."""
 
@@ -682,3 +655,26 @@ class TestGitLabClientError:
         """Test GitLabClientError can be raised."""
         with pytest.raises(GitLabClientError):
             raise GitLabClientError("Test error")
+
+
+class TestSharedHTTPClient:
+    """Tests for requests going through the shared HTTP client's features."""
+
+    @pytest.mark.anyio
+    async def test_requests_traced_with_auth_headers(self, mock_auth: Mock) -> None:
+        """Test that requests are traced and carry the authentication headers."""
+        mock_auth.get_headers.return_value = {"PRIVATE-TOKEN": "secret"}
+        client = GitLabClient(auth=mock_auth)
+        tracer = Mock()
+        response = Mock(status_code=200)
+        global_client = GlobalHTTPClient()
+        global_client.set_tracer(tracer)
+
+        try:
+            with patch.object(client._client, "get", new=AsyncMock(return_value=response)) as mock_get:
+                assert await client._get("https://gitlab.com/api/v4/projects/1/releases") is response
+        finally:
+            global_client.set_tracer(None)
+
+        assert mock_get.call_args.kwargs["headers"] == {"PRIVATE-TOKEN": "secret"}
+        tracer.trace_request.assert_called_once_with("GET", "https://gitlab.com/api/v4/projects/1/releases")
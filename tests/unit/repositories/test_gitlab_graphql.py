@@ -0,0 +1,208 @@
+"""Tests for batched GitLab GraphQL release fetching."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+import httpx
+import pytest
+
+from appimage_updater.repositories.base import RepositoryError
+from appimage_updater.repositories.gitlab.auth import GitLabAuth
+from appimage_updater.repositories.gitlab.client import GitLabClient
+from appimage_updater.repositories.gitlab.graphql import (
+    GitLabGraphQLClient,
+    GitLabGraphQLError,
+    GitLabProjectReleases,
+    build_releases_query,
+    build_releases_variables,
+    parse_project_id,
+    to_rest_release,
+)
+from appimage_updater.repositories.gitlab.repository import GitLabRepository
+
+
+def make_node(tag: str, released_at: str | None = "2024-05-01T10:00:00Z") -> dict[str, Any]:
+    """Create a GraphQL release node."""
+    return {
+        "tagName": tag,
+        "name": f"Release {tag}",
+        "releasedAt": released_at,
+        "createdAt": "2024-04-30T10:00:00Z",
+        "assets": {
+            "links": {
+                "nodes": [
+                    {
+                        "name": f"App-{tag}.AppImage",
+                        "url": f"https://gitlab.com/o/r/-/releases/{tag}/downloads/App.AppImage",
+                        "directAssetUrl": None,
+                        "linkType": "PACKAGE",
+                    }
+                ]
+            },
+            "sources": {"nodes": [{"format": "zip", "url": f"https://gitlab.com/o/r/-/archive/{tag}/r.zip"}]},
+        },
+    }
+
+
+def mock_http_client(*payloads: Any) -> AsyncMock:
+    """Create a get_http_client() result answering POSTs with the given JSON payloads."""
+    client = AsyncMock()
+    client.post = AsyncMock(
+        side_effect=[
+            httpx.Response(200, json=payload, request=httpx.Request("POST", "https://gitlab.com/api/graphql"))
+            for payload in payloads
+        ]
+    )
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+class TestQueryBuilding:
+    """Tests for building queries and converting their results."""
+
+    def test_query_aliases_each_project(self) -> None:
+        """Test that each project gets its own alias and path variable."""
+        query = build_releases_query(["o/one", "group/sub/two"])
+
+        assert "p0: project(fullPath: $path0)" in query
+        assert "p1: project(fullPath: $path1)" in query
+        assert "$path1: ID!" in query
+        assert "group/sub/two" not in query
+
+    def test_variables_carry_paths_and_limit(self) -> None:
+        """Test that paths and the release limit are passed as variables."""
+        assert build_releases_variables(["o/one", "o/two"], 5) == {"limit": 5, "path0": "o/one", "path1": "o/two"}
+
+    def test_to_rest_release(self) -> None:
+        """Test that a release node is converted to the REST API's format."""
+        release = to_rest_release(make_node("v1.0"))
+
+        assert release["tag_name"] == "v1.0"
+        assert release["released_at"] == "2024-05-01T10:00:00Z"
+        assert release["assets"]["links"][0]["name"] == "App-v1.0.AppImage"
+        assert release["assets"]["links"][0]["link_type"] == "package"
+        assert release["assets"]["sources"] == [{"format": "zip", "url": "https://gitlab.com/o/r/-/archive/v1.0/r.zip"}]
+
+    def test_upcoming_release_uses_created_at(self) -> None:
+        """Test that a release without a release date falls back to its creation date."""
+        assert to_rest_release(make_node("v2.0", released_at=None))["released_at"] == "2024-04-30T10:00:00Z"
+
+    @pytest.mark.parametrize(
+        ("global_id", "project_id"),
+        [("gid://gitlab/Project/278964", 278964), ("gid://gitlab/Group/9", None), ("", None), (None, None)],
+    )
+    def test_parse_project_id(self, global_id: str | None, project_id: int | None) -> None:
+        """Test that numeric IDs are taken from project global IDs only."""
+        assert parse_project_id(global_id) == project_id
+
+
+class TestGitLabGraphQLClient:
+    """Tests for executing batched queries."""
+
+    @pytest.mark.anyio
+    async def test_fetch_releases_in_batches(self) -> None:
+        """Test that projects are split into batches on the instance's endpoint and missing ones left out."""
+        client = mock_http_client(
+            {"data": {"p0": {"id": "gid://gitlab/Project/1", "releases": {"nodes": [make_node("v1")]}}, "p1": None}},
+            {"data": {"p0": {"id": "gid://gitlab/Project/3", "releases": {"nodes": []}}}},
+        )
+        graphql = GitLabGraphQLClient(auth=GitLabAuth(token="t"), batch_size=2)
+
+        with patch("appimage_updater.repositories.gitlab.graphql.get_http_client", return_value=client):
+            results = await graphql.fetch_releases("https://git.example.com", ["o/one", "o/missing", "o/three"])
+
+        assert client.post.await_count == 2
+        assert client.post.await_args.args[0] == "https://git.example.com/api/graphql"
+        assert client.post.await_args.kwargs["headers"] == {"PRIVATE-TOKEN": "t"}
+        assert set(results) == {"o/one", "o/three"}
+        assert results["o/one"].project_id == 1
+        assert results["o/one"].releases[0]["tag_name"] == "v1"
+
+    @pytest.mark.anyio
+    async def test_query_without_data_raises(self) -> None:
+        """Test that a query failing as a whole raises GitLabGraphQLError."""
+        client = mock_http_client({"errors": [{"message": "Query too complex"}]})
+        graphql = GitLabGraphQLClient(auth=GitLabAuth(token="t"))
+
+        with (
+            patch("appimage_updater.repositories.gitlab.graphql.get_http_client", return_value=client),
+            pytest.raises(GitLabGraphQLError, match="Query too complex"),
+        ):
+            await graphql.fetch_releases("https://gitlab.com", ["o/r"])
+
+
+class TestGitLabClientBatch:
+    """Tests for GitLabClient.get_releases_batch() and the project ID cache."""
+
+    @pytest.mark.anyio
+    async def test_project_ids_address_later_requests(self) -> None:
+        """Test that project IDs reported by a batch replace encoded paths in REST URLs."""
+        gitlab = GitLabClient(auth=GitLabAuth(token="t"))
+        fetched = {"group/sub/app": GitLabProjectReleases(42, [to_rest_release(make_node("v1"))])}
+
+        assert gitlab._get_releases_api_url("group/sub", "app", "https://gitlab.com") == (
+            "https://gitlab.com/api/v4/projects/group%2Fsub%2Fapp/releases"
+        )
+        with patch.object(GitLabGraphQLClient, "fetch_releases", new=AsyncMock(return_value=fetched)) as mock_fetch:
+            results = await gitlab.get_releases_batch([("group/sub", "app"), ("o", "gone")])
+
+        mock_fetch.assert_awaited_once_with("https://gitlab.com", ["group/sub/app", "o/gone"], limit=10)
+        assert set(results) == {("group/sub", "app")}
+        assert gitlab._get_releases_api_url("group/sub", "app", "https://gitlab.com") == (
+            "https://gitlab.com/api/v4/projects/42/releases"
+        )
+        assert gitlab._get_releases_api_url("o", "gone", "https://gitlab.com") == (
+            "https://gitlab.com/api/v4/projects/o%2Fgone/releases"
+        )
+
+
+class TestGitLabRepositoryBatch:
+    """Tests for GitLabRepository.get_releases_batch()."""
+
+    @pytest.mark.anyio
+    async def test_releases_grouped_by_instance(self) -> None:
+        """Test that each instance is queried once and releases keyed by the requested URLs."""
+        repository = GitLabRepository()
+        fetched = {("o", "r"): [to_rest_release(make_node("v1.2.3"))]}
+        urls = ["https://gitlab.com/o/r", "https://gitlab.com/o/r.git", "https://git.example.com/team/tool"]
+
+        with patch.object(
+            repository._gitlab_client, "get_releases_batch", new=AsyncMock(side_effect=[fetched, {}])
+        ) as mock_batch:
+            results = await repository.get_releases_batch(urls)
+
+        assert mock_batch.await_args_list[0].args == ([("o", "r")], "https://gitlab.com")
+        assert mock_batch.await_args_list[1].args == ([("team", "tool")], "https://git.example.com")
+        assert set(results) == {"https://gitlab.com/o/r", "https://gitlab.com/o/r.git"}
+        assert results["https://gitlab.com/o/r"][0].tag_name == "v1.2.3"
+        assert results["https://gitlab.com/o/r"][0].assets[0].name == "App-v1.2.3.AppImage"
+
+    @pytest.mark.anyio
+    async def test_graphql_failure_raises_repository_error(self) -> None:
+        """Test that a failed batch surfaces as RepositoryError."""
+        repository = GitLabRepository()
+        client = mock_http_client({"errors": [{"message": "boom"}]})
+
+        with (
+            patch("appimage_updater.repositories.gitlab.graphql.get_http_client", return_value=client),
+            pytest.raises(RepositoryError, match="boom"),
+        ):
+            await repository.get_releases_batch(["https://gitlab.com/o/r"])
+
+    def test_project_parsed_once_per_url(self) -> None:
+        """Test that owner, repo and base URL are parsed once per repository URL."""
+        repository = GitLabRepository()
+
+        with patch.object(repository, "parse_repo_url", new=Mock(return_value=("o", "r"))) as mock_parse:
+            repository._resolve_project("https://git.example.com/o/r")
+            project = repository._resolve_project("https://git.example.com/o/r")
+
+        mock_parse.assert_called_once()
+        assert project == ("o", "r", "https://git.example.com")
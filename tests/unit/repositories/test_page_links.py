@@ -0,0 +1,116 @@
+"""Tests for streaming extraction of AppImage links from web pages."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+import pytest
+
+from appimage_updater.repositories.page_links import (
+    AppImageLinkCollector,
+    extract_page_links,
+    scan_page_links,
+)
+
+
+PAGE = """<html><body>
+<a href="/files/App-2.0-x86_64.AppImage">App 2.0</a>
+<a href=/files/App-2.0-aarch64.AppImage>arm</a>
+<a href="/files/App-2.0-x86_64.AppImage">again</a>
+<a href="/files/App-2.0.tar.gz">source</a>
+<p>See [the previous release](https://example.com/App-1.0-x86_64.AppImage).</p>
+</body></html>"""
+
+
+def mock_streaming_client(chunks: list[bytes]) -> tuple[Mock, list[bytes]]:
+    """Create a get_http_client() result streaming the given chunks, recording those read."""
+    read: list[bytes] = []
+
+    async def aiter_bytes() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            read.append(chunk)
+            yield chunk
+
+    response = Mock(encoding="utf-8", aiter_bytes=aiter_bytes)
+
+    @asynccontextmanager
+    async def stream(method: str, url: str, **kwargs: Any) -> AsyncIterator[Mock]:
+        yield response
+
+    client = Mock(stream=stream)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client, read
+
+
+class TestAppImageLinkCollector:
+    """Tests for collecting links from HTML and Markdown."""
+
+    def test_links_in_document_order(self) -> None:
+        """Test that quoted, unquoted and Markdown links are found once, in document order."""
+        assert extract_page_links(PAGE) == [
+            "/files/App-2.0-x86_64.AppImage",
+            "/files/App-2.0-aarch64.AppImage",
+            "https://example.com/App-1.0-x86_64.AppImage",
+        ]
+
+    def test_chunked_feeding(self) -> None:
+        """Test that links split across chunks of any size are still found."""
+        collector = AppImageLinkCollector()
+        for start in range(0, len(PAGE), 7):
+            collector.feed(PAGE[start : start + 7])
+        collector.close()
+
+        assert collector.links == extract_page_links(PAGE)
+
+    def test_max_links(self) -> None:
+        """Test that links are collected up to max_links."""
+        assert extract_page_links(PAGE, max_links=1) == ["/files/App-2.0-x86_64.AppImage"]
+
+
+class TestScanPageLinks:
+    """Tests for streaming pages."""
+
+    @pytest.mark.anyio
+    async def test_stops_once_enough_links_found(self) -> None:
+        """Test that the rest of the page is not read once max_links links are found."""
+        chunks = [PAGE.encode()[:120], PAGE.encode()[120:], b"<p>" + b"x" * 10_000 + b"</p>"]
+        client, read = mock_streaming_client(chunks)
+
+        with patch("appimage_updater.repositories.page_links.get_http_client", return_value=client):
+            page = await scan_page_links("https://example.com/releases/", max_links=1)
+
+        assert page.links == ["/files/App-2.0-x86_64.AppImage"]
+        assert not page.complete
+        assert len(read) == 1
+
+    @pytest.mark.anyio
+    async def test_byte_limit(self) -> None:
+        """Test that reading stops at max_bytes, keeping the links found before it."""
+        client, read = mock_streaming_client([PAGE.encode()[:80], b"x" * 1000, PAGE.encode()])
+
+        with patch("appimage_updater.repositories.page_links.get_http_client", return_value=client):
+            page = await scan_page_links("https://example.com/releases/", max_bytes=500)
+
+        assert page.links == ["/files/App-2.0-x86_64.AppImage"]
+        assert len(page.text) <= 500
+        assert len(read) == 2
+
+    @pytest.mark.anyio
+    async def test_whole_page_read(self) -> None:
+        """Test that a page shorter than the limit is read completely."""
+        client, _ = mock_streaming_client([PAGE.encode()])
+
+        with patch("appimage_updater.repositories.page_links.get_http_client", return_value=client):
+            page = await scan_page_links("https://example.com/releases/")
+
+        assert page.complete
+        assert page.text == PAGE
+        assert len(page.links) == 3
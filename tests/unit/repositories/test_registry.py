@@ -0,0 +1,90 @@
+"""Tests for URL dispatch in the repository handler registry."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from appimage_updater.repositories.github.client import GitHubClient
+from appimage_updater.repositories.handlers.github_handler import GitHubHandler
+from appimage_updater.repositories.registry import (
+    RepositoryHandlerRegistry,
+    get_repository_registry,
+)
+
+
+@pytest.fixture
+def registry() -> RepositoryHandlerRegistry:
+    """Get the shared registry with an empty URL cache."""
+    registry = get_repository_registry()
+    registry.get_handler("github")
+    registry._resolved.clear()
+    return registry
+
+
+class TestResolveURL:
+    """Tests for resolving URLs to handlers and owner/repo."""
+
+    def test_github_url(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that a GitHub URL resolves to the GitHub handler and its owner/repo."""
+        resolved = registry.resolve_url("https://github.com/owner/repo.git")
+
+        assert resolved.handler_name == "github"
+        assert resolved.base_url == "https://github.com"
+        assert (resolved.owner, resolved.repo) == ("owner", "repo")
+
+    def test_handlers_sorted_by_priority(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that every compatible handler is listed, best first."""
+        resolved = registry.resolve_url("https://example.com/downloads/App.AppImage")
+
+        assert resolved.handler_names == ("direct_download", "dynamic_download")
+        assert resolved.owner is None
+
+    def test_owner_repo_for_other_forges(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that owner/repo is parsed for forges a forge handler accepts, like Codeberg."""
+        resolved = registry.resolve_url("https://codeberg.org/owner/repo")
+
+        assert (resolved.owner, resolved.repo) == ("owner", "repo")
+
+    def test_github_client_parses_unclaimed_forges(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that the GitHub client still parses owner/repo of self-hosted forges no handler claims."""
+        assert registry.resolve_url("https://git.example.com/owner/repo.git").owner is None
+        assert GitHubClient()._parse_repo_url("https://git.example.com/owner/repo.git") == ("owner", "repo")
+
+    def test_no_owner_repo_for_deeper_paths(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that only owner/repo paths are parsed as repositories."""
+        resolved = registry.resolve_url("https://github.com/owner/repo/releases")
+
+        assert resolved.owner is None
+        assert resolved.repo is None
+
+    def test_get_handlers_for_url_matches_resolution(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that get_handlers_for_url returns the resolved handlers."""
+        handlers = registry.get_handlers_for_url("https://gitlab.com/group/project")
+
+        assert [h.metadata.name for h in handlers] == list(
+            registry.resolve_url("https://gitlab.com/group/project").handler_names
+        )
+        assert "gitlab" in [h.metadata.name for h in handlers]
+
+    def test_resolution_cached_per_url(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that handlers are asked about a URL only once."""
+        url = "https://codeberg.org/owner/repo"
+
+        with patch.object(GitHubHandler, "can_handle_url", return_value=True) as mock_can_handle:
+            first = registry.resolve_url(url)
+            second = registry.resolve_url(url)
+
+        assert first is second
+        mock_can_handle.assert_called_once_with(url)
+
+    def test_domain_map_authoritative_for_known_hosts(self, registry: RepositoryHandlerRegistry) -> None:
+        """Test that a listed host goes to its owning handler without probing the other forge handlers."""
+        url = "https://gitlab.com/group/project"
+
+        with patch.object(GitHubHandler, "can_handle_url", return_value=True) as mock_can_handle:
+            resolved = registry.resolve_url(url)
+
+        mock_can_handle.assert_not_called()
+        assert resolved.handler_names == ("gitlab", "dynamic_download")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,7 +11,19 @@ import pytest
 
 from appimage_updater.core.models import Asset, Release
 from appimage_updater.repositories.base import RepositoryError
-from appimage_updater.repositories.sourceforge.repository import SourceForgeRepository
+from appimage_updater.repositories.page_links import (
+    PageLinks,
+    extract_page_links,
+)
+from appimage_updater.repositories.sourceforge.repository import (
+    HEAD_PROBE_CONCURRENCY,
+    SourceForgeRepository,
+)
+from appimage_updater.repositories.sourceforge.rss import (
+    SourceForgeFeedError,
+    get_feed_url,
+    parse_files,
+)
 
 
 @pytest.fixture
@@ -763,11 +776,15 @@ class TestAsyncMethods:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            with patch(
-                "appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client
+            with (
+                patch("appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client),
+                patch(
+                    "appimage_updater.repositories.sourceforge.repository.scan_page_links",
+                    new=AsyncMock(side_effect=httpx.HTTPError("Connection failed")),
+                ),
+                pytest.raises(RepositoryError, match="Failed to fetch release information"),
             ):
-                with pytest.raises(RepositoryError, match="Failed to fetch release information"):
-                    await sf_repo.get_releases("https://sourceforge.net/projects/test")
+                await sf_repo.get_releases("https://sourceforge.net/projects/test")
 
     @pytest.mark.anyio
     async def test_get_releases_timeout_error(self, sf_repo: SourceForgeRepository) -> None:
@@ -780,24 +797,155 @@ class TestAsyncMethods:
             mock_client.__aenter__ = AsyncMock(return_value=mock_client)
             mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            with patch(
-                "appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client
+            with (
+                patch("appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client),
+                patch(
+                    "appimage_updater.repositories.sourceforge.repository.scan_page_links",
+                    new=AsyncMock(side_effect=httpx.TimeoutException("Request timeout")),
+                ),
+                pytest.raises(RepositoryError, match="Failed to fetch release information"),
             ):
-                with pytest.raises(RepositoryError, match="Failed to fetch release information"):
-                    await sf_repo.get_releases("https://sourceforge.net/projects/test")
+                await sf_repo.get_releases("https://sourceforge.net/projects/test")
 
     @pytest.mark.anyio
     async def test_fetch_sourceforge_releases_no_appimages(self, sf_repo: SourceForgeRepository) -> None:
         """Test fetching releases when no AppImages found."""
-        mock_response = Mock()
-        mock_response.text = "<html><body>No AppImages here</body></html>"
-        mock_response.raise_for_status = Mock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        page = PageLinks(links=[], text="<html><body>No AppImages here</body></html>")
 
-        with patch("appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client):
+        with patch(
+            "appimage_updater.repositories.sourceforge.repository.scan_page_links", new=AsyncMock(return_value=page)
+        ):
             with pytest.raises(RepositoryError, match="No AppImage downloads found"):
                 await sf_repo._fetch_sourceforge_releases("https://sourceforge.net/projects/test", "test", "", 10)
+
+
+FEED_CONTENT = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss xmlns:media="http://video.search.yahoo.com/mrss/" version="2.0">
+  <channel>
+    <title>TestApp</title>
+    <item>
+      <title><![CDATA[/v1.1.0/TestApp-1.1.0.AppImage]]></title>
+      <link>https://sourceforge.net/projects/testproject/files/v1.1.0/TestApp-1.1.0.AppImage/download</link>
+      <pubDate>Tue, 02 Jan 2024 10:00:00 UT</pubDate>
+      <media:content url="https://sourceforge.net/projects/testproject/files/v1.1.0/TestApp-1.1.0.AppImage/download"
+        type="application/octet-stream" filesize="2048000">
+        <media:hash algo="md5">0123456789abcdef0123456789abcdef</media:hash>
+      </media:content>
+    </item>
+    <item>
+      <title><![CDATA[/v1.1.0/TestApp-1.1.0.tar.gz]]></title>
+      <link>https://sourceforge.net/projects/testproject/files/v1.1.0/TestApp-1.1.0.tar.gz/download</link>
+      <pubDate>Tue, 02 Jan 2024 09:00:00 UT</pubDate>
+    </item>
+    <item>
+      <title><![CDATA[/v1.0.0/TestApp-1.0.0.AppImage]]></title>
+      <link>https://sourceforge.net/projects/testproject/files/v1.0.0/TestApp-1.0.0.AppImage/download</link>
+      <pubDate>Mon, 01 Jan 2024 10:00:00 UT</pubDate>
+      <media:content type="application/octet-stream" filesize="1024000"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def mock_feed_client(*responses: object) -> AsyncMock:
+    """Create a get_http_client() result answering GETs with the given responses or errors."""
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=list(responses))
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    return mock_client
+
+
+class TestFileFeed:
+    """Tests for listing releases from the SourceForge file feed."""
+
+    def test_parse_files(self) -> None:
+        """Test that feed items carry name, size, date and MD5."""
+        files = parse_files(FEED_CONTENT)
+
+        assert [f.name for f in files] == ["TestApp-1.1.0.AppImage", "TestApp-1.1.0.tar.gz", "TestApp-1.0.0.AppImage"]
+        assert files[0].size == 2048000
+        assert files[0].published_at is not None and files[0].published_at.year == 2024
+        assert files[0].md5 == "0123456789abcdef0123456789abcdef"
+        assert files[1].size == 0
+        assert files[2].md5 is None
+
+    def test_parse_files_invalid(self) -> None:
+        """Test that malformed feeds raise SourceForgeFeedError."""
+        with pytest.raises(SourceForgeFeedError):
+            parse_files(b"<rss><channel>")
+
+    def test_feed_url(self) -> None:
+        """Test the feed URL of a project directory."""
+        assert get_feed_url("scribus", "scribus-devel/1.7.0") == (
+            "https://sourceforge.net/projects/scribus/rss?path=/scribus-devel/1.7.0"
+        )
+
+    @pytest.mark.anyio
+    async def test_get_releases_from_feed(self, sf_repo: SourceForgeRepository) -> None:
+        """Test that the feed answers in one request without HEAD probes."""
+        feed_url = "https://sourceforge.net/projects/testproject/rss?path=/"
+        mock_client = mock_feed_client(
+            httpx.Response(200, content=FEED_CONTENT, request=httpx.Request("GET", feed_url))
+        )
+
+        with (
+            patch("appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client),
+            patch.object(sf_repo, "_get_file_size", new_callable=AsyncMock) as mock_get_size,
+        ):
+            releases = await sf_repo.get_releases("https://sourceforge.net/projects/testproject/files/")
+
+        assert mock_client.get.await_count == 1
+        mock_get_size.assert_not_awaited()
+        assert [r.version for r in releases] == ["1.1.0", "1.0.0"]
+        assert releases[0].assets[0].size == 2048000
+        assert releases[0].published_at.day == 2
+
+    @pytest.mark.anyio
+    async def test_get_releases_falls_back_to_files_page(
+        self, sf_repo: SourceForgeRepository, mock_html_content: str
+    ) -> None:
+        """Test that the files page is scraped when the feed is unavailable."""
+        page = PageLinks(links=extract_page_links(mock_html_content), text=mock_html_content)
+        mock_client = mock_feed_client(httpx.ConnectError("feed unavailable"))
+
+        with (
+            patch("appimage_updater.repositories.sourceforge.repository.get_http_client", return_value=mock_client),
+            patch(
+                "appimage_updater.repositories.sourceforge.repository.scan_page_links",
+                new=AsyncMock(return_value=page),
+            ) as mock_scan,
+            patch.object(sf_repo, "_get_file_size", new_callable=AsyncMock, return_value=1024) as mock_get_size,
+        ):
+            releases = await sf_repo.get_releases("https://sourceforge.net/projects/testproject/files/")
+
+        assert mock_client.get.await_count == 1
+        mock_scan.assert_awaited_once()
+        assert releases
+        assert mock_get_size.await_count == len(releases)
+
+
+class TestConcurrentSizeProbes:
+    """Tests for HEAD probes of scraped files."""
+
+    @pytest.mark.anyio
+    async def test_probes_run_concurrently_with_limit(self, sf_repo: SourceForgeRepository) -> None:
+        """Test that probes overlap but never exceed HEAD_PROBE_CONCURRENCY."""
+        active = 0
+        peak = 0
+
+        async def fake_size(url: str) -> int:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return len(url)
+
+        urls = [f"https://example.com/{i}.AppImage" for i in range(HEAD_PROBE_CONCURRENCY * 2)]
+        with patch.object(sf_repo, "_get_file_size", side_effect=fake_size):
+            sizes = await sf_repo._get_file_sizes(urls)
+
+        assert sizes == [len(url) for url in urls]
+        assert 1 < peak <= HEAD_PROBE_CONCURRENCY
@@ -14,6 +14,7 @@ import pytest
 
 from appimage_updater.config.manager import AppConfigs, GlobalConfigManager, Manager
 from appimage_updater.config.models import Config, DefaultsConfig, GlobalConfig
+from appimage_updater.core.http_service import GlobalHTTPClient
 from appimage_updater.core.update_operations import _load_config_with_fallback
 
 
@@ -69,7 +70,7 @@ class TestDirectoryConfigLoading:
         }
 
         if global_config_format == "wrapped":
-            global_config_data: dict[str, dict[str, object]|object] = {"global_config": inner_global_config}
+            global_config_data: dict[str, dict[str, object] | object] = {"global_config": inner_global_config}
         else:
             # Newer bare GlobalConfig dumps use the inner structure directly
             global_config_data = inner_global_config
@@ -198,6 +199,24 @@ class TestDirectoryConfigLoading:
         # Verify global_config was loaded correctly
         assert app_configs._config.global_config.defaults.retain_count == 2
 
+    @pytest.mark.parametrize("manager_class", [AppConfigs, GlobalConfigManager])
+    def test_loading_config_applies_http_settings(self, tmp_path: Path, manager_class: type[Manager]) -> None:
+        """Test that every command loading the configuration applies its HTTP settings."""
+        config_dir = tmp_path / "appimage-updater"
+        apps_dir = config_dir / "apps"
+        apps_dir.mkdir(parents=True)
+        http_settings = {"cache_enabled": False, "default_host_concurrency": 2}
+        with (config_dir / "config.json").open("w") as f:
+            json.dump({"global_config": {"http": http_settings}}, f)
+        with (apps_dir / "global.json").open("w") as f:
+            json.dump({"global_config": {"http": http_settings}}, f)
+
+        manager_class(config_path=apps_dir)  # type: ignore[call-arg]
+
+        settings = GlobalHTTPClient()._settings
+        assert settings.cache_enabled is False
+        assert settings.default_host_concurrency == 2
+
     def test_load_config_with_invalid_global_config_json(self, tmp_path: Path) -> None:
         """Test that invalid config.json falls back to defaults gracefully."""
         # Create directory structure
@@ -238,8 +257,9 @@ class TestDirectoryConfigLoading:
         # Verify default global_config is used (fallback)
         assert config.global_config.defaults.retain_count == 3  # default
 
-    def test_load_config_with_fallback_uses_global_config_env(self, tmp_path: Path,
-    monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_load_config_with_fallback_uses_global_config_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test _load_config_with_fallback reading global config via env.
 
         This simulates the real check workflow, where no explicit config_file or
@@ -10,6 +10,7 @@ from appimage_updater.repositories.base import RepositoryClient, RepositoryError
 from appimage_updater.repositories.direct_download_repository import DirectDownloadRepository
 from appimage_updater.repositories.dynamic_download_repository import DynamicDownloadRepository
 from appimage_updater.repositories.factory import (
+    clear_repository_client_cache,
     get_repository_client,
     get_repository_client_async,
     get_repository_client_with_probing_sync,
@@ -356,3 +357,49 @@ class TestUnifiedRepositoryInterface:
 
             # Both should return the same type
             assert type(client) is type(client_with_probing)
+
+
+class TestRepositoryClientReuse:
+    """Test that the async factory reuses clients within an event loop."""
+
+    def test_same_host_reuses_client(self) -> None:
+        """Test that applications on one host share a client."""
+
+        async def resolve() -> tuple[RepositoryClient, RepositoryClient, RepositoryClient]:
+            first = await get_repository_client_async("https://github.com/user/one", source_type="github")
+            second = await get_repository_client_async("https://github.com/user/two", source_type="github")
+            other_host = await get_repository_client_async("https://codeberg.org/user/two", source_type="github")
+            return first, second, other_host
+
+        first, second, other_host = asyncio.run(resolve())
+
+        assert first is second
+        assert other_host is not first
+
+    def test_options_and_loops_get_separate_clients(self) -> None:
+        """Test that different timeouts and event loops do not share clients."""
+        url = "https://github.com/user/repo"
+
+        async def resolve() -> tuple[RepositoryClient, RepositoryClient]:
+            default = await get_repository_client_async(url, source_type="github")
+            slow = await get_repository_client_async(url, source_type="github", timeout=120)
+            return default, slow
+
+        default, slow = asyncio.run(resolve())
+        next_loop_default, _ = asyncio.run(resolve())
+
+        assert default is not slow
+        assert next_loop_default is not default
+
+    def test_clear_cache(self) -> None:
+        """Test that clearing the cache creates fresh clients."""
+        url = "https://github.com/user/repo"
+
+        async def resolve_twice() -> tuple[RepositoryClient, RepositoryClient]:
+            first = await get_repository_client_async(url, source_type="github")
+            clear_repository_client_cache()
+            return first, await get_repository_client_async(url, source_type="github")
+
+        first, second = asyncio.run(resolve_twice())
+
+        assert first is not second
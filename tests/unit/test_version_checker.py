@@ -2,7 +2,39 @@
 
 from __future__ import annotations
 
-from appimage_updater.core.version_checker import VersionChecker
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+import time
+from typing import Any
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+import pytest
+
+from appimage_updater.config.models import ApplicationConfig
+from appimage_updater.core.check_cache import (
+    CachedCheck,
+    CheckResultCache,
+)
+from appimage_updater.core.models import (
+    Asset,
+    CheckResult,
+    Release,
+)
+from appimage_updater.core.version_checker import (
+    STABLE_RELEASE_SCAN_LIMIT,
+    VersionChecker,
+)
+from appimage_updater.repositories.base import RepositoryError
+from appimage_updater.repositories.github.auth import GitHubAuth
+from appimage_updater.repositories.github.feed import GitHubFeedError
+from appimage_updater.repositories.github.repository import GitHubRepository
+from appimage_updater.repositories.gitlab.repository import GitLabRepository
 
 
 class TestVersionChecker:
@@ -15,3 +47,427 @@ class TestVersionChecker:
     def test_version_checker_initialization(self) -> None:
         """Test that VersionChecker can be initialized."""
         assert self.version_checker is not None
+
+
+class TestPrefetchReleases:
+    """Tests for batched GitHub release prefetching."""
+
+    @staticmethod
+    def make_app(name: str, url: str, source_type: str = "github") -> ApplicationConfig:
+        """Create an application configuration."""
+        return ApplicationConfig(
+            name=name,
+            source_type=source_type,
+            url=url,
+            download_dir=Path("apps"),
+            pattern=r".*\.AppImage$",
+        )
+
+    @pytest.mark.anyio
+    async def test_prefetched_releases_used_for_checks(self) -> None:
+        """Test that GitHub apps are batched and their releases reused by later checks."""
+        apps = [
+            self.make_app("One", "https://github.com/o/one"),
+            self.make_app("Two", "https://github.com/o/two"),
+            self.make_app("Forge", "https://gitlab.com/o/three", source_type="gitlab"),
+        ]
+        now = datetime.now()
+        asset = Asset(name="One.AppImage", url="https://example.com/One.AppImage", size=1, created_at=now)
+        releases = [Release(version="1.0", tag_name="v1.0", published_at=now, assets=[asset])]
+        checker = VersionChecker()
+
+        with (
+            patch.object(GitHubAuth, "is_authenticated", new=True),
+            patch.object(
+                GitHubRepository, "get_releases_batch", new=AsyncMock(return_value={apps[0].url: releases})
+            ) as mock_batch,
+        ):
+            await checker.prefetch_releases(apps)
+
+        mock_batch.assert_awaited_once_with([apps[0].url, apps[1].url])
+        assert await checker._get_repository_releases(apps[0]) is releases
+
+    @pytest.mark.anyio
+    async def test_no_prefetch_without_token(self) -> None:
+        """Test that nothing is batched without GitHub authentication."""
+        apps = [self.make_app("One", "https://github.com/o/one"), self.make_app("Two", "https://github.com/o/two")]
+        checker = VersionChecker()
+
+        with (
+            patch.object(GitHubAuth, "is_authenticated", new=False),
+            patch.object(GitHubRepository, "get_releases_batch", new=AsyncMock()) as mock_batch,
+        ):
+            await checker.prefetch_releases(apps)
+
+        mock_batch.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_batch_failure_falls_back_to_individual_checks(self) -> None:
+        """Test that a failed batch leaves every application to be checked individually."""
+        apps = [self.make_app("One", "https://github.com/o/one"), self.make_app("Two", "https://github.com/o/two")]
+        checker = VersionChecker()
+
+        with (
+            patch.object(GitHubAuth, "is_authenticated", new=True),
+            patch.object(
+                GitHubRepository, "get_releases_batch", new=AsyncMock(side_effect=RepositoryError("rate limited"))
+            ),
+        ):
+            await checker.prefetch_releases(apps)
+
+        assert checker._prefetched_releases == {}
+
+    @pytest.mark.anyio
+    async def test_gitlab_apps_batched_per_instance(self) -> None:
+        """Test that GitLab apps sharing an instance are batched without a token."""
+        apps = [
+            self.make_app("One", "https://gitlab.com/o/one", source_type="gitlab"),
+            self.make_app("Two", "https://gitlab.com/o/two", source_type="gitlab"),
+            self.make_app("Alone", "https://git.example.com/o/three", source_type="gitlab"),
+        ]
+        releases: list[Release] = []
+        checker = VersionChecker()
+
+        with patch.object(
+            GitLabRepository, "get_releases_batch", new=AsyncMock(return_value={apps[1].url: releases})
+        ) as mock_batch:
+            await checker.prefetch_releases(apps)
+
+        mock_batch.assert_awaited_once_with([apps[0].url, apps[1].url])
+        assert checker._prefetched_releases == {apps[1].url: releases}
+
+    @pytest.mark.anyio
+    async def test_checks_start_while_prefetching(self) -> None:
+        """Test that checks outside the batches run during the prefetch and batched ones wait for it."""
+        apps = [
+            self.make_app("Forge", "https://github.com/o/one"),
+            self.make_app("Direct", "https://example.com/app.AppImage", source_type="direct"),
+        ]
+        prefetch_done = asyncio.Event()
+        checked: list[str] = []
+
+        async def prefetch(app_configs: list[ApplicationConfig]) -> None:
+            await prefetch_done.wait()
+
+        async def check(app_config: ApplicationConfig) -> CheckResult:
+            checked.append(app_config.name)
+            return CheckResult(app_name=app_config.name, success=True)
+
+        checker = VersionChecker()
+        with (
+            patch.object(checker, "prefetch_releases", side_effect=prefetch),
+            patch.object(checker, "_check_repository_updates", side_effect=check),
+        ):
+            checker.start_prefetch(apps)
+            forge = asyncio.create_task(checker.check_for_updates(apps[0]))
+            await checker.check_for_updates(apps[1])
+            await asyncio.sleep(0)
+            assert checked == ["Direct"]
+
+            prefetch_done.set()
+            await forge
+            await checker.stop_prefetch()
+
+        assert checked == ["Direct", "Forge"]
+
+    @pytest.mark.anyio
+    async def test_stop_prefetch_cancels_running_prefetch(self) -> None:
+        """Test that a prefetch still running when the checks end is cancelled."""
+
+        async def prefetch(app_configs: list[ApplicationConfig]) -> None:
+            await asyncio.Event().wait()
+
+        checker = VersionChecker()
+        with patch.object(checker, "prefetch_releases", side_effect=prefetch):
+            checker.start_prefetch([self.make_app("One", "https://github.com/o/one")])
+            task = checker._prefetch_task
+            await checker.stop_prefetch()
+
+        assert task is not None
+        assert task.cancelled()
+
+
+class TestLatestReleaseFastPath:
+    """Tests for the latest release endpoint used for stable-only applications."""
+
+    @staticmethod
+    def make_app(prerelease: bool = False, version_pattern: str | None = None) -> ApplicationConfig:
+        """Create an application configuration."""
+        return ApplicationConfig(
+            name="App",
+            source_type="github",
+            url="https://github.com/o/app",
+            download_dir=Path("apps"),
+            pattern=r"App-.*\.AppImage$",
+            version_pattern=version_pattern,
+            prerelease=prerelease,
+        )
+
+    @staticmethod
+    def make_release(asset_name: str = "App-2.0.AppImage", version: str = "2.0") -> Release:
+        """Create a stable release with a single asset."""
+        now = datetime.now()
+        return Release(
+            version=version,
+            tag_name=f"v{version}",
+            published_at=now,
+            assets=[Asset(name=asset_name, url=f"https://example.com/{asset_name}", size=1, created_at=now)],
+        )
+
+    @staticmethod
+    def make_client(
+        latest: Release | None = None, error: Exception | None = None, scanned: list[Release] | None = None
+    ) -> Mock:
+        """Create a repository client answering latest release, release scan and release list requests."""
+
+        async def find_release(url: str, predicate: Callable[[Release], bool], max_releases: int | None = None) -> Any:
+            return next((release for release in scanned or [] if predicate(release)), None)
+
+        client = Mock()
+        client.get_latest_release_direct = AsyncMock(return_value=latest, side_effect=error)
+        client.find_release = AsyncMock(side_effect=find_release)
+        client.get_releases = AsyncMock(return_value=[])
+        return client
+
+    @pytest.mark.anyio
+    async def test_latest_release_used_for_stable_apps(self) -> None:
+        """Test that a matching latest release avoids listing releases."""
+        latest = self.make_release()
+        client = self.make_client(latest)
+
+        releases = await VersionChecker(repository_client=client)._get_repository_releases(self.make_app())
+
+        assert releases == [latest]
+        client.get_releases.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_falls_back_without_matching_asset(self) -> None:
+        """Test that releases are scanned when the latest release lacks the app's asset."""
+        client = self.make_client(self.make_release("Other-2.0.tar.gz"))
+
+        await VersionChecker(repository_client=client)._get_repository_releases(self.make_app())
+
+        client.find_release.assert_awaited_once()
+        client.get_releases.assert_awaited_once_with("https://github.com/o/app")
+
+    @pytest.mark.anyio
+    async def test_scan_stops_at_first_usable_release(self) -> None:
+        """Test that the scan returns the newest release with a matching asset without listing releases."""
+        usable = self.make_release(version="1.9")
+        client = self.make_client(
+            self.make_release("Other-2.0.tar.gz"),
+            scanned=[self.make_release("Other-2.0.tar.gz"), usable, self.make_release(version="1.8")],
+        )
+
+        releases = await VersionChecker(repository_client=client)._get_repository_releases(self.make_app())
+
+        assert releases == [usable]
+        assert client.find_release.await_args.kwargs["max_releases"] == STABLE_RELEASE_SCAN_LIMIT
+        client.get_releases.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_latest_release_outside_version_pattern_is_scanned_past(self) -> None:
+        """Test that a latest release not matching the version pattern is not used."""
+        pinned = self.make_release("App-1.5.0.AppImage", version="1.5.0")
+        client = self.make_client(
+            self.make_release("App-2.0.0.AppImage", version="2.0.0"),
+            scanned=[self.make_release("App-2.0.0.AppImage", version="2.0.0"), pinned],
+        )
+
+        releases = await VersionChecker(repository_client=client)._get_repository_releases(
+            self.make_app(version_pattern=r"^1\.")
+        )
+
+        assert releases == [pinned]
+        client.get_releases.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_prefetched_releases_without_usable_release_scanned_past(self) -> None:
+        """Test that prefetched releases lacking the app's asset fall back to the latest release and scan."""
+        usable = self.make_release(version="1.9")
+        client = self.make_client(self.make_release("Other-2.0.tar.gz"), scanned=[usable])
+        checker = VersionChecker(repository_client=client)
+        app_config = self.make_app()
+        checker._prefetched_releases[app_config.url] = [self.make_release("Other-2.0.tar.gz")]
+
+        releases = await checker._get_repository_releases(app_config)
+
+        assert releases == [usable]
+        client.get_latest_release_direct.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_usable_prefetched_releases_need_no_request(self) -> None:
+        """Test that prefetched releases with a usable release are returned as they are."""
+        prefetched = [self.make_release("Other-2.0.tar.gz"), self.make_release(version="1.9")]
+        client = self.make_client()
+        checker = VersionChecker(repository_client=client)
+        checker._prefetched_releases["https://github.com/o/app"] = prefetched
+
+        assert await checker._get_repository_releases(self.make_app()) is prefetched
+        client.get_latest_release_direct.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_falls_back_on_repository_error(self) -> None:
+        """Test that a failed latest release request falls back to scanning releases."""
+        client = self.make_client(error=RepositoryError("404 Not Found"))
+
+        await VersionChecker(repository_client=client)._get_repository_releases(self.make_app())
+
+        client.get_releases.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_prerelease_apps_skip_latest_release(self) -> None:
+        """Test that applications tracking prereleases always scan releases."""
+        client = self.make_client(self.make_release())
+
+        await VersionChecker(repository_client=client)._get_repository_releases(self.make_app(prerelease=True))
+
+        client.get_latest_release_direct.assert_not_awaited()
+        client.get_releases.assert_awaited_once()
+
+
+class TestReleaseFeedPrecheck:
+    """Tests for skipping release lookups when the release feed is unchanged."""
+
+    @staticmethod
+    def make_app(url: str = "https://github.com/o/app") -> ApplicationConfig:
+        """Create an application configuration."""
+        return ApplicationConfig(
+            name="App",
+            source_type="github",
+            url=url,
+            download_dir=Path("apps"),
+            pattern=r"App-.*\.AppImage$",
+        )
+
+    @pytest.mark.anyio
+    async def test_unchanged_feed_skips_release_lookup(self) -> None:
+        """Test that a newest feed entry matching the installed version avoids the API."""
+        checker = VersionChecker()
+
+        with (
+            patch.object(checker, "_get_current_version", return_value="2.0"),
+            patch.object(checker._release_feed, "get_newest_tag", new=AsyncMock(return_value="v2.0")),
+            patch.object(checker, "_get_repository_releases", new=AsyncMock()) as mock_releases,
+        ):
+            result = await checker._check_repository_updates(self.make_app())
+
+        mock_releases.assert_not_awaited()
+        assert result.success
+        assert result.update_available is False
+        assert result.available_version == "2.0"
+
+    @pytest.mark.anyio
+    async def test_new_feed_entry_checks_releases(self) -> None:
+        """Test that a different newest tag leads to a full release lookup."""
+        checker = VersionChecker()
+
+        with (
+            patch.object(checker, "_get_current_version", return_value="2.0"),
+            patch.object(checker._release_feed, "get_newest_tag", new=AsyncMock(return_value="v2.1")),
+            patch.object(checker, "_get_repository_releases", new=AsyncMock(return_value=[])) as mock_releases,
+        ):
+            await checker._check_repository_updates(self.make_app())
+
+        mock_releases.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_feed_error_checks_releases(self) -> None:
+        """Test that an unavailable feed falls back to a full release lookup."""
+        checker = VersionChecker()
+
+        with (
+            patch.object(checker, "_get_current_version", return_value="2.0"),
+            patch.object(checker._release_feed, "get_newest_tag", new=AsyncMock(side_effect=GitHubFeedError("503"))),
+            patch.object(checker, "_get_repository_releases", new=AsyncMock(return_value=[])) as mock_releases,
+        ):
+            await checker._check_repository_updates(self.make_app())
+
+        mock_releases.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_feed_not_read_without_installed_version(self) -> None:
+        """Test that new installations always look up releases."""
+        checker = VersionChecker()
+
+        with (
+            patch.object(checker, "_get_current_version", return_value=None),
+            patch.object(checker._release_feed, "get_newest_tag", new=AsyncMock()) as mock_feed,
+            patch.object(checker, "_get_repository_releases", new=AsyncMock(return_value=[])),
+        ):
+            await checker._check_repository_updates(self.make_app())
+
+        mock_feed.assert_not_awaited()
+
+
+class TestCachedResults:
+    """Tests for serving check results from the result cache."""
+
+    @staticmethod
+    def make_app() -> ApplicationConfig:
+        """Create an application configuration."""
+        return ApplicationConfig(
+            name="App",
+            source_type="github",
+            url="https://github.com/o/app",
+            download_dir=Path("apps"),
+            pattern=r"App-.*\.AppImage$",
+        )
+
+    @staticmethod
+    def make_cache(age: float, current_version: str = "2.0") -> Mock:
+        """Create a result cache holding a result of the given age."""
+        result = CheckResult(app_name="App", success=True, current_version=current_version, available_version="2.0")
+        cache = Mock(spec=CheckResultCache)
+        cache.lookup.return_value = CachedCheck(result=result, stored_at=time.time() - age)
+        return cache
+
+    @pytest.mark.anyio
+    async def test_fresh_result_served_without_checking(self) -> None:
+        """Test that a result younger than max_age is returned without any repository request."""
+        checker = VersionChecker(result_cache=self.make_cache(age=60), max_age=1800)
+
+        with (
+            patch.object(checker, "_get_current_version", return_value="2.0"),
+            patch.object(checker, "_check_repository_updates", new=AsyncMock()) as mock_check,
+        ):
+            result = await checker.check_for_updates(self.make_app())
+
+        mock_check.assert_not_awaited()
+        assert result.available_version == "2.0"
+
+    @pytest.mark.parametrize(
+        ("age", "cached_version"),
+        [(3600, "2.0"), (60, "1.0")],
+        ids=["expired", "installed-version-changed"],
+    )
+    @pytest.mark.anyio
+    async def test_unusable_result_checked_and_stored(self, age: float, cached_version: str) -> None:
+        """Test that expired results, or results for another installed version, are checked again and replaced."""
+        cache = self.make_cache(age=age, current_version=cached_version)
+        checker = VersionChecker(result_cache=cache, max_age=1800)
+        fresh = CheckResult(app_name="App", success=True, current_version="2.0", available_version="2.1")
+
+        with (
+            patch.object(checker, "_get_current_version", return_value="2.0"),
+            patch.object(checker, "_check_repository_updates", new=AsyncMock(return_value=fresh)) as mock_check,
+        ):
+            result = await checker.check_for_updates(self.make_app())
+
+        mock_check.assert_awaited_once()
+        assert result is fresh
+        cache.store.assert_called_once_with(self.make_app(), fresh)
+
+    @pytest.mark.anyio
+    async def test_cached_apps_not_prefetched(self) -> None:
+        """Test that applications answered from the cache are left out of batched prefetching."""
+        checker = VersionChecker(result_cache=self.make_cache(age=60), max_age=1800)
+
+        with (
+            patch.object(checker, "_get_current_version", return_value="2.0"),
+            patch.object(checker, "_prefetch_github_releases", new=AsyncMock()) as mock_github,
+            patch.object(checker, "_prefetch_gitlab_releases", new=AsyncMock()),
+        ):
+            await checker.prefetch_releases([self.make_app()])
+
+        mock_github.assert_awaited_once_with([])